@@ -0,0 +1,197 @@
+"""Mapping ORM rows to aggregates: validated constructors vs ``reconstitute``.
+
+"validated" maps the rows the way the mappers did before, building every ID
+and value object through its constructor and ``__post_init__``. "trusted" is
+the current mappers, which rebuild them with ``reconstitute``. Rows are
+transient ORM instances, so no database is needed.
+
+    PYTHONPATH=src python benchmarks/mapper_reconstitution_benchmark.py
+"""
+
+import timeit
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+from parkly.adapters.outbound.infrastructure.ulid_id_generator import (
+    FacilityIdGenerator,
+    ReservationIdGenerator,
+    SpotIdGenerator,
+    VehicleIdGenerator,
+)
+from parkly.adapters.outbound.persistence.mappers import (
+    facility_to_domain,
+    reservation_to_domain,
+)
+from parkly.adapters.outbound.persistence.orm_models import (
+    ParkingFacilityORM,
+    ParkingSpotORM,
+    ReservationORM,
+)
+from parkly.domain.model.enums import (
+    AccessControlMethod,
+    FacilityType,
+    ReservationStatus,
+    SpotStatus,
+    SpotType,
+)
+from parkly.domain.model.parking_facility import ParkingFacility, ParkingSpot
+from parkly.domain.model.reservation import Reservation
+from parkly.domain.model.typed_ids import (
+    FacilityId,
+    ReservationId,
+    SpotId,
+    VehicleId,
+)
+from parkly.domain.model.value_objects import (
+    Capacity,
+    Currency,
+    FacilityName,
+    Location,
+    Money,
+    SpotNumber,
+    TimeSlot,
+)
+
+SPOTS = 5_000
+RESERVATIONS = 5_000
+LOADS = 5
+REPEAT = 10
+
+_START = datetime(2026, 1, 1, 9, tzinfo=UTC)
+
+
+def validated_facility_to_domain(orm: ParkingFacilityORM) -> ParkingFacility:
+    spots = [
+        ParkingSpot.reconstitute(
+            spot_id=SpotId(value=s.ulid),
+            spot_number=SpotNumber(value=s.spot_number),
+            spot_type=SpotType(s.spot_type),
+            status=SpotStatus(s.status),
+        )
+        for s in orm.spots
+    ]
+    return ParkingFacility.reconstitute(
+        facility_id=FacilityId(value=orm.ulid),
+        name=FacilityName(value=orm.name),
+        location=Location(
+            latitude=orm.latitude,
+            longitude=orm.longitude,
+            address=orm.address,
+        ),
+        facility_type=FacilityType(orm.facility_type),
+        access_control=AccessControlMethod(orm.access_control),
+        total_capacity=Capacity(value=orm.total_capacity),
+        spots=spots,
+    )
+
+
+def validated_reservation_to_domain(orm: ReservationORM) -> Reservation:
+    return Reservation.reconstitute(
+        reservation_id=ReservationId(value=orm.ulid),
+        facility_id=FacilityId(value=orm.facility_ulid),
+        spot_id=SpotId(value=orm.spot_ulid),
+        vehicle_id=VehicleId(value=orm.vehicle_ulid),
+        time_slot=TimeSlot(start=orm.time_slot_start, end=orm.time_slot_end),
+        status=ReservationStatus(orm.status),
+        total_cost=Money(
+            amount=orm.cost_amount,
+            currency=Currency.of(orm.cost_currency),
+        ),
+        created_at=orm.created_at,
+    )
+
+
+def build_facility_row() -> ParkingFacilityORM:
+    spot_ids = SpotIdGenerator()
+    spot_types = list(SpotType)
+    return ParkingFacilityORM(
+        ulid=FacilityIdGenerator().generate().value,
+        name="Central Garage",
+        latitude=Decimal("40.7128000"),
+        longitude=Decimal("-74.0060000"),
+        address="1 Centre St, New York, NY",
+        facility_type=FacilityType.PUBLIC.value,
+        access_control=AccessControlMethod.LPR.value,
+        total_capacity=SPOTS,
+        spots=[
+            ParkingSpotORM(
+                ulid=spot_ids.generate().value,
+                spot_number=f"S-{i:05d}",
+                spot_type=spot_types[i % len(spot_types)].value,
+                status=SpotStatus.AVAILABLE.value,
+            )
+            for i in range(SPOTS)
+        ],
+    )
+
+
+def build_reservation_rows() -> list[ReservationORM]:
+    reservation_ids = ReservationIdGenerator()
+    facility_ulid = FacilityIdGenerator().generate().value
+    spot_ulid = SpotIdGenerator().generate().value
+    vehicle_ulid = VehicleIdGenerator().generate().value
+    rows = []
+    for i in range(RESERVATIONS):
+        start = _START + timedelta(hours=2 * i)
+        rows.append(
+            ReservationORM(
+                ulid=reservation_ids.generate().value,
+                facility_ulid=facility_ulid,
+                spot_ulid=spot_ulid,
+                vehicle_ulid=vehicle_ulid,
+                time_slot_start=start,
+                time_slot_end=start + timedelta(hours=1),
+                status=ReservationStatus.CONFIRMED.value,
+                cost_amount=Decimal("12.50"),
+                cost_currency="USD",
+                created_at=_START,
+            )
+        )
+    return rows
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    validated: Callable[[], object]
+    trusted: Callable[[], object]
+
+
+def build_cases() -> list[Case]:
+    facility = build_facility_row()
+    reservations = build_reservation_rows()
+    return [
+        Case(
+            f"facility ({SPOTS} spots)",
+            lambda: validated_facility_to_domain(facility),
+            lambda: facility_to_domain(facility),
+        ),
+        Case(
+            f"{RESERVATIONS} reservations",
+            lambda: [validated_reservation_to_domain(r) for r in reservations],
+            lambda: [reservation_to_domain(r) for r in reservations],
+        ),
+    ]
+
+
+def best_ms(load: Callable[[], object]) -> float:
+    return min(timeit.repeat(load, number=LOADS, repeat=REPEAT)) / LOADS * 1000
+
+
+def main() -> None:
+    header = f"{'load':<24}{'validated ms':>14}{'trusted ms':>12}{'speedup':>9}"
+    print(header)
+    print("-" * len(header))
+    for case in build_cases():
+        validated = best_ms(case.validated)
+        trusted = best_ms(case.trusted)
+        print(
+            f"{case.name:<24}{validated:>14.2f}{trusted:>12.2f}"
+            f"{validated / trusted:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
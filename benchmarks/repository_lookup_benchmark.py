@@ -0,0 +1,203 @@
+"""Reservation lookups per second: a select built per call vs a prebuilt one.
+
+Each lookup runs in its own session on one connection, as query handlers do.
+"lookups/cpu-s" counts only this process's CPU time, so it is the lookup rate
+one core of the application sustains while Postgres does its share elsewhere.
+Both are measured with asyncpg's prepared statement cache off and at the
+configured size.
+
+Needs a scratch Postgres; tables are created if missing and the benchmark's
+rows are deleted afterwards.
+
+    PARKLY_DATABASE_URL=postgresql+asyncpg://... \\
+        PYTHONPATH=src python benchmarks/repository_lookup_benchmark.py
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+from loggerizer import LogLevel
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from parkly.adapters.config import AppSettings
+from parkly.adapters.outbound.infrastructure.ulid_id_generator import (
+    FacilityIdGenerator,
+    ReservationIdGenerator,
+    SpotIdGenerator,
+    VehicleIdGenerator,
+)
+from parkly.adapters.outbound.logging.json_console_logger import JsonConsoleLogger
+from parkly.adapters.outbound.messaging.in_memory_event_publisher import (
+    InMemoryEventPublisher,
+)
+from parkly.adapters.outbound.persistence.database import (
+    create_engine,
+    create_session_factory,
+)
+from parkly.adapters.outbound.persistence.mappers import reservation_to_domain
+from parkly.adapters.outbound.persistence.orm_models import Base, ReservationORM
+from parkly.adapters.outbound.persistence.pg_reservation_repository import (
+    PgReservationRepository,
+)
+from parkly.adapters.outbound.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from parkly.domain.model.enums import ReservationStatus
+from parkly.domain.model.reservation import Reservation
+from parkly.domain.model.value_objects import Currency, Money, TimeSlot
+
+COUNT = 1_000
+LOOKUPS = 5_000
+
+_START = datetime(2026, 1, 1, 9, tzinfo=UTC)
+
+type Lookup = Callable[[Reservation], Awaitable[object]]
+
+
+def build_reservations() -> list[Reservation]:
+    reservation_ids = ReservationIdGenerator()
+    facility_id = FacilityIdGenerator().generate()
+    spot_id = SpotIdGenerator().generate()
+    vehicle_id = VehicleIdGenerator().generate()
+    cost = Money(amount=Decimal("12.50"), currency=Currency.of("USD"))
+    reservations = []
+    for i in range(COUNT):
+        start = _START + timedelta(hours=2 * i)
+        reservations.append(
+            Reservation.create(
+                reservation_id=reservation_ids.generate(),
+                facility_id=facility_id,
+                spot_id=spot_id,
+                vehicle_id=vehicle_id,
+                time_slot=TimeSlot(start=start, end=start + timedelta(hours=1)),
+                status=ReservationStatus.PENDING,
+                total_cost=cost,
+                created_at=_START,
+                occurred_at=_START,
+            )
+        )
+    return reservations
+
+
+def inline_lookups(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> dict[str, Lookup]:
+    """The lookups as they were before: a fresh select on every call."""
+
+    async def by_id(reservation: Reservation) -> object:
+        async with session_factory() as session, session.begin():
+            result = await session.execute(
+                select(ReservationORM).where(
+                    ReservationORM.ulid == reservation.id.value
+                )
+            )
+            row = result.scalar_one_or_none()
+        return None if row is None else reservation_to_domain(row)
+
+    async def by_spot_and_time(reservation: Reservation) -> object:
+        async with session_factory() as session, session.begin():
+            result = await session.execute(
+                select(ReservationORM).where(
+                    ReservationORM.spot_ulid == reservation.spot_id.value,
+                    ReservationORM.time_slot_start < reservation.time_slot.end,
+                    ReservationORM.time_slot_end > reservation.time_slot.start,
+                )
+            )
+            rows = result.scalars().all()
+        return [reservation_to_domain(r) for r in rows]
+
+    return {"find_by_id": by_id, "find_by_spot_and_time": by_spot_and_time}
+
+
+def prebuilt_lookups(repository: PgReservationRepository) -> dict[str, Lookup]:
+    async def by_id(reservation: Reservation) -> object:
+        return await repository.find_by_id(reservation.id)
+
+    async def by_spot_and_time(reservation: Reservation) -> object:
+        return await repository.find_by_spot_and_time(
+            reservation.spot_id, reservation.time_slot
+        )
+
+    return {"find_by_id": by_id, "find_by_spot_and_time": by_spot_and_time}
+
+
+async def lookups_per_second(
+    lookup: Lookup, reservations: list[Reservation]
+) -> tuple[float, float]:
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    for i in range(LOOKUPS):
+        await lookup(reservations[i % len(reservations)])
+    return (
+        LOOKUPS / (time.perf_counter() - wall),
+        LOOKUPS / (time.process_time() - cpu),
+    )
+
+
+def reservation_repository(
+    session_factory: async_sessionmaker[AsyncSession], logger: JsonConsoleLogger
+) -> PgReservationRepository:
+    uow = SqlAlchemyUnitOfWork(
+        session_factory=session_factory,
+        event_publisher=InMemoryEventPublisher(logger=logger),
+        logger=logger,
+    )
+    return PgReservationRepository(uow=uow, logger=logger)
+
+
+async def main() -> None:
+    settings = AppSettings()
+    logger = JsonConsoleLogger(level=LogLevel.WARNING)
+    reservations = build_reservations()
+
+    engine = create_engine(settings.database_url, pool_size=1, max_overflow=0)
+    session_factory = create_session_factory(engine)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    await reservation_repository(session_factory, logger).save_many(reservations)
+
+    print(
+        f"{'lookup':<24}{'statement':<10}{'ps cache':>10}"
+        f"{'lookups/s':>12}{'lookups/cpu-s':>15}"
+    )
+    try:
+        for cache_size in (0, settings.db_prepared_statement_cache_size):
+            lookup_engine = create_engine(
+                settings.database_url,
+                pool_size=1,
+                max_overflow=0,
+                prepared_statement_cache_size=cache_size,
+            )
+            lookup_sessions = create_session_factory(lookup_engine)
+            cases = {
+                "inline": inline_lookups(lookup_sessions),
+                "prebuilt": prebuilt_lookups(
+                    reservation_repository(lookup_sessions, logger)
+                ),
+            }
+            try:
+                for statement, lookups in cases.items():
+                    for name, lookup in lookups.items():
+                        wall_rate, cpu_rate = await lookups_per_second(
+                            lookup, reservations
+                        )
+                        print(
+                            f"{name:<24}{statement:<10}{cache_size:>10}"
+                            f"{wall_rate:>12.0f}{cpu_rate:>15.0f}"
+                        )
+            finally:
+                await lookup_engine.dispose()
+    finally:
+        async with session_factory() as session, session.begin():
+            await session.execute(
+                delete(ReservationORM).where(
+                    ReservationORM.ulid.in_([r.id.value for r in reservations])
+                )
+            )
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
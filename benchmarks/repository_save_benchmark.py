@@ -0,0 +1,146 @@
+"""Reservation saves per second: SELECT-then-mutate ORM save vs one upsert.
+
+Needs a scratch Postgres; tables are created if missing and the benchmark's
+rows are deleted afterwards.
+
+    PARKLY_DATABASE_URL=postgresql+asyncpg://... \\
+        PYTHONPATH=src python benchmarks/repository_save_benchmark.py
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+from loggerizer import LogLevel
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from parkly.adapters.config import AppSettings
+from parkly.adapters.outbound.infrastructure.ulid_id_generator import (
+    FacilityIdGenerator,
+    ReservationIdGenerator,
+    SpotIdGenerator,
+    VehicleIdGenerator,
+)
+from parkly.adapters.outbound.logging.json_console_logger import JsonConsoleLogger
+from parkly.adapters.outbound.messaging.in_memory_event_publisher import (
+    InMemoryEventPublisher,
+)
+from parkly.adapters.outbound.persistence.database import (
+    create_engine,
+    create_session_factory,
+)
+from parkly.adapters.outbound.persistence.mappers import reservation_to_row
+from parkly.adapters.outbound.persistence.orm_models import Base, ReservationORM
+from parkly.adapters.outbound.persistence.pg_reservation_repository import (
+    PgReservationRepository,
+)
+from parkly.adapters.outbound.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from parkly.domain.model.enums import ReservationStatus
+from parkly.domain.model.reservation import Reservation
+from parkly.domain.model.value_objects import Currency, Money, TimeSlot
+
+COUNT = 2_000
+
+_START = datetime(2026, 1, 1, 9, tzinfo=UTC)
+
+
+def build_reservations() -> list[Reservation]:
+    reservation_ids = ReservationIdGenerator()
+    facility_id = FacilityIdGenerator().generate()
+    spot_id = SpotIdGenerator().generate()
+    vehicle_id = VehicleIdGenerator().generate()
+    cost = Money(amount=Decimal("12.50"), currency=Currency.of("USD"))
+    reservations = []
+    for i in range(COUNT):
+        start = _START + timedelta(hours=2 * i)
+        reservations.append(
+            Reservation.create(
+                reservation_id=reservation_ids.generate(),
+                facility_id=facility_id,
+                spot_id=spot_id,
+                vehicle_id=vehicle_id,
+                time_slot=TimeSlot(start=start, end=start + timedelta(hours=1)),
+                status=ReservationStatus.PENDING,
+                total_cost=cost,
+                created_at=_START,
+                occurred_at=_START,
+            )
+        )
+    return reservations
+
+
+def select_then_mutate(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> Callable[[Reservation], Awaitable[None]]:
+    """The save as it was before upserts: load the row, then update or add."""
+
+    async def save(reservation: Reservation) -> None:
+        row_values = reservation_to_row(reservation)
+        async with session_factory() as session, session.begin():
+            result = await session.execute(
+                select(ReservationORM).where(
+                    ReservationORM.ulid == reservation.id.value
+                )
+            )
+            row = result.scalar_one_or_none()
+            if row is None:
+                session.add(ReservationORM(**row_values))
+            else:
+                for name, value in row_values.items():
+                    setattr(row, name, value)
+
+    return save
+
+
+async def saves_per_second(
+    save: Callable[[Reservation], Awaitable[None]], reservations: list[Reservation]
+) -> float:
+    started = time.perf_counter()
+    for reservation in reservations:
+        await save(reservation)
+    return len(reservations) / (time.perf_counter() - started)
+
+
+async def main() -> None:
+    settings = AppSettings()
+    engine = create_engine(settings.database_url, pool_size=1, max_overflow=0)
+    session_factory = create_session_factory(engine)
+    logger = JsonConsoleLogger(level=LogLevel.WARNING)
+    uow = SqlAlchemyUnitOfWork(
+        session_factory=session_factory,
+        event_publisher=InMemoryEventPublisher(logger=logger),
+        logger=logger,
+    )
+    repository = PgReservationRepository(uow=uow, logger=logger)
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    cases = {
+        "select+mutate": select_then_mutate(session_factory),
+        "upsert": repository.save,
+    }
+    created: list[str] = []
+    print(f"{'save':<16}{'inserts/s':>12}{'updates/s':>12}")
+    try:
+        for name, save in cases.items():
+            reservations = build_reservations()
+            created.extend(r.id.value for r in reservations)
+            inserts = await saves_per_second(save, reservations)
+            for reservation in reservations:
+                reservation.confirm(occurred_at=_START)
+            updates = await saves_per_second(save, reservations)
+            print(f"{name:<16}{inserts:>12.0f}{updates:>12.0f}")
+    finally:
+        async with session_factory() as session, session.begin():
+            await session.execute(
+                delete(ReservationORM).where(ReservationORM.ulid.in_(created))
+            )
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
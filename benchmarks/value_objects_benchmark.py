@@ -0,0 +1,126 @@
+"""Per-object memory and construction/hash time of value objects and typed IDs.
+
+"before" rebuilds each class as a plain frozen dataclass with the same fields
+and validation, which is how they were declared before they were slotted.
+
+    PYTHONPATH=src python benchmarks/value_objects_benchmark.py
+"""
+
+import gc
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, fields, make_dataclass
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+from parkly.domain.model.typed_ids import FacilityId, SpotId
+from parkly.domain.model.value_objects import Currency, Money, SpotNumber, TimeSlot
+
+COUNT = 100_000
+REPEAT = 5
+
+_START = datetime(2026, 1, 1, tzinfo=UTC)
+_END = _START + timedelta(hours=2)
+_ULID = "01JBZ8Q6Y3W3T0M1N6K8P2R4S5"
+
+
+def unslotted(cls: type) -> type:
+    return make_dataclass(
+        cls.__name__,
+        [(f.name, f.type) for f in fields(cls)],
+        namespace={"__post_init__": cls.__post_init__},
+        frozen=True,
+    )
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    before: Callable[[], object]
+    after: Callable[[], object]
+
+
+def build_cases() -> list[Case]:
+    old_facility_id = unslotted(FacilityId)
+    old_spot_id = unslotted(SpotId)
+    old_currency = unslotted(Currency)
+    old_money = unslotted(Money)
+    old_time_slot = unslotted(TimeSlot)
+    old_spot_number = unslotted(SpotNumber)
+    usd_before = old_currency("USD")
+    usd_after = Currency.of("USD")
+    amount = Decimal("12.50")
+
+    return [
+        Case("FacilityId", lambda: old_facility_id(_ULID), lambda: FacilityId(_ULID)),
+        Case("SpotId", lambda: old_spot_id(_ULID), lambda: SpotId(_ULID)),
+        Case("Currency", lambda: old_currency("USD"), lambda: Currency.of("USD")),
+        Case(
+            "Money",
+            lambda: old_money(amount, usd_before),
+            lambda: Money(amount, usd_after),
+        ),
+        Case(
+            "TimeSlot",
+            lambda: old_time_slot(_START, _END),
+            lambda: TimeSlot(_START, _END),
+        ),
+        Case(
+            "SpotNumber",
+            lambda: old_spot_number("A-101"),
+            lambda: SpotNumber("A-101"),
+        ),
+    ]
+
+
+def bytes_per_object(factory: Callable[[], object]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [factory() for _ in range(COUNT)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    list_overhead = objects.__sizeof__()
+    return (after - before - list_overhead) / COUNT
+
+
+def construct_ns(factory: Callable[[], object]) -> float:
+    best = min(timeit.repeat(factory, number=COUNT, repeat=REPEAT))
+    return best / COUNT * 1e9
+
+
+def hash_lookup_ns(factory: Callable[[], object]) -> float:
+    keys = [factory() for _ in range(1_000)]
+    index = dict.fromkeys(keys)
+    best = min(
+        timeit.repeat(
+            lambda: [k in index for k in keys], number=COUNT // 1_000, repeat=REPEAT
+        )
+    )
+    return best / COUNT * 1e9
+
+
+def main() -> None:
+    header = (
+        f"{'class':<12}"
+        f"{'bytes before':>14}{'bytes after':>13}"
+        f"{'ns/new before':>15}{'ns/new after':>14}"
+        f"{'ns/hash before':>16}{'ns/hash after':>15}"
+    )
+    print(header)
+    print("-" * len(header))
+    for case in build_cases():
+        print(
+            f"{case.name:<12}"
+            f"{bytes_per_object(case.before):>14.1f}"
+            f"{bytes_per_object(case.after):>13.1f}"
+            f"{construct_ns(case.before):>15.1f}"
+            f"{construct_ns(case.after):>14.1f}"
+            f"{hash_lookup_ns(case.before):>16.1f}"
+            f"{hash_lookup_ns(case.after):>15.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
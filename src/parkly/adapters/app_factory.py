@@ -1,10 +1,20 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
+from sqlalchemy.exc import SQLAlchemyError
 
 from parkly.adapters.config import AppSettings
 from parkly.adapters.container import Container
 from parkly.adapters.inbound.api.exception_handlers import register_exception_handlers
 from parkly.adapters.inbound.api.facilities_router import create_facilities_router
-from parkly.adapters.inbound.api.middleware import RequestLoggingMiddleware
+from parkly.adapters.inbound.api.health_router import create_health_router
+from parkly.adapters.inbound.api.middleware import (
+    ReadYourWritesMiddleware,
+    RequestLoggingMiddleware,
+)
+from parkly.adapters.inbound.api.quotes_router import create_quotes_router
 from parkly.adapters.inbound.api.reservations_router import create_reservations_router
 from parkly.adapters.inbound.api.sessions_router import create_sessions_router
 from parkly.adapters.inbound.api.vehicles_router import create_vehicles_router
@@ -22,24 +32,74 @@ TAGS_METADATA: list[dict[str, str]] = [
         "name": "Sessions",
         "description": "Parking session management. Start a session on entry, extend mid-session, and end on exit with cost calculation.",
     },
+    {
+        "name": "Quotes",
+        "description": "Price quotes. Price many time slots in one request without creating reservations.",
+    },
     {
         "name": "Vehicles",
         "description": "Vehicle registration. Register vehicles with license plate, type, and EV status. List vehicles by owner.",
     },
+    {
+        "name": "Health",
+        "description": "Readiness probe with database connection pool telemetry.",
+    },
 ]
 
 
+async def _refresh_facility_locator(container: Container, interval: float) -> None:
+    """Pick up facilities created by other processes, which raise no local event."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await container.facility_locator.refresh()
+        except (SQLAlchemyError, OSError) as exc:
+            container.logger.warning(
+                "Facility locator refresh failed",
+                extra={"error": str(exc)},
+            )
+
+
 def create_app(settings: AppSettings | None = None) -> FastAPI:
     resolved_settings: AppSettings = settings or AppSettings()
     container: Container = Container(resolved_settings)
 
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        try:
+            await container.facility_locator.load()
+        except (SQLAlchemyError, OSError) as exc:
+            # Location searches run in SQL until a refresh loads the index.
+            container.logger.warning(
+                "Facility locator warm-up failed",
+                extra={"error": str(exc)},
+            )
+        refresher: asyncio.Task[None] | None = None
+        if resolved_settings.facility_locator_refresh_seconds > 0:
+            refresher = asyncio.create_task(
+                _refresh_facility_locator(
+                    container, resolved_settings.facility_locator_refresh_seconds
+                )
+            )
+        yield
+        if refresher is not None:
+            refresher.cancel()
+            with suppress(asyncio.CancelledError):
+                await refresher
+
     app: FastAPI = FastAPI(
+        lifespan=lifespan,
         title=resolved_settings.app_name,
         version=resolved_settings.app_version,
         description="Parking management platform supporting all vehicle types, reservations, dynamic pricing, real-time availability, and multi-method access control.",
         openapi_tags=TAGS_METADATA,
     )
 
+    if resolved_settings.database_read_url:
+        app.add_middleware(
+            ReadYourWritesMiddleware,
+            window_seconds=resolved_settings.read_your_writes_seconds,
+        )
     app.add_middleware(RequestLoggingMiddleware, logger=container.logger)
     register_exception_handlers(app, container.logger)
 
@@ -47,6 +107,8 @@ def create_app(settings: AppSettings | None = None) -> FastAPI:
     app.include_router(create_reservations_router(container), prefix="/api/v1")
     app.include_router(create_sessions_router(container), prefix="/api/v1")
     app.include_router(create_vehicles_router(container), prefix="/api/v1")
+    app.include_router(create_quotes_router(container), prefix="/api/v1")
+    app.include_router(create_health_router(container))
 
     container.logger.info(
         "Application started",
@@ -1,3 +1,5 @@
+from decimal import Decimal
+
 from pydantic_settings import BaseSettings
 
 
@@ -14,3 +16,27 @@ class AppSettings(BaseSettings):
     db_echo: bool = False
     db_pool_size: int = 5
     db_max_overflow: int = 10
+    db_prepared_statement_cache_size: int = 500
+    db_pool_timeout_seconds: float = 30.0
+    db_pool_adaptive: bool = False
+    db_pool_min_concurrency: int = 2
+    db_pool_target_wait_ms: float = 20.0
+    db_pool_saturation_window_seconds: float = 30.0
+    database_read_url: str | None = None
+    db_read_pool_size: int = 5
+    db_read_max_overflow: int = 10
+    db_max_concurrent_streams: int = 2
+    read_your_writes_seconds: int = 5
+    facility_timezone: str = "UTC"
+    peak_pricing_multiplier: Decimal | None = None
+    peak_pricing_start_hour: int = 8
+    peak_pricing_end_hour: int = 18
+    quote_cache_size: int = 10_000
+    quote_cache_ttl_seconds: int = 300
+    facility_cache_max_weight: int = 100_000
+    vehicle_cache_max_weight: int = 50_000
+    aggregate_cache_ttl_seconds: int = 30
+    aggregate_cache_negative_ttl_seconds: int = 5
+    availability_index_max_facilities: int = 1_000
+    availability_index_ttl_seconds: int = 300
+    facility_locator_refresh_seconds: float = 60.0
@@ -1,6 +1,21 @@
+from datetime import timedelta
+from zoneinfo import ZoneInfo
+
 from loggerizer import LogLevel
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from parkly.adapters.config import AppSettings
+from parkly.adapters.outbound.caching.aggregate_cache import AggregateCache
+from parkly.adapters.outbound.caching.cache_invalidation import InvalidateCacheOnEvent
+from parkly.adapters.outbound.caching.cached_parking_facility_repository import (
+    CachedParkingFacilityRepository,
+    FacilitySnapshot,
+    facility_weight,
+)
+from parkly.adapters.outbound.caching.cached_vehicle_repository import (
+    CachedVehicleRepository,
+    VehicleSnapshot,
+)
 from parkly.adapters.outbound.infrastructure.system_clock import SystemClock
 from parkly.adapters.outbound.infrastructure.ulid_id_generator import (
     FacilityIdGenerator,
@@ -13,10 +28,14 @@ from parkly.adapters.outbound.logging.json_console_logger import JsonConsoleLogg
 from parkly.adapters.outbound.messaging.in_memory_event_publisher import (
     InMemoryEventPublisher,
 )
+from parkly.adapters.outbound.persistence.adaptive_limiter import AdaptiveLimiter
 from parkly.adapters.outbound.persistence.database import (
     create_engine,
     create_session_factory,
 )
+from parkly.adapters.outbound.persistence.pg_facility_read_model import (
+    PgFacilityReadModel,
+)
 from parkly.adapters.outbound.persistence.pg_parking_facility_repository import (
     PgParkingFacilityRepository,
 )
@@ -29,8 +48,11 @@ from parkly.adapters.outbound.persistence.pg_reservation_repository import (
 from parkly.adapters.outbound.persistence.pg_vehicle_repository import (
     PgVehicleRepository,
 )
+from parkly.adapters.outbound.persistence.pool_monitor import PoolMonitor
+from parkly.adapters.outbound.persistence.unit_of_work import SqlAlchemyUnitOfWork
 from parkly.application.command.activate_reservation import ActivateReservationHandler
 from parkly.application.command.add_parking_spot import AddParkingSpotHandler
+from parkly.application.command.add_parking_spots import AddParkingSpotsHandler
 from parkly.application.command.cancel_reservation import CancelReservationHandler
 from parkly.application.command.complete_reservation import CompleteReservationHandler
 from parkly.application.command.confirm_reservation import ConfirmReservationHandler
@@ -48,16 +70,35 @@ from parkly.application.command.remove_parking_spot import RemoveParkingSpotHand
 from parkly.application.command.start_parking_session import (
     StartParkingSessionHandler,
 )
+from parkly.application.event_handler.on_availability_changed import (
+    OnAvailabilityChangedUpdateIndex,
+)
+from parkly.application.event_handler.on_facility_created import (
+    OnFacilityCreatedIndexLocation,
+)
 from parkly.application.event_handler.on_reservation_cancelled import (
     OnReservationCancelledReleaseSpot,
 )
 from parkly.application.event_handler.on_session_ended import (
     OnSessionEndedReleaseSpot,
 )
+from parkly.application.port.facility_read_model import FacilityReadModel
+from parkly.application.query.export_facility_reservations import (
+    ExportFacilityReservationsHandler,
+)
+from parkly.application.query.export_facility_sessions import (
+    ExportFacilitySessionsHandler,
+)
 from parkly.application.query.find_available_spots import FindAvailableSpotsHandler
 from parkly.application.query.find_facilities_by_location import (
     FindFacilitiesByLocationHandler,
 )
+from parkly.application.query.find_facility_summaries import (
+    FindFacilitySummariesHandler,
+)
+from parkly.application.query.get_availability_grid import (
+    GetAvailabilityGridHandler,
+)
 from parkly.application.query.get_facility_details import GetFacilityDetailsHandler
 from parkly.application.query.get_reservation_details import (
     GetReservationDetailsHandler,
@@ -68,13 +109,34 @@ from parkly.application.query.list_vehicle_reservations import (
     ListVehicleReservationsHandler,
 )
 from parkly.application.query.list_vehicle_sessions import ListVehicleSessionsHandler
-from parkly.domain.event.events import ReservationCancelled, SessionEnded
+from parkly.application.query.quote_prices import QuotePricesHandler
+from parkly.application.service.availability_index import AvailabilityIndex
+from parkly.application.service.facility_locator import FacilityLocator
+from parkly.domain.event.events import (
+    FacilityCreated,
+    ReservationCancelled,
+    ReservationCompleted,
+    ReservationCreated,
+    ReservationExtended,
+    SessionEnded,
+    SessionStarted,
+    SpotAdded,
+    SpotRemoved,
+    VehicleRegistered,
+)
+from parkly.domain.model.config import PeakHourPricingConfig
+from parkly.domain.model.typed_ids import FacilityId, VehicleId
 from parkly.domain.port.parking_facility_repository import ParkingFacilityRepository
 from parkly.domain.port.parking_session_repository import ParkingSessionRepository
 from parkly.domain.port.reservation_repository import ReservationRepository
 from parkly.domain.port.vehicle_repository import VehicleRepository
 from parkly.domain.service.pricing_service import PricingService
-from parkly.domain.service.pricing_strategy import StaticPricing
+from parkly.domain.service.pricing_strategy import (
+    PricingStrategy,
+    StaticPricing,
+    TimeOfDayPricing,
+)
+from parkly.domain.service.quote_cache import QuoteCache
 
 
 class Container:
@@ -93,8 +155,41 @@ class Container:
             echo=settings.db_echo,
             pool_size=settings.db_pool_size,
             max_overflow=settings.db_max_overflow,
+            prepared_statement_cache_size=settings.db_prepared_statement_cache_size,
+            pool_timeout=settings.db_pool_timeout_seconds,
         )
         self.session_factory = create_session_factory(self.engine)
+        max_concurrency = settings.db_pool_size + settings.db_max_overflow
+        self.pool_limiter: AdaptiveLimiter | None = (
+            AdaptiveLimiter(
+                min_limit=min(settings.db_pool_min_concurrency, max_concurrency),
+                max_limit=max_concurrency,
+                target_wait=settings.db_pool_target_wait_ms / 1000,
+            )
+            if settings.db_pool_adaptive
+            else None
+        )
+        self.pool_monitor: PoolMonitor = PoolMonitor(
+            engine=self.engine,
+            logger=self.logger,
+            limiter=self.pool_limiter,
+            saturation_window=settings.db_pool_saturation_window_seconds,
+        )
+        # Reads outside a unit of work use the replica when one is configured.
+        self.read_engine: AsyncEngine | None = None
+        self.read_session_factory: async_sessionmaker[AsyncSession] | None = None
+        if settings.database_read_url:
+            self.read_engine = create_engine(
+                database_url=settings.database_read_url,
+                echo=settings.db_echo,
+                pool_size=settings.db_read_pool_size,
+                max_overflow=settings.db_read_max_overflow,
+                prepared_statement_cache_size=(
+                    settings.db_prepared_statement_cache_size
+                ),
+                pool_timeout=settings.db_pool_timeout_seconds,
+            )
+            self.read_session_factory = create_session_factory(self.read_engine)
 
         # ID generators
         self.facility_id_generator: FacilityIdGenerator = FacilityIdGenerator()
@@ -103,26 +198,123 @@ class Container:
         self.vehicle_id_generator: VehicleIdGenerator = VehicleIdGenerator()
         self.session_id_generator: SessionIdGenerator = SessionIdGenerator()
 
+        # Event publisher
+        self.event_publisher: InMemoryEventPublisher = InMemoryEventPublisher(
+            logger=self.logger
+        )
+
+        # Unit of work
+        self.uow: SqlAlchemyUnitOfWork = SqlAlchemyUnitOfWork(
+            session_factory=self.session_factory,
+            event_publisher=self.event_publisher,
+            logger=self.logger,
+            read_session_factory=self.read_session_factory,
+            limiter=self.pool_limiter,
+            max_streams=settings.db_max_concurrent_streams,
+        )
+
         # Repositories
         self.facility_repo: ParkingFacilityRepository = PgParkingFacilityRepository(
-            session_factory=self.session_factory, logger=self.logger
+            uow=self.uow, logger=self.logger
         )
         self.reservation_repo: ReservationRepository = PgReservationRepository(
-            session_factory=self.session_factory, logger=self.logger
+            uow=self.uow, logger=self.logger
         )
         self.session_repo: ParkingSessionRepository = PgParkingSessionRepository(
-            session_factory=self.session_factory, logger=self.logger
+            uow=self.uow, logger=self.logger
         )
         self.vehicle_repo: VehicleRepository = PgVehicleRepository(
-            session_factory=self.session_factory, logger=self.logger
+            uow=self.uow, logger=self.logger
+        )
+
+        # Aggregate caches
+        self.facility_cache: AggregateCache[FacilityId, FacilitySnapshot] | None = (
+            AggregateCache(
+                max_weight=settings.facility_cache_max_weight,
+                ttl=timedelta(seconds=settings.aggregate_cache_ttl_seconds),
+                negative_ttl=timedelta(
+                    seconds=settings.aggregate_cache_negative_ttl_seconds
+                ),
+                clock=self.clock,
+                weigh=facility_weight,
+                replica_lag=timedelta(seconds=settings.read_your_writes_seconds),
+            )
+            if settings.facility_cache_max_weight > 0
+            else None
+        )
+        if self.facility_cache is not None:
+            self.facility_repo = CachedParkingFacilityRepository(
+                inner=self.facility_repo,
+                cache=self.facility_cache,
+                uow=self.uow,
+                logger=self.logger,
+            )
+        self.vehicle_cache: AggregateCache[VehicleId, VehicleSnapshot] | None = (
+            AggregateCache(
+                max_weight=settings.vehicle_cache_max_weight,
+                ttl=timedelta(seconds=settings.aggregate_cache_ttl_seconds),
+                negative_ttl=timedelta(
+                    seconds=settings.aggregate_cache_negative_ttl_seconds
+                ),
+                clock=self.clock,
+                weigh=lambda _: 1,
+                replica_lag=timedelta(seconds=settings.read_your_writes_seconds),
+            )
+            if settings.vehicle_cache_max_weight > 0
+            else None
+        )
+        if self.vehicle_cache is not None:
+            self.vehicle_repo = CachedVehicleRepository(
+                inner=self.vehicle_repo,
+                cache=self.vehicle_cache,
+                uow=self.uow,
+                logger=self.logger,
+            )
+
+        # Read models
+        self.facility_read_model: FacilityReadModel = PgFacilityReadModel(
+            uow=self.uow, logger=self.logger
         )
 
         # Domain services
-        self.pricing_service: PricingService = PricingService(strategy=StaticPricing())
+        self.quote_cache: QuoteCache | None = (
+            QuoteCache(
+                max_entries=settings.quote_cache_size,
+                ttl=timedelta(seconds=settings.quote_cache_ttl_seconds),
+                clock=self.clock,
+            )
+            if settings.quote_cache_size > 0
+            else None
+        )
+        # Peak hours are read in the facilities' local time.
+        self.pricing_strategy: PricingStrategy = (
+            TimeOfDayPricing(
+                PeakHourPricingConfig(
+                    peak_start_hour=settings.peak_pricing_start_hour,
+                    peak_end_hour=settings.peak_pricing_end_hour,
+                    peak_multiplier=settings.peak_pricing_multiplier,
+                ),
+                ZoneInfo(settings.facility_timezone),
+            )
+            if settings.peak_pricing_multiplier is not None
+            else StaticPricing()
+        )
+        self.pricing_service: PricingService = PricingService(
+            strategy=self.pricing_strategy, cache=self.quote_cache
+        )
 
-        # Event publisher
-        self.event_publisher: InMemoryEventPublisher = InMemoryEventPublisher(
-            logger=self.logger
+        # Application services
+        self.availability_index: AvailabilityIndex = AvailabilityIndex(
+            facility_repo=self.facility_repo,
+            reservation_repo=self.reservation_repo,
+            session_repo=self.session_repo,
+            clock=self.clock,
+            logger=self.logger,
+            max_facilities=settings.availability_index_max_facilities,
+            ttl=timedelta(seconds=settings.availability_index_ttl_seconds),
+        )
+        self.facility_locator: FacilityLocator = FacilityLocator(
+            facility_repo=self.facility_repo, logger=self.logger
         )
 
         # Command handlers
@@ -131,7 +323,7 @@ class Container:
                 facility_repo=self.facility_repo,
                 id_generator=self.facility_id_generator,
                 clock=self.clock,
-                event_publisher=self.event_publisher,
+                uow=self.uow,
                 logger=self.logger,
             )
         )
@@ -139,14 +331,21 @@ class Container:
             facility_repo=self.facility_repo,
             id_generator=self.spot_id_generator,
             clock=self.clock,
-            event_publisher=self.event_publisher,
+            uow=self.uow,
+            logger=self.logger,
+        )
+        self.add_parking_spots_handler: AddParkingSpotsHandler = AddParkingSpotsHandler(
+            facility_repo=self.facility_repo,
+            id_generator=self.spot_id_generator,
+            clock=self.clock,
+            uow=self.uow,
             logger=self.logger,
         )
         self.remove_parking_spot_handler: RemoveParkingSpotHandler = (
             RemoveParkingSpotHandler(
                 facility_repo=self.facility_repo,
                 clock=self.clock,
-                event_publisher=self.event_publisher,
+                uow=self.uow,
                 logger=self.logger,
             )
         )
@@ -154,7 +353,7 @@ class Container:
             vehicle_repo=self.vehicle_repo,
             id_generator=self.vehicle_id_generator,
             clock=self.clock,
-            event_publisher=self.event_publisher,
+            uow=self.uow,
             logger=self.logger,
         )
         self.create_reservation_handler: CreateReservationHandler = (
@@ -165,7 +364,7 @@ class Container:
                 id_generator=self.reservation_id_generator,
                 pricing_service=self.pricing_service,
                 clock=self.clock,
-                event_publisher=self.event_publisher,
+                uow=self.uow,
                 logger=self.logger,
             )
         )
@@ -173,7 +372,7 @@ class Container:
             ConfirmReservationHandler(
                 reservation_repo=self.reservation_repo,
                 clock=self.clock,
-                event_publisher=self.event_publisher,
+                uow=self.uow,
                 logger=self.logger,
             )
         )
@@ -181,7 +380,7 @@ class Container:
             ActivateReservationHandler(
                 reservation_repo=self.reservation_repo,
                 clock=self.clock,
-                event_publisher=self.event_publisher,
+                uow=self.uow,
                 logger=self.logger,
             )
         )
@@ -189,7 +388,7 @@ class Container:
             CompleteReservationHandler(
                 reservation_repo=self.reservation_repo,
                 clock=self.clock,
-                event_publisher=self.event_publisher,
+                uow=self.uow,
                 logger=self.logger,
             )
         )
@@ -197,14 +396,15 @@ class Container:
             CancelReservationHandler(
                 reservation_repo=self.reservation_repo,
                 clock=self.clock,
-                event_publisher=self.event_publisher,
+                uow=self.uow,
                 logger=self.logger,
             )
         )
         self.extend_reservation_handler: ExtendReservationHandler = (
             ExtendReservationHandler(
                 reservation_repo=self.reservation_repo,
-                event_publisher=self.event_publisher,
+                clock=self.clock,
+                uow=self.uow,
                 logger=self.logger,
             )
         )
@@ -214,7 +414,7 @@ class Container:
                 facility_repo=self.facility_repo,
                 id_generator=self.session_id_generator,
                 clock=self.clock,
-                event_publisher=self.event_publisher,
+                uow=self.uow,
                 logger=self.logger,
             )
         )
@@ -222,7 +422,7 @@ class Container:
             ExtendParkingSessionHandler(
                 session_repo=self.session_repo,
                 clock=self.clock,
-                event_publisher=self.event_publisher,
+                uow=self.uow,
                 logger=self.logger,
             )
         )
@@ -230,7 +430,7 @@ class Container:
             EndParkingSessionHandler(
                 session_repo=self.session_repo,
                 clock=self.clock,
-                event_publisher=self.event_publisher,
+                uow=self.uow,
                 logger=self.logger,
             )
         )
@@ -239,6 +439,13 @@ class Container:
         self.find_available_spots_handler: FindAvailableSpotsHandler = (
             FindAvailableSpotsHandler(
                 facility_repo=self.facility_repo,
+                availability_index=self.availability_index,
+                logger=self.logger,
+            )
+        )
+        self.get_availability_grid_handler: GetAvailabilityGridHandler = (
+            GetAvailabilityGridHandler(
+                availability_index=self.availability_index,
                 logger=self.logger,
             )
         )
@@ -278,19 +485,43 @@ class Container:
                 logger=self.logger,
             )
         )
+        self.export_sessions_handler: ExportFacilitySessionsHandler = (
+            ExportFacilitySessionsHandler(
+                session_repo=self.session_repo,
+                logger=self.logger,
+            )
+        )
+        self.export_reservations_handler: ExportFacilityReservationsHandler = (
+            ExportFacilityReservationsHandler(
+                reservation_repo=self.reservation_repo,
+                logger=self.logger,
+            )
+        )
         self.find_facilities_by_location_handler: FindFacilitiesByLocationHandler = (
             FindFacilitiesByLocationHandler(
                 facility_repo=self.facility_repo,
+                facility_locator=self.facility_locator,
                 logger=self.logger,
             )
         )
+        self.find_facility_summaries_handler: FindFacilitySummariesHandler = (
+            FindFacilitySummariesHandler(
+                read_model=self.facility_read_model,
+                logger=self.logger,
+            )
+        )
+
+        self.quote_prices_handler: QuotePricesHandler = QuotePricesHandler(
+            pricing_service=self.pricing_service,
+            logger=self.logger,
+        )
 
         # Event handlers
         on_reservation_cancelled: OnReservationCancelledReleaseSpot = (
             OnReservationCancelledReleaseSpot(
                 reservation_repo=self.reservation_repo,
                 facility_repo=self.facility_repo,
-                event_publisher=self.event_publisher,
+                uow=self.uow,
                 logger=self.logger,
             )
         )
@@ -299,13 +530,56 @@ class Container:
             facility_repo=self.facility_repo,
             reservation_repo=self.reservation_repo,
             clock=self.clock,
-            event_publisher=self.event_publisher,
+            uow=self.uow,
             logger=self.logger,
         )
+        on_availability_changed: OnAvailabilityChangedUpdateIndex = (
+            OnAvailabilityChangedUpdateIndex(
+                availability_index=self.availability_index,
+                logger=self.logger,
+            )
+        )
         self.event_publisher.register_handler(
             ReservationCancelled, on_reservation_cancelled
         )
         self.event_publisher.register_handler(SessionEnded, on_session_ended)
+        for event_type in (
+            SpotAdded,
+            SpotRemoved,
+            ReservationCreated,
+            ReservationExtended,
+            ReservationCancelled,
+            ReservationCompleted,
+            SessionStarted,
+            SessionEnded,
+        ):
+            self.event_publisher.register_handler(event_type, on_availability_changed)
+        self.event_publisher.register_handler(
+            FacilityCreated,
+            OnFacilityCreatedIndexLocation(
+                facility_locator=self.facility_locator, logger=self.logger
+            ),
+        )
+
+        if self.facility_cache is not None:
+            for event_type in (FacilityCreated, SpotAdded, SpotRemoved):
+                self.event_publisher.register_handler(
+                    event_type,
+                    InvalidateCacheOnEvent(
+                        cache=self.facility_cache,
+                        key_of=lambda event: event.facility_id,
+                        logger=self.logger,
+                    ),
+                )
+        if self.vehicle_cache is not None:
+            self.event_publisher.register_handler(
+                VehicleRegistered,
+                InvalidateCacheOnEvent(
+                    cache=self.vehicle_cache,
+                    key_of=lambda event: event.vehicle_id,
+                    logger=self.logger,
+                ),
+            )
 
         self.logger.info(
             "Container initialized",
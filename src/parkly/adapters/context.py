@@ -1,4 +1,18 @@
 from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import Any
 
 request_context: ContextVar[dict[str, Any]] = ContextVar("request_context", default={})
+
+
+@dataclass
+class ReadConsistency:
+    """Where a request's reads go; ``wrote`` is set once it commits a write."""
+
+    use_primary: bool = False
+    wrote: bool = False
+
+
+read_consistency: ContextVar[ReadConsistency | None] = ContextVar(
+    "read_consistency", default=None
+)
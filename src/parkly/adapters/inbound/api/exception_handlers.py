@@ -11,6 +11,7 @@ from parkly.domain.exception.exceptions import (
     CapacityExceededError,
     DomainException,
     DomainValidationError,
+    InvalidCursorError,
     InvalidOperationError,
     SpotNotAvailableError,
 )
@@ -35,6 +36,13 @@ def register_exception_handlers(app: FastAPI, logger: Logger) -> None:
     async def not_found_handler(request: Request, exc: NotFoundError) -> JSONResponse:
         return _error_response(404, exc, logger)
 
+    @app.exception_handler(InvalidCursorError)
+    async def invalid_cursor_handler(
+        request: Request, exc: InvalidCursorError
+    ) -> JSONResponse:
+        # A cursor the server did not issue is a bad request, not bad data.
+        return _error_response(400, exc, logger)
+
     @app.exception_handler(DomainValidationError)
     async def validation_handler(
         request: Request, exc: DomainValidationError
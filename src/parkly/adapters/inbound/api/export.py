@@ -0,0 +1,66 @@
+import csv
+import io
+from collections.abc import AsyncIterator
+from typing import Literal
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+type ExportFormat = Literal["ndjson", "csv"]
+
+# Records serialized into one chunk: large enough to keep per-write overhead
+# low, small enough that a chunk stays a few hundred kilobytes.
+CHUNK_RECORDS = 500
+
+_MEDIA_TYPES: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+async def _ndjson_chunks(records: AsyncIterator[BaseModel]) -> AsyncIterator[str]:
+    lines: list[str] = []
+    async for record in records:
+        lines.append(record.model_dump_json())
+        if len(lines) == CHUNK_RECORDS:
+            yield "\n".join(lines) + "\n"
+            lines.clear()
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+async def _csv_chunks(
+    records: AsyncIterator[BaseModel], model: type[BaseModel]
+) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(model.model_fields))
+    writer.writeheader()
+    count = 0
+    async for record in records:
+        writer.writerow(record.model_dump(mode="json"))
+        count += 1
+        if count % CHUNK_RECORDS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def export_response(
+    records: AsyncIterator[object],
+    model: type[BaseModel],
+    export_format: ExportFormat,
+    filename: str,
+) -> StreamingResponse:
+    """Streams DTOs shaped like ``model`` as NDJSON or CSV, chunk by chunk."""
+    models = (model.model_validate(r, from_attributes=True) async for r in records)
+    chunks = (
+        _csv_chunks(models, model) if export_format == "csv" else _ndjson_chunks(models)
+    )
+    return StreamingResponse(
+        chunks,
+        media_type=_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{export_format}"'
+        },
+    )
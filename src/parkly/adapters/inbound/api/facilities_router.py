@@ -1,31 +1,66 @@
 from __future__ import annotations
 
+import csv
+import io
 from datetime import datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from fastapi import APIRouter, Query, Response
+from fastapi import APIRouter, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 
 from parkly.adapters.inbound.api.schemas import (
     AddSpotRequest,
+    AddSpotsRequest,
+    AvailabilityBucketResponse,
+    AvailabilityGridResponse,
+    CreatedManyResponse,
     CreatedResponse,
     CreateFacilityRequest,
     ErrorResponse,
     FacilityResponse,
+    FacilitySummaryResponse,
     SpotResponse,
 )
 from parkly.application.command.add_parking_spot import AddParkingSpot
+from parkly.application.command.add_parking_spots import AddParkingSpots, NewSpot
 from parkly.application.command.create_parking_facility import CreateParkingFacility
 from parkly.application.command.remove_parking_spot import RemoveParkingSpot
 from parkly.application.query.find_available_spots import FindAvailableSpots
 from parkly.application.query.find_facilities_by_location import (
     FindFacilitiesByLocation,
 )
+from parkly.application.query.find_facility_summaries import FindFacilitySummaries
+from parkly.application.query.get_availability_grid import GetAvailabilityGrid
 from parkly.application.query.get_facility_details import GetFacilityDetails
 
 if TYPE_CHECKING:
     from parkly.adapters.container import Container
 
+_ADD_SPOTS_BODY = AddSpotsRequest.model_json_schema(
+    ref_template="#/components/schemas/{model}"
+)
+_ADD_SPOTS_BODY.pop("$defs", None)
+
+
+async def _parse_spots(request: Request) -> AddSpotsRequest:
+    body = await request.body()
+    try:
+        if request.headers.get("content-type", "").startswith("text/csv"):
+            reader = csv.DictReader(io.StringIO(body.decode("utf-8-sig")))
+            # Empty cells fall back to the field defaults.
+            rows = [{k: v for k, v in row.items() if k and v} for row in reader]
+            return AddSpotsRequest.model_validate(rows)
+        return AddSpotsRequest.model_validate_json(body)
+    except (ValidationError, UnicodeDecodeError, csv.Error) as exc:
+        errors = (
+            exc.errors()
+            if isinstance(exc, ValidationError)
+            else [{"type": "value_error", "loc": ("body",), "msg": str(exc)}]
+        )
+        raise RequestValidationError(errors) from exc
+
 
 def create_facilities_router(container: Container) -> APIRouter:
     router: APIRouter = APIRouter(prefix="/facilities", tags=["Facilities"])
@@ -53,6 +88,49 @@ def create_facilities_router(container: Container) -> APIRouter:
         )
         return CreatedResponse(id=facility_id)
 
+    @router.get(
+        "/summaries",
+        response_model=list[FacilitySummaryResponse],
+        summary="Find facility summaries by location",
+        description="Lightweight search for map views: name, location, distance and spot counts per type and status, nearest first. Use GET /facilities/{facility_id} for the full spot list.",
+    )
+    async def find_facility_summaries(
+        latitude: str = Query(..., description="GPS latitude", examples=["40.7128"]),
+        longitude: str = Query(..., description="GPS longitude", examples=["-74.0060"]),
+        address: str = Query("", description="Optional address filter"),
+        radius_km: str = Query(
+            "10", description="Search radius in kilometers", examples=["10"]
+        ),
+        limit: int | None = Query(
+            None,
+            ge=1,
+            description="Return only the closest facilities, nearest first",
+            examples=[20],
+        ),
+    ) -> list[FacilitySummaryResponse]:
+        query: FindFacilitySummaries = FindFacilitySummaries(
+            latitude=Decimal(latitude),
+            longitude=Decimal(longitude),
+            address=address,
+            radius_km=Decimal(radius_km),
+            limit=limit,
+        )
+        dtos = await container.find_facility_summaries_handler.handle(query)
+        return [
+            FacilitySummaryResponse(
+                facility_id=dto.facility_id,
+                name=dto.name,
+                latitude=dto.latitude,
+                longitude=dto.longitude,
+                address=dto.address,
+                facility_type=dto.facility_type,
+                total_capacity=dto.total_capacity,
+                distance_km=dto.distance_km,
+                spot_counts=dto.spot_counts,
+            )
+            for dto in dtos
+        ]
+
     @router.get(
         "/{facility_id}",
         response_model=FacilityResponse,
@@ -89,7 +167,7 @@ def create_facilities_router(container: Container) -> APIRouter:
         "",
         response_model=list[FacilityResponse],
         summary="Find facilities by location",
-        description="Search for parking facilities within a radius of the given GPS coordinates.",
+        description="Search for parking facilities within a radius of the given GPS coordinates, nearest first.",
     )
     async def find_facilities_by_location(
         latitude: str = Query(..., description="GPS latitude", examples=["40.7128"]),
@@ -98,12 +176,19 @@ def create_facilities_router(container: Container) -> APIRouter:
         radius_km: str = Query(
             "10", description="Search radius in kilometers", examples=["10"]
         ),
+        limit: int | None = Query(
+            None,
+            ge=1,
+            description="Return only the closest facilities, nearest first",
+            examples=[20],
+        ),
     ) -> list[FacilityResponse]:
         query: FindFacilitiesByLocation = FindFacilitiesByLocation(
             latitude=Decimal(latitude),
             longitude=Decimal(longitude),
             address=address,
             radius_km=Decimal(radius_km),
+            limit=limit,
         )
         dtos = await container.find_facilities_by_location_handler.handle(query)
         return [
@@ -151,6 +236,48 @@ def create_facilities_router(container: Container) -> APIRouter:
         spot_id: str = await container.add_parking_spot_handler.handle(command)
         return CreatedResponse(id=spot_id)
 
+    @router.post(
+        "/{facility_id}/spots:batch",
+        status_code=201,
+        response_model=CreatedManyResponse,
+        summary="Add parking spots in bulk",
+        description="Add many spots to a facility in one request, as a JSON array or as CSV with a spot_number,spot_type,status header. All spots are added or none.",
+        responses={
+            404: {"model": ErrorResponse, "description": "Facility not found"},
+            409: {"model": ErrorResponse, "description": "Capacity exceeded"},
+            422: {"model": ErrorResponse, "description": "Validation error"},
+        },
+        openapi_extra={
+            "requestBody": {
+                "required": True,
+                "content": {
+                    "application/json": {"schema": _ADD_SPOTS_BODY},
+                    "text/csv": {
+                        "schema": {"type": "string"},
+                        "example": "spot_number,spot_type,status\n"
+                        "A-101,standard,available\n"
+                        "A-102,ev_charging,available\n",
+                    },
+                },
+            }
+        },
+    )
+    async def add_spots(facility_id: str, request: Request) -> CreatedManyResponse:
+        body = await _parse_spots(request)
+        command: AddParkingSpots = AddParkingSpots(
+            facility_id=facility_id,
+            spots=[
+                NewSpot(
+                    spot_number=s.spot_number,
+                    spot_type=s.spot_type,
+                    status=s.status,
+                )
+                for s in body.root
+            ],
+        )
+        spot_ids = await container.add_parking_spots_handler.handle(command)
+        return CreatedManyResponse(ids=spot_ids)
+
     @router.delete(
         "/{facility_id}/spots/{spot_id}",
         status_code=204,
@@ -207,4 +334,42 @@ def create_facilities_router(container: Container) -> APIRouter:
             for s in dtos
         ]
 
+    @router.get(
+        "/{facility_id}/availability",
+        response_model=AvailabilityGridResponse,
+        summary="Get the availability grid",
+        description="Count free spots in a facility for every 15-minute bucket of a window of up to 48 hours, optionally filtered by spot type.",
+        responses={
+            404: {"model": ErrorResponse, "description": "Facility not found"},
+            422: {"model": ErrorResponse, "description": "Validation error"},
+        },
+    )
+    async def get_availability_grid(
+        facility_id: str,
+        window_start: datetime = Query(
+            ..., description="Start of the window (ISO 8601)"
+        ),
+        window_end: datetime = Query(..., description="End of the window (ISO 8601)"),
+        spot_type: str | None = Query(
+            None,
+            description="Filter by spot type: standard, ev_charging, handicapped, motorcycle, oversized, bicycle",
+        ),
+    ) -> AvailabilityGridResponse:
+        query: GetAvailabilityGrid = GetAvailabilityGrid(
+            facility_id=facility_id,
+            window_start=window_start,
+            window_end=window_end,
+            spot_type=spot_type,
+        )
+        dto = await container.get_availability_grid_handler.handle(query)
+        return AvailabilityGridResponse(
+            facility_id=dto.facility_id,
+            spot_type=dto.spot_type,
+            bucket_minutes=dto.bucket_minutes,
+            buckets=[
+                AvailabilityBucketResponse(start=b.start, free_spots=b.free_spots)
+                for b in dto.buckets
+            ],
+        )
+
     return router
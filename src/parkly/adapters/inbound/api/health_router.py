@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from fastapi import APIRouter, Response
+
+from parkly.adapters.inbound.api.schemas import PoolStatsResponse, ReadinessResponse
+
+if TYPE_CHECKING:
+    from parkly.adapters.container import Container
+
+
+def create_health_router(container: Container) -> APIRouter:
+    router: APIRouter = APIRouter(prefix="/health", tags=["Health"])
+
+    @router.get(
+        "/ready",
+        response_model=ReadinessResponse,
+        summary="Readiness",
+        description="Report whether the instance can take traffic, with the primary connection pool's telemetry. Answers 503 while the pool is saturated: a checkout timed out recently, or the adaptive limiter queues more callers than it admits.",
+        responses={503: {"model": ReadinessResponse, "description": "Saturated"}},
+    )
+    async def ready(response: Response) -> ReadinessResponse:
+        stats = container.pool_monitor.stats()
+        if not stats.ready:
+            response.status_code = 503
+        return ReadinessResponse(
+            status="ready" if stats.ready else "saturated",
+            pool=PoolStatsResponse(
+                size=stats.size,
+                in_use=stats.in_use,
+                overflow=stats.overflow,
+                checkouts=stats.checkouts,
+                timeouts=stats.timeouts,
+                wait_ms_avg=stats.wait_ms_avg,
+                wait_ms_max=stats.wait_ms_max,
+                limit=stats.limit,
+                waiting=stats.waiting,
+            ),
+        )
+
+    return router
@@ -7,7 +7,11 @@ from starlette.requests import Request
 from starlette.responses import Response
 from ulid import ULID
 
-from parkly.adapters.context import request_context
+from parkly.adapters.context import (
+    ReadConsistency,
+    read_consistency,
+    request_context,
+)
 from parkly.application.port.logger import Logger
 
 
@@ -54,3 +58,37 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         response.headers["X-Trace-ID"] = trace_id
         request_context.reset(token)
         return response
+
+
+class ReadYourWritesMiddleware(BaseHTTPMiddleware):
+    """Pins a client's reads to the primary for a while after it writes.
+
+    A request that commits a write sets a short-lived cookie; requests that
+    carry it skip the read replica, which may not have caught up yet.
+    """
+
+    COOKIE = "parkly_recent_write"
+
+    def __init__(self, app: object, window_seconds: int) -> None:
+        super().__init__(app)  # type: ignore[arg-type]
+        self._window_seconds: int = window_seconds
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        consistency = ReadConsistency(use_primary=self.COOKIE in request.cookies)
+        token: Token[ReadConsistency | None] = read_consistency.set(consistency)
+        try:
+            response: Response = await call_next(request)
+        finally:
+            read_consistency.reset(token)
+
+        if consistency.wrote:
+            response.set_cookie(
+                self.COOKIE,
+                "1",
+                max_age=self._window_seconds,
+                httponly=True,
+                samesite="lax",
+            )
+        return response
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from fastapi import APIRouter
+
+from parkly.adapters.inbound.api.schemas import (
+    BatchQuoteRequest,
+    ErrorResponse,
+    QuoteResponse,
+)
+from parkly.application.query.quote_prices import PriceQuote, QuotePrices
+
+if TYPE_CHECKING:
+    from parkly.adapters.container import Container
+
+
+def create_quotes_router(container: Container) -> APIRouter:
+    router: APIRouter = APIRouter(prefix="/quotes", tags=["Quotes"])
+
+    @router.post(
+        ":batch",
+        response_model=list[QuoteResponse],
+        summary="Quote prices in bulk",
+        description="Price many time slots in one request with the active pricing strategy. Quotes are returned in request order.",
+        responses={422: {"model": ErrorResponse, "description": "Validation error"}},
+    )
+    async def quote_batch(body: BatchQuoteRequest) -> list[QuoteResponse]:
+        query: QuotePrices = QuotePrices(
+            quotes=[
+                PriceQuote(
+                    time_slot_start=q.time_slot_start,
+                    time_slot_end=q.time_slot_end,
+                    base_rate_amount=q.base_rate_amount,
+                    base_rate_currency=q.base_rate_currency,
+                )
+                for q in body.quotes
+            ],
+        )
+        dtos = await container.quote_prices_handler.handle(query)
+        return [
+            QuoteResponse(
+                time_slot_start=dto.time_slot_start,
+                time_slot_end=dto.time_slot_end,
+                total_cost_amount=dto.total_cost_amount,
+                total_cost_currency=dto.total_cost_currency,
+            )
+            for dto in dtos
+        ]
+
+    return router
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import TYPE_CHECKING
 
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, Query, Response
+from fastapi.responses import StreamingResponse
 
+from parkly.adapters.inbound.api.export import ExportFormat, export_response
 from parkly.adapters.inbound.api.schemas import (
     CancelReservationRequest,
     CreatedResponse,
     CreateReservationRequest,
     ErrorResponse,
     ExtendReservationRequest,
+    ReservationPageResponse,
     ReservationResponse,
 )
 from parkly.application.command.activate_reservation import ActivateReservation
@@ -18,8 +22,12 @@ from parkly.application.command.complete_reservation import CompleteReservation
 from parkly.application.command.confirm_reservation import ConfirmReservation
 from parkly.application.command.create_reservation import CreateReservation
 from parkly.application.command.extend_reservation import ExtendReservation
+from parkly.application.query.export_facility_reservations import (
+    ExportFacilityReservations,
+)
 from parkly.application.query.get_reservation_details import GetReservationDetails
 from parkly.application.query.list_vehicle_reservations import ListVehicleReservations
+from parkly.domain.model.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 if TYPE_CHECKING:
     from parkly.adapters.container import Container
@@ -61,20 +69,67 @@ def create_reservations_router(container: Container) -> APIRouter:
         reservation_id: str = await container.create_reservation_handler.handle(command)
         return CreatedResponse(id=reservation_id)
 
+    @router.get(
+        "/export",
+        response_class=StreamingResponse,
+        summary="Export facility reservations",
+        description="Stream every reservation of a facility by start time as NDJSON (one ReservationResponse object per line) or CSV. Rows are read through a server-side cursor, so the export size is unbounded.",
+        responses={
+            200: {
+                "description": "Reservations as NDJSON or CSV",
+                "content": {"application/x-ndjson": {}, "text/csv": {}},
+            },
+            422: {"model": ErrorResponse, "description": "Validation error"},
+        },
+    )
+    async def export_reservations(
+        facility_id: str = Query(..., description="UUID of the facility"),
+        since: datetime | None = Query(
+            None, description="Earliest start time, inclusive (ISO 8601)"
+        ),
+        until: datetime | None = Query(
+            None, description="Latest start time, exclusive (ISO 8601)"
+        ),
+        export_format: ExportFormat = Query(
+            "ndjson", alias="format", description="ndjson or csv"
+        ),
+    ) -> StreamingResponse:
+        query: ExportFacilityReservations = ExportFacilityReservations(
+            facility_id=facility_id,
+            since=since,
+            until=until,
+        )
+        dtos = container.export_reservations_handler.handle(query)
+        return export_response(
+            dtos,
+            ReservationResponse,
+            export_format,
+            filename=f"reservations-{facility_id}",
+        )
+
     @router.get(
         "/vehicle/{vehicle_id}",
-        response_model=list[ReservationResponse],
+        response_model=ReservationPageResponse,
         summary="List vehicle reservations",
-        description="Retrieve all reservations associated with a specific vehicle.",
+        description="Retrieve a vehicle's reservations, latest start first. Pass next_cursor back as cursor for the following page.",
+        responses={400: {"model": ErrorResponse, "description": "Invalid cursor"}},
     )
     async def list_vehicle_reservations(
         vehicle_id: str,
-    ) -> list[ReservationResponse]:
+        limit: int = Query(
+            DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"
+        ),
+        cursor: str | None = Query(
+            None, description="next_cursor of the previous page"
+        ),
+    ) -> ReservationPageResponse:
         query: ListVehicleReservations = ListVehicleReservations(
             vehicle_id=vehicle_id,
+            limit=limit,
+            cursor=cursor,
         )
-        dtos = await container.list_vehicle_reservations_handler.handle(query)
-        return [
+        page = await container.list_vehicle_reservations_handler.handle(query)
+        items = [
             ReservationResponse(
                 reservation_id=dto.reservation_id,
                 facility_id=dto.facility_id,
@@ -87,8 +142,9 @@ def create_reservations_router(container: Container) -> APIRouter:
                 total_cost_currency=dto.total_cost_currency,
                 created_at=dto.created_at,
             )
-            for dto in dtos
+            for dto in page.items
         ]
+        return ReservationPageResponse(items=items, next_cursor=page.next_cursor)
 
     @router.get(
         "/{reservation_id}",
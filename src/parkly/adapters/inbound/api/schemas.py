@@ -1,7 +1,8 @@
 from datetime import datetime
 from decimal import Decimal
+from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, RootModel
 
 
 # ── Request Models ────────────────────────────────────────────
@@ -47,6 +48,15 @@ class AddSpotRequest(BaseModel):
     )
 
 
+class AddSpotsRequest(RootModel[list[AddSpotRequest]]):
+    root: list[AddSpotRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=10_000,
+        description="Spots to add, at most 10000 per request",
+    )
+
+
 class CreateReservationRequest(BaseModel):
     facility_id: str = Field(
         ...,
@@ -144,6 +154,34 @@ class EndSessionRequest(BaseModel):
     )
 
 
+class QuoteRequest(BaseModel):
+    time_slot_start: datetime = Field(
+        ...,
+        description="Start of the time slot to price (ISO 8601)",
+        examples=["2026-03-01T09:00:00Z"],
+    )
+    time_slot_end: datetime = Field(
+        ...,
+        description="End of the time slot to price (ISO 8601)",
+        examples=["2026-03-01T12:00:00Z"],
+    )
+    base_rate_amount: Decimal = Field(
+        ..., description="Hourly rate amount", examples=["5.00"]
+    )
+    base_rate_currency: str = Field(
+        ..., description="Currency code (ISO 4217)", examples=["USD"]
+    )
+
+
+class BatchQuoteRequest(BaseModel):
+    quotes: list[QuoteRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=10_000,
+        description="Time slots to price, at most 10000 per request",
+    )
+
+
 class RegisterVehicleRequest(BaseModel):
     owner_id: str = Field(
         ...,
@@ -169,6 +207,12 @@ class RegisterVehicleRequest(BaseModel):
 # ── Response Models ───────────────────────────────────────────
 
 
+class CreatedManyResponse(BaseModel):
+    ids: list[str] = Field(
+        ..., description="UUIDs of the created resources, in request order"
+    )
+
+
 class CreatedResponse(BaseModel):
     id: str = Field(
         ...,
@@ -211,6 +255,57 @@ class FacilityResponse(BaseModel):
     )
 
 
+class FacilitySummaryResponse(BaseModel):
+    facility_id: str = Field(..., description="UUID of the facility")
+    name: str = Field(..., description="Facility name", examples=["Downtown Garage"])
+    latitude: str = Field(..., description="GPS latitude")
+    longitude: str = Field(..., description="GPS longitude")
+    address: str = Field(..., description="Street address")
+    facility_type: str = Field(..., description="Facility type", examples=["public"])
+    total_capacity: int = Field(
+        ..., description="Maximum number of spots", examples=[200]
+    )
+    distance_km: float = Field(
+        ..., description="Distance from the search point", examples=[1.42]
+    )
+    spot_counts: dict[str, dict[str, int]] = Field(
+        ...,
+        description="Number of spots per spot type, then per status",
+        examples=[{"standard": {"available": 120, "occupied": 40}}],
+    )
+
+
+class QuoteResponse(BaseModel):
+    time_slot_start: datetime = Field(..., description="Start of the priced slot")
+    time_slot_end: datetime = Field(..., description="End of the priced slot")
+    total_cost_amount: str = Field(
+        ..., description="Price of the slot", examples=["15.00"]
+    )
+    total_cost_currency: str = Field(
+        ..., description="Currency code (ISO 4217)", examples=["USD"]
+    )
+
+
+class AvailabilityBucketResponse(BaseModel):
+    start: datetime = Field(..., description="Start of the time bucket")
+    free_spots: int = Field(
+        ..., description="Spots free for the whole bucket", examples=[42]
+    )
+
+
+class AvailabilityGridResponse(BaseModel):
+    facility_id: str = Field(..., description="UUID of the facility")
+    spot_type: str | None = Field(
+        None, description="Spot type the counts are filtered by", examples=["standard"]
+    )
+    bucket_minutes: int = Field(
+        ..., description="Length of each time bucket in minutes", examples=[15]
+    )
+    buckets: list[AvailabilityBucketResponse] = Field(
+        ..., description="Free spot count per time bucket"
+    )
+
+
 class ReservationResponse(BaseModel):
     reservation_id: str = Field(..., description="UUID of the reservation")
     facility_id: str = Field(..., description="UUID of the facility")
@@ -230,6 +325,15 @@ class ReservationResponse(BaseModel):
     created_at: datetime = Field(..., description="When the reservation was created")
 
 
+class ReservationPageResponse(BaseModel):
+    items: list[ReservationResponse] = Field(
+        ..., description="Reservations, latest start first on this page"
+    )
+    next_cursor: str | None = Field(
+        ..., description="Cursor of the next page; null on the last page"
+    )
+
+
 class SessionResponse(BaseModel):
     session_id: str = Field(..., description="UUID of the parking session")
     reservation_id: str | None = Field(
@@ -251,6 +355,15 @@ class SessionResponse(BaseModel):
     )
 
 
+class SessionPageResponse(BaseModel):
+    items: list[SessionResponse] = Field(
+        ..., description="Sessions, latest entry first on this page"
+    )
+    next_cursor: str | None = Field(
+        ..., description="Cursor of the next page; null on the last page"
+    )
+
+
 class VehicleResponse(BaseModel):
     vehicle_id: str = Field(..., description="UUID of the vehicle")
     owner_id: str = Field(..., description="UUID of the owner")
@@ -264,3 +377,37 @@ class VehicleResponse(BaseModel):
     is_ev: bool = Field(
         ..., description="Whether the vehicle is electric", examples=[False]
     )
+
+
+class VehiclePageResponse(BaseModel):
+    items: list[VehicleResponse] = Field(
+        ..., description="Vehicles in registration order on this page"
+    )
+    next_cursor: str | None = Field(
+        ..., description="Cursor of the next page; null on the last page"
+    )
+
+
+class PoolStatsResponse(BaseModel):
+    size: int = Field(..., description="Connections held open by the pool")
+    in_use: int = Field(..., description="Connections checked out right now")
+    overflow: int = Field(..., description="Connections open beyond the pool size")
+    checkouts: int = Field(..., description="Checkouts since startup")
+    timeouts: int = Field(..., description="Checkouts that timed out since startup")
+    wait_ms_avg: float = Field(
+        ..., description="Moving average of the checkout wait, in milliseconds"
+    )
+    wait_ms_max: float = Field(
+        ..., description="Longest checkout wait since startup, in milliseconds"
+    )
+    limit: int | None = Field(
+        ..., description="Adaptive concurrency limit; null when adaptive mode is off"
+    )
+    waiting: int = Field(..., description="Callers queued for the adaptive limit")
+
+
+class ReadinessResponse(BaseModel):
+    status: Literal["ready", "saturated"] = Field(
+        ..., description="Whether the instance should receive traffic"
+    )
+    pool: PoolStatsResponse = Field(..., description="Primary database connection pool")
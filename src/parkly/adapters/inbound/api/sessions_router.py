@@ -1,22 +1,28 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import TYPE_CHECKING
 
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, Query, Response
+from fastapi.responses import StreamingResponse
 
+from parkly.adapters.inbound.api.export import ExportFormat, export_response
 from parkly.adapters.inbound.api.schemas import (
     CreatedResponse,
     EndSessionRequest,
     ErrorResponse,
     ExtendSessionRequest,
+    SessionPageResponse,
     SessionResponse,
     StartSessionRequest,
 )
 from parkly.application.command.end_parking_session import EndParkingSession
 from parkly.application.command.extend_parking_session import ExtendParkingSession
 from parkly.application.command.start_parking_session import StartParkingSession
+from parkly.application.query.export_facility_sessions import ExportFacilitySessions
 from parkly.application.query.get_session_details import GetSessionDetails
 from parkly.application.query.list_vehicle_sessions import ListVehicleSessions
+from parkly.domain.model.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 if TYPE_CHECKING:
     from parkly.adapters.container import Container
@@ -48,18 +54,64 @@ def create_sessions_router(container: Container) -> APIRouter:
         session_id: str = await container.start_parking_session_handler.handle(command)
         return CreatedResponse(id=session_id)
 
+    @router.get(
+        "/export",
+        response_class=StreamingResponse,
+        summary="Export facility sessions",
+        description="Stream every session of a facility by entry time as NDJSON (one SessionResponse object per line) or CSV. Rows are read through a server-side cursor, so the export size is unbounded.",
+        responses={
+            200: {
+                "description": "Sessions as NDJSON or CSV",
+                "content": {"application/x-ndjson": {}, "text/csv": {}},
+            },
+            422: {"model": ErrorResponse, "description": "Validation error"},
+        },
+    )
+    async def export_sessions(
+        facility_id: str = Query(..., description="UUID of the facility"),
+        since: datetime | None = Query(
+            None, description="Earliest entry time, inclusive (ISO 8601)"
+        ),
+        until: datetime | None = Query(
+            None, description="Latest entry time, exclusive (ISO 8601)"
+        ),
+        export_format: ExportFormat = Query(
+            "ndjson", alias="format", description="ndjson or csv"
+        ),
+    ) -> StreamingResponse:
+        query: ExportFacilitySessions = ExportFacilitySessions(
+            facility_id=facility_id,
+            since=since,
+            until=until,
+        )
+        dtos = container.export_sessions_handler.handle(query)
+        return export_response(
+            dtos, SessionResponse, export_format, filename=f"sessions-{facility_id}"
+        )
+
     @router.get(
         "/vehicle/{vehicle_id}",
-        response_model=list[SessionResponse],
+        response_model=SessionPageResponse,
         summary="List vehicle sessions",
-        description="Retrieve all parking sessions for a specific vehicle.",
+        description="Retrieve a vehicle's parking sessions, latest entry first. Pass next_cursor back as cursor for the following page.",
+        responses={400: {"model": ErrorResponse, "description": "Invalid cursor"}},
     )
-    async def list_vehicle_sessions(vehicle_id: str) -> list[SessionResponse]:
+    async def list_vehicle_sessions(
+        vehicle_id: str,
+        limit: int = Query(
+            DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"
+        ),
+        cursor: str | None = Query(
+            None, description="next_cursor of the previous page"
+        ),
+    ) -> SessionPageResponse:
         query: ListVehicleSessions = ListVehicleSessions(
             vehicle_id=vehicle_id,
+            limit=limit,
+            cursor=cursor,
         )
-        dtos = await container.list_vehicle_sessions_handler.handle(query)
-        return [
+        page = await container.list_vehicle_sessions_handler.handle(query)
+        items = [
             SessionResponse(
                 session_id=dto.session_id,
                 reservation_id=dto.reservation_id,
@@ -72,8 +124,9 @@ def create_sessions_router(container: Container) -> APIRouter:
                 total_cost_currency=dto.total_cost_currency,
                 is_active=dto.is_active,
             )
-            for dto in dtos
+            for dto in page.items
         ]
+        return SessionPageResponse(items=items, next_cursor=page.next_cursor)
 
     @router.get(
         "/{session_id}",
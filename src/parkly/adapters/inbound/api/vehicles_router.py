@@ -2,16 +2,18 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 
 from parkly.adapters.inbound.api.schemas import (
     CreatedResponse,
     ErrorResponse,
     RegisterVehicleRequest,
+    VehiclePageResponse,
     VehicleResponse,
 )
 from parkly.application.command.register_vehicle import RegisterVehicle
 from parkly.application.query.list_owner_vehicles import ListOwnerVehicles
+from parkly.domain.model.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 if TYPE_CHECKING:
     from parkly.adapters.container import Container
@@ -41,16 +43,27 @@ def create_vehicles_router(container: Container) -> APIRouter:
 
     @router.get(
         "/owner/{owner_id}",
-        response_model=list[VehicleResponse],
+        response_model=VehiclePageResponse,
         summary="List owner vehicles",
-        description="Retrieve all vehicles registered to a specific owner.",
+        description="Retrieve an owner's vehicles in registration order. Pass next_cursor back as cursor for the following page.",
+        responses={400: {"model": ErrorResponse, "description": "Invalid cursor"}},
     )
-    async def list_owner_vehicles(owner_id: str) -> list[VehicleResponse]:
+    async def list_owner_vehicles(
+        owner_id: str,
+        limit: int = Query(
+            DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"
+        ),
+        cursor: str | None = Query(
+            None, description="next_cursor of the previous page"
+        ),
+    ) -> VehiclePageResponse:
         query: ListOwnerVehicles = ListOwnerVehicles(
             owner_id=owner_id,
+            limit=limit,
+            cursor=cursor,
         )
-        dtos = await container.list_owner_vehicles_handler.handle(query)
-        return [
+        page = await container.list_owner_vehicles_handler.handle(query)
+        items = [
             VehicleResponse(
                 vehicle_id=dto.vehicle_id,
                 owner_id=dto.owner_id,
@@ -59,7 +72,8 @@ def create_vehicles_router(container: Container) -> APIRouter:
                 vehicle_type=dto.vehicle_type,
                 is_ev=dto.is_ev,
             )
-            for dto in dtos
+            for dto in page.items
         ]
+        return VehiclePageResponse(items=items, next_cursor=page.next_cursor)
 
     return router
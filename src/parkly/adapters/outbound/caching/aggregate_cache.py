@@ -0,0 +1,174 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from parkly.domain.port.clock import Clock
+
+# Invalidations remembered for racing fills; older ones reject every fill
+# that started before them.
+_RECENT_INVALIDATIONS = 1_024
+
+
+@dataclass(frozen=True, slots=True)
+class CacheHit[S]:
+    """A cached lookup; ``value`` is ``None`` for a cached not-found."""
+
+    value: S | None
+
+
+@dataclass(frozen=True)
+class AggregateCacheStats:
+    entries: int
+    weight: int
+    hits: int
+    negative_hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.negative_hits + self.misses
+        return (self.hits + self.negative_hits) / lookups if lookups else 0.0
+
+
+@dataclass(slots=True)
+class _Entry[S]:
+    snapshot: S | None
+    weight: int
+    expires_at: datetime
+
+
+class AggregateCache[K: Hashable, S]:
+    """Bounded LRU of immutable aggregate snapshots, weighed by ``weigh``.
+
+    Aggregates are mutable, so callers store a frozen snapshot and rebuild a
+    fresh aggregate from it on every hit; entries are shared, never copied.
+    Not-found lookups are cached for a shorter time. A fill passes the
+    ``token()`` taken before it read the database, and is dropped if the key
+    was invalidated in the meantime. A fill read from a replica is also
+    dropped if the key was invalidated within ``replica_lag``, since the
+    replica may not have applied that write yet.
+    """
+
+    def __init__(
+        self,
+        max_weight: int,
+        ttl: timedelta,
+        negative_ttl: timedelta,
+        clock: Clock,
+        weigh: Callable[[S], int],
+        replica_lag: timedelta = timedelta(0),
+    ) -> None:
+        self._max_weight = max_weight
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._clock = clock
+        self._weigh = weigh
+        self._replica_lag = replica_lag
+        self._entries: OrderedDict[K, _Entry[S]] = OrderedDict()
+        self._weight = 0
+        self._generation = 0
+        # Generation and time of each key's last invalidation.
+        self._invalidated: OrderedDict[K, tuple[int, datetime]] = OrderedDict()
+        self._forgotten = 0
+        self._forgotten_at = datetime.min.replace(tzinfo=UTC)
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def get(self, key: K) -> CacheHit[S] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        if entry.expires_at <= self._clock.now():
+            self._remove(key)
+            self._expirations += 1
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        if entry.snapshot is None:
+            self._negative_hits += 1
+            return CacheHit(None)
+        self._hits += 1
+        return CacheHit(entry.snapshot)
+
+    def token(self) -> int:
+        return self._generation
+
+    def _is_stale(self, key: K, token: int, from_replica: bool) -> bool:
+        settled = self._clock.now() - self._replica_lag if from_replica else None
+        if token < self._forgotten or (
+            settled is not None and self._forgotten_at > settled
+        ):
+            return True
+        invalidated = self._invalidated.get(key)
+        if invalidated is None:
+            return False
+        generation, at = invalidated
+        return generation > token or (settled is not None and at > settled)
+
+    def put(
+        self, key: K, snapshot: S | None, token: int, from_replica: bool = False
+    ) -> None:
+        if self._is_stale(key, token, from_replica):
+            return
+        if snapshot is None:
+            entry = _Entry[S](None, 1, self._clock.now() + self._negative_ttl)
+        else:
+            entry = _Entry(
+                snapshot, self._weigh(snapshot), self._clock.now() + self._ttl
+            )
+        if entry.weight > self._max_weight:
+            return
+        self._remove(key)
+        self._entries[key] = entry
+        self._weight += entry.weight
+        while self._weight > self._max_weight:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._evictions += 1
+
+    def invalidate(self, key: K) -> None:
+        self._generation += 1
+        self._invalidated[key] = (self._generation, self._clock.now())
+        self._invalidated.move_to_end(key)
+        if len(self._invalidated) > _RECENT_INVALIDATIONS:
+            _, (self._forgotten, self._forgotten_at) = self._invalidated.popitem(
+                last=False
+            )
+        if self._remove(key):
+            self._invalidations += 1
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._forgotten = self._generation
+        self._forgotten_at = self._clock.now()
+        self._invalidated.clear()
+        self._entries.clear()
+        self._weight = 0
+
+    def _remove(self, key: K) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._weight -= entry.weight
+        return True
+
+    def stats(self) -> AggregateCacheStats:
+        return AggregateCacheStats(
+            entries=len(self._entries),
+            weight=self._weight,
+            hits=self._hits,
+            negative_hits=self._negative_hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            expirations=self._expirations,
+            invalidations=self._invalidations,
+        )
@@ -0,0 +1,28 @@
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from parkly.adapters.outbound.caching.aggregate_cache import AggregateCache
+from parkly.application.port.logger import Logger
+from parkly.domain.event.domain_event import DomainEvent
+
+
+class InvalidateCacheOnEvent[E: DomainEvent, K: Hashable]:
+    """Drops the cached aggregate an event names, including a cached not-found."""
+
+    def __init__(
+        self,
+        cache: AggregateCache[K, Any],
+        key_of: Callable[[E], K],
+        logger: Logger,
+    ) -> None:
+        self._cache = cache
+        self._key_of = key_of
+        self._logger = logger
+
+    async def handle(self, event: E) -> None:
+        key = self._key_of(event)
+        self._logger.debug(
+            f"Handling {type(event).__name__} for cache invalidation",
+            extra={"key": str(key)},
+        )
+        self._cache.invalidate(key)
@@ -0,0 +1,157 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Self
+
+from parkly.adapters.outbound.caching.aggregate_cache import AggregateCache
+from parkly.adapters.outbound.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from parkly.application.port.logger import Logger
+from parkly.domain.model.enums import (
+    AccessControlMethod,
+    FacilityType,
+    SpotStatus,
+    SpotType,
+)
+from parkly.domain.model.parking_facility import ParkingFacility, ParkingSpot
+from parkly.domain.model.typed_ids import FacilityId, SpotId
+from parkly.domain.model.value_objects import (
+    Capacity,
+    FacilityName,
+    Location,
+    SpotNumber,
+)
+from parkly.domain.port.parking_facility_repository import ParkingFacilityRepository
+
+
+@dataclass(frozen=True, slots=True)
+class FacilitySnapshot:
+    """Immutable cached form of a facility, rebuilt into a fresh aggregate."""
+
+    facility_id: FacilityId
+    name: FacilityName
+    location: Location
+    facility_type: FacilityType
+    access_control: AccessControlMethod
+    total_capacity: Capacity
+    spots: tuple[tuple[SpotId, SpotNumber, SpotType, SpotStatus], ...]
+
+    @classmethod
+    def of(cls, facility: ParkingFacility) -> Self:
+        return cls(
+            facility_id=facility.id,
+            name=facility.name,
+            location=facility.location,
+            facility_type=facility.facility_type,
+            access_control=facility.access_control,
+            total_capacity=facility.total_capacity,
+            spots=tuple(
+                (s.id, s.spot_number, s.spot_type, s.status) for s in facility.spots
+            ),
+        )
+
+    def restore(self) -> ParkingFacility:
+        return ParkingFacility.reconstitute(
+            facility_id=self.facility_id,
+            name=self.name,
+            location=self.location,
+            facility_type=self.facility_type,
+            access_control=self.access_control,
+            total_capacity=self.total_capacity,
+            spots=[ParkingSpot.reconstitute(*spot) for spot in self.spots],
+        )
+
+
+def facility_weight(snapshot: FacilitySnapshot) -> int:
+    return 1 + len(snapshot.spots)
+
+
+class CachedParkingFacilityRepository(ParkingFacilityRepository):
+    """Read-through cache over another facility repository.
+
+    Saved facilities are dropped from the cache at once and again after the
+    unit commits, so no fill racing the write can keep the old state; a
+    replica read fills only once the last write is past the replica lag.
+    Inside a unit of work the unit's identity map answers first, and a hit
+    is restored into it, so the unit keeps one instance of each facility.
+    """
+
+    def __init__(
+        self,
+        inner: ParkingFacilityRepository,
+        cache: AggregateCache[FacilityId, FacilitySnapshot],
+        uow: SqlAlchemyUnitOfWork,
+        logger: Logger,
+    ) -> None:
+        self._inner = inner
+        self._cache = cache
+        self._uow = uow
+        self._logger = logger
+
+    def _invalidate(self, facilities: list[ParkingFacility]) -> None:
+        for facility in facilities:
+            self._cache.invalidate(facility.id)
+
+    async def save(self, facility: ParkingFacility) -> None:
+        self._invalidate([facility])
+        await self._inner.save(facility)
+        self._uow.on_commit(lambda: self._invalidate([facility]))
+
+    async def save_many(self, facilities: list[ParkingFacility]) -> None:
+        self._invalidate(facilities)
+        await self._inner.save_many(facilities)
+        self._uow.on_commit(lambda: self._invalidate(facilities))
+
+    async def find_by_id(self, id: FacilityId) -> ParkingFacility | None:
+        known = self._uow.get(ParkingFacility, id)
+        if known is not None:
+            return known
+        hit = self._cache.get(id)
+        if hit is not None:
+            self._logger.debug(
+                "Facility cache hit",
+                extra={"facility_id": id.value, "found": hit.value is not None},
+            )
+            return None if hit.value is None else self._uow.track(hit.value.restore())
+
+        token = self._cache.token()
+        from_replica = self._uow.reads_replica()
+        facility = await self._inner.find_by_id(id)
+        snapshot = None if facility is None else FacilitySnapshot.of(facility)
+        self._cache.put(id, snapshot, token, from_replica)
+        return facility
+
+    async def find_by_ids(self, ids: list[FacilityId]) -> list[ParkingFacility]:
+        facilities: list[ParkingFacility] = []
+        missing: list[FacilityId] = []
+        for id in ids:
+            known = self._uow.get(ParkingFacility, id)
+            if known is not None:
+                facilities.append(known)
+                continue
+            hit = self._cache.get(id)
+            if hit is None:
+                missing.append(id)
+            elif hit.value is not None:
+                facilities.append(self._uow.track(hit.value.restore()))
+        if not missing:
+            return facilities
+
+        token = self._cache.token()
+        from_replica = self._uow.reads_replica()
+        loaded = await self._inner.find_by_ids(missing)
+        for facility in loaded:
+            self._cache.put(
+                facility.id, FacilitySnapshot.of(facility), token, from_replica
+            )
+        self._logger.debug(
+            "Facility cache batch lookup",
+            extra={"requested": len(ids), "loaded": len(missing)},
+        )
+        return facilities + loaded
+
+    async def find_all_locations(self) -> list[tuple[FacilityId, Location]]:
+        return await self._inner.find_all_locations()
+
+    async def find_by_location(
+        self, location: Location, radius: Decimal, limit: int | None = None
+    ) -> list[ParkingFacility]:
+        return await self._inner.find_by_location(location, radius, limit)
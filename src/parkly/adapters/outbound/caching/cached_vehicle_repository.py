@@ -0,0 +1,104 @@
+from dataclasses import dataclass
+from typing import Self
+
+from parkly.adapters.outbound.caching.aggregate_cache import AggregateCache
+from parkly.adapters.outbound.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from parkly.application.port.logger import Logger
+from parkly.domain.model.enums import VehicleType
+from parkly.domain.model.pagination import Page, PageRequest
+from parkly.domain.model.typed_ids import OwnerId, VehicleId
+from parkly.domain.model.value_objects import LicensePlate
+from parkly.domain.model.vehicle import Vehicle
+from parkly.domain.port.vehicle_repository import VehicleRepository
+
+
+@dataclass(frozen=True, slots=True)
+class VehicleSnapshot:
+    """Immutable cached form of a vehicle, rebuilt into a fresh aggregate."""
+
+    vehicle_id: VehicleId
+    owner_id: OwnerId
+    license_plate: LicensePlate
+    vehicle_type: VehicleType
+    is_ev: bool
+
+    @classmethod
+    def of(cls, vehicle: Vehicle) -> Self:
+        return cls(
+            vehicle_id=vehicle.id,
+            owner_id=vehicle.owner_id,
+            license_plate=vehicle.license_plate,
+            vehicle_type=vehicle.vehicle_type,
+            is_ev=vehicle.is_ev,
+        )
+
+    def restore(self) -> Vehicle:
+        return Vehicle.reconstitute(
+            vehicle_id=self.vehicle_id,
+            owner_id=self.owner_id,
+            license_plate=self.license_plate,
+            vehicle_type=self.vehicle_type,
+            is_ev=self.is_ev,
+        )
+
+
+class CachedVehicleRepository(VehicleRepository):
+    """Read-through cache of vehicles by ID over another vehicle repository.
+
+    A replica read fills only once the last write is past the replica lag.
+    Inside a unit of work the unit's identity map answers first, and a hit
+    is restored into it.
+    """
+
+    def __init__(
+        self,
+        inner: VehicleRepository,
+        cache: AggregateCache[VehicleId, VehicleSnapshot],
+        uow: SqlAlchemyUnitOfWork,
+        logger: Logger,
+    ) -> None:
+        self._inner = inner
+        self._cache = cache
+        self._uow = uow
+        self._logger = logger
+
+    def _invalidate(self, vehicles: list[Vehicle]) -> None:
+        for vehicle in vehicles:
+            self._cache.invalidate(vehicle.id)
+
+    async def save(self, vehicle: Vehicle) -> None:
+        self._invalidate([vehicle])
+        await self._inner.save(vehicle)
+        self._uow.on_commit(lambda: self._invalidate([vehicle]))
+
+    async def save_many(self, vehicles: list[Vehicle]) -> None:
+        self._invalidate(vehicles)
+        await self._inner.save_many(vehicles)
+        self._uow.on_commit(lambda: self._invalidate(vehicles))
+
+    async def find_by_id(self, id: VehicleId) -> Vehicle | None:
+        known = self._uow.get(Vehicle, id)
+        if known is not None:
+            return known
+        hit = self._cache.get(id)
+        if hit is not None:
+            self._logger.debug(
+                "Vehicle cache hit",
+                extra={"vehicle_id": id.value, "found": hit.value is not None},
+            )
+            return None if hit.value is None else self._uow.track(hit.value.restore())
+
+        token = self._cache.token()
+        from_replica = self._uow.reads_replica()
+        vehicle = await self._inner.find_by_id(id)
+        snapshot = None if vehicle is None else VehicleSnapshot.of(vehicle)
+        self._cache.put(id, snapshot, token, from_replica)
+        return vehicle
+
+    async def find_by_owner(
+        self, owner_id: OwnerId, page: PageRequest
+    ) -> Page[Vehicle]:
+        return await self._inner.find_by_owner(owner_id, page)
+
+    async def find_by_license_plate(self, plate: LicensePlate) -> Vehicle | None:
+        return await self._inner.find_by_license_plate(plate)
@@ -0,0 +1,79 @@
+import asyncio
+from collections import deque
+from contextlib import suppress
+
+
+class AdaptiveLimiter:
+    """Concurrency limit that follows connection checkout latency (AIMD).
+
+    Each checkout wait within ``target_wait`` seconds raises the limit by
+    ``1 / limit``, about one slot per round of checkouts. A slower one cuts it
+    by ``backoff``. The limit stays within ``min_limit`` and ``max_limit``.
+    Callers over the limit queue here, in order, instead of in the pool.
+    """
+
+    def __init__(
+        self,
+        min_limit: int,
+        max_limit: int,
+        target_wait: float,
+        backoff: float = 0.75,
+    ) -> None:
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError(
+                f"Limits must satisfy 1 <= min <= max, got {min_limit}..{max_limit}"
+            )
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._target_wait = target_wait
+        self._backoff = backoff
+        self._limit = float(max_limit)
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    def observe(self, wait: float) -> None:
+        if wait > self._target_wait:
+            self._limit = max(float(self._min_limit), self._limit * self._backoff)
+        else:
+            self._limit = min(float(self._max_limit), self._limit + 1 / self._limit)
+            self._wake()
+
+    async def acquire(self) -> None:
+        if not self._waiters and self._in_flight < self.limit:
+            self._in_flight += 1
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.cancelled():
+                with suppress(ValueError):
+                    self._waiters.remove(waiter)
+            else:
+                # The slot was handed over just as the caller was cancelled.
+                self.release()
+            raise
+
+    def release(self) -> None:
+        self._in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
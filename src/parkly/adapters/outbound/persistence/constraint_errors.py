@@ -0,0 +1,16 @@
+from sqlalchemy.exc import IntegrityError
+
+ACTIVE_SESSION_PER_SPOT = "uq_sessions_active_spot"
+RESERVATION_SLOT_OVERLAP = "ex_reservations_spot_slot"
+
+
+def violated_constraint(exc: IntegrityError) -> str | None:
+    """Name of the constraint or unique index the database reported."""
+    # SQLAlchemy wraps the asyncpg error, which carries the name, as the cause.
+    cause = exc.orig.__cause__ if exc.orig is not None else None
+    return getattr(cause, "constraint_name", None)
+
+
+def violation_detail(exc: IntegrityError) -> str:
+    cause = exc.orig.__cause__ if exc.orig is not None else None
+    return getattr(cause, "detail", None) or ""
@@ -5,18 +5,35 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
+from parkly.adapters.outbound.persistence.pool_monitor import MonitoredPool
+
+# Rows fetched per round trip from a server-side cursor when streaming.
+STREAM_BATCH_ROWS = 1_000
+
 
 def create_engine(
     database_url: str,
     echo: bool = False,
     pool_size: int = 5,
     max_overflow: int = 10,
+    prepared_statement_cache_size: int = 100,
+    pool_timeout: float = 30.0,
 ) -> AsyncEngine:
+    """Engine over asyncpg.
+
+    Repositories keep their hot lookups as module-level statements, so the
+    SQL text is stable and each connection prepares it once and reuses it
+    from asyncpg's statement cache of ``prepared_statement_cache_size``.
+    Checkouts are timed for a ``PoolMonitor``.
+    """
     return create_async_engine(
         database_url,
         echo=echo,
         pool_size=pool_size,
         max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        poolclass=MonitoredPool,
+        connect_args={"prepared_statement_cache_size": prepared_statement_cache_size},
     )
 
 
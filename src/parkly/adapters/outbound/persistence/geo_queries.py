@@ -0,0 +1,72 @@
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal
+
+from sqlalchemy import ColumnElement, func, or_
+
+from parkly.adapters.outbound.persistence.orm_models import ParkingFacilityORM
+from parkly.domain.model.consts import EARTH_RADIUS_KM
+from parkly.domain.service.geo_index import bounding_box
+
+# Scale of the NUMERIC(10, 7) coordinate columns.
+_COORDINATE_STEP = Decimal("0.0000001")
+
+
+def distance_km(latitude: float, longitude: float) -> ColumnElement[float]:
+    """Great-circle distance from the point to each facility row."""
+    lat_column = ParkingFacilityORM.latitude
+    lng_column = ParkingFacilityORM.longitude
+    return float(EARTH_RADIUS_KM) * func.acos(
+        func.least(
+            1.0,
+            func.greatest(
+                -1.0,
+                func.cos(func.radians(latitude))
+                * func.cos(func.radians(lat_column))
+                * func.cos(func.radians(lng_column) - func.radians(longitude))
+                + func.sin(func.radians(latitude)) * func.sin(func.radians(lat_column)),
+            ),
+        )
+    )
+
+
+def _outward(value: float, rounding: str) -> Decimal:
+    return Decimal(value).quantize(_COORDINATE_STEP, rounding=rounding)
+
+
+def bounding_box_predicates(
+    latitude: float, longitude: float, radius_km: float
+) -> list[ColumnElement[bool]]:
+    """Sargable range predicates on ``ix_facilities_lat_lng`` for a radius.
+
+    Bounds are bound as numerics rounded outward to the column scale, so the
+    comparison stays on the indexed ``NUMERIC`` columns and never drops a
+    facility on the edge.
+    """
+    lat_column = ParkingFacilityORM.latitude
+    lng_column = ParkingFacilityORM.longitude
+    south, north, west, east = bounding_box(latitude, longitude, radius_km)
+    predicates: list[ColumnElement[bool]] = [
+        lat_column.between(_outward(south, ROUND_FLOOR), _outward(north, ROUND_CEILING))
+    ]
+    if west is None or east is None:
+        return predicates
+    if west < -180.0:
+        predicates.append(
+            or_(
+                lng_column >= _outward(west + 360.0, ROUND_FLOOR),
+                lng_column <= _outward(east, ROUND_CEILING),
+            )
+        )
+    elif east > 180.0:
+        predicates.append(
+            or_(
+                lng_column >= _outward(west, ROUND_FLOOR),
+                lng_column <= _outward(east - 360.0, ROUND_CEILING),
+            )
+        )
+    else:
+        predicates.append(
+            lng_column.between(
+                _outward(west, ROUND_FLOOR), _outward(east, ROUND_CEILING)
+            )
+        )
+    return predicates
@@ -0,0 +1,69 @@
+import binascii
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from parkly.domain.exception.exceptions import InvalidCursorError
+from parkly.domain.model.pagination import PageRequest
+
+type SortKey = Sequence[InstrumentedAttribute[Any]]
+
+
+def encode_cursor(values: Sequence[datetime | str]) -> str:
+    raw = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    return urlsafe_b64encode(json.dumps(raw).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, key: SortKey) -> list[datetime | str]:
+    try:
+        raw = json.loads(urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(raw, list) or len(raw) != len(key):
+            raise InvalidCursorError()
+        values: list[datetime | str] = []
+        for column, value in zip(key, raw, strict=True):
+            if not isinstance(value, str):
+                raise InvalidCursorError()
+            if column.type.python_type is datetime:
+                moment = datetime.fromisoformat(value)
+                # Cursors are only ever issued for timezone-aware columns.
+                if moment.tzinfo is None:
+                    raise InvalidCursorError()
+                values.append(moment)
+            else:
+                values.append(value)
+        return values
+    except (binascii.Error, ValueError, TypeError) as exc:
+        raise InvalidCursorError() from exc
+
+
+async def fetch_page[R](
+    session: AsyncSession,
+    statement: Select[tuple[R]],
+    key: SortKey,
+    page: PageRequest,
+    descending: bool = False,
+) -> tuple[list[R], str | None]:
+    """Rows of ``statement`` after the cursor, in key order, and the next cursor.
+
+    The key must end in a unique column. The cursor is compared as a row value,
+    ``(a, b) > (:a, :b)``, which an index on the filter columns followed by
+    the key serves as a single range scan.
+    """
+    if page.cursor is not None:
+        after = tuple_(*key)
+        values = tuple_(*decode_cursor(page.cursor, key))
+        statement = statement.where(after < values if descending else after > values)
+    statement = statement.order_by(
+        *(c.desc() if descending else c.asc() for c in key)
+    ).limit(page.limit + 1)
+    rows = list((await session.execute(statement)).scalars().all())
+    if len(rows) <= page.limit:
+        return rows, None
+    rows = rows[: page.limit]
+    return rows, encode_cursor([getattr(rows[-1], c.key) for c in key])
@@ -0,0 +1,38 @@
+"""reservation_slot_exclusion
+
+Revision ID: 5548a983ea97
+Revises: e6c19624056c
+Create Date: 2026-10-16 13:05:52.774130
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5548a983ea97"
+down_revision: Union[str, None] = "e6c19624056c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # btree_gist provides the GiST equality operator for spot_ulid.
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    # The range is an expression rather than a stored column, so adding the
+    # constraint scans the table once instead of rewriting it. Fails if
+    # overlapping live reservations already exist.
+    op.execute(
+        "ALTER TABLE reservations ADD CONSTRAINT ex_reservations_spot_slot"
+        " EXCLUDE USING gist"
+        " (spot_ulid WITH =, tstzrange(time_slot_start, time_slot_end) WITH &&)"
+        " WHERE (status NOT IN ('cancelled', 'completed'))"
+    )
+
+
+def downgrade() -> None:
+    # btree_gist is left installed; other objects may depend on it.
+    op.execute(
+        "ALTER TABLE reservations DROP CONSTRAINT IF EXISTS ex_reservations_spot_slot"
+    )
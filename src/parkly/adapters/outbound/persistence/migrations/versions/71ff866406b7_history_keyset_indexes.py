@@ -0,0 +1,81 @@
+"""history_keyset_indexes
+
+Revision ID: 71ff866406b7
+Revises: 35765084c52a
+Create Date: 2026-10-16 10:12:41.205318
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "71ff866406b7"
+down_revision: Union[str, None] = "35765084c52a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Composite indexes serving the keyset-paginated history listings. Each one
+# starts with the column the single-column index covered, which is dropped.
+_INDEXES = (
+    (
+        "ix_reservations_vehicle_start",
+        "reservations",
+        ["vehicle_ulid", "time_slot_start", "ulid"],
+        "ix_reservations_vehicle_ulid",
+        "vehicle_ulid",
+    ),
+    (
+        "ix_sessions_vehicle_entry",
+        "parking_sessions",
+        ["vehicle_ulid", "entry_time", "ulid"],
+        "ix_parking_sessions_vehicle_ulid",
+        "vehicle_ulid",
+    ),
+    (
+        "ix_vehicles_owner_ulid_ulid",
+        "vehicles",
+        ["owner_ulid", "ulid"],
+        "ix_vehicles_owner_ulid",
+        "owner_ulid",
+    ),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the tables writable while the indexes build; it
+    # cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        for name, table, columns, replaced, _ in _INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.drop_index(
+                replaced,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, replaced, column in _INDEXES:
+            op.create_index(
+                replaced,
+                table,
+                [column],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
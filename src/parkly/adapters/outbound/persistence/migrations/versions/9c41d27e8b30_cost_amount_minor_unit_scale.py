@@ -0,0 +1,46 @@
+"""cost_amount_minor_unit_scale
+
+Revision ID: 9c41d27e8b30
+Revises: 5548a983ea97
+Create Date: 2026-10-16 15:22:37.914062
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c41d27e8b30"
+down_revision: Union[str, None] = "5548a983ea97"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Three decimals hold every ISO 4217 minor unit (BHD, KWD, ...); the extra
+# digit of precision keeps the integer range the (12, 2) columns had.
+_TABLES = ("reservations", "parking_sessions")
+
+
+def upgrade() -> None:
+    # Changing the scale rewrites both tables under an exclusive lock.
+    for table in _TABLES:
+        op.alter_column(
+            table,
+            "cost_amount",
+            type_=sa.Numeric(13, 3),
+            existing_type=sa.Numeric(12, 2),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    # Rounds three-decimal amounts back to two.
+    for table in _TABLES:
+        op.alter_column(
+            table,
+            "cost_amount",
+            type_=sa.Numeric(12, 2),
+            existing_type=sa.Numeric(13, 3),
+            existing_nullable=False,
+        )
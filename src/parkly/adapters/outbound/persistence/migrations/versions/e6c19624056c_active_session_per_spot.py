@@ -0,0 +1,43 @@
+"""active_session_per_spot
+
+Revision ID: e6c19624056c
+Revises: 71ff866406b7
+Create Date: 2026-10-16 11:40:08.512907
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e6c19624056c"
+down_revision: Union[str, None] = "71ff866406b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Fails if a spot already has two open sessions; close the older one
+    # first. CONCURRENTLY keeps gate traffic flowing while the index builds.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_sessions_active_spot",
+            "parking_sessions",
+            ["spot_ulid"],
+            unique=True,
+            postgresql_where=sa.text("exit_time IS NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "uq_sessions_active_spot",
+            table_name="parking_sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -9,8 +9,10 @@ from sqlalchemy import (
     Numeric,
     String,
     UniqueConstraint,
+    func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import TIMESTAMP
+from sqlalchemy.dialects.postgresql import TIMESTAMP, ExcludeConstraint
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -66,11 +68,11 @@ class ReservationORM(Base):
     ulid: Mapped[str] = mapped_column(String(26), unique=True, index=True)
     facility_ulid: Mapped[str] = mapped_column(String(26), index=True)
     spot_ulid: Mapped[str] = mapped_column(String(26), index=True)
-    vehicle_ulid: Mapped[str] = mapped_column(String(26), index=True)
+    vehicle_ulid: Mapped[str] = mapped_column(String(26))
     time_slot_start: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True))
     time_slot_end: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True))
     status: Mapped[str] = mapped_column(String(20))
-    cost_amount: Mapped[Decimal] = mapped_column(Numeric(12, 2))
+    cost_amount: Mapped[Decimal] = mapped_column(Numeric(13, 3))
     cost_currency: Mapped[str] = mapped_column(String(3))
     created_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True))
 
@@ -81,6 +83,20 @@ class ReservationORM(Base):
             "time_slot_start",
             "time_slot_end",
         ),
+        Index(
+            "ix_reservations_vehicle_start",
+            "vehicle_ulid",
+            "time_slot_start",
+            "ulid",
+        ),
+        # Live reservations of a spot never overlap; needs btree_gist.
+        ExcludeConstraint(
+            ("spot_ulid", "="),
+            (func.tstzrange(text("time_slot_start"), text("time_slot_end")), "&&"),
+            name="ex_reservations_spot_slot",
+            using="gist",
+            where=text("status NOT IN ('cancelled', 'completed')"),
+        ),
     )
 
 
@@ -89,7 +105,7 @@ class VehicleORM(Base):
 
     pk: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     ulid: Mapped[str] = mapped_column(String(26), unique=True, index=True)
-    owner_ulid: Mapped[str] = mapped_column(String(26), index=True)
+    owner_ulid: Mapped[str] = mapped_column(String(26))
     license_plate_value: Mapped[str] = mapped_column(String(20))
     license_plate_region: Mapped[str] = mapped_column(String(10))
     vehicle_type: Mapped[str] = mapped_column(String(20))
@@ -101,6 +117,7 @@ class VehicleORM(Base):
             "license_plate_region",
             name="uq_vehicle_plate",
         ),
+        Index("ix_vehicles_owner_ulid_ulid", "owner_ulid", "ulid"),
     )
 
 
@@ -114,12 +131,22 @@ class ParkingSessionORM(Base):
     )
     facility_ulid: Mapped[str] = mapped_column(String(26), index=True)
     spot_ulid: Mapped[str] = mapped_column(String(26), index=True)
-    vehicle_ulid: Mapped[str] = mapped_column(String(26), index=True)
+    vehicle_ulid: Mapped[str] = mapped_column(String(26))
     entry_time: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True))
     exit_time: Mapped[datetime | None] = mapped_column(
         TIMESTAMP(timezone=True), nullable=True
     )
-    cost_amount: Mapped[Decimal] = mapped_column(Numeric(12, 2))
+    cost_amount: Mapped[Decimal] = mapped_column(Numeric(13, 3))
     cost_currency: Mapped[str] = mapped_column(String(3))
 
-    __table_args__ = (Index("ix_sessions_spot_exit", "spot_ulid", "exit_time"),)
+    __table_args__ = (
+        Index("ix_sessions_spot_exit", "spot_ulid", "exit_time"),
+        Index("ix_sessions_vehicle_entry", "vehicle_ulid", "entry_time", "ulid"),
+        # At most one open session per spot.
+        Index(
+            "uq_sessions_active_spot",
+            "spot_ulid",
+            unique=True,
+            postgresql_where=text("exit_time IS NULL"),
+        ),
+    )
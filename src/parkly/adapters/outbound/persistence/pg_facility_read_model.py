@@ -0,0 +1,115 @@
+from decimal import Decimal
+
+from sqlalchemy import func, select
+
+from parkly.adapters.outbound.persistence.geo_queries import (
+    bounding_box_predicates,
+    distance_km,
+)
+from parkly.adapters.outbound.persistence.orm_models import (
+    ParkingFacilityORM,
+    ParkingSpotORM,
+)
+from parkly.adapters.outbound.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from parkly.application.dto.facility_summary_dto import FacilitySummaryDTO
+from parkly.application.port.facility_read_model import FacilityReadModel
+from parkly.application.port.logger import Logger
+from parkly.domain.model.value_objects import Location
+
+
+class PgFacilityReadModel(FacilityReadModel):
+    def __init__(
+        self,
+        uow: SqlAlchemyUnitOfWork,
+        logger: Logger,
+    ) -> None:
+        self._uow = uow
+        self._logger = logger
+
+    async def find_summaries_near(
+        self, location: Location, radius_km: Decimal, limit: int | None = None
+    ) -> list[FacilitySummaryDTO]:
+        lat = float(location.latitude)
+        lng = float(location.longitude)
+        radius = float(radius_km)
+
+        candidates = (
+            select(
+                ParkingFacilityORM.pk,
+                ParkingFacilityORM.ulid,
+                ParkingFacilityORM.name,
+                ParkingFacilityORM.latitude,
+                ParkingFacilityORM.longitude,
+                ParkingFacilityORM.address,
+                ParkingFacilityORM.facility_type,
+                ParkingFacilityORM.total_capacity,
+                distance_km(lat, lng).label("distance"),
+            )
+            .where(*bounding_box_predicates(lat, lng, radius))
+            .subquery()
+        )
+        nearest = (
+            select(candidates)
+            .where(candidates.c.distance <= radius)
+            .order_by(candidates.c.distance)
+            .limit(limit)
+            .cte("nearest")
+        )
+        spot_count = func.count(ParkingSpotORM.pk).label("spot_count")
+        summary = (
+            select(
+                nearest.c.ulid,
+                nearest.c.name,
+                nearest.c.latitude,
+                nearest.c.longitude,
+                nearest.c.address,
+                nearest.c.facility_type,
+                nearest.c.total_capacity,
+                nearest.c.distance,
+                ParkingSpotORM.spot_type,
+                ParkingSpotORM.status,
+                spot_count,
+            )
+            .outerjoin(ParkingSpotORM, ParkingSpotORM.facility_pk == nearest.c.pk)
+            .group_by(
+                *nearest.c,
+                ParkingSpotORM.spot_type,
+                ParkingSpotORM.status,
+            )
+            .order_by(nearest.c.distance, nearest.c.pk)
+        )
+
+        async with self._uow.session() as session:
+            result = await session.execute(summary)
+            rows = result.all()
+
+        summaries: dict[str, FacilitySummaryDTO] = {}
+        for row in rows:
+            dto = summaries.get(row.ulid)
+            if dto is None:
+                dto = summaries[row.ulid] = FacilitySummaryDTO(
+                    facility_id=row.ulid,
+                    name=row.name,
+                    latitude=str(row.latitude),
+                    longitude=str(row.longitude),
+                    address=row.address,
+                    facility_type=row.facility_type,
+                    total_capacity=row.total_capacity,
+                    distance_km=row.distance,
+                    spot_counts={},
+                )
+            if row.spot_type is not None:
+                dto.spot_counts.setdefault(row.spot_type, {})[row.status] = (
+                    row.spot_count
+                )
+
+        self._logger.debug(
+            "Facility summary search",
+            extra={
+                "latitude": str(location.latitude),
+                "longitude": str(location.longitude),
+                "radius_km": str(radius_km),
+                "found": len(summaries),
+            },
+        )
+        return list(summaries.values())
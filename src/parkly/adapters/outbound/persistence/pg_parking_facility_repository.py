@@ -1,91 +1,135 @@
 from decimal import Decimal
+from itertools import batched
 
-from sqlalchemy import select, text
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import bindparam, delete, insert, select, update
 from sqlalchemy.orm import selectinload
 
+from parkly.adapters.outbound.persistence.geo_queries import (
+    bounding_box_predicates,
+    distance_km,
+)
 from parkly.adapters.outbound.persistence.mappers import (
     facility_to_domain,
-    facility_to_orm,
-    spot_to_orm,
+    facility_to_row,
+    spot_to_row,
 )
 from parkly.adapters.outbound.persistence.orm_models import (
     ParkingFacilityORM,
+    ParkingSpotORM,
+)
+from parkly.adapters.outbound.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from parkly.adapters.outbound.persistence.upsert import (
+    MAX_BIND_PARAMS,
+    bulk_upsert_by_ulid,
 )
+from parkly.application.exception.exceptions import FacilityNotFoundError
 from parkly.application.port.logger import Logger
 from parkly.domain.model.parking_facility import ParkingFacility
 from parkly.domain.model.typed_ids import FacilityId
 from parkly.domain.model.value_objects import Location
 from parkly.domain.port.parking_facility_repository import ParkingFacilityRepository
 
+# Core statement: executemany over the spots table, keyed by ULID rather than
+# the ORM primary key.
+_UPDATE_SPOT_STATUS = (
+    update(ParkingSpotORM.__table__)
+    .where(ParkingSpotORM.__table__.c.ulid == bindparam("spot_ulid"))
+    .values(status=bindparam("spot_status"))
+)
+# Built once; lookups reuse the compiled statement and its cache key.
+_FACILITY_BY_ULID = (
+    select(ParkingFacilityORM)
+    .options(selectinload(ParkingFacilityORM.spots))
+    .where(ParkingFacilityORM.ulid == bindparam("ulid"))
+)
+
 
 class PgParkingFacilityRepository(ParkingFacilityRepository):
     def __init__(
         self,
-        session_factory: async_sessionmaker[AsyncSession],
+        uow: SqlAlchemyUnitOfWork,
         logger: Logger,
     ) -> None:
-        self._session_factory = session_factory
+        self._uow = uow
         self._logger = logger
 
     async def save(self, facility: ParkingFacility) -> None:
-        async with self._session_factory() as session, session.begin():
-            existing = await session.execute(
-                select(ParkingFacilityORM)
-                .options(selectinload(ParkingFacilityORM.spots))
-                .where(ParkingFacilityORM.ulid == facility.id.value)
+        await self.save_many([facility])
+
+    async def save_many(self, facilities: list[ParkingFacility]) -> None:
+        for facility in facilities:
+            self._uow.mark_saved(facility)
+        pending = [(f, f.collect_changes()) for f in facilities]
+        pending = [(f, c) for f, c in pending if not c.is_empty]
+        if not pending:
+            return
+
+        async with self._uow.session() as session:
+            facility_pks: dict[str, int] = {}
+            new_rows = [facility_to_row(f) for f, c in pending if c.is_new]
+            if new_rows:
+                inserted = await session.execute(
+                    insert(ParkingFacilityORM).returning(
+                        ParkingFacilityORM.ulid, ParkingFacilityORM.pk
+                    ),
+                    new_rows,
+                )
+                facility_pks.update(inserted.tuples().all())
+            unknown = [
+                f.id.value
+                for f, c in pending
+                if c.added_spots and f.id.value not in facility_pks
+            ]
+            for batch in batched(unknown, MAX_BIND_PARAMS):
+                found = await session.execute(
+                    select(ParkingFacilityORM.ulid, ParkingFacilityORM.pk).where(
+                        ParkingFacilityORM.ulid.in_(batch)
+                    )
+                )
+                facility_pks.update(found.tuples().all())
+            for facility, changes in pending:
+                if changes.added_spots and facility.id.value not in facility_pks:
+                    raise FacilityNotFoundError(facility.id)
+
+            removed = [i.value for _, c in pending for i in c.removed_spot_ids]
+            for batch in batched(removed, MAX_BIND_PARAMS):
+                await session.execute(
+                    delete(ParkingSpotORM).where(ParkingSpotORM.ulid.in_(batch))
+                )
+            await bulk_upsert_by_ulid(
+                session,
+                ParkingSpotORM,
+                [
+                    spot_to_row(s, facility_pks[f.id.value])
+                    for f, c in pending
+                    for s in c.added_spots
+                ],
             )
-            row: ParkingFacilityORM | None = existing.scalar_one_or_none()
-
-            if row is not None:
-                row.name = facility.name.value
-                row.latitude = facility.location.latitude
-                row.longitude = facility.location.longitude
-                row.address = facility.location.address
-                row.facility_type = facility.facility_type.value
-                row.access_control = facility.access_control.value
-                row.total_capacity = facility.total_capacity.value
-
-                domain_spot_ulids = {s.id.value for s in facility.spots}
-                existing_spot_ulids = {s.ulid for s in row.spots}
-
-                for orm_spot in list(row.spots):
-                    if orm_spot.ulid not in domain_spot_ulids:
-                        await session.delete(orm_spot)
-
-                for orm_spot in row.spots:
-                    if orm_spot.ulid in domain_spot_ulids:
-                        domain_spot = next(
-                            s for s in facility.spots if s.id.value == orm_spot.ulid
-                        )
-                        orm_spot.spot_number = domain_spot.spot_number.value
-                        orm_spot.spot_type = domain_spot.spot_type.value
-                        orm_spot.status = domain_spot.status.value
-
-                for domain_spot in facility.spots:
-                    if domain_spot.id.value not in existing_spot_ulids:
-                        new_orm = spot_to_orm(domain_spot, row.pk)
-                        session.add(new_orm)
-            else:
-                orm = facility_to_orm(facility)
-                session.add(orm)
-                await session.flush()
-                for domain_spot in facility.spots:
-                    spot_orm = spot_to_orm(domain_spot, orm.pk)
-                    session.add(spot_orm)
+            updated = [
+                {"spot_ulid": s.id.value, "spot_status": s.status.value}
+                for _, c in pending
+                for s in c.updated_spots
+            ]
+            if updated:
+                await session.execute(_UPDATE_SPOT_STATUS, updated)
 
         self._logger.debug(
-            "Facility saved",
-            extra={"facility_id": facility.id.value},
+            "Facilities saved",
+            extra={
+                "facilities": len(pending),
+                "facilities_created": sum(c.is_new for _, c in pending),
+                "spots_added": sum(len(c.added_spots) for _, c in pending),
+                "spots_updated": len(updated),
+                "spots_removed": len(removed),
+            },
         )
 
     async def find_by_id(self, id: FacilityId) -> ParkingFacility | None:
-        async with self._session_factory() as session:
-            result = await session.execute(
-                select(ParkingFacilityORM)
-                .options(selectinload(ParkingFacilityORM.spots))
-                .where(ParkingFacilityORM.ulid == id.value)
-            )
+        known = self._uow.get(ParkingFacility, id)
+        if known is not None:
+            return known
+        async with self._uow.session() as session:
+            result = await session.execute(_FACILITY_BY_ULID, {"ulid": id.value})
             row = result.scalar_one_or_none()
 
         found = row is not None
@@ -95,33 +139,69 @@ class PgParkingFacilityRepository(ParkingFacilityRepository):
         )
         if row is None:
             return None
-        return facility_to_domain(row)
+        return self._uow.track(facility_to_domain(row))
+
+    async def find_by_ids(self, ids: list[FacilityId]) -> list[ParkingFacility]:
+        if not ids:
+            return []
+        async with self._uow.session() as session:
+            result = await session.execute(
+                select(ParkingFacilityORM)
+                .options(selectinload(ParkingFacilityORM.spots))
+                .where(ParkingFacilityORM.ulid.in_([i.value for i in ids]))
+            )
+            rows = result.scalars().all()
+
+        facilities = [self._uow.track(facility_to_domain(r)) for r in rows]
+        self._logger.debug(
+            "Facility batch lookup",
+            extra={"requested": len(ids), "found": len(facilities)},
+        )
+        return facilities
+
+    async def find_all_locations(self) -> list[tuple[FacilityId, Location]]:
+        async with self._uow.session() as session:
+            result = await session.execute(
+                select(
+                    ParkingFacilityORM.ulid,
+                    ParkingFacilityORM.latitude,
+                    ParkingFacilityORM.longitude,
+                    ParkingFacilityORM.address,
+                )
+            )
+            rows = result.all()
+
+        self._logger.debug("Facility locations loaded", extra={"found": len(rows)})
+        return [
+            (
+                FacilityId.reconstitute(value=ulid),
+                Location.reconstitute(
+                    latitude=latitude, longitude=longitude, address=address
+                ),
+            )
+            for ulid, latitude, longitude, address in rows
+        ]
 
     async def find_by_location(
-        self, location: Location, radius: Decimal
+        self, location: Location, radius: Decimal, limit: int | None = None
     ) -> list[ParkingFacility]:
         lat = float(location.latitude)
         lng = float(location.longitude)
         radius_km = float(radius)
 
-        haversine_sql = text("""
-            SELECT pk FROM parking_facilities
-            WHERE (
-                6371.0 * acos(
-                    LEAST(1.0, GREATEST(-1.0,
-                        cos(radians(:lat)) * cos(radians(latitude))
-                        * cos(radians(longitude) - radians(:lng))
-                        + sin(radians(:lat)) * sin(radians(latitude))
-                    ))
-                )
-            ) <= :radius
-        """)
+        candidates = select(
+            ParkingFacilityORM.pk, distance_km(lat, lng).label("distance")
+        ).where(*bounding_box_predicates(lat, lng, radius_km))
+        search = (
+            select(candidates.c.pk)
+            .where(candidates.c.distance <= radius_km)
+            .order_by(candidates.c.distance)
+            .limit(limit)
+        )
 
-        async with self._session_factory() as session:
-            pk_result = await session.execute(
-                haversine_sql, {"lat": lat, "lng": lng, "radius": radius_km}
-            )
-            pks = [row[0] for row in pk_result.fetchall()]
+        async with self._uow.session() as session:
+            pk_result = await session.execute(search)
+            pks = list(pk_result.scalars().all())
 
             if not pks:
                 self._logger.debug(
@@ -140,9 +220,11 @@ class PgParkingFacilityRepository(ParkingFacilityRepository):
                 .options(selectinload(ParkingFacilityORM.spots))
                 .where(ParkingFacilityORM.pk.in_(pks))
             )
-            rows = result.scalars().all()
+            rows = {r.pk: r for r in result.scalars().all()}
 
-        facilities = [facility_to_domain(r) for r in rows]
+        facilities = [
+            self._uow.track(facility_to_domain(rows[pk])) for pk in pks if pk in rows
+        ]
         self._logger.debug(
             "Facility location search",
             extra={
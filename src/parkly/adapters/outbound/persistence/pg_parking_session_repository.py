@@ -1,60 +1,107 @@
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from collections.abc import AsyncIterator
+from datetime import datetime
 
+from sqlalchemy import bindparam, select
+from sqlalchemy.exc import IntegrityError
+
+from parkly.adapters.outbound.persistence.constraint_errors import (
+    ACTIVE_SESSION_PER_SPOT,
+    violated_constraint,
+    violation_detail,
+)
+from parkly.adapters.outbound.persistence.database import STREAM_BATCH_ROWS
+from parkly.adapters.outbound.persistence.keyset import fetch_page
 from parkly.adapters.outbound.persistence.mappers import (
     session_to_domain,
-    session_to_orm,
+    session_to_row,
 )
 from parkly.adapters.outbound.persistence.orm_models import ParkingSessionORM
+from parkly.adapters.outbound.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from parkly.adapters.outbound.persistence.upsert import (
+    bulk_upsert_by_ulid,
+    upsert_by_ulid,
+)
+from parkly.application.exception.exceptions import SpotAlreadyOccupiedError
 from parkly.application.port.logger import Logger
+from parkly.domain.model.pagination import Page, PageRequest
 from parkly.domain.model.parking_session import ParkingSession
-from parkly.domain.model.typed_ids import SessionId, SpotId, VehicleId
+from parkly.domain.model.typed_ids import FacilityId, SessionId, SpotId, VehicleId
 from parkly.domain.port.parking_session_repository import ParkingSessionRepository
 
+_SESSION_BY_ULID = select(ParkingSessionORM).where(
+    ParkingSessionORM.ulid == bindparam("ulid")
+)
+_ACTIVE_SESSION_BY_SPOT = select(ParkingSessionORM).where(
+    ParkingSessionORM.spot_ulid == bindparam("spot_ulid"),
+    ParkingSessionORM.exit_time.is_(None),
+)
+
 
 class PgParkingSessionRepository(ParkingSessionRepository):
     def __init__(
         self,
-        session_factory: async_sessionmaker[AsyncSession],
+        uow: SqlAlchemyUnitOfWork,
         logger: Logger,
     ) -> None:
-        self._session_factory = session_factory
+        self._uow = uow
         self._logger = logger
 
-    async def save(self, session: ParkingSession) -> None:
-        async with self._session_factory() as db_session, db_session.begin():
-            result = await db_session.execute(
-                select(ParkingSessionORM).where(
-                    ParkingSessionORM.ulid == session.id.value
-                )
-            )
-            row: ParkingSessionORM | None = result.scalar_one_or_none()
+    @staticmethod
+    def _occupied_spot(
+        exc: IntegrityError, sessions: list[ParkingSession]
+    ) -> SpotAlreadyOccupiedError | None:
+        if violated_constraint(exc) != ACTIVE_SESSION_PER_SPOT:
+            return None
+        detail = violation_detail(exc)
+        for session in sessions:
+            if session.is_active and (
+                len(sessions) == 1 or session.spot_id.value in detail
+            ):
+                return SpotAlreadyOccupiedError(session.spot_id)
+        return None
 
-            if row is not None:
-                row.reservation_ulid = (
-                    session.reservation_id.value if session.reservation_id else None
+    async def save(self, session: ParkingSession) -> None:
+        self._uow.mark_saved(session)
+        try:
+            async with self._uow.session() as db_session:
+                await db_session.execute(
+                    upsert_by_ulid(ParkingSessionORM, session_to_row(session))
                 )
-                row.facility_ulid = session.facility_id.value
-                row.spot_ulid = session.spot_id.value
-                row.vehicle_ulid = session.vehicle_id.value
-                row.entry_time = session.entry_time
-                row.exit_time = session.exit_time
-                row.cost_amount = session.total_cost.amount
-                row.cost_currency = session.total_cost.currency.code
-            else:
-                orm = session_to_orm(session)
-                db_session.add(orm)
+        except IntegrityError as exc:
+            occupied = self._occupied_spot(exc, [session])
+            if occupied is None:
+                raise
+            raise occupied from exc
 
         self._logger.debug(
             "Session saved",
             extra={"session_id": session.id.value},
         )
 
+    async def save_many(self, sessions: list[ParkingSession]) -> None:
+        for session in sessions:
+            self._uow.mark_saved(session)
+        try:
+            async with self._uow.session() as db_session:
+                await bulk_upsert_by_ulid(
+                    db_session,
+                    ParkingSessionORM,
+                    [session_to_row(s) for s in sessions],
+                )
+        except IntegrityError as exc:
+            occupied = self._occupied_spot(exc, sessions)
+            if occupied is None:
+                raise
+            raise occupied from exc
+
+        self._logger.debug("Sessions saved", extra={"count": len(sessions)})
+
     async def find_by_id(self, id: SessionId) -> ParkingSession | None:
-        async with self._session_factory() as db_session:
-            result = await db_session.execute(
-                select(ParkingSessionORM).where(ParkingSessionORM.ulid == id.value)
-            )
+        known = self._uow.get(ParkingSession, id)
+        if known is not None:
+            return known
+        async with self._uow.session() as db_session:
+            result = await db_session.execute(_SESSION_BY_ULID, {"ulid": id.value})
             row = result.scalar_one_or_none()
 
         self._logger.debug(
@@ -63,15 +110,12 @@ class PgParkingSessionRepository(ParkingSessionRepository):
         )
         if row is None:
             return None
-        return session_to_domain(row)
+        return self._uow.track(session_to_domain(row))
 
     async def find_active_by_spot(self, spot_id: SpotId) -> ParkingSession | None:
-        async with self._session_factory() as db_session:
+        async with self._uow.session() as db_session:
             result = await db_session.execute(
-                select(ParkingSessionORM).where(
-                    ParkingSessionORM.spot_ulid == spot_id.value,
-                    ParkingSessionORM.exit_time.is_(None),
-                )
+                _ACTIVE_SESSION_BY_SPOT, {"spot_ulid": spot_id.value}
             )
             row = result.scalar_one_or_none()
 
@@ -81,20 +125,79 @@ class PgParkingSessionRepository(ParkingSessionRepository):
         )
         if row is None:
             return None
-        return session_to_domain(row)
+        return self._uow.track(session_to_domain(row))
 
-    async def find_by_vehicle(self, vehicle_id: VehicleId) -> list[ParkingSession]:
-        async with self._session_factory() as db_session:
+    async def find_active_by_facility(
+        self, facility_id: FacilityId
+    ) -> list[ParkingSession]:
+        async with self._uow.session() as db_session:
             result = await db_session.execute(
                 select(ParkingSessionORM).where(
-                    ParkingSessionORM.vehicle_ulid == vehicle_id.value
+                    ParkingSessionORM.facility_ulid == facility_id.value,
+                    ParkingSessionORM.exit_time.is_(None),
                 )
             )
             rows = result.scalars().all()
 
-        sessions = [session_to_domain(r) for r in rows]
+        sessions = [self._uow.track(session_to_domain(r)) for r in rows]
         self._logger.debug(
-            "Session vehicle search",
-            extra={"vehicle_id": vehicle_id.value, "found": len(sessions)},
+            "Active session facility search",
+            extra={"facility_id": facility_id.value, "found": len(sessions)},
         )
         return sessions
+
+    async def find_by_vehicle(
+        self, vehicle_id: VehicleId, page: PageRequest
+    ) -> Page[ParkingSession]:
+        async with self._uow.session() as db_session:
+            rows, next_cursor = await fetch_page(
+                db_session,
+                select(ParkingSessionORM).where(
+                    ParkingSessionORM.vehicle_ulid == vehicle_id.value
+                ),
+                key=(ParkingSessionORM.entry_time, ParkingSessionORM.ulid),
+                page=page,
+                descending=True,
+            )
+
+        sessions = [self._uow.track(session_to_domain(r)) for r in rows]
+        self._logger.debug(
+            "Session vehicle search",
+            extra={
+                "vehicle_id": vehicle_id.value,
+                "found": len(sessions),
+                "more": next_cursor is not None,
+            },
+        )
+        return Page(items=sessions, next_cursor=next_cursor)
+
+    async def stream_by_facility(
+        self,
+        facility_id: FacilityId,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> AsyncIterator[ParkingSession]:
+        statement = select(ParkingSessionORM).where(
+            ParkingSessionORM.facility_ulid == facility_id.value
+        )
+        if since is not None:
+            statement = statement.where(ParkingSessionORM.entry_time >= since)
+        if until is not None:
+            statement = statement.where(ParkingSessionORM.entry_time < until)
+        statement = statement.order_by(
+            ParkingSessionORM.entry_time, ParkingSessionORM.ulid
+        ).execution_options(yield_per=STREAM_BATCH_ROWS)
+
+        # Rows are mapped as they arrive and not tracked by the unit of work,
+        # so memory stays flat however long the history is.
+        streamed = 0
+        async with self._uow.stream_session() as db_session:
+            result = await db_session.stream_scalars(statement)
+            async for row in result:
+                streamed += 1
+                yield session_to_domain(row)
+
+        self._logger.debug(
+            "Sessions streamed",
+            extra={"facility_id": facility_id.value, "count": streamed},
+        )
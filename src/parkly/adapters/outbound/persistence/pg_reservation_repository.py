@@ -1,60 +1,115 @@
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from collections.abc import AsyncIterator
+from datetime import datetime
 
+from sqlalchemy import bindparam, select
+from sqlalchemy.exc import IntegrityError
+
+from parkly.adapters.outbound.persistence.constraint_errors import (
+    RESERVATION_SLOT_OVERLAP,
+    violated_constraint,
+    violation_detail,
+)
+from parkly.adapters.outbound.persistence.database import STREAM_BATCH_ROWS
+from parkly.adapters.outbound.persistence.keyset import fetch_page
 from parkly.adapters.outbound.persistence.mappers import (
     reservation_to_domain,
-    reservation_to_orm,
+    reservation_to_row,
 )
 from parkly.adapters.outbound.persistence.orm_models import ReservationORM
+from parkly.adapters.outbound.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from parkly.adapters.outbound.persistence.upsert import (
+    bulk_upsert_by_ulid,
+    upsert_by_ulid,
+)
 from parkly.application.port.logger import Logger
+from parkly.domain.exception.exceptions import SpotAlreadyReservedError
+from parkly.domain.model.enums import ReservationStatus
+from parkly.domain.model.pagination import Page, PageRequest
 from parkly.domain.model.reservation import Reservation
-from parkly.domain.model.typed_ids import ReservationId, SpotId, VehicleId
+from parkly.domain.model.typed_ids import (
+    FacilityId,
+    ReservationId,
+    SpotId,
+    VehicleId,
+)
 from parkly.domain.model.value_objects import TimeSlot
 from parkly.domain.port.reservation_repository import ReservationRepository
 
+_RESERVATION_BY_ULID = select(ReservationORM).where(
+    ReservationORM.ulid == bindparam("ulid")
+)
+_RESERVATIONS_OVERLAPPING = select(ReservationORM).where(
+    ReservationORM.spot_ulid == bindparam("spot_ulid"),
+    ReservationORM.time_slot_start < bindparam("end"),
+    ReservationORM.time_slot_end > bindparam("start"),
+)
+
 
 class PgReservationRepository(ReservationRepository):
     def __init__(
         self,
-        session_factory: async_sessionmaker[AsyncSession],
+        uow: SqlAlchemyUnitOfWork,
         logger: Logger,
     ) -> None:
-        self._session_factory = session_factory
+        self._uow = uow
         self._logger = logger
 
+    @staticmethod
+    def _reserved_spot(
+        exc: IntegrityError, reservations: list[Reservation]
+    ) -> SpotAlreadyReservedError | None:
+        if violated_constraint(exc) != RESERVATION_SLOT_OVERLAP:
+            return None
+        detail = violation_detail(exc)
+        for reservation in reservations:
+            if len(reservations) == 1 or reservation.spot_id.value in detail:
+                return SpotAlreadyReservedError(
+                    spot_identifier=reservation.spot_id.value
+                )
+        return None
+
     async def save(self, reservation: Reservation) -> None:
-        async with self._session_factory() as session, session.begin():
-            result = await session.execute(
-                select(ReservationORM).where(
-                    ReservationORM.ulid == reservation.id.value
+        self._uow.mark_saved(reservation)
+        try:
+            async with self._uow.session() as session:
+                await session.execute(
+                    upsert_by_ulid(ReservationORM, reservation_to_row(reservation))
                 )
-            )
-            row: ReservationORM | None = result.scalar_one_or_none()
-
-            if row is not None:
-                row.facility_ulid = reservation.facility_id.value
-                row.spot_ulid = reservation.spot_id.value
-                row.vehicle_ulid = reservation.vehicle_id.value
-                row.time_slot_start = reservation.time_slot.start
-                row.time_slot_end = reservation.time_slot.end
-                row.status = reservation.status.value
-                row.cost_amount = reservation.total_cost.amount
-                row.cost_currency = reservation.total_cost.currency.code
-                row.created_at = reservation.created_at
-            else:
-                orm = reservation_to_orm(reservation)
-                session.add(orm)
+        except IntegrityError as exc:
+            reserved = self._reserved_spot(exc, [reservation])
+            if reserved is None:
+                raise
+            raise reserved from exc
 
         self._logger.debug(
             "Reservation saved",
             extra={"reservation_id": reservation.id.value},
         )
 
+    async def save_many(self, reservations: list[Reservation]) -> None:
+        for reservation in reservations:
+            self._uow.mark_saved(reservation)
+        try:
+            async with self._uow.session() as session:
+                await bulk_upsert_by_ulid(
+                    session,
+                    ReservationORM,
+                    [reservation_to_row(r) for r in reservations],
+                )
+        except IntegrityError as exc:
+            reserved = self._reserved_spot(exc, reservations)
+            if reserved is None:
+                raise
+            raise reserved from exc
+
+        self._logger.debug("Reservations saved", extra={"count": len(reservations)})
+
     async def find_by_id(self, id: ReservationId) -> Reservation | None:
-        async with self._session_factory() as session:
-            result = await session.execute(
-                select(ReservationORM).where(ReservationORM.ulid == id.value)
-            )
+        known = self._uow.get(Reservation, id)
+        if known is not None:
+            return known
+        async with self._uow.session() as session:
+            result = await session.execute(_RESERVATION_BY_ULID, {"ulid": id.value})
             row = result.scalar_one_or_none()
 
         self._logger.debug(
@@ -63,22 +118,23 @@ class PgReservationRepository(ReservationRepository):
         )
         if row is None:
             return None
-        return reservation_to_domain(row)
+        return self._uow.track(reservation_to_domain(row))
 
     async def find_by_spot_and_time(
         self, spot_id: SpotId, time_slot: TimeSlot
     ) -> list[Reservation]:
-        async with self._session_factory() as session:
+        async with self._uow.session() as session:
             result = await session.execute(
-                select(ReservationORM).where(
-                    ReservationORM.spot_ulid == spot_id.value,
-                    ReservationORM.time_slot_start < time_slot.end,
-                    ReservationORM.time_slot_end > time_slot.start,
-                )
+                _RESERVATIONS_OVERLAPPING,
+                {
+                    "spot_ulid": spot_id.value,
+                    "start": time_slot.start,
+                    "end": time_slot.end,
+                },
             )
             rows = result.scalars().all()
 
-        reservations = [reservation_to_domain(r) for r in rows]
+        reservations = [self._uow.track(reservation_to_domain(r)) for r in rows]
         self._logger.debug(
             "Reservation spot+time search",
             extra={
@@ -90,18 +146,81 @@ class PgReservationRepository(ReservationRepository):
         )
         return reservations
 
-    async def find_by_vehicle(self, vehicle_id: VehicleId) -> list[Reservation]:
-        async with self._session_factory() as session:
-            result = await session.execute(
+    async def find_active_by_facility(
+        self, facility_id: FacilityId, ending_after: datetime | None = None
+    ) -> list[Reservation]:
+        statement = select(ReservationORM).where(
+            ReservationORM.facility_ulid == facility_id.value,
+            ReservationORM.status.not_in(
+                (
+                    ReservationStatus.CANCELLED.value,
+                    ReservationStatus.COMPLETED.value,
+                )
+            ),
+        )
+        if ending_after is not None:
+            statement = statement.where(ReservationORM.time_slot_end > ending_after)
+        async with self._uow.session() as session:
+            result = await session.execute(statement)
+            rows = result.scalars().all()
+
+        reservations = [self._uow.track(reservation_to_domain(r)) for r in rows]
+        self._logger.debug(
+            "Reservation active facility search",
+            extra={"facility_id": facility_id.value, "found": len(reservations)},
+        )
+        return reservations
+
+    async def find_by_vehicle(
+        self, vehicle_id: VehicleId, page: PageRequest
+    ) -> Page[Reservation]:
+        async with self._uow.session() as session:
+            rows, next_cursor = await fetch_page(
+                session,
                 select(ReservationORM).where(
                     ReservationORM.vehicle_ulid == vehicle_id.value
-                )
+                ),
+                key=(ReservationORM.time_slot_start, ReservationORM.ulid),
+                page=page,
+                descending=True,
             )
-            rows = result.scalars().all()
 
-        reservations = [reservation_to_domain(r) for r in rows]
+        reservations = [self._uow.track(reservation_to_domain(r)) for r in rows]
         self._logger.debug(
             "Reservation vehicle search",
-            extra={"vehicle_id": vehicle_id.value, "found": len(reservations)},
+            extra={
+                "vehicle_id": vehicle_id.value,
+                "found": len(reservations),
+                "more": next_cursor is not None,
+            },
+        )
+        return Page(items=reservations, next_cursor=next_cursor)
+
+    async def stream_by_facility(
+        self,
+        facility_id: FacilityId,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> AsyncIterator[Reservation]:
+        statement = select(ReservationORM).where(
+            ReservationORM.facility_ulid == facility_id.value
+        )
+        if since is not None:
+            statement = statement.where(ReservationORM.time_slot_start >= since)
+        if until is not None:
+            statement = statement.where(ReservationORM.time_slot_start < until)
+        statement = statement.order_by(
+            ReservationORM.time_slot_start, ReservationORM.ulid
+        ).execution_options(yield_per=STREAM_BATCH_ROWS)
+
+        streamed = 0
+        async with self._uow.stream_session() as session:
+            result = await session.stream_scalars(statement)
+            async for row in result:
+                streamed += 1
+                yield reservation_to_domain(row)
+
+        self._logger.debug(
+            "Reservations streamed",
+            extra={"facility_id": facility_id.value, "count": streamed},
         )
-        return reservations
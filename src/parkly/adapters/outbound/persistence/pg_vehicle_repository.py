@@ -1,54 +1,65 @@
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import bindparam, select
 
+from parkly.adapters.outbound.persistence.keyset import fetch_page
 from parkly.adapters.outbound.persistence.mappers import (
     vehicle_to_domain,
-    vehicle_to_orm,
+    vehicle_to_row,
 )
 from parkly.adapters.outbound.persistence.orm_models import VehicleORM
+from parkly.adapters.outbound.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from parkly.adapters.outbound.persistence.upsert import (
+    bulk_upsert_by_ulid,
+    upsert_by_ulid,
+)
 from parkly.application.port.logger import Logger
+from parkly.domain.model.pagination import Page, PageRequest
 from parkly.domain.model.typed_ids import OwnerId, VehicleId
 from parkly.domain.model.value_objects import LicensePlate
 from parkly.domain.model.vehicle import Vehicle
 from parkly.domain.port.vehicle_repository import VehicleRepository
 
+_VEHICLE_BY_ULID = select(VehicleORM).where(VehicleORM.ulid == bindparam("ulid"))
+_VEHICLE_BY_PLATE = select(VehicleORM).where(
+    VehicleORM.license_plate_value == bindparam("plate"),
+    VehicleORM.license_plate_region == bindparam("region"),
+)
+
 
 class PgVehicleRepository(VehicleRepository):
     def __init__(
         self,
-        session_factory: async_sessionmaker[AsyncSession],
+        uow: SqlAlchemyUnitOfWork,
         logger: Logger,
     ) -> None:
-        self._session_factory = session_factory
+        self._uow = uow
         self._logger = logger
 
     async def save(self, vehicle: Vehicle) -> None:
-        async with self._session_factory() as session, session.begin():
-            result = await session.execute(
-                select(VehicleORM).where(VehicleORM.ulid == vehicle.id.value)
-            )
-            row: VehicleORM | None = result.scalar_one_or_none()
-
-            if row is not None:
-                row.owner_ulid = vehicle.owner_id.value
-                row.license_plate_value = vehicle.license_plate.value
-                row.license_plate_region = vehicle.license_plate.region
-                row.vehicle_type = vehicle.vehicle_type.value
-                row.is_ev = vehicle.is_ev
-            else:
-                orm = vehicle_to_orm(vehicle)
-                session.add(orm)
+        self._uow.mark_saved(vehicle)
+        async with self._uow.session() as session:
+            await session.execute(upsert_by_ulid(VehicleORM, vehicle_to_row(vehicle)))
 
         self._logger.debug(
             "Vehicle saved",
             extra={"vehicle_id": vehicle.id.value},
         )
 
-    async def find_by_id(self, id: VehicleId) -> Vehicle | None:
-        async with self._session_factory() as session:
-            result = await session.execute(
-                select(VehicleORM).where(VehicleORM.ulid == id.value)
+    async def save_many(self, vehicles: list[Vehicle]) -> None:
+        for vehicle in vehicles:
+            self._uow.mark_saved(vehicle)
+        async with self._uow.session() as session:
+            await bulk_upsert_by_ulid(
+                session, VehicleORM, [vehicle_to_row(v) for v in vehicles]
             )
+
+        self._logger.debug("Vehicles saved", extra={"count": len(vehicles)})
+
+    async def find_by_id(self, id: VehicleId) -> Vehicle | None:
+        known = self._uow.get(Vehicle, id)
+        if known is not None:
+            return known
+        async with self._uow.session() as session:
+            result = await session.execute(_VEHICLE_BY_ULID, {"ulid": id.value})
             row = result.scalar_one_or_none()
 
         self._logger.debug(
@@ -57,29 +68,34 @@ class PgVehicleRepository(VehicleRepository):
         )
         if row is None:
             return None
-        return vehicle_to_domain(row)
+        return self._uow.track(vehicle_to_domain(row))
 
-    async def find_by_owner(self, owner_id: OwnerId) -> list[Vehicle]:
-        async with self._session_factory() as session:
-            result = await session.execute(
-                select(VehicleORM).where(VehicleORM.owner_ulid == owner_id.value)
+    async def find_by_owner(
+        self, owner_id: OwnerId, page: PageRequest
+    ) -> Page[Vehicle]:
+        async with self._uow.session() as session:
+            rows, next_cursor = await fetch_page(
+                session,
+                select(VehicleORM).where(VehicleORM.owner_ulid == owner_id.value),
+                key=(VehicleORM.ulid,),
+                page=page,
             )
-            rows = result.scalars().all()
 
-        vehicles = [vehicle_to_domain(r) for r in rows]
+        vehicles = [self._uow.track(vehicle_to_domain(r)) for r in rows]
         self._logger.debug(
             "Vehicle owner search",
-            extra={"owner_id": owner_id.value, "found": len(vehicles)},
+            extra={
+                "owner_id": owner_id.value,
+                "found": len(vehicles),
+                "more": next_cursor is not None,
+            },
         )
-        return vehicles
+        return Page(items=vehicles, next_cursor=next_cursor)
 
     async def find_by_license_plate(self, plate: LicensePlate) -> Vehicle | None:
-        async with self._session_factory() as session:
+        async with self._uow.session() as session:
             result = await session.execute(
-                select(VehicleORM).where(
-                    VehicleORM.license_plate_value == plate.value,
-                    VehicleORM.license_plate_region == plate.region,
-                )
+                _VEHICLE_BY_PLATE, {"plate": plate.value, "region": plate.region}
             )
             row = result.scalar_one_or_none()
 
@@ -92,4 +108,4 @@ class PgVehicleRepository(VehicleRepository):
         )
         if row is None:
             return None
-        return vehicle_to_domain(row)
+        return self._uow.track(vehicle_to_domain(row))
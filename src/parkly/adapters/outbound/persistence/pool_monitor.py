@@ -0,0 +1,143 @@
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection, QueuePool
+
+from parkly.adapters.outbound.persistence.adaptive_limiter import AdaptiveLimiter
+from parkly.application.port.logger import Logger
+
+# Weight of the newest checkout in the moving average of wait times.
+_WAIT_SMOOTHING = 0.2
+
+
+class MonitoredPool(AsyncAdaptedQueuePool):
+    """Queue pool that reports how long each checkout waited to its monitor."""
+
+    monitor: PoolMonitor | None = None
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            if self.monitor is not None:
+                self.monitor.record_timeout(time.perf_counter() - started)
+            raise
+        if self.monitor is not None:
+            self.monitor.record_wait(time.perf_counter() - started)
+        return connection
+
+    def recreate(self) -> QueuePool:
+        pool = super().recreate()
+        if isinstance(pool, MonitoredPool):
+            pool.monitor = self.monitor
+        return pool
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    size: int
+    in_use: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    wait_ms_avg: float
+    wait_ms_max: float
+    limit: int | None
+    waiting: int
+    ready: bool
+
+
+class PoolMonitor:
+    """Checkout telemetry for an engine's pool, from pool events and timings.
+
+    With a limiter, every checkout wait is fed to it so the admitted
+    concurrency follows the pool's latency. The pool counts as saturated
+    after a checkout timeout, for ``saturation_window`` seconds, or while the
+    limiter queues more callers than it admits. ``clock`` reads monotonic
+    seconds for that window.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        logger: Logger,
+        limiter: AdaptiveLimiter | None = None,
+        saturation_window: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._engine = engine.sync_engine
+        self._logger = logger
+        self._limiter = limiter
+        self._saturation_window = saturation_window
+        self._clock = clock
+        self._in_use = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._last_timeout: float | None = None
+        self._wait_avg = 0.0
+        self._wait_max = 0.0
+
+        # A recreated pool keeps both the listeners and the monitor.
+        pool = self._engine.pool
+        if isinstance(pool, MonitoredPool):
+            pool.monitor = self
+        event.listen(pool, "checkout", self._on_checkout)
+        event.listen(pool, "checkin", self._on_checkin)
+
+    @property
+    def limiter(self) -> AdaptiveLimiter | None:
+        return self._limiter
+
+    def _on_checkout(self, *_: Any) -> None:
+        self._checkouts += 1
+        self._in_use += 1
+
+    def _on_checkin(self, *_: Any) -> None:
+        self._in_use = max(0, self._in_use - 1)
+
+    def record_wait(self, seconds: float) -> None:
+        self._wait_avg += _WAIT_SMOOTHING * (seconds - self._wait_avg)
+        self._wait_max = max(self._wait_max, seconds)
+        if self._limiter is not None:
+            self._limiter.observe(seconds)
+
+    def record_timeout(self, seconds: float) -> None:
+        self._timeouts += 1
+        self._last_timeout = self._clock()
+        if self._limiter is not None:
+            self._limiter.observe(seconds)
+        self._logger.warning(
+            "Connection pool checkout timed out",
+            extra={"waited_ms": round(seconds * 1000, 2), "in_use": self._in_use},
+        )
+
+    def is_ready(self) -> bool:
+        if (
+            self._last_timeout is not None
+            and self._clock() - self._last_timeout < self._saturation_window
+        ):
+            return False
+        limiter = self._limiter
+        return limiter is None or limiter.waiting <= limiter.limit
+
+    def stats(self) -> PoolStats:
+        pool = self._engine.pool
+        queued = isinstance(pool, QueuePool)
+        return PoolStats(
+            size=pool.size() if queued else 0,
+            in_use=self._in_use,
+            overflow=max(0, pool.overflow()) if queued else 0,
+            checkouts=self._checkouts,
+            timeouts=self._timeouts,
+            wait_ms_avg=round(self._wait_avg * 1000, 2),
+            wait_ms_max=round(self._wait_max * 1000, 2),
+            limit=None if self._limiter is None else self._limiter.limit,
+            waiting=0 if self._limiter is None else self._limiter.waiting,
+            ready=self.is_ready(),
+        )
@@ -0,0 +1,204 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Any, Self
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from parkly.adapters.context import read_consistency
+from parkly.adapters.outbound.persistence.adaptive_limiter import AdaptiveLimiter
+from parkly.application.port.event_publisher import EventPublisher
+from parkly.application.port.logger import Logger
+from parkly.application.port.unit_of_work import UnitOfWork
+from parkly.domain.model.entity import AggregateRoot
+
+type _IdentityKey = tuple[type[AggregateRoot[Any]], object]
+
+
+@dataclass
+class _Unit:
+    session: AsyncSession
+    token: Token[_Unit | None] | None = None
+    depth: int = 1
+    identity_map: dict[_IdentityKey, AggregateRoot[Any]] = field(default_factory=dict)
+    saved: dict[_IdentityKey, AggregateRoot[Any]] = field(default_factory=dict)
+    on_commit: list[Callable[[], None]] = field(default_factory=list)
+
+
+class SqlAlchemyUnitOfWork(UnitOfWork):
+    """Units run on the primary; reads outside a unit go to the replica, if any.
+
+    A request that committed a write, or that the inbound adapter marks as
+    following one, reads from the primary so it sees its own writes. With a
+    limiter, primary sessions are only opened once it admits them. Streamed
+    reads are capped separately by ``max_streams``.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        event_publisher: EventPublisher,
+        logger: Logger,
+        read_session_factory: async_sessionmaker[AsyncSession] | None = None,
+        limiter: AdaptiveLimiter | None = None,
+        max_streams: int | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._read_session_factory = read_session_factory
+        self._limiter = limiter
+        self._streams = asyncio.Semaphore(max_streams) if max_streams else None
+        self._event_publisher = event_publisher
+        self._logger = logger
+        # Per task: each request or event handler gets its own unit.
+        self._current: ContextVar[_Unit | None] = ContextVar(
+            f"unit_of_work_{id(self)}", default=None
+        )
+
+    async def __aenter__(self) -> Self:
+        unit = self._current.get()
+        if unit is not None:
+            unit.depth += 1
+            return self
+        if self._limiter is not None:
+            await self._limiter.acquire()
+        try:
+            session = self._session_factory()
+            await session.begin()
+        except BaseException:
+            if self._limiter is not None:
+                self._limiter.release()
+            raise
+        unit = _Unit(session=session)
+        unit.token = self._current.set(unit)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        unit = self._current.get()
+        if unit is None:
+            return
+        unit.depth -= 1
+        if unit.depth > 0:
+            return
+        if unit.token is not None:
+            self._current.reset(unit.token)
+
+        try:
+            if exc_type is None:
+                await unit.session.commit()
+            else:
+                await unit.session.rollback()
+        finally:
+            await unit.session.close()
+            if self._limiter is not None:
+                self._limiter.release()
+
+        if exc_type is not None:
+            self._logger.debug(
+                "Unit of work rolled back",
+                extra={"error": type(exc).__name__},
+            )
+            return
+        consistency = read_consistency.get()
+        if consistency is not None and unit.saved:
+            consistency.use_primary = consistency.wrote = True
+        for callback in unit.on_commit:
+            callback()
+        events = [e for a in unit.saved.values() for e in a.collect_events()]
+        self._logger.debug(
+            "Unit of work committed",
+            extra={"aggregates": len(unit.saved), "events": len(events)},
+        )
+        await self._event_publisher.publish(events)
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """The unit's session, or a session of its own outside a unit."""
+        unit = self._current.get()
+        if unit is not None:
+            yield unit.session
+            return
+        if self._read_session_factory is not None and self.reads_replica():
+            async with self._read_session_factory() as session, session.begin():
+                yield session
+            return
+        if self._limiter is not None:
+            await self._limiter.acquire()
+        try:
+            async with self._session_factory() as session, session.begin():
+                yield session
+        finally:
+            if self._limiter is not None:
+                self._limiter.release()
+
+    @asynccontextmanager
+    async def stream_session(self) -> AsyncIterator[AsyncSession]:
+        """A session for a long streamed read, such as an export.
+
+        The stream holds its session for as long as the client takes to read
+        it, so it goes to the replica whenever there is one, accepting its
+        lag, and never takes a limiter slot. Streams over ``max_streams``
+        wait here rather than for a pooled connection.
+        """
+        unit = self._current.get()
+        if unit is not None:
+            yield unit.session
+            return
+        factory = self._read_session_factory or self._session_factory
+        if self._streams is None:
+            async with factory() as session, session.begin():
+                yield session
+            return
+        async with self._streams, factory() as session, session.begin():
+            yield session
+
+    def in_unit(self) -> bool:
+        """Whether the calling task is inside a unit of work."""
+        return self._current.get() is not None
+
+    def reads_replica(self) -> bool:
+        """Whether a read made now is served by the read replica."""
+        if self._read_session_factory is None or self._current.get() is not None:
+            return False
+        consistency = read_consistency.get()
+        return consistency is None or not consistency.use_primary
+
+    def get[A: AggregateRoot[Any]](
+        self, aggregate_type: type[A], aggregate_id: object
+    ) -> A | None:
+        unit = self._current.get()
+        if unit is None:
+            return None
+        found = unit.identity_map.get((aggregate_type, aggregate_id))
+        return found if isinstance(found, aggregate_type) else None
+
+    def track[A: AggregateRoot[Any]](self, aggregate: A) -> A:
+        """Return the unit's instance of the aggregate, registering it if new."""
+        unit = self._current.get()
+        if unit is None:
+            return aggregate
+        known = unit.identity_map.setdefault((type(aggregate), aggregate.id), aggregate)
+        return known if isinstance(known, type(aggregate)) else aggregate
+
+    def mark_saved(self, aggregate: AggregateRoot[Any]) -> None:
+        unit = self._current.get()
+        if unit is None:
+            return
+        key = (type(aggregate), aggregate.id)
+        unit.identity_map[key] = aggregate
+        unit.saved.setdefault(key, aggregate)
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        """Run the callback once the unit commits; at once outside a unit."""
+        unit = self._current.get()
+        if unit is None:
+            callback()
+            return
+        unit.on_commit.append(callback)
@@ -0,0 +1,74 @@
+from collections.abc import Mapping, Sequence
+from itertools import batched
+from typing import Any
+
+from sqlalchemy import column, select, table, text
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from parkly.adapters.outbound.persistence.orm_models import Base
+
+# Postgres caps a statement at 32767 bind parameters.
+MAX_BIND_PARAMS = 32_767
+# From this many rows on, COPY into a staging table beats multi-row VALUES.
+COPY_THRESHOLD = 5_000
+
+
+def _on_conflict_update(statement: Insert, columns: Sequence[str]) -> Insert:
+    return statement.on_conflict_do_update(
+        index_elements=["ulid"],
+        set_={name: statement.excluded[name] for name in columns if name != "ulid"},
+    )
+
+
+def upsert_by_ulid(
+    model: type[Base], rows: Mapping[str, Any] | Sequence[Mapping[str, Any]]
+) -> Insert:
+    """``INSERT ... ON CONFLICT (ulid) DO UPDATE`` of every other column."""
+    columns = list(rows.keys() if isinstance(rows, Mapping) else rows[0].keys())
+    return _on_conflict_update(insert(model).values(rows), columns)
+
+
+async def bulk_upsert_by_ulid(
+    session: AsyncSession, model: type[Base], rows: Sequence[Mapping[str, Any]]
+) -> None:
+    """Upsert many rows: multi-row VALUES batches, or COPY and merge."""
+    if not rows:
+        return
+    # ON CONFLICT cannot touch the same row twice in one statement.
+    rows = list({row["ulid"]: row for row in rows}.values())
+    if len(rows) >= COPY_THRESHOLD:
+        await _copy_and_merge(session, model, rows)
+        return
+    batch_size = MAX_BIND_PARAMS // len(rows[0])
+    for batch in batched(rows, batch_size):
+        await session.execute(upsert_by_ulid(model, batch))
+
+
+async def _copy_and_merge(
+    session: AsyncSession, model: type[Base], rows: Sequence[Mapping[str, Any]]
+) -> None:
+    columns = list(rows[0].keys())
+    target = model.__tablename__
+    staging = f"_staging_{target}"
+    # Issued through the session so it runs inside the session's transaction.
+    await session.execute(
+        text(
+            f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+            f"SELECT {', '.join(columns)} FROM {target} WITH NO DATA"
+        )
+    )
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        staging,
+        records=[tuple(row[name] for name in columns) for row in rows],
+        columns=columns,
+    )
+    staged = table(staging, *(column(name) for name in columns))
+    await session.execute(
+        _on_conflict_update(
+            insert(model).from_select(columns, select(*staged.c)), columns
+        )
+    )
+    await session.execute(text(f"DROP TABLE {staging}"))
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
 
 from parkly.application.exception.exceptions import FacilityNotFoundError
-from parkly.application.port.event_publisher import EventPublisher
 from parkly.application.port.logger import Logger
+from parkly.application.port.unit_of_work import UnitOfWork
 from parkly.domain.model.enums import SpotStatus, SpotType
 from parkly.domain.model.typed_ids import FacilityId, SpotId
 from parkly.domain.model.value_objects import SpotNumber
@@ -25,13 +25,13 @@ class AddParkingSpotHandler:
         facility_repo: ParkingFacilityRepository,
         id_generator: IdGenerator[SpotId],
         clock: Clock,
-        event_publisher: EventPublisher,
+        uow: UnitOfWork,
         logger: Logger,
     ) -> None:
         self._facility_repo = facility_repo
         self._id_generator = id_generator
         self._clock = clock
-        self._event_publisher = event_publisher
+        self._uow = uow
         self._logger = logger
 
     async def handle(self, command: AddParkingSpot) -> str:
@@ -44,31 +44,31 @@ class AddParkingSpotHandler:
             },
         )
 
-        facility_id = FacilityId(value=command.facility_id)
-        facility = await self._facility_repo.find_by_id(facility_id)
-        if facility is None:
-            self._logger.warning(
-                "Facility not found",
-                extra={"facility_id": str(command.facility_id)},
-            )
-            raise FacilityNotFoundError(facility_id)
+        async with self._uow:
+            facility_id = FacilityId(value=command.facility_id)
+            facility = await self._facility_repo.find_by_id(facility_id)
+            if facility is None:
+                self._logger.warning(
+                    "Facility not found",
+                    extra={"facility_id": str(command.facility_id)},
+                )
+                raise FacilityNotFoundError(facility_id)
 
-        spot_id = self._id_generator.generate()
-        spot_number = SpotNumber(value=command.spot_number)
-        spot_type = SpotType(command.spot_type)
-        status = SpotStatus(command.status)
+            spot_id = self._id_generator.generate()
+            spot_number = SpotNumber(value=command.spot_number)
+            spot_type = SpotType(command.spot_type)
+            status = SpotStatus(command.status)
 
-        occurred_at = self._clock.now()
-        facility.add_spot(
-            spot_id=spot_id,
-            spot_number=spot_number,
-            spot_type=spot_type,
-            status=status,
-            occurred_at=occurred_at,
-        )
+            occurred_at = self._clock.now()
+            facility.add_spot(
+                spot_id=spot_id,
+                spot_number=spot_number,
+                spot_type=spot_type,
+                status=status,
+                occurred_at=occurred_at,
+            )
 
-        await self._facility_repo.save(facility)
-        await self._event_publisher.publish(facility.collect_events())
+            await self._facility_repo.save(facility)
 
         self._logger.info(
             "Parking spot added",
@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+
+from parkly.application.exception.exceptions import FacilityNotFoundError
+from parkly.application.port.logger import Logger
+from parkly.application.port.unit_of_work import UnitOfWork
+from parkly.domain.model.enums import SpotStatus, SpotType
+from parkly.domain.model.parking_facility import ParkingSpot
+from parkly.domain.model.typed_ids import FacilityId, SpotId
+from parkly.domain.model.value_objects import SpotNumber
+from parkly.domain.port.clock import Clock
+from parkly.domain.port.id_generator import IdGenerator
+from parkly.domain.port.parking_facility_repository import ParkingFacilityRepository
+
+
+@dataclass(frozen=True)
+class NewSpot:
+    spot_number: str
+    spot_type: str
+    status: str
+
+
+@dataclass(frozen=True)
+class AddParkingSpots:
+    facility_id: str
+    spots: list[NewSpot]
+
+
+class AddParkingSpotsHandler:
+    def __init__(
+        self,
+        facility_repo: ParkingFacilityRepository,
+        id_generator: IdGenerator[SpotId],
+        clock: Clock,
+        uow: UnitOfWork,
+        logger: Logger,
+    ) -> None:
+        self._facility_repo = facility_repo
+        self._id_generator = id_generator
+        self._clock = clock
+        self._uow = uow
+        self._logger = logger
+
+    async def handle(self, command: AddParkingSpots) -> list[str]:
+        self._logger.info(
+            "Handling AddParkingSpots",
+            extra={
+                "facility_id": str(command.facility_id),
+                "count": len(command.spots),
+            },
+        )
+
+        spots = [
+            ParkingSpot.create(
+                spot_id=self._id_generator.generate(),
+                spot_number=SpotNumber(value=s.spot_number),
+                spot_type=SpotType(s.spot_type),
+                status=SpotStatus(s.status),
+            )
+            for s in command.spots
+        ]
+
+        async with self._uow:
+            facility_id = FacilityId(value=command.facility_id)
+            facility = await self._facility_repo.find_by_id(facility_id)
+            if facility is None:
+                self._logger.warning(
+                    "Facility not found",
+                    extra={"facility_id": str(command.facility_id)},
+                )
+                raise FacilityNotFoundError(facility_id)
+
+            facility.add_spots(spots, occurred_at=self._clock.now())
+
+            await self._facility_repo.save(facility)
+
+        self._logger.info(
+            "Parking spots added",
+            extra={
+                "facility_id": str(command.facility_id),
+                "count": len(spots),
+            },
+        )
+        return [str(s.id.value) for s in spots]
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
 from decimal import Decimal
 
-from parkly.application.port.event_publisher import EventPublisher
 from parkly.application.port.logger import Logger
+from parkly.application.port.unit_of_work import UnitOfWork
 from parkly.domain.model.enums import AccessControlMethod, FacilityType
 from parkly.domain.model.parking_facility import ParkingFacility
 from parkly.domain.model.typed_ids import FacilityId
@@ -29,13 +29,13 @@ class CreateParkingFacilityHandler:
         facility_repo: ParkingFacilityRepository,
         id_generator: IdGenerator[FacilityId],
         clock: Clock,
-        event_publisher: EventPublisher,
+        uow: UnitOfWork,
         logger: Logger,
     ) -> None:
         self._facility_repo = facility_repo
         self._id_generator = id_generator
         self._clock = clock
-        self._event_publisher = event_publisher
+        self._uow = uow
         self._logger = logger
 
     async def handle(self, command: CreateParkingFacility) -> str:
@@ -47,30 +47,30 @@ class CreateParkingFacilityHandler:
             },
         )
 
-        facility_id = self._id_generator.generate()
-        name = FacilityName(value=command.name)
-        location = Location(
-            latitude=command.latitude,
-            longitude=command.longitude,
-            address=command.address,
-        )
-        capacity = Capacity(value=command.total_capacity)
-        facility_type = FacilityType(command.facility_type)
-        access_control = AccessControlMethod(command.access_control)
+        async with self._uow:
+            facility_id = self._id_generator.generate()
+            name = FacilityName(value=command.name)
+            location = Location(
+                latitude=command.latitude,
+                longitude=command.longitude,
+                address=command.address,
+            )
+            capacity = Capacity(value=command.total_capacity)
+            facility_type = FacilityType(command.facility_type)
+            access_control = AccessControlMethod(command.access_control)
 
-        occurred_at = self._clock.now()
-        facility = ParkingFacility.create(
-            facility_id=facility_id,
-            name=name,
-            location=location,
-            facility_type=facility_type,
-            access_control=access_control,
-            total_capacity=capacity,
-            occurred_at=occurred_at,
-        )
+            occurred_at = self._clock.now()
+            facility = ParkingFacility.create(
+                facility_id=facility_id,
+                name=name,
+                location=location,
+                facility_type=facility_type,
+                access_control=access_control,
+                total_capacity=capacity,
+                occurred_at=occurred_at,
+            )
 
-        await self._facility_repo.save(facility)
-        await self._event_publisher.publish(facility.collect_events())
+            await self._facility_repo.save(facility)
 
         self._logger.info(
             "Facility created",
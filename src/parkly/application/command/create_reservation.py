@@ -6,12 +6,9 @@ from parkly.application.exception.exceptions import (
     FacilityNotFoundError,
     VehicleNotFoundError,
 )
-from parkly.application.port.event_publisher import EventPublisher
 from parkly.application.port.logger import Logger
-from parkly.domain.exception.exceptions import (
-    IneligibleSpotTypeError,
-    SpotAlreadyReservedError,
-)
+from parkly.application.port.unit_of_work import UnitOfWork
+from parkly.domain.exception.exceptions import IneligibleSpotTypeError
 from parkly.domain.model.enums import ReservationStatus
 from parkly.domain.model.reservation import Reservation
 from parkly.domain.model.typed_ids import FacilityId, ReservationId, SpotId, VehicleId
@@ -44,7 +41,7 @@ class CreateReservationHandler:
         id_generator: IdGenerator[ReservationId],
         pricing_service: PricingService,
         clock: Clock,
-        event_publisher: EventPublisher,
+        uow: UnitOfWork,
         logger: Logger,
     ) -> None:
         self._facility_repo = facility_repo
@@ -53,7 +50,7 @@ class CreateReservationHandler:
         self._id_generator = id_generator
         self._pricing_service = pricing_service
         self._clock = clock
-        self._event_publisher = event_publisher
+        self._uow = uow
         self._logger = logger
 
     async def handle(self, command: CreateReservation) -> str:
@@ -66,79 +63,67 @@ class CreateReservationHandler:
             },
         )
 
-        facility_id = FacilityId(value=command.facility_id)
-        spot_id = SpotId(value=command.spot_id)
-        vehicle_id = VehicleId(value=command.vehicle_id)
-        time_slot = TimeSlot(start=command.time_slot_start, end=command.time_slot_end)
-        base_rate = Money(
-            amount=command.base_rate_amount,
-            currency=Currency(code=command.base_rate_currency),
-        )
-
-        facility = await self._facility_repo.find_by_id(facility_id)
-        if facility is None:
-            self._logger.warning(
-                "Facility not found",
-                extra={"facility_id": str(command.facility_id)},
+        async with self._uow:
+            facility_id = FacilityId(value=command.facility_id)
+            spot_id = SpotId(value=command.spot_id)
+            vehicle_id = VehicleId(value=command.vehicle_id)
+            time_slot = TimeSlot(
+                start=command.time_slot_start, end=command.time_slot_end
             )
-            raise FacilityNotFoundError(facility_id)
-
-        vehicle = await self._vehicle_repo.find_by_id(vehicle_id)
-        if vehicle is None:
-            self._logger.warning(
-                "Vehicle not found",
-                extra={"vehicle_id": str(command.vehicle_id)},
+            base_rate = Money(
+                amount=command.base_rate_amount,
+                currency=Currency.of(command.base_rate_currency),
             )
-            raise VehicleNotFoundError(vehicle_id)
-
-        spot = None
-        for s in facility.spots:
-            if s.id == spot_id:
-                spot = s
-                break
 
-        if spot is not None:
-            eligible_types = vehicle.eligible_spot_types()
-            if spot.spot_type not in eligible_types:
-                raise IneligibleSpotTypeError(
-                    vehicle_type=vehicle.vehicle_type.value,
-                    spot_type=spot.spot_type.value,
+            facility = await self._facility_repo.find_by_id(facility_id)
+            if facility is None:
+                self._logger.warning(
+                    "Facility not found",
+                    extra={"facility_id": str(command.facility_id)},
                 )
+                raise FacilityNotFoundError(facility_id)
 
-        existing = await self._reservation_repo.find_by_spot_and_time(
-            spot_id, time_slot
-        )
-        active_reservations = [
-            r
-            for r in existing
-            if r.status
-            not in (ReservationStatus.CANCELLED, ReservationStatus.COMPLETED)
-        ]
-        if active_reservations:
-            raise SpotAlreadyReservedError(spot_identifier=str(command.spot_id))
-
-        total_cost = self._pricing_service.calculate_price(time_slot, base_rate)
-
-        facility.reserve_spot(spot_id)
-        await self._facility_repo.save(facility)
-        await self._event_publisher.publish(facility.collect_events())
-
-        occurred_at = self._clock.now()
-        reservation_id = self._id_generator.generate()
-        reservation = Reservation.create(
-            reservation_id=reservation_id,
-            facility_id=facility_id,
-            spot_id=spot_id,
-            vehicle_id=vehicle_id,
-            time_slot=time_slot,
-            status=ReservationStatus.PENDING,
-            total_cost=total_cost,
-            created_at=occurred_at,
-            occurred_at=occurred_at,
-        )
+            vehicle = await self._vehicle_repo.find_by_id(vehicle_id)
+            if vehicle is None:
+                self._logger.warning(
+                    "Vehicle not found",
+                    extra={"vehicle_id": str(command.vehicle_id)},
+                )
+                raise VehicleNotFoundError(vehicle_id)
+
+            spot = facility.find_spot(spot_id)
+            if spot is not None:
+                eligible_types = vehicle.eligible_spot_types()
+                if spot.spot_type not in eligible_types:
+                    raise IneligibleSpotTypeError(
+                        vehicle_type=vehicle.vehicle_type.value,
+                        spot_type=spot.spot_type.value,
+                    )
+
+            total_cost = self._pricing_service.calculate_price_minor(
+                time_slot, base_rate
+            ).to_money()
+
+            facility.reserve_spot(spot_id)
+            await self._facility_repo.save(facility)
+
+            occurred_at = self._clock.now()
+            reservation_id = self._id_generator.generate()
+            reservation = Reservation.create(
+                reservation_id=reservation_id,
+                facility_id=facility_id,
+                spot_id=spot_id,
+                vehicle_id=vehicle_id,
+                time_slot=time_slot,
+                status=ReservationStatus.PENDING,
+                total_cost=total_cost,
+                created_at=occurred_at,
+                occurred_at=occurred_at,
+            )
 
-        await self._reservation_repo.save(reservation)
-        await self._event_publisher.publish(reservation.collect_events())
+            # An overlapping live reservation of the spot is rejected by the
+            # database and raised as SpotAlreadyReservedError.
+            await self._reservation_repo.save(reservation)
 
         self._logger.info(
             "Reservation created",
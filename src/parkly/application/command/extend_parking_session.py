@@ -3,8 +3,8 @@ from datetime import datetime
 from decimal import Decimal
 
 from parkly.application.exception.exceptions import SessionNotFoundError
-from parkly.application.port.event_publisher import EventPublisher
 from parkly.application.port.logger import Logger
+from parkly.application.port.unit_of_work import UnitOfWork
 from parkly.domain.model.typed_ids import SessionId
 from parkly.domain.model.value_objects import Currency, Money
 from parkly.domain.port.clock import Clock
@@ -24,12 +24,12 @@ class ExtendParkingSessionHandler:
         self,
         session_repo: ParkingSessionRepository,
         clock: Clock,
-        event_publisher: EventPublisher,
+        uow: UnitOfWork,
         logger: Logger,
     ) -> None:
         self._session_repo = session_repo
         self._clock = clock
-        self._event_publisher = event_publisher
+        self._uow = uow
         self._logger = logger
 
     async def handle(self, command: ExtendParkingSession) -> None:
@@ -41,24 +41,26 @@ class ExtendParkingSessionHandler:
             },
         )
 
-        session_id = SessionId(value=command.session_id)
-        new_total_cost = Money(
-            amount=command.new_total_cost_amount,
-            currency=Currency(code=command.new_total_cost_currency),
-        )
-
-        session = await self._session_repo.find_by_id(session_id)
-        if session is None:
-            self._logger.warning(
-                "Session not found",
-                extra={"session_id": str(command.session_id)},
+        async with self._uow:
+            session_id = SessionId(value=command.session_id)
+            new_total_cost = Money(
+                amount=command.new_total_cost_amount,
+                currency=Currency.of(command.new_total_cost_currency),
             )
-            raise SessionNotFoundError(session_id)
 
-        session.extend(command.new_end, new_total_cost, occurred_at=self._clock.now())
+            session = await self._session_repo.find_by_id(session_id)
+            if session is None:
+                self._logger.warning(
+                    "Session not found",
+                    extra={"session_id": str(command.session_id)},
+                )
+                raise SessionNotFoundError(session_id)
+
+            session.extend(
+                command.new_end, new_total_cost, occurred_at=self._clock.now()
+            )
 
-        await self._session_repo.save(session)
-        await self._event_publisher.publish(session.collect_events())
+            await self._session_repo.save(session)
 
         self._logger.info(
             "Parking session extended",
@@ -2,9 +2,10 @@ from dataclasses import dataclass
 from datetime import datetime
 
 from parkly.application.exception.exceptions import ReservationNotFoundError
-from parkly.application.port.event_publisher import EventPublisher
 from parkly.application.port.logger import Logger
+from parkly.application.port.unit_of_work import UnitOfWork
 from parkly.domain.model.typed_ids import ReservationId
+from parkly.domain.port.clock import Clock
 from parkly.domain.port.reservation_repository import ReservationRepository
 
 
@@ -18,11 +19,13 @@ class ExtendReservationHandler:
     def __init__(
         self,
         reservation_repo: ReservationRepository,
-        event_publisher: EventPublisher,
+        clock: Clock,
+        uow: UnitOfWork,
         logger: Logger,
     ) -> None:
         self._reservation_repo = reservation_repo
-        self._event_publisher = event_publisher
+        self._clock = clock
+        self._uow = uow
         self._logger = logger
 
     async def handle(self, command: ExtendReservation) -> None:
@@ -34,19 +37,19 @@ class ExtendReservationHandler:
             },
         )
 
-        reservation_id = ReservationId(value=command.reservation_id)
-        reservation = await self._reservation_repo.find_by_id(reservation_id)
-        if reservation is None:
-            self._logger.warning(
-                "Reservation not found",
-                extra={"reservation_id": str(command.reservation_id)},
-            )
-            raise ReservationNotFoundError(reservation_id)
+        async with self._uow:
+            reservation_id = ReservationId(value=command.reservation_id)
+            reservation = await self._reservation_repo.find_by_id(reservation_id)
+            if reservation is None:
+                self._logger.warning(
+                    "Reservation not found",
+                    extra={"reservation_id": str(command.reservation_id)},
+                )
+                raise ReservationNotFoundError(reservation_id)
 
-        reservation.extend(command.new_end)
+            reservation.extend(command.new_end, occurred_at=self._clock.now())
 
-        await self._reservation_repo.save(reservation)
-        await self._event_publisher.publish(reservation.collect_events())
+            await self._reservation_repo.save(reservation)
 
         self._logger.info(
             "Reservation extended",
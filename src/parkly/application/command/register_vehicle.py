@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
-from parkly.application.port.event_publisher import EventPublisher
 from parkly.application.port.logger import Logger
+from parkly.application.port.unit_of_work import UnitOfWork
 from parkly.domain.model.enums import VehicleType
 from parkly.domain.model.typed_ids import OwnerId, VehicleId
 from parkly.domain.model.value_objects import LicensePlate
@@ -26,13 +26,13 @@ class RegisterVehicleHandler:
         vehicle_repo: VehicleRepository,
         id_generator: IdGenerator[VehicleId],
         clock: Clock,
-        event_publisher: EventPublisher,
+        uow: UnitOfWork,
         logger: Logger,
     ) -> None:
         self._vehicle_repo = vehicle_repo
         self._id_generator = id_generator
         self._clock = clock
-        self._event_publisher = event_publisher
+        self._uow = uow
         self._logger = logger
 
     async def handle(self, command: RegisterVehicle) -> str:
@@ -44,26 +44,26 @@ class RegisterVehicleHandler:
             },
         )
 
-        vehicle_id = self._id_generator.generate()
-        owner_id = OwnerId(value=command.owner_id)
-        license_plate = LicensePlate(
-            value=command.license_plate_value,
-            region=command.license_plate_region,
-        )
-        vehicle_type = VehicleType(command.vehicle_type)
+        async with self._uow:
+            vehicle_id = self._id_generator.generate()
+            owner_id = OwnerId(value=command.owner_id)
+            license_plate = LicensePlate(
+                value=command.license_plate_value,
+                region=command.license_plate_region,
+            )
+            vehicle_type = VehicleType(command.vehicle_type)
 
-        occurred_at = self._clock.now()
-        vehicle = Vehicle.create(
-            vehicle_id=vehicle_id,
-            owner_id=owner_id,
-            license_plate=license_plate,
-            vehicle_type=vehicle_type,
-            is_ev=command.is_ev,
-            occurred_at=occurred_at,
-        )
+            occurred_at = self._clock.now()
+            vehicle = Vehicle.create(
+                vehicle_id=vehicle_id,
+                owner_id=owner_id,
+                license_plate=license_plate,
+                vehicle_type=vehicle_type,
+                is_ev=command.is_ev,
+                occurred_at=occurred_at,
+            )
 
-        await self._vehicle_repo.save(vehicle)
-        await self._event_publisher.publish(vehicle.collect_events())
+            await self._vehicle_repo.save(vehicle)
 
         self._logger.info(
             "Vehicle registered",
@@ -1,12 +1,9 @@
 from dataclasses import dataclass
 from decimal import Decimal
 
-from parkly.application.exception.exceptions import (
-    FacilityNotFoundError,
-    SpotAlreadyOccupiedError,
-)
-from parkly.application.port.event_publisher import EventPublisher
+from parkly.application.exception.exceptions import FacilityNotFoundError
 from parkly.application.port.logger import Logger
+from parkly.application.port.unit_of_work import UnitOfWork
 from parkly.domain.model.parking_session import ParkingSession
 from parkly.domain.model.typed_ids import (
     FacilityId,
@@ -38,14 +35,14 @@ class StartParkingSessionHandler:
         facility_repo: ParkingFacilityRepository,
         id_generator: IdGenerator[SessionId],
         clock: Clock,
-        event_publisher: EventPublisher,
+        uow: UnitOfWork,
         logger: Logger,
     ) -> None:
         self._session_repo = session_repo
         self._facility_repo = facility_repo
         self._id_generator = id_generator
         self._clock = clock
-        self._event_publisher = event_publisher
+        self._uow = uow
         self._logger = logger
 
     async def handle(self, command: StartParkingSession) -> str:
@@ -58,43 +55,41 @@ class StartParkingSessionHandler:
             },
         )
 
-        facility_id = FacilityId(value=command.facility_id)
-        spot_id = SpotId(value=command.spot_id)
-        vehicle_id = VehicleId(value=command.vehicle_id)
-        reservation_id = (
-            ReservationId(value=command.reservation_id)
-            if command.reservation_id
-            else None
-        )
-        currency = Currency(code=command.currency)
-
-        facility = await self._facility_repo.find_by_id(facility_id)
-        if facility is None:
-            self._logger.warning(
-                "Facility not found",
-                extra={"facility_id": str(command.facility_id)},
+        async with self._uow:
+            facility_id = FacilityId(value=command.facility_id)
+            spot_id = SpotId(value=command.spot_id)
+            vehicle_id = VehicleId(value=command.vehicle_id)
+            reservation_id = (
+                ReservationId(value=command.reservation_id)
+                if command.reservation_id
+                else None
             )
-            raise FacilityNotFoundError(facility_id)
+            currency = Currency.of(command.currency)
 
-        active_session = await self._session_repo.find_active_by_spot(spot_id)
-        if active_session is not None:
-            raise SpotAlreadyOccupiedError(spot_id)
+            facility = await self._facility_repo.find_by_id(facility_id)
+            if facility is None:
+                self._logger.warning(
+                    "Facility not found",
+                    extra={"facility_id": str(command.facility_id)},
+                )
+                raise FacilityNotFoundError(facility_id)
 
-        occurred_at = self._clock.now()
-        session_id = self._id_generator.generate()
-        session = ParkingSession.create(
-            session_id=session_id,
-            facility_id=facility_id,
-            spot_id=spot_id,
-            vehicle_id=vehicle_id,
-            entry_time=occurred_at,
-            total_cost=Money(amount=Decimal("0"), currency=currency),
-            occurred_at=occurred_at,
-            reservation_id=reservation_id,
-        )
+            occurred_at = self._clock.now()
+            session_id = self._id_generator.generate()
+            session = ParkingSession.create(
+                session_id=session_id,
+                facility_id=facility_id,
+                spot_id=spot_id,
+                vehicle_id=vehicle_id,
+                entry_time=occurred_at,
+                total_cost=Money(amount=Decimal("0"), currency=currency),
+                occurred_at=occurred_at,
+                reservation_id=reservation_id,
+            )
 
-        await self._session_repo.save(session)
-        await self._event_publisher.publish(session.collect_events())
+            # A spot's second open session is rejected by the database and
+            # raised as SpotAlreadyOccupiedError.
+            await self._session_repo.save(session)
 
         self._logger.info(
             "Parking session started",
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class AvailabilityBucketDTO:
+    start: datetime
+    free_spots: int
+
+
+@dataclass(frozen=True)
+class AvailabilityGridDTO:
+    facility_id: str
+    spot_type: str | None
+    bucket_minutes: int
+    buckets: list[AvailabilityBucketDTO]
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class FacilitySummaryDTO:
+    facility_id: str
+    name: str
+    latitude: str
+    longitude: str
+    address: str
+    facility_type: str
+    total_capacity: int
+    distance_km: float
+    spot_counts: dict[str, dict[str, int]]
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from parkly.domain.model.value_objects import MinorMoney, TimeSlot
+
+
+@dataclass(frozen=True)
+class QuoteDTO:
+    time_slot_start: datetime
+    time_slot_end: datetime
+    total_cost_amount: str
+    total_cost_currency: str
+
+    @staticmethod
+    def from_domain(time_slot: TimeSlot, price: MinorMoney) -> QuoteDTO:
+        total_cost = price.to_money()
+        return QuoteDTO(
+            time_slot_start=time_slot.start,
+            time_slot_end=time_slot.end,
+            total_cost_amount=str(total_cost.amount),
+            total_cost_currency=str(total_cost.currency),
+        )
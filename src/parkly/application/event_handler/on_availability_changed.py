@@ -0,0 +1,65 @@
+from parkly.application.port.logger import Logger
+from parkly.application.service.availability_index import AvailabilityIndex
+from parkly.domain.event.events import (
+    ReservationCancelled,
+    ReservationCompleted,
+    ReservationCreated,
+    ReservationExtended,
+    SessionEnded,
+    SessionStarted,
+    SpotAdded,
+    SpotRemoved,
+)
+
+
+class OnAvailabilityChangedUpdateIndex:
+    def __init__(
+        self,
+        availability_index: AvailabilityIndex,
+        logger: Logger,
+    ) -> None:
+        self._availability_index = availability_index
+        self._logger = logger
+
+    async def handle(
+        self,
+        event: SpotAdded
+        | SpotRemoved
+        | ReservationCreated
+        | ReservationExtended
+        | ReservationCancelled
+        | ReservationCompleted
+        | SessionStarted
+        | SessionEnded,
+    ) -> None:
+        self._logger.debug(f"Handling {type(event).__name__} for availability")
+
+        match event:
+            case SpotAdded():
+                self._availability_index.add_spot(
+                    event.facility_id, event.spot_id, event.spot_type
+                )
+            case SpotRemoved():
+                self._availability_index.remove_spot(event.facility_id, event.spot_id)
+            case ReservationCreated():
+                self._availability_index.reserve(
+                    reservation_id=event.reservation_id,
+                    facility_id=event.facility_id,
+                    spot_id=event.spot_id,
+                    time_slot=event.time_slot,
+                )
+            case ReservationExtended():
+                self._availability_index.reschedule(
+                    event.reservation_id, event.time_slot
+                )
+            case ReservationCancelled() | ReservationCompleted():
+                self._availability_index.release(event.reservation_id)
+            case SessionStarted():
+                self._availability_index.occupy(
+                    session_id=event.session_id,
+                    facility_id=event.facility_id,
+                    spot_id=event.spot_id,
+                    start=event.occurred_at,
+                )
+            case SessionEnded():
+                self._availability_index.release(event.session_id)
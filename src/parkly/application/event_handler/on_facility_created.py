@@ -0,0 +1,20 @@
+from parkly.application.port.logger import Logger
+from parkly.application.service.facility_locator import FacilityLocator
+from parkly.domain.event.events import FacilityCreated
+
+
+class OnFacilityCreatedIndexLocation:
+    def __init__(
+        self,
+        facility_locator: FacilityLocator,
+        logger: Logger,
+    ) -> None:
+        self._facility_locator = facility_locator
+        self._logger = logger
+
+    async def handle(self, event: FacilityCreated) -> None:
+        self._logger.debug(
+            "Handling FacilityCreated for location index",
+            extra={"facility_id": str(event.facility_id.value)},
+        )
+        self._facility_locator.add(event.facility_id, event.location)
@@ -1,5 +1,5 @@
-from parkly.application.port.event_publisher import EventPublisher
 from parkly.application.port.logger import Logger
+from parkly.application.port.unit_of_work import UnitOfWork
 from parkly.domain.event.events import SessionEnded
 from parkly.domain.port.clock import Clock
 from parkly.domain.port.parking_facility_repository import ParkingFacilityRepository
@@ -14,14 +14,14 @@ class OnSessionEndedReleaseSpot:
         facility_repo: ParkingFacilityRepository,
         reservation_repo: ReservationRepository,
         clock: Clock,
-        event_publisher: EventPublisher,
+        uow: UnitOfWork,
         logger: Logger,
     ) -> None:
         self._session_repo = session_repo
         self._facility_repo = facility_repo
         self._reservation_repo = reservation_repo
         self._clock = clock
-        self._event_publisher = event_publisher
+        self._uow = uow
         self._logger = logger
 
     async def handle(self, event: SessionEnded) -> None:
@@ -30,37 +30,36 @@ class OnSessionEndedReleaseSpot:
             extra={"session_id": str(event.session_id.value)},
         )
 
-        session = await self._session_repo.find_by_id(event.session_id)
-        if session is None:
-            self._logger.warning(
-                "Session not found, skipping spot release",
-                extra={"session_id": str(event.session_id.value)},
-            )
-            return
+        async with self._uow:
+            session = await self._session_repo.find_by_id(event.session_id)
+            if session is None:
+                self._logger.warning(
+                    "Session not found, skipping spot release",
+                    extra={"session_id": str(event.session_id.value)},
+                )
+                return
 
-        facility = await self._facility_repo.find_by_id(session.facility_id)
-        if facility is None:
-            self._logger.warning(
-                "Facility not found, skipping spot release",
-                extra={
-                    "session_id": str(event.session_id.value),
-                    "facility_id": str(session.facility_id.value),
-                },
-            )
-            return
+            facility = await self._facility_repo.find_by_id(session.facility_id)
+            if facility is None:
+                self._logger.warning(
+                    "Facility not found, skipping spot release",
+                    extra={
+                        "session_id": str(event.session_id.value),
+                        "facility_id": str(session.facility_id.value),
+                    },
+                )
+                return
 
-        facility.release_spot(session.spot_id)
-        await self._facility_repo.save(facility)
-        await self._event_publisher.publish(facility.collect_events())
+            facility.release_spot(session.spot_id)
+            await self._facility_repo.save(facility)
 
-        if session.reservation_id is not None:
-            reservation = await self._reservation_repo.find_by_id(
-                session.reservation_id
-            )
-            if reservation is not None:
-                reservation.complete(occurred_at=self._clock.now())
-                await self._reservation_repo.save(reservation)
-                await self._event_publisher.publish(reservation.collect_events())
+            if session.reservation_id is not None:
+                reservation = await self._reservation_repo.find_by_id(
+                    session.reservation_id
+                )
+                if reservation is not None:
+                    reservation.complete(occurred_at=self._clock.now())
+                    await self._reservation_repo.save(reservation)
 
         self._logger.info(
             "Spot released after session ended",
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from decimal import Decimal
+
+from parkly.application.dto.facility_summary_dto import FacilitySummaryDTO
+from parkly.domain.model.value_objects import Location
+
+
+class FacilityReadModel(ABC):
+    @abstractmethod
+    async def find_summaries_near(
+        self, location: Location, radius_km: Decimal, limit: int | None = None
+    ) -> list[FacilitySummaryDTO]: ...
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import Self
+
+
+class UnitOfWork(ABC):
+    """One transaction around a command.
+
+    Repositories used inside ``async with uow:`` share its connection and see
+    each aggregate once; events of saved aggregates are published after
+    commit. Nested blocks join the outermost one.
+    """
+
+    @abstractmethod
+    async def __aenter__(self) -> Self: ...
+
+    @abstractmethod
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None: ...
@@ -0,0 +1,50 @@
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime
+
+from parkly.application.dto.reservation_dto import ReservationDTO
+from parkly.application.port.logger import Logger
+from parkly.domain.exception.exceptions import InvalidTimeSlotError
+from parkly.domain.model.typed_ids import FacilityId
+from parkly.domain.port.reservation_repository import ReservationRepository
+
+
+@dataclass(frozen=True)
+class ExportFacilityReservations:
+    facility_id: str
+    since: datetime | None = None
+    until: datetime | None = None
+
+
+class ExportFacilityReservationsHandler:
+    def __init__(
+        self,
+        reservation_repo: ReservationRepository,
+        logger: Logger,
+    ) -> None:
+        self._reservation_repo = reservation_repo
+        self._logger = logger
+
+    def handle(
+        self, query: ExportFacilityReservations
+    ) -> AsyncIterator[ReservationDTO]:
+        self._logger.debug(
+            "Handling ExportFacilityReservations",
+            extra={
+                "facility_id": str(query.facility_id),
+                "since": str(query.since),
+                "until": str(query.until),
+            },
+        )
+
+        facility_id = FacilityId(value=query.facility_id)
+        if (
+            query.since is not None
+            and query.until is not None
+            and query.since >= query.until
+        ):
+            raise InvalidTimeSlotError()
+        reservations = self._reservation_repo.stream_by_facility(
+            facility_id, query.since, query.until
+        )
+        return (ReservationDTO.from_domain(r) async for r in reservations)
@@ -0,0 +1,49 @@
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime
+
+from parkly.application.dto.session_dto import SessionDTO
+from parkly.application.port.logger import Logger
+from parkly.domain.exception.exceptions import InvalidTimeSlotError
+from parkly.domain.model.typed_ids import FacilityId
+from parkly.domain.port.parking_session_repository import ParkingSessionRepository
+
+
+@dataclass(frozen=True)
+class ExportFacilitySessions:
+    facility_id: str
+    since: datetime | None = None
+    until: datetime | None = None
+
+
+class ExportFacilitySessionsHandler:
+    def __init__(
+        self,
+        session_repo: ParkingSessionRepository,
+        logger: Logger,
+    ) -> None:
+        self._session_repo = session_repo
+        self._logger = logger
+
+    def handle(self, query: ExportFacilitySessions) -> AsyncIterator[SessionDTO]:
+        """Validates eagerly, then streams sessions as they are read."""
+        self._logger.debug(
+            "Handling ExportFacilitySessions",
+            extra={
+                "facility_id": str(query.facility_id),
+                "since": str(query.since),
+                "until": str(query.until),
+            },
+        )
+
+        facility_id = FacilityId(value=query.facility_id)
+        if (
+            query.since is not None
+            and query.until is not None
+            and query.since >= query.until
+        ):
+            raise InvalidTimeSlotError()
+        sessions = self._session_repo.stream_by_facility(
+            facility_id, query.since, query.until
+        )
+        return (SessionDTO.from_domain(s) async for s in sessions)
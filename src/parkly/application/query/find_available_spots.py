@@ -4,6 +4,7 @@ from datetime import datetime
 from parkly.application.dto.spot_dto import SpotDTO
 from parkly.application.exception.exceptions import FacilityNotFoundError
 from parkly.application.port.logger import Logger
+from parkly.application.service.availability_index import AvailabilityIndex
 from parkly.domain.model.enums import SpotType
 from parkly.domain.model.typed_ids import FacilityId
 from parkly.domain.model.value_objects import TimeSlot
@@ -22,9 +23,11 @@ class FindAvailableSpotsHandler:
     def __init__(
         self,
         facility_repo: ParkingFacilityRepository,
+        availability_index: AvailabilityIndex,
         logger: Logger,
     ) -> None:
         self._facility_repo = facility_repo
+        self._availability_index = availability_index
         self._logger = logger
 
     async def handle(self, query: FindAvailableSpots) -> list[SpotDTO]:
@@ -41,7 +44,8 @@ class FindAvailableSpotsHandler:
         spot_type = SpotType(query.spot_type) if query.spot_type else None
 
         facility = await self._facility_repo.find_by_id(facility_id)
-        if facility is None:
+        schedule = await self._availability_index.schedule_for(facility_id)
+        if facility is None or schedule is None:
             self._logger.warning(
                 "Facility not found",
                 extra={"facility_id": str(query.facility_id)},
@@ -51,6 +55,7 @@ class FindAvailableSpotsHandler:
         available = facility.get_available_spots(
             time_slot=time_slot,
             spot_type=spot_type,
+            schedule=schedule,
         )
         result = [SpotDTO.from_domain(s) for s in available]
 
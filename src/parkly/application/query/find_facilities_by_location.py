@@ -3,6 +3,8 @@ from decimal import Decimal
 
 from parkly.application.dto.facility_dto import FacilityDTO
 from parkly.application.port.logger import Logger
+from parkly.application.service.facility_locator import FacilityLocator
+from parkly.domain.model.parking_facility import ParkingFacility
 from parkly.domain.model.value_objects import Location
 from parkly.domain.port.parking_facility_repository import ParkingFacilityRepository
 
@@ -13,15 +15,18 @@ class FindFacilitiesByLocation:
     longitude: Decimal
     address: str
     radius_km: Decimal
+    limit: int | None = None
 
 
 class FindFacilitiesByLocationHandler:
     def __init__(
         self,
         facility_repo: ParkingFacilityRepository,
+        facility_locator: FacilityLocator,
         logger: Logger,
     ) -> None:
         self._facility_repo = facility_repo
+        self._facility_locator = facility_locator
         self._logger = logger
 
     async def handle(self, query: FindFacilitiesByLocation) -> list[FacilityDTO]:
@@ -31,6 +36,7 @@ class FindFacilitiesByLocationHandler:
                 "latitude": str(query.latitude),
                 "longitude": str(query.longitude),
                 "radius_km": str(query.radius_km),
+                "limit": query.limit,
             },
         )
 
@@ -39,9 +45,13 @@ class FindFacilitiesByLocationHandler:
             longitude=query.longitude,
             address=query.address,
         )
-        facilities = await self._facility_repo.find_by_location(
-            location, query.radius_km
-        )
+        if self._facility_locator.is_loaded:
+            facilities = await self._locate(location, query.radius_km, query.limit)
+        else:
+            # Until the index is loaded, the repository searches by itself.
+            facilities = await self._facility_repo.find_by_location(
+                location, query.radius_km, query.limit
+            )
         result = [FacilityDTO.from_domain(f) for f in facilities]
 
         self._logger.debug(
@@ -49,3 +59,16 @@ class FindFacilitiesByLocationHandler:
             extra={"count": len(result)},
         )
         return result
+
+    async def _locate(
+        self, location: Location, radius_km: Decimal, limit: int | None
+    ) -> list[ParkingFacility]:
+        if limit is None:
+            matches = await self._facility_locator.within(location, radius_km)
+        else:
+            matches = await self._facility_locator.nearest(location, limit, radius_km)
+        facilities = {
+            f.id: f
+            for f in await self._facility_repo.find_by_ids([i for i, _ in matches])
+        }
+        return [facilities[i] for i, _ in matches if i in facilities]
@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+from decimal import Decimal
+
+from parkly.application.dto.facility_summary_dto import FacilitySummaryDTO
+from parkly.application.port.facility_read_model import FacilityReadModel
+from parkly.application.port.logger import Logger
+from parkly.domain.model.value_objects import Location
+
+
+@dataclass(frozen=True)
+class FindFacilitySummaries:
+    latitude: Decimal
+    longitude: Decimal
+    address: str
+    radius_km: Decimal
+    limit: int | None = None
+
+
+class FindFacilitySummariesHandler:
+    def __init__(
+        self,
+        read_model: FacilityReadModel,
+        logger: Logger,
+    ) -> None:
+        self._read_model = read_model
+        self._logger = logger
+
+    async def handle(self, query: FindFacilitySummaries) -> list[FacilitySummaryDTO]:
+        self._logger.debug(
+            "Handling FindFacilitySummaries",
+            extra={
+                "latitude": str(query.latitude),
+                "longitude": str(query.longitude),
+                "radius_km": str(query.radius_km),
+                "limit": query.limit,
+            },
+        )
+
+        location = Location(
+            latitude=query.latitude,
+            longitude=query.longitude,
+            address=query.address,
+        )
+        result = await self._read_model.find_summaries_near(
+            location, query.radius_km, query.limit
+        )
+
+        self._logger.debug(
+            "FindFacilitySummaries completed",
+            extra={"count": len(result)},
+        )
+        return result
@@ -0,0 +1,71 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from parkly.application.dto.availability_grid_dto import (
+    AvailabilityBucketDTO,
+    AvailabilityGridDTO,
+)
+from parkly.application.exception.exceptions import FacilityNotFoundError
+from parkly.application.port.logger import Logger
+from parkly.application.service.availability_index import AvailabilityIndex
+from parkly.domain.model.enums import SpotType
+from parkly.domain.model.typed_ids import FacilityId
+from parkly.domain.model.value_objects import TimeSlot
+
+
+@dataclass(frozen=True)
+class GetAvailabilityGrid:
+    facility_id: str
+    window_start: datetime
+    window_end: datetime
+    spot_type: str | None = None
+
+
+class GetAvailabilityGridHandler:
+    def __init__(
+        self,
+        availability_index: AvailabilityIndex,
+        logger: Logger,
+    ) -> None:
+        self._availability_index = availability_index
+        self._logger = logger
+
+    async def handle(self, query: GetAvailabilityGrid) -> AvailabilityGridDTO:
+        self._logger.debug(
+            "Handling GetAvailabilityGrid",
+            extra={
+                "facility_id": str(query.facility_id),
+                "spot_type": query.spot_type,
+            },
+        )
+
+        facility_id = FacilityId(value=query.facility_id)
+        window = TimeSlot(start=query.window_start, end=query.window_end)
+        spot_type = SpotType(query.spot_type) if query.spot_type else None
+
+        grid = await self._availability_index.grid_for(facility_id)
+        if grid is None:
+            self._logger.warning(
+                "Facility not found",
+                extra={"facility_id": str(query.facility_id)},
+            )
+            raise FacilityNotFoundError(facility_id)
+
+        buckets = [
+            AvailabilityBucketDTO(start=start, free_spots=free)
+            for start, free in grid.free_counts(window, spot_type)
+        ]
+
+        self._logger.debug(
+            "GetAvailabilityGrid completed",
+            extra={
+                "facility_id": str(query.facility_id),
+                "buckets": len(buckets),
+            },
+        )
+        return AvailabilityGridDTO(
+            facility_id=str(facility_id.value),
+            spot_type=spot_type.value if spot_type else None,
+            bucket_minutes=int(grid.bucket_size.total_seconds()) // 60,
+            buckets=buckets,
+        )
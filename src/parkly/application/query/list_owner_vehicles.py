@@ -2,6 +2,7 @@ from dataclasses import dataclass
 
 from parkly.application.dto.vehicle_dto import VehicleDTO
 from parkly.application.port.logger import Logger
+from parkly.domain.model.pagination import DEFAULT_PAGE_SIZE, Page, PageRequest
 from parkly.domain.model.typed_ids import OwnerId
 from parkly.domain.port.vehicle_repository import VehicleRepository
 
@@ -9,6 +10,8 @@ from parkly.domain.port.vehicle_repository import VehicleRepository
 @dataclass(frozen=True)
 class ListOwnerVehicles:
     owner_id: str
+    limit: int = DEFAULT_PAGE_SIZE
+    cursor: str | None = None
 
 
 class ListOwnerVehiclesHandler:
@@ -20,21 +23,26 @@ class ListOwnerVehiclesHandler:
         self._vehicle_repo = vehicle_repo
         self._logger = logger
 
-    async def handle(self, query: ListOwnerVehicles) -> list[VehicleDTO]:
+    async def handle(self, query: ListOwnerVehicles) -> Page[VehicleDTO]:
         self._logger.debug(
             "Handling ListOwnerVehicles",
             extra={"owner_id": str(query.owner_id)},
         )
 
         owner_id = OwnerId(value=query.owner_id)
-        vehicles = await self._vehicle_repo.find_by_owner(owner_id)
-        result = [VehicleDTO.from_domain(v) for v in vehicles]
+        page = await self._vehicle_repo.find_by_owner(
+            owner_id, PageRequest(limit=query.limit, cursor=query.cursor)
+        )
+        result = Page(
+            items=[VehicleDTO.from_domain(v) for v in page.items],
+            next_cursor=page.next_cursor,
+        )
 
         self._logger.debug(
             "ListOwnerVehicles completed",
             extra={
                 "owner_id": str(query.owner_id),
-                "count": len(result),
+                "count": len(result.items),
             },
         )
         return result
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 
 from parkly.application.dto.reservation_dto import ReservationDTO
 from parkly.application.port.logger import Logger
+from parkly.domain.model.pagination import DEFAULT_PAGE_SIZE, Page, PageRequest
 from parkly.domain.model.typed_ids import VehicleId
 from parkly.domain.port.reservation_repository import ReservationRepository
 
@@ -9,6 +10,8 @@ from parkly.domain.port.reservation_repository import ReservationRepository
 @dataclass(frozen=True)
 class ListVehicleReservations:
     vehicle_id: str
+    limit: int = DEFAULT_PAGE_SIZE
+    cursor: str | None = None
 
 
 class ListVehicleReservationsHandler:
@@ -20,21 +23,26 @@ class ListVehicleReservationsHandler:
         self._reservation_repo = reservation_repo
         self._logger = logger
 
-    async def handle(self, query: ListVehicleReservations) -> list[ReservationDTO]:
+    async def handle(self, query: ListVehicleReservations) -> Page[ReservationDTO]:
         self._logger.debug(
             "Handling ListVehicleReservations",
             extra={"vehicle_id": str(query.vehicle_id)},
         )
 
         vehicle_id = VehicleId(value=query.vehicle_id)
-        reservations = await self._reservation_repo.find_by_vehicle(vehicle_id)
-        result = [ReservationDTO.from_domain(r) for r in reservations]
+        page = await self._reservation_repo.find_by_vehicle(
+            vehicle_id, PageRequest(limit=query.limit, cursor=query.cursor)
+        )
+        result = Page(
+            items=[ReservationDTO.from_domain(r) for r in page.items],
+            next_cursor=page.next_cursor,
+        )
 
         self._logger.debug(
             "ListVehicleReservations completed",
             extra={
                 "vehicle_id": str(query.vehicle_id),
-                "count": len(result),
+                "count": len(result.items),
             },
         )
         return result
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 
 from parkly.application.dto.session_dto import SessionDTO
 from parkly.application.port.logger import Logger
+from parkly.domain.model.pagination import DEFAULT_PAGE_SIZE, Page, PageRequest
 from parkly.domain.model.typed_ids import VehicleId
 from parkly.domain.port.parking_session_repository import ParkingSessionRepository
 
@@ -9,6 +10,8 @@ from parkly.domain.port.parking_session_repository import ParkingSessionReposito
 @dataclass(frozen=True)
 class ListVehicleSessions:
     vehicle_id: str
+    limit: int = DEFAULT_PAGE_SIZE
+    cursor: str | None = None
 
 
 class ListVehicleSessionsHandler:
@@ -20,21 +23,26 @@ class ListVehicleSessionsHandler:
         self._session_repo = session_repo
         self._logger = logger
 
-    async def handle(self, query: ListVehicleSessions) -> list[SessionDTO]:
+    async def handle(self, query: ListVehicleSessions) -> Page[SessionDTO]:
         self._logger.debug(
             "Handling ListVehicleSessions",
             extra={"vehicle_id": str(query.vehicle_id)},
         )
 
         vehicle_id = VehicleId(value=query.vehicle_id)
-        sessions = await self._session_repo.find_by_vehicle(vehicle_id)
-        result = [SessionDTO.from_domain(s) for s in sessions]
+        page = await self._session_repo.find_by_vehicle(
+            vehicle_id, PageRequest(limit=query.limit, cursor=query.cursor)
+        )
+        result = Page(
+            items=[SessionDTO.from_domain(s) for s in page.items],
+            next_cursor=page.next_cursor,
+        )
 
         self._logger.debug(
             "ListVehicleSessions completed",
             extra={
                 "vehicle_id": str(query.vehicle_id),
-                "count": len(result),
+                "count": len(result.items),
             },
         )
         return result
@@ -0,0 +1,64 @@
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+
+from parkly.application.dto.quote_dto import QuoteDTO
+from parkly.application.port.logger import Logger
+from parkly.domain.model.value_objects import Currency, Money, TimeSlot
+from parkly.domain.service.pricing_service import PricingService
+
+
+@dataclass(frozen=True)
+class PriceQuote:
+    time_slot_start: datetime
+    time_slot_end: datetime
+    base_rate_amount: Decimal
+    base_rate_currency: str
+
+
+@dataclass(frozen=True)
+class QuotePrices:
+    quotes: list[PriceQuote]
+
+
+class QuotePricesHandler:
+    def __init__(
+        self,
+        pricing_service: PricingService,
+        logger: Logger,
+    ) -> None:
+        self._pricing_service = pricing_service
+        self._logger = logger
+
+    async def handle(self, query: QuotePrices) -> list[QuoteDTO]:
+        self._logger.debug(
+            "Handling QuotePrices",
+            extra={"quotes": len(query.quotes)},
+        )
+
+        time_slots: list[TimeSlot] = []
+        base_rates: list[Money] = []
+        # Quotes in a batch mostly share a few rates; reusing one Money per
+        # rate lets the batch pricer work out each rate's factors once.
+        rates: dict[tuple[Decimal, str], Money] = {}
+        for quote in query.quotes:
+            time_slots.append(
+                TimeSlot(start=quote.time_slot_start, end=quote.time_slot_end)
+            )
+            key = (quote.base_rate_amount, quote.base_rate_currency)
+            base_rate = rates.get(key)
+            if base_rate is None:
+                base_rate = rates[key] = Money(
+                    amount=quote.base_rate_amount,
+                    currency=Currency.of(quote.base_rate_currency),
+                )
+            base_rates.append(base_rate)
+
+        prices = self._pricing_service.calculate_price_many(time_slots, base_rates)
+        result = [QuoteDTO.from_domain(t, p) for t, p in zip(time_slots, prices)]
+
+        self._logger.debug(
+            "QuotePrices completed",
+            extra={"quotes": len(result), "distinct_rates": len(rates)},
+        )
+        return result
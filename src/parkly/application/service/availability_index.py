@@ -0,0 +1,209 @@
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from parkly.application.port.logger import Logger
+from parkly.domain.model.availability_grid import AvailabilityGrid, ClaimId
+from parkly.domain.model.enums import SpotStatus, SpotType
+from parkly.domain.model.spot_schedule import FacilitySchedule
+from parkly.domain.model.typed_ids import FacilityId, ReservationId, SessionId, SpotId
+from parkly.domain.model.value_objects import TimeSlot
+from parkly.domain.port.clock import Clock
+from parkly.domain.port.parking_facility_repository import ParkingFacilityRepository
+from parkly.domain.port.parking_session_repository import ParkingSessionRepository
+from parkly.domain.port.reservation_repository import ReservationRepository
+
+
+@dataclass
+class FacilityAvailability:
+    """Both views of one facility's occupancy, built from the same load."""
+
+    schedule: FacilitySchedule
+    grid: AvailabilityGrid
+    expires_at: datetime
+
+
+@dataclass
+class _Load:
+    """One in-flight load of a facility, shared by every caller waiting on it."""
+
+    task: asyncio.Task[FacilityAvailability | None]
+    stale: bool = False
+
+
+class AvailabilityIndex:
+    """Occupancy of the most recently used facilities, kept current by events.
+
+    A facility is loaded once with the reservations that had not ended and the
+    sessions still open, then reloaded once older than ``ttl`` so ended
+    reservations drop out. At most ``max_facilities`` are kept. Concurrent
+    callers for a facility that is not loaded share a single load.
+    """
+
+    def __init__(
+        self,
+        facility_repo: ParkingFacilityRepository,
+        reservation_repo: ReservationRepository,
+        session_repo: ParkingSessionRepository,
+        clock: Clock,
+        logger: Logger,
+        max_facilities: int,
+        ttl: timedelta,
+    ) -> None:
+        self._facility_repo = facility_repo
+        self._reservation_repo = reservation_repo
+        self._session_repo = session_repo
+        self._clock = clock
+        self._logger = logger
+        self._max_facilities = max_facilities
+        self._ttl = ttl
+        self._entries: OrderedDict[FacilityId, FacilityAvailability] = OrderedDict()
+        self._facilities: dict[ClaimId, FacilityId] = {}
+        self._loading: dict[FacilityId, _Load] = {}
+
+    async def schedule_for(self, facility_id: FacilityId) -> FacilitySchedule | None:
+        entry = await self._entry_for(facility_id)
+        return entry.schedule if entry is not None else None
+
+    async def grid_for(self, facility_id: FacilityId) -> AvailabilityGrid | None:
+        entry = await self._entry_for(facility_id)
+        return entry.grid if entry is not None else None
+
+    async def _entry_for(self, facility_id: FacilityId) -> FacilityAvailability | None:
+        now = self._clock.now()
+        entry = self._entries.get(facility_id)
+        if entry is not None:
+            if entry.expires_at > now:
+                self._entries.move_to_end(facility_id)
+                return entry
+            self._evict(facility_id)
+
+        load = self._loading.get(facility_id)
+        if load is None:
+            load = _Load(asyncio.create_task(self._load(facility_id, now)))
+            self._loading[facility_id] = load
+        # Shielded: a caller that gives up must not cancel the others' load.
+        return await asyncio.shield(load.task)
+
+    async def _load(
+        self, facility_id: FacilityId, now: datetime
+    ) -> FacilityAvailability | None:
+        try:
+            facility = await self._facility_repo.find_by_id(facility_id)
+            if facility is None:
+                return None
+            reservations = await self._reservation_repo.find_active_by_facility(
+                facility_id, ending_after=now
+            )
+            sessions = await self._session_repo.find_active_by_facility(facility_id)
+        finally:
+            load = self._loading.pop(facility_id)
+
+        slots = [(r.id, r.spot_id, r.time_slot) for r in reservations]
+        entry = FacilityAvailability(
+            schedule=FacilitySchedule.build(slots),
+            grid=AvailabilityGrid.build(
+                spots=[
+                    (s.id, s.spot_type, s.status != SpotStatus.OUT_OF_SERVICE)
+                    for s in facility.spots
+                ],
+                reservations=slots,
+                sessions=[(s.id, s.spot_id, s.entry_time) for s in sessions],
+            ),
+            expires_at=now + self._ttl,
+        )
+        if load.stale or facility_id in self._entries or self._max_facilities <= 0:
+            # An event raced the load; serve this result but do not keep it.
+            return entry
+
+        self._entries[facility_id] = entry
+        for reservation in reservations:
+            self._facilities[reservation.id] = facility_id
+        for session in sessions:
+            self._facilities[session.id] = facility_id
+        while len(self._entries) > self._max_facilities:
+            self._evict(next(iter(self._entries)))
+        self._logger.debug(
+            "Facility availability loaded",
+            extra={
+                "facility_id": str(facility_id.value),
+                "spots": len(facility.spots),
+                "reservations": len(reservations),
+                "sessions": len(sessions),
+                "claims_dropped": len(reservations) + len(sessions) - len(entry.grid),
+            },
+        )
+        return entry
+
+    def add_spot(
+        self, facility_id: FacilityId, spot_id: SpotId, spot_type: SpotType
+    ) -> None:
+        entry = self._loaded(facility_id)
+        if entry is not None:
+            entry.grid.add_spot(spot_id, spot_type)
+
+    def remove_spot(self, facility_id: FacilityId, spot_id: SpotId) -> None:
+        entry = self._loaded(facility_id)
+        if entry is not None:
+            entry.grid.remove_spot(spot_id)
+
+    def reserve(
+        self,
+        reservation_id: ReservationId,
+        facility_id: FacilityId,
+        spot_id: SpotId,
+        time_slot: TimeSlot,
+    ) -> None:
+        entry = self._loaded(facility_id)
+        if entry is not None:
+            entry.schedule.add(reservation_id, spot_id, time_slot)
+            entry.grid.claim(reservation_id, spot_id, time_slot)
+            self._facilities[reservation_id] = facility_id
+
+    def occupy(
+        self,
+        session_id: SessionId,
+        facility_id: FacilityId,
+        spot_id: SpotId,
+        start: datetime,
+    ) -> None:
+        entry = self._loaded(facility_id)
+        if entry is not None:
+            entry.grid.claim_open(session_id, spot_id, start)
+            self._facilities[session_id] = facility_id
+
+    def reschedule(self, reservation_id: ReservationId, time_slot: TimeSlot) -> None:
+        facility_id = self._facilities.get(reservation_id)
+        if facility_id is None:
+            self._mark_loading_changed()
+            return
+        entry = self._entries[facility_id]
+        entry.schedule.reschedule(reservation_id, time_slot)
+        entry.grid.move(reservation_id, time_slot)
+
+    def release(self, claim_id: ClaimId) -> None:
+        facility_id = self._facilities.pop(claim_id, None)
+        if facility_id is None:
+            self._mark_loading_changed()
+            return
+        entry = self._entries[facility_id]
+        if isinstance(claim_id, ReservationId):
+            entry.schedule.remove(claim_id)
+        entry.grid.release(claim_id)
+
+    def _loaded(self, facility_id: FacilityId) -> FacilityAvailability | None:
+        load = self._loading.get(facility_id)
+        if load is not None:
+            load.stale = True
+        return self._entries.get(facility_id)
+
+    def _evict(self, facility_id: FacilityId) -> None:
+        entry = self._entries.pop(facility_id)
+        for claim_id in entry.grid:
+            self._facilities.pop(claim_id, None)
+
+    def _mark_loading_changed(self) -> None:
+        # The owning facility is unknown, so any in-flight load may be stale.
+        for load in self._loading.values():
+            load.stale = True
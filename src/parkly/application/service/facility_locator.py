@@ -0,0 +1,97 @@
+import asyncio
+from decimal import Decimal
+
+from parkly.application.port.logger import Logger
+from parkly.domain.model.typed_ids import FacilityId
+from parkly.domain.model.value_objects import Location
+from parkly.domain.port.parking_facility_repository import ParkingFacilityRepository
+from parkly.domain.service.geo_index import GeoIndex
+
+
+class FacilityLocator:
+    def __init__(
+        self,
+        facility_repo: ParkingFacilityRepository,
+        logger: Logger,
+    ) -> None:
+        self._facility_repo = facility_repo
+        self._logger = logger
+        self._index: GeoIndex | None = None
+        self._lock = asyncio.Lock()
+        self._added_while_loading: list[tuple[FacilityId, Location]] | None = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._index is not None
+
+    async def load(self) -> GeoIndex:
+        async with self._lock:
+            if self._index is not None:
+                return self._index
+            index = self._index = await self._build()
+
+        self._logger.info(
+            "Facility locator loaded",
+            extra={"facilities": len(index)},
+        )
+        return index
+
+    async def refresh(self) -> GeoIndex:
+        """Rebuild the index from the repository and swap it in.
+
+        ``add`` only sees facilities created in this process, so other
+        processes' facilities appear once the index is refreshed.
+        """
+        async with self._lock:
+            index = self._index = await self._build()
+
+        self._logger.debug(
+            "Facility locator refreshed",
+            extra={"facilities": len(index)},
+        )
+        return index
+
+    async def _build(self) -> GeoIndex:
+        self._added_while_loading = []
+        try:
+            locations = await self._facility_repo.find_all_locations()
+            index = GeoIndex()
+            for facility_id, location in locations + self._added_while_loading:
+                index.add(
+                    facility_id, float(location.latitude), float(location.longitude)
+                )
+        finally:
+            self._added_while_loading = None
+        return index
+
+    def add(self, facility_id: FacilityId, location: Location) -> None:
+        if self._added_while_loading is not None:
+            self._added_while_loading.append((facility_id, location))
+        if self._index is not None:
+            self._index.add(
+                facility_id, float(location.latitude), float(location.longitude)
+            )
+
+    async def _loaded_index(self) -> GeoIndex:
+        if self._index is not None:
+            return self._index
+        return await self.load()
+
+    async def within(
+        self, location: Location, radius_km: Decimal
+    ) -> list[tuple[FacilityId, float]]:
+        index = await self._loaded_index()
+        return index.within(
+            float(location.latitude), float(location.longitude), float(radius_km)
+        )
+
+    async def nearest(
+        self, location: Location, k: int, radius_km: Decimal
+    ) -> list[tuple[FacilityId, float]]:
+        index = await self._loaded_index()
+        return index.nearest(
+            float(location.latitude),
+            float(location.longitude),
+            k,
+            max_radius_km=float(radius_km),
+        )
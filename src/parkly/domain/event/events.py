@@ -10,7 +10,7 @@ from parkly.domain.model.typed_ids import (
     SpotId,
     VehicleId,
 )
-from parkly.domain.model.value_objects import LicensePlate, Money, TimeSlot
+from parkly.domain.model.value_objects import LicensePlate, Location, Money, TimeSlot
 from parkly.domain.event.domain_event import DomainEvent
 
 # ── ParkingFacility Events ─────────────────────────────────────
@@ -19,6 +19,7 @@ from parkly.domain.event.domain_event import DomainEvent
 @dataclass(frozen=True)
 class FacilityCreated(DomainEvent):
     facility_id: FacilityId
+    location: Location
 
 
 @dataclass(frozen=True)
@@ -67,6 +68,12 @@ class ReservationCompleted(DomainEvent):
     reservation_id: ReservationId
 
 
+@dataclass(frozen=True)
+class ReservationExtended(DomainEvent):
+    reservation_id: ReservationId
+    time_slot: TimeSlot
+
+
 # ── ParkingSession Events ──────────────────────────────────────
 
 
@@ -23,6 +23,11 @@ class NonDecimalMoneyAmountError(InvalidMoneyAmountError):
         super().__init__("Money amount must be a Decimal")
 
 
+class NonIntegerMinorUnitsError(InvalidMoneyAmountError):
+    def __init__(self) -> None:
+        super().__init__("Minor units must be an int")
+
+
 class NegativeMoneyAmountError(InvalidMoneyAmountError):
     def __init__(self) -> None:
         super().__init__("Money amount must be non-negative")
@@ -95,6 +100,12 @@ class DuplicateSpotError(DomainValidationError):
         super().__init__(f"Spot {spot_id} already exists in this facility")
 
 
+class DuplicateSpotNumberError(DomainValidationError):
+    def __init__(self, spot_number: str) -> None:
+        self.spot_number = spot_number
+        super().__init__(f"Spot number {spot_number} already exists in this facility")
+
+
 class SpotNotFoundError(DomainValidationError):
     def __init__(self, spot_id: object) -> None:
         self.spot_id = spot_id
@@ -106,6 +117,25 @@ class InvalidExtensionError(DomainValidationError):
         super().__init__("New end time must be after current end time")
 
 
+class AvailabilityWindowTooLargeError(DomainValidationError):
+    def __init__(self, buckets: int, max_buckets: int) -> None:
+        self.buckets = buckets
+        self.max_buckets = max_buckets
+        super().__init__(
+            f"Availability window spans {buckets} buckets, at most {max_buckets}"
+            " are allowed"
+        )
+
+
+class BatchLengthMismatchError(DomainValidationError):
+    def __init__(self, time_slots: int, base_rates: int) -> None:
+        self.time_slots = time_slots
+        self.base_rates = base_rates
+        super().__init__(
+            f"Got {time_slots} time slots but {base_rates} base rates to price"
+        )
+
+
 class IneligibleSpotTypeError(DomainValidationError):
     def __init__(self, vehicle_type: str, spot_type: str) -> None:
         self.vehicle_type = vehicle_type
@@ -115,6 +145,17 @@ class IneligibleSpotTypeError(DomainValidationError):
         )
 
 
+class InvalidPageSizeError(DomainValidationError):
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        super().__init__(f"Page size must be positive, got {limit}")
+
+
+class InvalidCursorError(DomainValidationError):
+    def __init__(self) -> None:
+        super().__init__("Page cursor is malformed or belongs to another listing")
+
+
 # --- Operation errors (lifecycle / state-machine violations) ---
 
 
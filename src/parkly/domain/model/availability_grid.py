@@ -0,0 +1,282 @@
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Self
+
+from parkly.domain.exception.exceptions import (
+    AvailabilityWindowTooLargeError,
+    SpotNotFoundError,
+)
+from parkly.domain.model.consts import (
+    AVAILABILITY_BUCKET_SECONDS,
+    AVAILABILITY_MAX_BUCKETS,
+)
+from parkly.domain.model.enums import SpotType
+from parkly.domain.model.typed_ids import ReservationId, SessionId, SpotId
+from parkly.domain.model.value_objects import TimeSlot
+
+type ClaimId = ReservationId | SessionId
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_RESOLUTION = timedelta(microseconds=1)
+
+
+@dataclass
+class _Claim:
+    ordinal: int
+    first_bucket: int
+    last_bucket: int | None
+
+
+@dataclass
+class AvailabilityGrid:
+    """Spot occupancy of one facility as one bitset per fixed time bucket.
+
+    Every spot owns one bit ordinal. A bucket's bitset has the bit of each spot
+    held at any point of the bucket by a reservation or an open session, so a
+    spot is free for a time slot when its bit is clear in every bucket the slot
+    touches. Open sessions have no end and are kept out of the bucket map.
+    """
+
+    _bucket_seconds: int = AVAILABILITY_BUCKET_SECONDS
+    _ordinals: dict[SpotId, int] = field(default_factory=dict)
+    _spot_ids: list[SpotId | None] = field(default_factory=list)
+    _free_ordinals: list[int] = field(default_factory=list)
+    _type_masks: dict[SpotType, int] = field(default_factory=dict)
+    _in_service_mask: int = 0
+    _occupied: dict[int, int] = field(default_factory=dict)
+    _open_mask: int = 0
+    _open_claims: set[ClaimId] = field(default_factory=set)
+    _latest_open_start: int | None = None
+    _claims: dict[ClaimId, _Claim] = field(default_factory=dict)
+    _claims_by_ordinal: dict[int, set[ClaimId]] = field(default_factory=dict)
+
+    @classmethod
+    def build(
+        cls,
+        spots: list[tuple[SpotId, SpotType, bool]],
+        reservations: list[tuple[ReservationId, SpotId, TimeSlot]],
+        sessions: list[tuple[SessionId, SpotId, datetime]],
+    ) -> Self:
+        """Build a grid, dropping claims on spots the facility no longer has.
+
+        Nothing stops a spot from being removed while reservations or sessions
+        still name it, and one such claim must not fail every query.
+        """
+        grid = cls()
+        for spot_id, spot_type, in_service in spots:
+            grid.add_spot(spot_id, spot_type, in_service)
+        for reservation_id, spot_id, time_slot in reservations:
+            if spot_id in grid._ordinals:
+                grid.claim(reservation_id, spot_id, time_slot)
+        for session_id, spot_id, start in sessions:
+            if spot_id in grid._ordinals:
+                grid.claim_open(session_id, spot_id, start)
+        return grid
+
+    @property
+    def bucket_size(self) -> timedelta:
+        return timedelta(seconds=self._bucket_seconds)
+
+    def __contains__(self, claim_id: ClaimId) -> bool:
+        return claim_id in self._claims
+
+    def __iter__(self) -> Iterator[ClaimId]:
+        return iter(self._claims)
+
+    def __len__(self) -> int:
+        return len(self._claims)
+
+    def _bucket_of(self, moment: datetime) -> int:
+        return (moment - _EPOCH) // self.bucket_size
+
+    def _bucket_start(self, bucket: int) -> datetime:
+        return _EPOCH + bucket * self.bucket_size
+
+    def _buckets_of(self, time_slot: TimeSlot) -> range:
+        return range(
+            self._bucket_of(time_slot.start),
+            self._bucket_of(time_slot.end - _RESOLUTION) + 1,
+        )
+
+    def _ordinal_of(self, spot_id: SpotId) -> int:
+        ordinal = self._ordinals.get(spot_id)
+        if ordinal is None:
+            raise SpotNotFoundError(spot_id.value)
+        return ordinal
+
+    # ── Spots ─────────────────────────────────────────────────
+
+    def add_spot(
+        self, spot_id: SpotId, spot_type: SpotType, in_service: bool = True
+    ) -> None:
+        # Idempotent: a SpotAdded event may follow a load that saw the spot.
+        if spot_id in self._ordinals:
+            return
+        if self._free_ordinals:
+            ordinal = self._free_ordinals.pop()
+            self._spot_ids[ordinal] = spot_id
+        else:
+            ordinal = len(self._spot_ids)
+            self._spot_ids.append(spot_id)
+        self._ordinals[spot_id] = ordinal
+
+        bit = 1 << ordinal
+        self._type_masks[spot_type] = self._type_masks.get(spot_type, 0) | bit
+        if in_service:
+            self._in_service_mask |= bit
+
+    def remove_spot(self, spot_id: SpotId) -> None:
+        ordinal = self._ordinals.get(spot_id)
+        if ordinal is None:
+            return
+        for claim_id in list(self._claims_by_ordinal.get(ordinal, ())):
+            self.release(claim_id)
+
+        bit = 1 << ordinal
+        for spot_type, mask in self._type_masks.items():
+            self._type_masks[spot_type] = mask & ~bit
+        self._in_service_mask &= ~bit
+        del self._ordinals[spot_id]
+        self._spot_ids[ordinal] = None
+        self._free_ordinals.append(ordinal)
+
+    # ── Claims ────────────────────────────────────────────────
+
+    def claim(self, claim_id: ClaimId, spot_id: SpotId, time_slot: TimeSlot) -> None:
+        if claim_id in self._claims:
+            self.release(claim_id)
+        ordinal = self._ordinal_of(spot_id)
+        buckets = self._buckets_of(time_slot)
+        self._register(claim_id, _Claim(ordinal, buckets.start, buckets.stop - 1))
+        self._mark(ordinal, buckets)
+
+    def claim_open(self, claim_id: ClaimId, spot_id: SpotId, start: datetime) -> None:
+        if claim_id in self._claims:
+            self.release(claim_id)
+        ordinal = self._ordinal_of(spot_id)
+        first_bucket = self._bucket_of(start)
+        self._register(claim_id, _Claim(ordinal, first_bucket, None))
+        self._open_claims.add(claim_id)
+        self._open_mask |= 1 << ordinal
+        if self._latest_open_start is None or first_bucket > self._latest_open_start:
+            self._latest_open_start = first_bucket
+
+    def move(self, claim_id: ClaimId, time_slot: TimeSlot) -> None:
+        claim = self._claims.get(claim_id)
+        if claim is None:
+            return
+        spot_id = self._spot_ids[claim.ordinal]
+        if spot_id is not None:
+            self.claim(claim_id, spot_id, time_slot)
+
+    def release(self, claim_id: ClaimId) -> None:
+        claim = self._claims.pop(claim_id, None)
+        if claim is None:
+            return
+        siblings = self._claims_by_ordinal[claim.ordinal]
+        siblings.discard(claim_id)
+        if not siblings:
+            del self._claims_by_ordinal[claim.ordinal]
+
+        if claim.last_bucket is None:
+            self._open_claims.discard(claim_id)
+            self._release_open(claim.ordinal, siblings)
+            return
+
+        released = range(claim.first_bucket, claim.last_bucket + 1)
+        self._clear(claim.ordinal, released)
+        # Claims on the same spot may share the edge buckets of this one.
+        for sibling_id in siblings:
+            sibling = self._claims[sibling_id]
+            if sibling.last_bucket is None:
+                continue
+            overlap = range(
+                max(sibling.first_bucket, released.start),
+                min(sibling.last_bucket + 1, released.stop),
+            )
+            self._mark(claim.ordinal, overlap)
+
+    def _register(self, claim_id: ClaimId, claim: _Claim) -> None:
+        self._claims[claim_id] = claim
+        self._claims_by_ordinal.setdefault(claim.ordinal, set()).add(claim_id)
+
+    def _release_open(self, ordinal: int, siblings: set[ClaimId]) -> None:
+        if not any(self._claims[c].last_bucket is None for c in siblings):
+            self._open_mask &= ~(1 << ordinal)
+        self._latest_open_start = max(
+            (self._claims[c].first_bucket for c in self._open_claims), default=None
+        )
+
+    def _mark(self, ordinal: int, buckets: range) -> None:
+        bit = 1 << ordinal
+        occupied = self._occupied
+        for bucket in buckets:
+            occupied[bucket] = occupied.get(bucket, 0) | bit
+
+    def _clear(self, ordinal: int, buckets: range) -> None:
+        keep = ~(1 << ordinal)
+        occupied = self._occupied
+        for bucket in buckets:
+            remaining = occupied.get(bucket, 0) & keep
+            if remaining:
+                occupied[bucket] = remaining
+            else:
+                occupied.pop(bucket, None)
+
+    # ── Queries ───────────────────────────────────────────────
+
+    def _open_at(self, bucket: int) -> int:
+        if self._latest_open_start is None or bucket >= self._latest_open_start:
+            return self._open_mask
+        mask = 0
+        for claim_id in self._open_claims:
+            claim = self._claims[claim_id]
+            if claim.first_bucket <= bucket:
+                mask |= 1 << claim.ordinal
+        return mask
+
+    def _candidates(self, spot_type: SpotType | None) -> int:
+        if spot_type is None:
+            return self._in_service_mask
+        return self._in_service_mask & self._type_masks.get(spot_type, 0)
+
+    def free_mask(self, time_slot: TimeSlot, spot_type: SpotType | None = None) -> int:
+        buckets = self._buckets_of(time_slot)
+        occupied = self._open_at(buckets.stop - 1)
+        for bucket in buckets:
+            occupied |= self._occupied.get(bucket, 0)
+        return self._candidates(spot_type) & ~occupied
+
+    def free_spots(
+        self, time_slot: TimeSlot, spot_type: SpotType | None = None
+    ) -> list[SpotId]:
+        mask = self.free_mask(time_slot, spot_type)
+        spot_ids: list[SpotId] = []
+        while mask:
+            low = mask & -mask
+            spot_id = self._spot_ids[low.bit_length() - 1]
+            if spot_id is not None:
+                spot_ids.append(spot_id)
+            mask ^= low
+        return spot_ids
+
+    def free_counts(
+        self, window: TimeSlot, spot_type: SpotType | None = None
+    ) -> list[tuple[datetime, int]]:
+        buckets = self._buckets_of(window)
+        if len(buckets) > AVAILABILITY_MAX_BUCKETS:
+            raise AvailabilityWindowTooLargeError(
+                len(buckets), AVAILABILITY_MAX_BUCKETS
+            )
+        candidates = self._candidates(spot_type)
+        return [
+            (
+                self._bucket_start(bucket),
+                (
+                    candidates
+                    & ~(self._occupied.get(bucket, 0) | self._open_at(bucket))
+                ).bit_count(),
+            )
+            for bucket in buckets
+        ]
@@ -4,6 +4,12 @@ EARTH_RADIUS_KM = Decimal("6371.0")
 
 SECONDS_PER_HOUR = Decimal("3600")
 
+MICROSECONDS_PER_HOUR = 3_600_000_000
+
+AVAILABILITY_BUCKET_SECONDS = 15 * 60
+
+AVAILABILITY_MAX_BUCKETS = 48 * 4
+
 
 ISO_4217_CODES: frozenset[str] = frozenset(
     {
@@ -165,3 +171,32 @@ ISO_4217_CODES: frozenset[str] = frozenset(
         "ZWL",
     }
 )
+
+DEFAULT_MINOR_UNITS = 2
+
+# ISO 4217 exponents that differ from DEFAULT_MINOR_UNITS.
+ISO_4217_MINOR_UNITS: dict[str, int] = {
+    "BIF": 0,
+    "CLP": 0,
+    "DJF": 0,
+    "GNF": 0,
+    "ISK": 0,
+    "JPY": 0,
+    "KMF": 0,
+    "KRW": 0,
+    "PYG": 0,
+    "RWF": 0,
+    "UGX": 0,
+    "VND": 0,
+    "VUV": 0,
+    "XAF": 0,
+    "XOF": 0,
+    "XPF": 0,
+    "BHD": 3,
+    "IQD": 3,
+    "JOD": 3,
+    "KWD": 3,
+    "LYD": 3,
+    "OMR": 3,
+    "TND": 3,
+}
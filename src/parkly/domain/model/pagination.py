@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+
+from parkly.domain.exception.exceptions import InvalidPageSizeError
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+@dataclass(frozen=True, slots=True)
+class PageRequest:
+    """Up to ``limit`` items after an opaque cursor; from the start if None."""
+
+    limit: int
+    cursor: str | None = None
+
+    def __post_init__(self) -> None:
+        if self.limit < 1:
+            raise InvalidPageSizeError(self.limit)
+
+
+@dataclass(frozen=True, slots=True)
+class Page[T]:
+    """One page of a listing; ``next_cursor`` is ``None`` on the last page."""
+
+    items: list[T]
+    next_cursor: str | None
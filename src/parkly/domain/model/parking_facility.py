@@ -6,6 +6,7 @@ from parkly.domain.event.events import FacilityCreated, SpotAdded, SpotRemoved
 from parkly.domain.exception.exceptions import (
     CapacityExceededError,
     DuplicateSpotError,
+    DuplicateSpotNumberError,
     RequiredFieldError,
     SpotNotAvailableError,
     SpotNotFoundError,
@@ -17,6 +18,7 @@ from parkly.domain.model.enums import (
     SpotType,
 )
 from parkly.domain.model.entity import AggregateRoot, Entity
+from parkly.domain.model.spot_schedule import FacilitySchedule
 from parkly.domain.model.typed_ids import FacilityId, SpotId
 from parkly.domain.model.value_objects import (
     Capacity,
@@ -83,8 +85,14 @@ class ParkingSpot(Entity[SpotId]):
     def status(self) -> SpotStatus:
         return self._status
 
-    def is_available(self, time_slot: TimeSlot) -> bool:
-        return self._status == SpotStatus.AVAILABLE
+    def is_available(
+        self, time_slot: TimeSlot, schedule: FacilitySchedule | None = None
+    ) -> bool:
+        if schedule is None:
+            return self._status == SpotStatus.AVAILABLE
+        if self._status in (SpotStatus.OCCUPIED, SpotStatus.OUT_OF_SERVICE):
+            return False
+        return schedule.is_free(self._id, time_slot)
 
     def reserve(self) -> None:
         if self._status != SpotStatus.AVAILABLE:
@@ -95,6 +103,25 @@ class ParkingSpot(Entity[SpotId]):
         self._status = SpotStatus.AVAILABLE
 
 
+@dataclass(frozen=True)
+class FacilityChanges:
+    """Persistence work accumulated on a facility since it was last saved."""
+
+    is_new: bool
+    added_spots: list[ParkingSpot]
+    updated_spots: list[ParkingSpot]
+    removed_spot_ids: list[SpotId]
+
+    @property
+    def is_empty(self) -> bool:
+        return not (
+            self.is_new
+            or self.added_spots
+            or self.updated_spots
+            or self.removed_spot_ids
+        )
+
+
 @dataclass
 class ParkingFacility(AggregateRoot[FacilityId]):
     _name: FacilityName
@@ -102,7 +129,26 @@ class ParkingFacility(AggregateRoot[FacilityId]):
     _facility_type: FacilityType
     _access_control: AccessControlMethod
     _total_capacity: Capacity
-    _spots: list[ParkingSpot] = field(default_factory=list)
+    _spots: dict[SpotId, ParkingSpot] = field(default_factory=dict)
+    _spot_ids_by_number: dict[SpotNumber, SpotId] = field(
+        init=False, repr=False, compare=False
+    )
+    _spots_by_type: dict[SpotType, dict[SpotId, ParkingSpot]] = field(
+        init=False, repr=False, compare=False
+    )
+    _is_new: bool = field(default=False, init=False, repr=False, compare=False)
+    _added_spot_ids: set[SpotId] = field(init=False, repr=False, compare=False)
+    _updated_spot_ids: set[SpotId] = field(init=False, repr=False, compare=False)
+    _removed_spot_ids: set[SpotId] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._spot_ids_by_number = {}
+        self._spots_by_type = {}
+        self._added_spot_ids = set()
+        self._updated_spot_ids = set()
+        self._removed_spot_ids = set()
+        for spot in self._spots.values():
+            self._index_spot(spot)
 
     @property
     def name(self) -> FacilityName:
@@ -126,7 +172,7 @@ class ParkingFacility(AggregateRoot[FacilityId]):
 
     @property
     def spots(self) -> list[ParkingSpot]:
-        return list(self._spots)
+        return list(self._spots.values())
 
     @classmethod
     def create(
@@ -159,9 +205,11 @@ class ParkingFacility(AggregateRoot[FacilityId]):
             _access_control=access_control,
             _total_capacity=total_capacity,
         )
+        facility._is_new = True
         facility._record_event(
             FacilityCreated(
                 facility_id=facility_id,
+                location=location,
                 occurred_at=occurred_at,
             )
         )
@@ -185,9 +233,35 @@ class ParkingFacility(AggregateRoot[FacilityId]):
             _facility_type=facility_type,
             _access_control=access_control,
             _total_capacity=total_capacity,
-            _spots=spots if spots is not None else [],
+            _spots={s.id: s for s in spots} if spots is not None else {},
         )
 
+    def _index_spot(self, spot: ParkingSpot) -> None:
+        self._spot_ids_by_number[spot.spot_number] = spot.id
+        self._spots_by_type.setdefault(spot.spot_type, {})[spot.id] = spot
+
+    def _unindex_spot(self, spot: ParkingSpot) -> None:
+        del self._spot_ids_by_number[spot.spot_number]
+        bucket = self._spots_by_type[spot.spot_type]
+        del bucket[spot.id]
+        if not bucket:
+            del self._spots_by_type[spot.spot_type]
+
+    def _get_spot(self, spot_id: SpotId) -> ParkingSpot:
+        spot = self._spots.get(spot_id)
+        if spot is None:
+            raise SpotNotFoundError(spot_id=spot_id)
+        return spot
+
+    def find_spot(self, spot_id: SpotId) -> ParkingSpot | None:
+        return self._spots.get(spot_id)
+
+    def find_spot_by_number(self, spot_number: SpotNumber) -> ParkingSpot | None:
+        spot_id = self._spot_ids_by_number.get(spot_number)
+        if spot_id is None:
+            return None
+        return self._spots[spot_id]
+
     def add_spot(
         self,
         spot_id: SpotId,
@@ -200,16 +274,19 @@ class ParkingFacility(AggregateRoot[FacilityId]):
             raise CapacityExceededError(
                 facility_name=str(self._name), capacity=self._total_capacity.value
             )
-        for existing in self._spots:
-            if existing.id == spot_id:
-                raise DuplicateSpotError(spot_id=spot_id)
+        if spot_id in self._spots:
+            raise DuplicateSpotError(spot_id=spot_id)
+        if spot_number in self._spot_ids_by_number:
+            raise DuplicateSpotNumberError(spot_number=str(spot_number))
         spot = ParkingSpot.create(
             spot_id=spot_id,
             spot_number=spot_number,
             spot_type=spot_type,
             status=status,
         )
-        self._spots.append(spot)
+        self._spots[spot_id] = spot
+        self._index_spot(spot)
+        self._added_spot_ids.add(spot_id)
         self._record_event(
             SpotAdded(
                 facility_id=self._id,
@@ -219,43 +296,93 @@ class ParkingFacility(AggregateRoot[FacilityId]):
             )
         )
 
-    def remove_spot(self, spot_id: SpotId, occurred_at: datetime) -> None:
-        for i, spot in enumerate(self._spots):
-            if spot.id == spot_id:
-                self._spots.pop(i)
-                self._record_event(
-                    SpotRemoved(
-                        facility_id=self._id,
-                        spot_id=spot_id,
-                        occurred_at=occurred_at,
-                    )
+    def add_spots(self, spots: list[ParkingSpot], occurred_at: datetime) -> None:
+        """Add all spots or none: capacity and uniqueness are checked first."""
+        if len(self._spots) + len(spots) > self._total_capacity.value:
+            raise CapacityExceededError(
+                facility_name=str(self._name), capacity=self._total_capacity.value
+            )
+        spot_ids: set[SpotId] = set()
+        spot_numbers: set[SpotNumber] = set()
+        for spot in spots:
+            if spot.id in self._spots or spot.id in spot_ids:
+                raise DuplicateSpotError(spot_id=spot.id)
+            if (
+                spot.spot_number in self._spot_ids_by_number
+                or spot.spot_number in spot_numbers
+            ):
+                raise DuplicateSpotNumberError(spot_number=str(spot.spot_number))
+            spot_ids.add(spot.id)
+            spot_numbers.add(spot.spot_number)
+
+        for spot in spots:
+            self._spots[spot.id] = spot
+            self._index_spot(spot)
+            self._added_spot_ids.add(spot.id)
+            self._record_event(
+                SpotAdded(
+                    facility_id=self._id,
+                    spot_id=spot.id,
+                    spot_type=spot.spot_type,
+                    occurred_at=occurred_at,
                 )
-                return
-        raise SpotNotFoundError(spot_id=spot_id)
+            )
+
+    def remove_spot(self, spot_id: SpotId, occurred_at: datetime) -> None:
+        spot = self._spots.pop(spot_id, None)
+        if spot is None:
+            raise SpotNotFoundError(spot_id=spot_id)
+        self._unindex_spot(spot)
+        self._updated_spot_ids.discard(spot_id)
+        if spot_id in self._added_spot_ids:
+            self._added_spot_ids.discard(spot_id)
+        else:
+            self._removed_spot_ids.add(spot_id)
+        self._record_event(
+            SpotRemoved(
+                facility_id=self._id,
+                spot_id=spot_id,
+                occurred_at=occurred_at,
+            )
+        )
+
+    def _track_status(self, spot: ParkingSpot, previous: SpotStatus) -> None:
+        if spot.status != previous and spot.id not in self._added_spot_ids:
+            self._updated_spot_ids.add(spot.id)
 
     def reserve_spot(self, spot_id: SpotId) -> None:
-        for spot in self._spots:
-            if spot.id == spot_id:
-                spot.reserve()
-                return
-        raise SpotNotFoundError(spot_id=spot_id)
+        spot = self._get_spot(spot_id)
+        previous = spot.status
+        spot.reserve()
+        self._track_status(spot, previous)
 
     def release_spot(self, spot_id: SpotId) -> None:
-        for spot in self._spots:
-            if spot.id == spot_id:
-                spot.release()
-                return
-        raise SpotNotFoundError(spot_id=spot_id)
+        spot = self._get_spot(spot_id)
+        previous = spot.status
+        spot.release()
+        self._track_status(spot, previous)
+
+    def collect_changes(self) -> FacilityChanges:
+        changes = FacilityChanges(
+            is_new=self._is_new,
+            added_spots=[self._spots[i] for i in self._added_spot_ids],
+            updated_spots=[self._spots[i] for i in self._updated_spot_ids],
+            removed_spot_ids=list(self._removed_spot_ids),
+        )
+        self._is_new = False
+        self._added_spot_ids.clear()
+        self._updated_spot_ids.clear()
+        self._removed_spot_ids.clear()
+        return changes
 
     def get_available_spots(
         self,
         time_slot: TimeSlot,
         spot_type: SpotType | None = None,
+        schedule: FacilitySchedule | None = None,
     ) -> list[ParkingSpot]:
-        available: list[ParkingSpot] = []
-        for spot in self._spots:
-            if spot_type is not None and spot.spot_type != spot_type:
-                continue
-            if spot.is_available(time_slot):
-                available.append(spot)
-        return available
+        if spot_type is None:
+            candidates = self._spots.values()
+        else:
+            candidates = self._spots_by_type.get(spot_type, {}).values()
+        return [spot for spot in candidates if spot.is_available(time_slot, schedule)]
@@ -20,7 +20,7 @@ from parkly.domain.model.typed_ids import (
     VehicleId,
 )
 from parkly.domain.model.consts import SECONDS_PER_HOUR
-from parkly.domain.model.value_objects import Money
+from parkly.domain.model.value_objects import MinorMoney, Money
 from parkly.domain.model.entity import AggregateRoot
 
 
@@ -170,3 +170,9 @@ class ParkingSession(AggregateRoot[SessionId]):
         duration_seconds = (end - self._entry_time).total_seconds()
         hours = Decimal(str(duration_seconds)) / SECONDS_PER_HOUR
         return rate_per_hour.multiply(hours)
+
+    def calculate_cost_minor(
+        self, rate_per_hour: Money, current_time: datetime
+    ) -> MinorMoney:
+        end = self._exit_time or current_time
+        return MinorMoney.for_duration(rate_per_hour, end - self._entry_time)
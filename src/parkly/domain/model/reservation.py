@@ -8,6 +8,7 @@ from parkly.domain.event.events import (
     ReservationCompleted,
     ReservationConfirmed,
     ReservationCreated,
+    ReservationExtended,
 )
 from parkly.domain.exception.exceptions import (
     InvalidExtensionError,
@@ -204,7 +205,7 @@ class Reservation(AggregateRoot[ReservationId]):
             )
         )
 
-    def extend(self, new_end: datetime) -> None:
+    def extend(self, new_end: datetime, occurred_at: datetime) -> None:
         if self._status not in (
             ReservationStatus.CONFIRMED,
             ReservationStatus.ACTIVE,
@@ -213,3 +214,10 @@ class Reservation(AggregateRoot[ReservationId]):
         if new_end <= self._time_slot.end:
             raise InvalidExtensionError()
         self._time_slot = TimeSlot(start=self._time_slot.start, end=new_end)
+        self._record_event(
+            ReservationExtended(
+                reservation_id=self._id,
+                time_slot=self._time_slot,
+                occurred_at=occurred_at,
+            )
+        )
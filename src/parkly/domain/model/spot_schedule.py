@@ -0,0 +1,110 @@
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Self
+
+from parkly.domain.model.typed_ids import ReservationId, SpotId
+from parkly.domain.model.value_objects import TimeSlot
+
+
+@dataclass
+class SpotSchedule:
+    """Reservations of one spot, sorted by start.
+
+    Reservations on a spot do not overlap, so ends are sorted too and a lookup
+    is a single bisect; while an overlap is held, lookups scan linearly.
+    """
+
+    _starts: list[datetime] = field(default_factory=list)
+    _ends: list[datetime] = field(default_factory=list)
+    _reservation_ids: list[ReservationId] = field(default_factory=list)
+    _has_overlaps: bool = False
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def add(self, reservation_id: ReservationId, time_slot: TimeSlot) -> None:
+        index = bisect_right(self._starts, time_slot.start)
+        if (index > 0 and self._ends[index - 1] > time_slot.start) or (
+            index < len(self._starts) and self._starts[index] < time_slot.end
+        ):
+            self._has_overlaps = True
+        self._starts.insert(index, time_slot.start)
+        self._ends.insert(index, time_slot.end)
+        self._reservation_ids.insert(index, reservation_id)
+
+    def remove(self, reservation_id: ReservationId, start: datetime) -> None:
+        index = bisect_left(self._starts, start)
+        while index < len(self._starts) and self._starts[index] == start:
+            if self._reservation_ids[index] == reservation_id:
+                del self._starts[index]
+                del self._ends[index]
+                del self._reservation_ids[index]
+                if self._has_overlaps:
+                    self._has_overlaps = self._overlaps()
+                return
+            index += 1
+
+    def _overlaps(self) -> bool:
+        latest_end: datetime | None = None
+        for start, end in zip(self._starts, self._ends, strict=True):
+            if latest_end is not None and latest_end > start:
+                return True
+            if latest_end is None or end > latest_end:
+                latest_end = end
+        return False
+
+    def is_free(self, time_slot: TimeSlot) -> bool:
+        candidates = bisect_left(self._starts, time_slot.end)
+        if candidates == 0:
+            return True
+        if self._has_overlaps:
+            return all(end <= time_slot.start for end in self._ends[:candidates])
+        return self._ends[candidates - 1] <= time_slot.start
+
+
+@dataclass
+class FacilitySchedule:
+    """Per-spot reservation schedules of one facility."""
+
+    _spots: dict[SpotId, SpotSchedule] = field(default_factory=dict)
+    _slots: dict[ReservationId, tuple[SpotId, TimeSlot]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, reservations: list[tuple[ReservationId, SpotId, TimeSlot]]) -> Self:
+        schedule = cls()
+        for reservation_id, spot_id, time_slot in sorted(
+            reservations, key=lambda r: r[2].start
+        ):
+            schedule.add(reservation_id, spot_id, time_slot)
+        return schedule
+
+    def __contains__(self, reservation_id: ReservationId) -> bool:
+        return reservation_id in self._slots
+
+    def add(
+        self, reservation_id: ReservationId, spot_id: SpotId, time_slot: TimeSlot
+    ) -> None:
+        if reservation_id in self._slots:
+            self.remove(reservation_id)
+        self._spots.setdefault(spot_id, SpotSchedule()).add(reservation_id, time_slot)
+        self._slots[reservation_id] = (spot_id, time_slot)
+
+    def remove(self, reservation_id: ReservationId) -> None:
+        entry = self._slots.pop(reservation_id, None)
+        if entry is None:
+            return
+        spot_id, time_slot = entry
+        spot_schedule = self._spots[spot_id]
+        spot_schedule.remove(reservation_id, time_slot.start)
+        if not spot_schedule:
+            del self._spots[spot_id]
+
+    def reschedule(self, reservation_id: ReservationId, time_slot: TimeSlot) -> None:
+        entry = self._slots.get(reservation_id)
+        if entry is not None:
+            self.add(reservation_id, entry[0], time_slot)
+
+    def is_free(self, spot_id: SpotId, time_slot: TimeSlot) -> bool:
+        spot_schedule = self._spots.get(spot_id)
+        return spot_schedule is None or spot_schedule.is_free(time_slot)
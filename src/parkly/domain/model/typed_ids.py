@@ -1,9 +1,10 @@
 from dataclasses import dataclass
+from typing import Self
 
 from parkly.domain.exception.exceptions import RequiredFieldError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TypedId[T]:
     value: T
 
@@ -11,26 +12,33 @@ class TypedId[T]:
         if self.value is None:
             raise RequiredFieldError(type(self).__name__, "value")
 
+    @classmethod
+    def reconstitute(cls, value: T) -> Self:
+        """Rebuild a persisted ID without validating it again."""
+        typed_id = object.__new__(cls)
+        object.__setattr__(typed_id, "value", value)
+        return typed_id
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class FacilityId(TypedId): ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SpotId(TypedId): ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReservationId(TypedId): ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VehicleId(TypedId): ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SessionId(TypedId): ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OwnerId(TypedId): ...
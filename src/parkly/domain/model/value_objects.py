@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 from math import asin, cos, radians, sin, sqrt
 from typing import Self
 
@@ -17,12 +17,23 @@ from parkly.domain.exception.exceptions import (
     NegativeMoneyAmountError,
     NegativeMoneyResultError,
     NonDecimalMoneyAmountError,
+    NonIntegerMinorUnitsError,
     RequiredFieldError,
 )
-from parkly.domain.model.consts import EARTH_RADIUS_KM, ISO_4217_CODES
+from parkly.domain.model.consts import (
+    DEFAULT_MINOR_UNITS,
+    EARTH_RADIUS_KM,
+    ISO_4217_CODES,
+    ISO_4217_MINOR_UNITS,
+    MICROSECONDS_PER_HOUR,
+)
+
+# ``reconstitute`` rebuilds a value from persisted data that passed validation
+# when it was stored, skipping ``__post_init__``. Only persistence mappers
+# should call it.
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TimeSlot:
     start: datetime
     end: datetime
@@ -35,17 +46,24 @@ class TimeSlot:
         if self.start >= self.end:
             raise InvalidTimeSlotError()
 
-    def overlaps(self, other: "TimeSlot") -> bool:
+    @classmethod
+    def reconstitute(cls, start: datetime, end: datetime) -> Self:
+        time_slot = object.__new__(cls)
+        object.__setattr__(time_slot, "start", start)
+        object.__setattr__(time_slot, "end", end)
+        return time_slot
+
+    def overlaps(self, other: TimeSlot) -> bool:
         return self.start < other.end and other.start < self.end
 
-    def is_adjacent(self, other: "TimeSlot") -> bool:
+    def is_adjacent(self, other: TimeSlot) -> bool:
         return self.end == other.start or other.end == self.start
 
     def duration(self) -> timedelta:
         return self.end - self.start
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Currency:
     code: str
 
@@ -54,11 +72,28 @@ class Currency:
             raise InvalidCurrencyCodeError(self.code if self.code else "")
         object.__setattr__(self, "code", self.code.upper())
 
+    @classmethod
+    def of(cls, code: str) -> Currency:
+        currency = _currencies.get(code)
+        if currency is None:
+            built = cls(code=code)
+            # Keyed by the normalised code first, so "usd" and "USD" share one.
+            currency = _currencies.setdefault(built.code, built)
+            _currencies[code] = currency
+        return currency
+
+    @property
+    def minor_units(self) -> int:
+        return ISO_4217_MINOR_UNITS.get(self.code, DEFAULT_MINOR_UNITS)
+
     def __str__(self) -> str:
         return self.code
 
 
-@dataclass(frozen=True)
+_currencies: dict[str, Currency] = {}
+
+
+@dataclass(frozen=True, slots=True)
 class Money:
     amount: Decimal
     currency: Currency
@@ -71,17 +106,24 @@ class Money:
         if self.currency is None:
             raise RequiredFieldError(type(self).__name__, "currency")
 
-    def _check_same_currency(self, other: "Money") -> None:
+    @classmethod
+    def reconstitute(cls, amount: Decimal, currency: Currency) -> Self:
+        money = object.__new__(cls)
+        object.__setattr__(money, "amount", amount)
+        object.__setattr__(money, "currency", currency)
+        return money
+
+    def _check_same_currency(self, other: Money) -> None:
         if self.currency != other.currency:
             raise CurrencyMismatchError(
                 currency_a=str(self.currency), currency_b=str(other.currency)
             )
 
-    def add(self, other: "Money") -> Self:
+    def add(self, other: Money) -> Self:
         self._check_same_currency(other)
         return type(self)(amount=self.amount + other.amount, currency=self.currency)
 
-    def subtract(self, other: "Money") -> Self:
+    def subtract(self, other: Money) -> Self:
         self._check_same_currency(other)
         result = self.amount - other.amount
         if result < Decimal("0"):
@@ -92,7 +134,83 @@ class Money:
         return type(self)(amount=self.amount * factor, currency=self.currency)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class MinorMoney:
+    """Money as an integer count of the currency's minor units."""
+
+    units: int
+    currency: Currency
+
+    def __post_init__(self) -> None:
+        if type(self.units) is not int:
+            raise NonIntegerMinorUnitsError()
+        if self.units < 0:
+            raise NegativeMoneyAmountError()
+        if self.currency is None:
+            raise RequiredFieldError(type(self).__name__, "currency")
+
+    @classmethod
+    def from_ratio(cls, numerator: int, denominator: int, currency: Currency) -> Self:
+        # Round half up, as PostgreSQL does when storing into a numeric column.
+        return cls(
+            units=(2 * numerator + denominator) // (2 * denominator),
+            currency=currency,
+        )
+
+    @classmethod
+    def for_duration(
+        cls,
+        rate_per_hour: Money,
+        duration: timedelta,
+        multiplier: Decimal = Decimal(1),
+    ) -> Self:
+        rate_numerator, rate_denominator = rate_per_hour.amount.as_integer_ratio()
+        multiplier_numerator, multiplier_denominator = multiplier.as_integer_ratio()
+        micros = max(duration // timedelta(microseconds=1), 0)
+        return cls.from_ratio(
+            numerator=rate_numerator
+            * 10**rate_per_hour.currency.minor_units
+            * micros
+            * multiplier_numerator,
+            denominator=rate_denominator
+            * multiplier_denominator
+            * MICROSECONDS_PER_HOUR,
+            currency=rate_per_hour.currency,
+        )
+
+    @classmethod
+    def from_money(cls, money: Money) -> Self:
+        units = money.amount.scaleb(money.currency.minor_units)
+        return cls(
+            units=int(units.to_integral_value(rounding=ROUND_HALF_UP)),
+            currency=money.currency,
+        )
+
+    def to_money(self) -> Money:
+        return Money(
+            amount=Decimal(self.units).scaleb(-self.currency.minor_units),
+            currency=self.currency,
+        )
+
+    def _check_same_currency(self, other: MinorMoney) -> None:
+        if self.currency != other.currency:
+            raise CurrencyMismatchError(
+                currency_a=str(self.currency), currency_b=str(other.currency)
+            )
+
+    def add(self, other: MinorMoney) -> Self:
+        self._check_same_currency(other)
+        return type(self)(units=self.units + other.units, currency=self.currency)
+
+    def subtract(self, other: MinorMoney) -> Self:
+        self._check_same_currency(other)
+        result = self.units - other.units
+        if result < 0:
+            raise NegativeMoneyResultError()
+        return type(self)(units=result, currency=self.currency)
+
+
+@dataclass(frozen=True, slots=True)
 class LicensePlate:
     value: str
     region: str
@@ -103,11 +221,18 @@ class LicensePlate:
         if not self.region or not self.region.strip():
             raise EmptyLicensePlateRegionError()
 
+    @classmethod
+    def reconstitute(cls, value: str, region: str) -> Self:
+        plate = object.__new__(cls)
+        object.__setattr__(plate, "value", value)
+        object.__setattr__(plate, "region", region)
+        return plate
+
     def formatted(self) -> str:
         return f"[{self.region}] {self.value}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SpotNumber:
     value: str
 
@@ -116,11 +241,17 @@ class SpotNumber:
             raise EmptySpotNumberError()
         object.__setattr__(self, "value", self.value.strip())
 
+    @classmethod
+    def reconstitute(cls, value: str) -> Self:
+        spot_number = object.__new__(cls)
+        object.__setattr__(spot_number, "value", value)
+        return spot_number
+
     def __str__(self) -> str:
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Location:
     latitude: Decimal
     longitude: Decimal
@@ -138,7 +269,15 @@ class Location:
         if not (Decimal("-180") <= self.longitude <= Decimal("180")):
             raise InvalidLongitudeError()
 
-    def distance_to(self, other: "Location") -> Decimal:
+    @classmethod
+    def reconstitute(cls, latitude: Decimal, longitude: Decimal, address: str) -> Self:
+        location = object.__new__(cls)
+        object.__setattr__(location, "latitude", latitude)
+        object.__setattr__(location, "longitude", longitude)
+        object.__setattr__(location, "address", address)
+        return location
+
+    def distance_to(self, other: Location) -> Decimal:
         lat1 = radians(float(self.latitude))
         lat2 = radians(float(other.latitude))
         dlat = radians(float(other.latitude - self.latitude))
@@ -148,7 +287,7 @@ class Location:
         return EARTH_RADIUS_KM * Decimal(str(c))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FacilityName:
     value: str
 
@@ -157,11 +296,17 @@ class FacilityName:
             raise RequiredFieldError(type(self).__name__, "value")
         object.__setattr__(self, "value", self.value.strip())
 
+    @classmethod
+    def reconstitute(cls, value: str) -> Self:
+        name = object.__new__(cls)
+        object.__setattr__(name, "value", value)
+        return name
+
     def __str__(self) -> str:
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Capacity:
     value: int
 
@@ -170,3 +315,9 @@ class Capacity:
             raise RequiredFieldError(type(self).__name__, "value")
         if self.value < 0:
             raise NegativeCapacityError()
+
+    @classmethod
+    def reconstitute(cls, value: int) -> Self:
+        capacity = object.__new__(cls)
+        object.__setattr__(capacity, "value", value)
+        return capacity
@@ -10,10 +10,19 @@ class ParkingFacilityRepository(ABC):
     @abstractmethod
     async def save(self, facility: ParkingFacility) -> None: ...
 
+    @abstractmethod
+    async def save_many(self, facilities: list[ParkingFacility]) -> None: ...
+
     @abstractmethod
     async def find_by_id(self, id: FacilityId) -> ParkingFacility | None: ...
 
+    @abstractmethod
+    async def find_by_ids(self, ids: list[FacilityId]) -> list[ParkingFacility]: ...
+
+    @abstractmethod
+    async def find_all_locations(self) -> list[tuple[FacilityId, Location]]: ...
+
     @abstractmethod
     async def find_by_location(
-        self, location: Location, radius: Decimal
+        self, location: Location, radius: Decimal, limit: int | None = None
     ) -> list[ParkingFacility]: ...
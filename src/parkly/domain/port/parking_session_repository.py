@@ -1,13 +1,19 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import datetime
 
+from parkly.domain.model.pagination import Page, PageRequest
 from parkly.domain.model.parking_session import ParkingSession
-from parkly.domain.model.typed_ids import SessionId, SpotId, VehicleId
+from parkly.domain.model.typed_ids import FacilityId, SessionId, SpotId, VehicleId
 
 
 class ParkingSessionRepository(ABC):
     @abstractmethod
     async def save(self, session: ParkingSession) -> None: ...
 
+    @abstractmethod
+    async def save_many(self, sessions: list[ParkingSession]) -> None: ...
+
     @abstractmethod
     async def find_by_id(self, id: SessionId) -> ParkingSession | None: ...
 
@@ -15,4 +21,20 @@ class ParkingSessionRepository(ABC):
     async def find_active_by_spot(self, spot_id: SpotId) -> ParkingSession | None: ...
 
     @abstractmethod
-    async def find_by_vehicle(self, vehicle_id: VehicleId) -> list[ParkingSession]: ...
+    async def find_active_by_facility(
+        self, facility_id: FacilityId
+    ) -> list[ParkingSession]: ...
+
+    @abstractmethod
+    async def find_by_vehicle(
+        self, vehicle_id: VehicleId, page: PageRequest
+    ) -> Page[ParkingSession]: ...
+
+    @abstractmethod
+    def stream_by_facility(
+        self,
+        facility_id: FacilityId,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> AsyncIterator[ParkingSession]:
+        """Sessions that entered in [since, until), by entry time, unbuffered."""
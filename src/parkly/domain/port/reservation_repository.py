@@ -1,7 +1,15 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import datetime
 
+from parkly.domain.model.pagination import Page, PageRequest
 from parkly.domain.model.reservation import Reservation
-from parkly.domain.model.typed_ids import ReservationId, SpotId, VehicleId
+from parkly.domain.model.typed_ids import (
+    FacilityId,
+    ReservationId,
+    SpotId,
+    VehicleId,
+)
 from parkly.domain.model.value_objects import TimeSlot
 
 
@@ -9,6 +17,9 @@ class ReservationRepository(ABC):
     @abstractmethod
     async def save(self, reservation: Reservation) -> None: ...
 
+    @abstractmethod
+    async def save_many(self, reservations: list[Reservation]) -> None: ...
+
     @abstractmethod
     async def find_by_id(self, id: ReservationId) -> Reservation | None: ...
 
@@ -18,4 +29,21 @@ class ReservationRepository(ABC):
     ) -> list[Reservation]: ...
 
     @abstractmethod
-    async def find_by_vehicle(self, vehicle_id: VehicleId) -> list[Reservation]: ...
+    async def find_active_by_facility(
+        self, facility_id: FacilityId, ending_after: datetime | None = None
+    ) -> list[Reservation]:
+        """Reservations not cancelled or completed, ending after ending_after."""
+
+    @abstractmethod
+    async def find_by_vehicle(
+        self, vehicle_id: VehicleId, page: PageRequest
+    ) -> Page[Reservation]: ...
+
+    @abstractmethod
+    def stream_by_facility(
+        self,
+        facility_id: FacilityId,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> AsyncIterator[Reservation]:
+        """Reservations starting in [since, until), by start time, unbuffered."""
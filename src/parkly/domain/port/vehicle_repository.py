@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from parkly.domain.model.pagination import Page, PageRequest
 from parkly.domain.model.typed_ids import OwnerId, VehicleId
 from parkly.domain.model.value_objects import LicensePlate
 from parkly.domain.model.vehicle import Vehicle
@@ -9,11 +10,16 @@ class VehicleRepository(ABC):
     @abstractmethod
     async def save(self, vehicle: Vehicle) -> None: ...
 
+    @abstractmethod
+    async def save_many(self, vehicles: list[Vehicle]) -> None: ...
+
     @abstractmethod
     async def find_by_id(self, id: VehicleId) -> Vehicle | None: ...
 
     @abstractmethod
-    async def find_by_owner(self, owner_id: OwnerId) -> list[Vehicle]: ...
+    async def find_by_owner(
+        self, owner_id: OwnerId, page: PageRequest
+    ) -> Page[Vehicle]: ...
 
     @abstractmethod
     async def find_by_license_plate(self, plate: LicensePlate) -> Vehicle | None: ...
@@ -0,0 +1,129 @@
+from math import asin, ceil, cos, degrees, floor, radians, sin, sqrt
+
+from parkly.domain.model.consts import EARTH_RADIUS_KM
+from parkly.domain.model.typed_ids import FacilityId
+
+_EARTH_RADIUS_KM = float(EARTH_RADIUS_KM)
+_KM_PER_DEGREE = radians(1) * _EARTH_RADIUS_KM
+_HALF_CIRCUMFERENCE_KM = radians(180) * _EARTH_RADIUS_KM
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    phi1 = radians(lat1)
+    phi2 = radians(lat2)
+    a = (
+        sin(radians(lat2 - lat1) / 2) ** 2
+        + cos(phi1) * cos(phi2) * sin(radians(lng2 - lng1) / 2) ** 2
+    )
+    return 2 * _EARTH_RADIUS_KM * asin(min(1.0, sqrt(a)))
+
+
+def bounding_box(
+    latitude: float, longitude: float, radius_km: float
+) -> tuple[float, float, float, float] | tuple[float, float, None, None]:
+    """South, north, west and east edges of a box enclosing the circle.
+
+    West and east are ``None`` when the circle reaches every meridian. They are
+    not normalised: west below -180 or east above 180 means the box wraps the
+    antimeridian.
+    """
+    lat_span = radius_km / _KM_PER_DEGREE
+    south = max(latitude - lat_span, -90.0)
+    north = min(latitude + lat_span, 90.0)
+    if radius_km >= _HALF_CIRCUMFERENCE_KM or south <= -90.0 or north >= 90.0:
+        return south, north, None, None
+    # Widest longitude reach of the circle; a circle over a pole reaches
+    # every meridian.
+    reach = sin(radius_km / _EARTH_RADIUS_KM) / cos(radians(latitude))
+    if reach >= 1.0:
+        return south, north, None, None
+    lng_span = degrees(asin(reach))
+    return south, north, longitude - lng_span, longitude + lng_span
+
+
+class GeoIndex:
+    """Facility coordinates bucketed into a fixed lat/lng degree grid."""
+
+    def __init__(self, cell_degrees: float = 0.1) -> None:
+        self._cell = cell_degrees
+        self._lat_cells = ceil(180 / cell_degrees)
+        self._lng_cells = ceil(360 / cell_degrees)
+        self._points: dict[FacilityId, tuple[float, float]] = {}
+        self._cells: dict[tuple[int, int], set[FacilityId]] = {}
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def _cell_of(self, latitude: float, longitude: float) -> tuple[int, int]:
+        row = min(floor((latitude + 90) / self._cell), self._lat_cells - 1)
+        column = floor((longitude + 180) / self._cell) % self._lng_cells
+        return row, column
+
+    def add(self, facility_id: FacilityId, latitude: float, longitude: float) -> None:
+        self.remove(facility_id)
+        self._points[facility_id] = (latitude, longitude)
+        self._cells.setdefault(self._cell_of(latitude, longitude), set()).add(
+            facility_id
+        )
+
+    def remove(self, facility_id: FacilityId) -> None:
+        point = self._points.pop(facility_id, None)
+        if point is None:
+            return
+        cell = self._cell_of(*point)
+        members = self._cells[cell]
+        members.discard(facility_id)
+        if not members:
+            del self._cells[cell]
+
+    def _candidates(
+        self, latitude: float, longitude: float, radius_km: float
+    ) -> list[FacilityId]:
+        if radius_km >= _HALF_CIRCUMFERENCE_KM:
+            return list(self._points)
+
+        south, north, west, east = bounding_box(latitude, longitude, radius_km)
+        if west is None or east is None:
+            columns = range(self._lng_cells)
+        else:
+            first = floor((west + 180) / self._cell)
+            last = floor((east + 180) / self._cell)
+            columns = range(first, min(last, first + self._lng_cells - 1) + 1)
+
+        first_row, _ = self._cell_of(south, longitude)
+        last_row, _ = self._cell_of(north, longitude)
+        candidates: list[FacilityId] = []
+        for row in range(first_row, last_row + 1):
+            for column in columns:
+                members = self._cells.get((row, column % self._lng_cells))
+                if members:
+                    candidates.extend(members)
+        return candidates
+
+    def within(
+        self, latitude: float, longitude: float, radius_km: float
+    ) -> list[tuple[FacilityId, float]]:
+        matches: list[tuple[FacilityId, float]] = []
+        for facility_id in self._candidates(latitude, longitude, radius_km):
+            lat, lng = self._points[facility_id]
+            distance = haversine_km(latitude, longitude, lat, lng)
+            if distance <= radius_km:
+                matches.append((facility_id, distance))
+        matches.sort(key=lambda match: match[1])
+        return matches
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int,
+        max_radius_km: float = _HALF_CIRCUMFERENCE_KM,
+    ) -> list[tuple[FacilityId, float]]:
+        if k <= 0 or not self._points:
+            return []
+        radius_km = min(self._cell * _KM_PER_DEGREE, max_radius_km)
+        while True:
+            matches = self.within(latitude, longitude, radius_km)
+            if len(matches) >= k or radius_km >= max_radius_km:
+                return matches[:k]
+            radius_km = min(radius_km * 2, max_radius_km)
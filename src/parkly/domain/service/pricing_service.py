@@ -1,10 +1,30 @@
-from parkly.domain.model.value_objects import Money, TimeSlot
+from collections.abc import Sequence
+
+from parkly.domain.model.value_objects import MinorMoney, Money, TimeSlot
 from parkly.domain.service.pricing_strategy import PricingStrategy
+from parkly.domain.service.quote_cache import QuoteCache, QuoteKey
 
 
 class PricingService:
-    def __init__(self, strategy: PricingStrategy) -> None:
+    def __init__(
+        self, strategy: PricingStrategy, cache: QuoteCache | None = None
+    ) -> None:
+        self._strategy = strategy
+        self._strategy_key = strategy.cache_key()
+        self._cache = cache
+
+    @property
+    def cache(self) -> QuoteCache | None:
+        return self._cache
+
+    def set_strategy(self, strategy: PricingStrategy) -> None:
+        if self._cache is not None:
+            self._cache.invalidate(self._strategy_key)
         self._strategy = strategy
+        self._strategy_key = strategy.cache_key()
+
+    def _quote_key(self, time_slot: TimeSlot, base_rate: Money) -> QuoteKey:
+        return (self._strategy_key, base_rate, self._strategy.slot_key(time_slot))
 
     def calculate_price(
         self,
@@ -12,3 +32,44 @@ class PricingService:
         base_rate: Money,
     ) -> Money:
         return self._strategy.calculate(time_slot, base_rate)
+
+    def calculate_price_minor(
+        self,
+        time_slot: TimeSlot,
+        base_rate: Money,
+    ) -> MinorMoney:
+        if self._cache is None:
+            return self._strategy.calculate_minor(time_slot, base_rate)
+
+        key = self._quote_key(time_slot, base_rate)
+        price = self._cache.get(key)
+        if price is None:
+            price = self._strategy.calculate_minor(time_slot, base_rate)
+            self._cache.put(key, price)
+        return price
+
+    def calculate_price_many(
+        self,
+        time_slots: Sequence[TimeSlot],
+        base_rates: Sequence[Money],
+    ) -> list[MinorMoney]:
+        if self._cache is None or len(time_slots) != len(base_rates):
+            return self._strategy.calculate_many(time_slots, base_rates)
+
+        keys = [self._quote_key(t, r) for t, r in zip(time_slots, base_rates)]
+        prices: dict[int, MinorMoney] = {}
+        missing: list[int] = []
+        for i, key in enumerate(keys):
+            price = self._cache.get(key)
+            if price is None:
+                missing.append(i)
+            else:
+                prices[i] = price
+        if missing:
+            computed = self._strategy.calculate_many(
+                [time_slots[i] for i in missing], [base_rates[i] for i in missing]
+            )
+            for i, price in zip(missing, computed):
+                prices[i] = price
+                self._cache.put(keys[i], price)
+        return [prices[i] for i in range(len(keys))]
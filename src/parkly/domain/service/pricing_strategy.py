@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
+from collections.abc import Hashable, Iterable, Sequence
+from datetime import UTC, timedelta, tzinfo
 from decimal import Decimal
+from itertools import repeat
 
+from parkly.domain.exception.exceptions import BatchLengthMismatchError
 from parkly.domain.model.config import (
     DurationDiscountPricingConfig,
     DynamicPricingConfig,
@@ -8,22 +12,98 @@ from parkly.domain.model.config import (
     PeakHourPricingConfig,
     TieredPricingConfig,
 )
-from parkly.domain.model.consts import SECONDS_PER_HOUR
-from parkly.domain.model.value_objects import Money, TimeSlot
+from parkly.domain.model.consts import MICROSECONDS_PER_HOUR, SECONDS_PER_HOUR
+from parkly.domain.model.value_objects import MinorMoney, Money, TimeSlot
+from parkly.domain.service.rate_calendar import RateCalendar
+
+_ONE = Decimal(1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _check_batch(time_slots: Sequence[TimeSlot], base_rates: Sequence[Money]) -> None:
+    if len(time_slots) != len(base_rates):
+        raise BatchLengthMismatchError(len(time_slots), len(base_rates))
+
+
+def _price_durations(
+    base_rates: Iterable[Money],
+    durations: Iterable[timedelta],
+    multipliers: Iterable[Decimal],
+) -> list[MinorMoney]:
+    # Same integer ratio as MinorMoney.for_duration, with the per-rate factors
+    # worked out once per rate and multiplier object in the batch. Keying on
+    # identity skips hashing Decimals; the inputs outlive the loop.
+    factors: dict[tuple[int, int], tuple[int, int]] = {}
+    prices: list[MinorMoney] = []
+    for base_rate, duration, multiplier in zip(base_rates, durations, multipliers):
+        key = (id(base_rate), id(multiplier))
+        factor = factors.get(key)
+        if factor is None:
+            rate_numerator, rate_denominator = base_rate.amount.as_integer_ratio()
+            multiplier_numerator, multiplier_denominator = multiplier.as_integer_ratio()
+            factor = factors[key] = (
+                rate_numerator
+                * 10**base_rate.currency.minor_units
+                * multiplier_numerator,
+                rate_denominator * multiplier_denominator * MICROSECONDS_PER_HOUR,
+            )
+        numerator, denominator = factor
+        prices.append(
+            MinorMoney.from_ratio(
+                numerator=numerator * max(duration // _MICROSECOND, 0),
+                denominator=denominator,
+                currency=base_rate.currency,
+            )
+        )
+    return prices
 
 
 class PricingStrategy(ABC):
     @abstractmethod
     def calculate(self, time_slot: TimeSlot, base_rate: Money) -> Money: ...
 
+    def cache_key(self) -> Hashable:
+        return (type(self),)
+
+    def slot_key(self, time_slot: TimeSlot) -> Hashable:
+        return (time_slot.start, time_slot.end)
+
+    def calculate_minor(self, time_slot: TimeSlot, base_rate: Money) -> MinorMoney:
+        return MinorMoney.from_money(self.calculate(time_slot, base_rate))
+
+    def calculate_many(
+        self, time_slots: Sequence[TimeSlot], base_rates: Sequence[Money]
+    ) -> list[MinorMoney]:
+        _check_batch(time_slots, base_rates)
+        return [
+            self.calculate_minor(time_slot, base_rate)
+            for time_slot, base_rate in zip(time_slots, base_rates)
+        ]
+
 
 class StaticPricing(PricingStrategy):
     """Flat rate per hour."""
 
+    def slot_key(self, time_slot: TimeSlot) -> Hashable:
+        return time_slot.end - time_slot.start
+
     def calculate(self, time_slot: TimeSlot, base_rate: Money) -> Money:
         hours = Decimal(str(time_slot.duration().total_seconds())) / SECONDS_PER_HOUR
         return base_rate.multiply(hours)
 
+    def calculate_minor(self, time_slot: TimeSlot, base_rate: Money) -> MinorMoney:
+        return MinorMoney.for_duration(base_rate, time_slot.duration())
+
+    def calculate_many(
+        self, time_slots: Sequence[TimeSlot], base_rates: Sequence[Money]
+    ) -> list[MinorMoney]:
+        _check_batch(time_slots, base_rates)
+        return _price_durations(
+            base_rates,
+            (t.end - t.start for t in time_slots),
+            repeat(_ONE),
+        )
+
 
 class DynamicPricing(PricingStrategy):
     """Demand-based surge pricing."""
@@ -31,10 +111,31 @@ class DynamicPricing(PricingStrategy):
     def __init__(self, config: DynamicPricingConfig) -> None:
         self._config = config
 
+    def cache_key(self) -> Hashable:
+        return (type(self), self._config)
+
+    def slot_key(self, time_slot: TimeSlot) -> Hashable:
+        return time_slot.end - time_slot.start
+
     def calculate(self, time_slot: TimeSlot, base_rate: Money) -> Money:
         hours = Decimal(str(time_slot.duration().total_seconds())) / SECONDS_PER_HOUR
         return base_rate.multiply(hours * self._config.surge_multiplier)
 
+    def calculate_minor(self, time_slot: TimeSlot, base_rate: Money) -> MinorMoney:
+        return MinorMoney.for_duration(
+            base_rate, time_slot.duration(), self._config.surge_multiplier
+        )
+
+    def calculate_many(
+        self, time_slots: Sequence[TimeSlot], base_rates: Sequence[Money]
+    ) -> list[MinorMoney]:
+        _check_batch(time_slots, base_rates)
+        return _price_durations(
+            base_rates,
+            (t.end - t.start for t in time_slots),
+            repeat(self._config.surge_multiplier),
+        )
+
 
 class EventAwarePricing(PricingStrategy):
     """Premium pricing near event venues."""
@@ -42,23 +143,51 @@ class EventAwarePricing(PricingStrategy):
     def __init__(self, config: EventPricingConfig) -> None:
         self._config = config
 
+    def cache_key(self) -> Hashable:
+        return (type(self), self._config)
+
+    def slot_key(self, time_slot: TimeSlot) -> Hashable:
+        return time_slot.end - time_slot.start
+
     def calculate(self, time_slot: TimeSlot, base_rate: Money) -> Money:
         hours = Decimal(str(time_slot.duration().total_seconds())) / SECONDS_PER_HOUR
         return base_rate.multiply(hours * self._config.event_multiplier)
 
+    def calculate_minor(self, time_slot: TimeSlot, base_rate: Money) -> MinorMoney:
+        return MinorMoney.for_duration(
+            base_rate, time_slot.duration(), self._config.event_multiplier
+        )
+
+    def calculate_many(
+        self, time_slots: Sequence[TimeSlot], base_rates: Sequence[Money]
+    ) -> list[MinorMoney]:
+        _check_batch(time_slots, base_rates)
+        return _price_durations(
+            base_rates,
+            (t.end - t.start for t in time_slots),
+            repeat(self._config.event_multiplier),
+        )
+
 
 class TimeOfDayPricing(PricingStrategy):
-    """Peak / off-peak tiers."""
+    """Peak / off-peak tiers, prorated across peak boundaries in local time."""
 
-    def __init__(self, config: PeakHourPricingConfig) -> None:
+    def __init__(self, config: PeakHourPricingConfig, tz: tzinfo = UTC) -> None:
         self._config = config
+        self._tz = tz
+        self._calendar = RateCalendar(config, tz)
+
+    def cache_key(self) -> Hashable:
+        return (type(self), self._config, self._tz)
+
+    def slot_key(self, time_slot: TimeSlot) -> Hashable:
+        return self._calendar.slot_key(time_slot)
 
     def calculate(self, time_slot: TimeSlot, base_rate: Money) -> Money:
-        hours = Decimal(str(time_slot.duration().total_seconds())) / SECONDS_PER_HOUR
-        start_hour = time_slot.start.hour
-        if self._config.peak_start_hour <= start_hour < self._config.peak_end_hour:
-            return base_rate.multiply(hours * self._config.peak_multiplier)
-        return base_rate.multiply(hours)
+        return base_rate.multiply(self._calendar.weighted_hours(time_slot))
+
+    def calculate_minor(self, time_slot: TimeSlot, base_rate: Money) -> MinorMoney:
+        return self._calendar.price(time_slot, base_rate)
 
 
 class TieredPricing(PricingStrategy):
@@ -67,6 +196,12 @@ class TieredPricing(PricingStrategy):
     def __init__(self, config: TieredPricingConfig) -> None:
         self._config = config
 
+    def cache_key(self) -> Hashable:
+        return (type(self), self._config)
+
+    def slot_key(self, time_slot: TimeSlot) -> Hashable:
+        return time_slot.end - time_slot.start
+
     def calculate(self, time_slot: TimeSlot, base_rate: Money) -> Money:
         total_hours = (
             Decimal(str(time_slot.duration().total_seconds())) / SECONDS_PER_HOUR
@@ -76,6 +211,21 @@ class TieredPricing(PricingStrategy):
         )
         return base_rate.multiply(billable)
 
+    def calculate_minor(self, time_slot: TimeSlot, base_rate: Money) -> MinorMoney:
+        billable = time_slot.duration() - timedelta(hours=self._config.free_hours)
+        return MinorMoney.for_duration(base_rate, billable)
+
+    def calculate_many(
+        self, time_slots: Sequence[TimeSlot], base_rates: Sequence[Money]
+    ) -> list[MinorMoney]:
+        _check_batch(time_slots, base_rates)
+        free = timedelta(hours=self._config.free_hours)
+        return _price_durations(
+            base_rates,
+            (t.end - t.start - free for t in time_slots),
+            repeat(_ONE),
+        )
+
 
 class DurationDiscountPricing(PricingStrategy):
     """Daily max cap."""
@@ -83,6 +233,12 @@ class DurationDiscountPricing(PricingStrategy):
     def __init__(self, config: DurationDiscountPricingConfig) -> None:
         self._config = config
 
+    def cache_key(self) -> Hashable:
+        return (type(self), self._config)
+
+    def slot_key(self, time_slot: TimeSlot) -> Hashable:
+        return time_slot.end - time_slot.start
+
     def calculate(self, time_slot: TimeSlot, base_rate: Money) -> Money:
         hours = Decimal(str(time_slot.duration().total_seconds())) / SECONDS_PER_HOUR
         total = base_rate.multiply(hours)
@@ -92,3 +248,25 @@ class DurationDiscountPricing(PricingStrategy):
         ):
             return self._config.daily_max
         return total
+
+    def calculate_minor(self, time_slot: TimeSlot, base_rate: Money) -> MinorMoney:
+        total = MinorMoney.for_duration(base_rate, time_slot.duration())
+        if self._config.daily_max is not None:
+            daily_max = MinorMoney.from_money(self._config.daily_max)
+            if total.units > daily_max.units:
+                return daily_max
+        return total
+
+    def calculate_many(
+        self, time_slots: Sequence[TimeSlot], base_rates: Sequence[Money]
+    ) -> list[MinorMoney]:
+        _check_batch(time_slots, base_rates)
+        totals = _price_durations(
+            base_rates,
+            (t.end - t.start for t in time_slots),
+            repeat(_ONE),
+        )
+        if self._config.daily_max is None:
+            return totals
+        daily_max = MinorMoney.from_money(self._config.daily_max)
+        return [daily_max if t.units > daily_max.units else t for t in totals]
@@ -0,0 +1,74 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from parkly.domain.model.value_objects import MinorMoney
+from parkly.domain.port.clock import Clock
+
+type QuoteKey = tuple[Hashable, Hashable, Hashable]
+
+
+@dataclass(frozen=True)
+class QuoteCacheStats:
+    entries: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+
+class QuoteCache:
+    """Bounded LRU of computed prices with a time-to-live per entry."""
+
+    def __init__(self, max_entries: int, ttl: timedelta, clock: Clock) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[QuoteKey, tuple[MinorMoney, datetime]] = (
+            OrderedDict()
+        )
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: QuoteKey) -> MinorMoney | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        price, expires_at = entry
+        if expires_at <= self._clock.now():
+            del self._entries[key]
+            self._expirations += 1
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return price
+
+    def put(self, key: QuoteKey, price: MinorMoney) -> None:
+        if self._max_entries <= 0:
+            return
+        self._entries[key] = (price, self._clock.now() + self._ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, strategy_key: Hashable | None = None) -> None:
+        if strategy_key is None:
+            self._entries.clear()
+            return
+        for key in [k for k in self._entries if k[0] == strategy_key]:
+            del self._entries[key]
+
+    def stats(self) -> QuoteCacheStats:
+        return QuoteCacheStats(
+            entries=len(self._entries),
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            expirations=self._expirations,
+        )
@@ -0,0 +1,147 @@
+from collections.abc import Hashable
+from datetime import UTC, datetime, timedelta, tzinfo
+from decimal import Decimal
+from itertools import pairwise
+
+from parkly.domain.model.config import PeakHourPricingConfig
+from parkly.domain.model.consts import MICROSECONDS_PER_HOUR
+from parkly.domain.model.value_objects import MinorMoney, Money, TimeSlot
+
+HOURS_PER_WEEK = 7 * 24
+
+# A Monday, so table hour 0 is Monday 00:00 local time.
+_WEEK_ORIGIN = datetime(1969, 12, 29)
+_MICROSECONDS_PER_WEEK = HOURS_PER_WEEK * MICROSECONDS_PER_HOUR
+_UTC_WEEK_ORIGIN = _WEEK_ORIGIN.replace(tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+_TRANSITION_PROBE = timedelta(days=7)
+
+
+class RateCalendar:
+    """Cumulative peak-weighted time over a local week, in hour resolution.
+
+    Weights are integers: off-peak time counts ``denominator`` per microsecond
+    and peak time counts the peak multiplier scaled by the same denominator, so
+    any slot prices exactly from two lookups and a subtraction.
+    """
+
+    def __init__(self, config: PeakHourPricingConfig, tz: tzinfo = UTC) -> None:
+        numerator, denominator = config.peak_multiplier.as_integer_ratio()
+        self._tz = tz
+        self._denominator = denominator
+        self._weights: list[int] = [
+            numerator
+            if config.peak_start_hour <= hour % 24 < config.peak_end_hour
+            else denominator
+            for hour in range(HOURS_PER_WEEK)
+        ]
+        # The table repeats daily unless weekdays are weighted differently.
+        period_hours = 24 if self._weights == self._weights[:24] * 7 else HOURS_PER_WEEK
+        self._period_micros = period_hours * MICROSECONDS_PER_HOUR
+        self._cumulative: list[int] = [0]
+        for weight in self._weights:
+            self._cumulative.append(
+                self._cumulative[-1] + weight * MICROSECONDS_PER_HOUR
+            )
+
+    @property
+    def denominator(self) -> int:
+        return self._denominator
+
+    def _utc_micros(self, moment: datetime) -> int:
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=UTC)
+        return (moment - _UTC_WEEK_ORIGIN) // _MICROSECOND
+
+    def _offset_micros(self, moment: datetime) -> int:
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=UTC)
+        offset = moment.astimezone(self._tz).utcoffset() or timedelta(0)
+        return offset // _MICROSECOND
+
+    def _position(self, local_micros: int) -> int:
+        weeks, into_week = divmod(local_micros, _MICROSECONDS_PER_WEEK)
+        hour, into_hour = divmod(into_week, MICROSECONDS_PER_HOUR)
+        return (
+            weeks * self._cumulative[-1]
+            + self._cumulative[hour]
+            + self._weights[hour] * into_hour
+        )
+
+    def _transitions(self, start: datetime, end: datetime) -> list[datetime]:
+        """Instants in (start, end] at which the UTC offset changes.
+
+        Offsets are probed a week apart, which finds every change as long as
+        changes are at least a week apart, then each one is bisected to the
+        microsecond.
+        """
+        transitions: list[datetime] = []
+        low = start
+        while low < end:
+            high = min(low + _TRANSITION_PROBE, end)
+            offset = self._offset_micros(low)
+            if self._offset_micros(high) != offset:
+                left, right = low, high
+                while right - left > _MICROSECOND:
+                    middle = left + (right - left) // 2
+                    if self._offset_micros(middle) == offset:
+                        left = middle
+                    else:
+                        right = middle
+                transitions.append(right)
+            low = high
+        return transitions
+
+    def _segments(self, time_slot: TimeSlot) -> list[tuple[int, int, int]]:
+        """UTC start, UTC end and UTC offset of each constant-offset piece."""
+        segments: list[tuple[int, int, int]] = []
+        start = time_slot.start
+        for boundary in [*self._transitions(start, time_slot.end), time_slot.end]:
+            segments.append(
+                (
+                    self._utc_micros(start),
+                    self._utc_micros(boundary),
+                    self._offset_micros(start),
+                )
+            )
+            start = boundary
+        return segments
+
+    def weighted_micros(self, time_slot: TimeSlot) -> int:
+        """Peak-weighted length of the slot, in units of 1/denominator µs."""
+        # Within a piece the wall clock runs with real time, so the piece is
+        # weighted by the local hours it actually covers. An hour skipped at
+        # spring forward is never charged and an hour repeated at fall back
+        # is charged twice, each at its own rate.
+        return sum(
+            self._position(end + offset) - self._position(start + offset)
+            for start, end, offset in self._segments(time_slot)
+        )
+
+    def slot_key(self, time_slot: TimeSlot) -> Hashable:
+        """Local start within the table's period, duration and offset changes."""
+        segments = self._segments(time_slot)
+        start, _, offset = segments[0]
+        return (
+            (start + offset) % self._period_micros,
+            (time_slot.end - time_slot.start) // _MICROSECOND,
+            tuple(
+                ((end + offset) % self._period_micros, next_offset - offset)
+                for (_, end, offset), (_, _, next_offset) in pairwise(segments)
+            ),
+        )
+
+    def price(self, time_slot: TimeSlot, base_rate: Money) -> MinorMoney:
+        rate_numerator, rate_denominator = base_rate.amount.as_integer_ratio()
+        return MinorMoney.from_ratio(
+            numerator=rate_numerator
+            * 10**base_rate.currency.minor_units
+            * self.weighted_micros(time_slot),
+            denominator=rate_denominator * self._denominator * MICROSECONDS_PER_HOUR,
+            currency=base_rate.currency,
+        )
+
+    def weighted_hours(self, time_slot: TimeSlot) -> Decimal:
+        return Decimal(self.weighted_micros(time_slot)) / Decimal(
+            self._denominator * MICROSECONDS_PER_HOUR
+        )
@@ -0,0 +1,277 @@
+import asyncio
+from collections.abc import AsyncIterator, Generator
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Self
+
+from sqlalchemy.exc import IntegrityError
+
+from parkly.application.port.logger import Logger
+from parkly.domain.model.enums import ReservationStatus
+from parkly.domain.model.pagination import Page, PageRequest
+from parkly.domain.model.parking_facility import ParkingFacility
+from parkly.domain.model.parking_session import ParkingSession
+from parkly.domain.model.reservation import Reservation
+from parkly.domain.model.typed_ids import (
+    FacilityId,
+    ReservationId,
+    SessionId,
+    SpotId,
+    VehicleId,
+)
+from parkly.domain.model.value_objects import Location, TimeSlot
+from parkly.domain.port.parking_facility_repository import ParkingFacilityRepository
+from parkly.domain.port.parking_session_repository import ParkingSessionRepository
+from parkly.domain.port.reservation_repository import ReservationRepository
+
+
+class FakeResult:
+    def __init__(self, rows: list[tuple[Any, ...]]) -> None:
+        self._rows = rows
+
+    def tuples(self) -> Self:
+        return self
+
+    def all(self) -> list[tuple[Any, ...]]:
+        return self._rows
+
+
+class FakeTransaction:
+    """What ``AsyncSession.begin`` returns: awaitable and a context manager."""
+
+    def __init__(self, session: FakeSession) -> None:
+        self._session = session
+
+    def __await__(self) -> Generator[None]:
+        self._session.began = True
+        yield from ()
+
+    async def __aenter__(self) -> Self:
+        self._session.began = True
+        return self
+
+    async def __aexit__(self, exc_type: type[BaseException] | None, *_: object) -> None:
+        if exc_type is None:
+            self._session.committed = True
+        else:
+            self._session.rolled_back = True
+
+
+class FakeSession:
+    """Stands in for an ``AsyncSession``; records statements, returns no rows.
+
+    ``rows`` are the rows every ``execute`` answers with, e.g. the
+    ``(ulid, pk)`` pairs of an ``INSERT ... RETURNING``; ``error``, when
+    given, is raised by every ``execute`` instead.
+    """
+
+    def __init__(
+        self,
+        rows: list[tuple[Any, ...]] | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        self.rows = rows or []
+        self.error = error
+        self.statements: list[Any] = []
+        self.began = False
+        self.committed = False
+        self.rolled_back = False
+        self.closed = False
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        self.closed = True
+
+    def begin(self) -> FakeTransaction:
+        return FakeTransaction(self)
+
+    async def execute(self, statement: Any, params: Any = None) -> FakeResult:
+        self.statements.append(statement)
+        if self.error is not None:
+            raise self.error
+        return FakeResult(self.rows)
+
+    async def commit(self) -> None:
+        self.committed = True
+
+    async def rollback(self) -> None:
+        self.rolled_back = True
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeSessionFactory:
+    def __init__(
+        self,
+        rows: list[tuple[Any, ...]] | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        self._rows = rows
+        self._error = error
+        self.sessions: list[FakeSession] = []
+
+    def __call__(self) -> FakeSession:
+        session = FakeSession(self._rows, self._error)
+        self.sessions.append(session)
+        return session
+
+
+class FakeDriverError(Exception):
+    """What asyncpg raises on a violation: it names the constraint."""
+
+    def __init__(self, constraint_name: str | None, detail: str | None) -> None:
+        super().__init__(detail)
+        self.constraint_name = constraint_name
+        self.detail = detail
+
+
+def integrity_error(
+    constraint_name: str | None, detail: str | None = None
+) -> IntegrityError:
+    """An ``IntegrityError`` chained the way SQLAlchemy wraps asyncpg's."""
+    orig = Exception("integrity violation")
+    orig.__cause__ = FakeDriverError(constraint_name, detail)
+    return IntegrityError("INSERT ...", {}, orig)
+
+
+class NullLogger(Logger):
+    def debug(self, message: str, extra: dict[str, Any] | None = None) -> None: ...
+
+    def info(self, message: str, extra: dict[str, Any] | None = None) -> None: ...
+
+    def warning(self, message: str, extra: dict[str, Any] | None = None) -> None: ...
+
+    def error(self, message: str, extra: dict[str, Any] | None = None) -> None: ...
+
+
+class InMemoryParkingFacilityRepository(ParkingFacilityRepository):
+    """Facilities by ID; every lookup yields to the event loop like a query."""
+
+    def __init__(self, facilities: list[ParkingFacility] | None = None) -> None:
+        self.facilities = {f.id: f for f in facilities or []}
+        self.loads = 0
+
+    async def save(self, facility: ParkingFacility) -> None:
+        self.facilities[facility.id] = facility
+
+    async def save_many(self, facilities: list[ParkingFacility]) -> None:
+        for facility in facilities:
+            await self.save(facility)
+
+    async def find_by_id(self, id: FacilityId) -> ParkingFacility | None:
+        self.loads += 1
+        await asyncio.sleep(0)
+        return self.facilities.get(id)
+
+    async def find_by_ids(self, ids: list[FacilityId]) -> list[ParkingFacility]:
+        return [f for i in ids if (f := await self.find_by_id(i)) is not None]
+
+    async def find_all_locations(self) -> list[tuple[FacilityId, Location]]:
+        await asyncio.sleep(0)
+        return [(f.id, f.location) for f in self.facilities.values()]
+
+    async def find_by_location(
+        self, location: Location, radius: Decimal, limit: int | None = None
+    ) -> list[ParkingFacility]:
+        return list(self.facilities.values())[:limit]
+
+
+class InMemoryReservationRepository(ReservationRepository):
+    def __init__(self, reservations: list[Reservation] | None = None) -> None:
+        self.reservations = {r.id: r for r in reservations or []}
+
+    async def save(self, reservation: Reservation) -> None:
+        self.reservations[reservation.id] = reservation
+
+    async def save_many(self, reservations: list[Reservation]) -> None:
+        for reservation in reservations:
+            await self.save(reservation)
+
+    async def find_by_id(self, id: ReservationId) -> Reservation | None:
+        return self.reservations.get(id)
+
+    async def find_by_spot_and_time(
+        self, spot_id: SpotId, time_slot: TimeSlot
+    ) -> list[Reservation]:
+        return [
+            r
+            for r in self.reservations.values()
+            if r.spot_id == spot_id and r.time_slot.overlaps(time_slot)
+        ]
+
+    async def find_active_by_facility(
+        self, facility_id: FacilityId, ending_after: datetime | None = None
+    ) -> list[Reservation]:
+        return [
+            r
+            for r in self.reservations.values()
+            if r.facility_id == facility_id
+            and r.status
+            not in (ReservationStatus.CANCELLED, ReservationStatus.COMPLETED)
+            and (ending_after is None or r.time_slot.end > ending_after)
+        ]
+
+    async def find_by_vehicle(
+        self, vehicle_id: VehicleId, page: PageRequest
+    ) -> Page[Reservation]:
+        items = [r for r in self.reservations.values() if r.vehicle_id == vehicle_id]
+        return Page(items=items[: page.limit], next_cursor=None)
+
+    async def stream_by_facility(
+        self,
+        facility_id: FacilityId,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> AsyncIterator[Reservation]:
+        for reservation in self.reservations.values():
+            if reservation.facility_id == facility_id:
+                yield reservation
+
+
+class InMemoryParkingSessionRepository(ParkingSessionRepository):
+    def __init__(self, sessions: list[ParkingSession] | None = None) -> None:
+        self.sessions = {s.id: s for s in sessions or []}
+
+    async def save(self, session: ParkingSession) -> None:
+        self.sessions[session.id] = session
+
+    async def save_many(self, sessions: list[ParkingSession]) -> None:
+        for session in sessions:
+            await self.save(session)
+
+    async def find_by_id(self, id: SessionId) -> ParkingSession | None:
+        return self.sessions.get(id)
+
+    async def find_active_by_spot(self, spot_id: SpotId) -> ParkingSession | None:
+        return next(
+            (s for s in self.sessions.values() if s.spot_id == spot_id and s.is_active),
+            None,
+        )
+
+    async def find_active_by_facility(
+        self, facility_id: FacilityId
+    ) -> list[ParkingSession]:
+        return [
+            s
+            for s in self.sessions.values()
+            if s.facility_id == facility_id and s.is_active
+        ]
+
+    async def find_by_vehicle(
+        self, vehicle_id: VehicleId, page: PageRequest
+    ) -> Page[ParkingSession]:
+        items = [s for s in self.sessions.values() if s.vehicle_id == vehicle_id]
+        return Page(items=items[: page.limit], next_cursor=None)
+
+    async def stream_by_facility(
+        self,
+        facility_id: FacilityId,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> AsyncIterator[ParkingSession]:
+        for session in self.sessions.values():
+            if session.facility_id == facility_id:
+                yield session
@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+
+from parkly.adapters.outbound.persistence.adaptive_limiter import AdaptiveLimiter
+
+FAST = 0.001
+SLOW = 0.5
+
+
+def _limiter(min_limit: int = 2, max_limit: int = 10) -> AdaptiveLimiter:
+    return AdaptiveLimiter(
+        min_limit=min_limit, max_limit=max_limit, target_wait=0.02, backoff=0.75
+    )
+
+
+def test_slow_waits_cut_the_limit_multiplicatively():
+    limiter = _limiter()
+
+    limits = []
+    for _ in range(3):
+        limiter.observe(SLOW)
+        limits.append(limiter.limit)
+
+    # 10 * 0.75 = 7.5, then 5.625, then 4.21875
+    assert limits == [7, 5, 4]
+
+
+def test_fast_waits_raise_the_limit_by_one_over_the_limit():
+    limiter = _limiter()
+    limiter.observe(SLOW)
+    limiter.observe(SLOW)
+
+    limits = []
+    for _ in range(3):
+        limiter.observe(FAST)
+        limits.append(limiter.limit)
+
+    # 5.625 grows by 1/5.625, 1/5.80, 1/5.97: one slot after three checkouts.
+    assert limits == [5, 5, 6]
+
+
+def test_a_wait_exactly_at_the_target_counts_as_fast():
+    limiter = _limiter()
+    limiter.observe(SLOW)
+
+    limiter.observe(0.02)
+
+    assert limiter.limit == 7
+    limiter.observe(0.02)
+    limiter.observe(0.02)
+    limiter.observe(0.02)
+    assert limiter.limit == 8
+
+
+def test_the_limit_stays_within_its_bounds():
+    limiter = _limiter(min_limit=3)
+
+    for _ in range(20):
+        limiter.observe(SLOW)
+    assert limiter.limit == 3
+
+    for _ in range(200):
+        limiter.observe(FAST)
+    assert limiter.limit == 10
+
+
+@pytest.mark.parametrize("limits", [(0, 5), (6, 5)])
+def test_inverted_or_empty_limits_are_rejected(limits: tuple[int, int]):
+    with pytest.raises(ValueError):
+        _limiter(*limits)
+
+
+def test_callers_over_the_limit_queue_until_a_release_or_a_raise():
+    limiter = _limiter(min_limit=1, max_limit=2)
+    limiter.observe(SLOW)
+    order: list[str] = []
+
+    async def caller(name: str) -> None:
+        await limiter.acquire()
+        order.append(name)
+
+    async def run() -> None:
+        await limiter.acquire()
+        first = asyncio.create_task(caller("first"))
+        second = asyncio.create_task(caller("second"))
+        await asyncio.sleep(0)
+        assert (limiter.in_flight, limiter.waiting) == (1, 2)
+
+        limiter.release()
+        await asyncio.sleep(0)
+        assert order == ["first"]
+
+        # 1.5 + 1 / 1.5 reaches the ceiling of 2, admitting one more.
+        limiter.observe(FAST)
+        await asyncio.gather(first, second)
+
+    asyncio.run(run())
+
+    assert order == ["first", "second"]
+    assert (limiter.in_flight, limiter.waiting) == (2, 0)
+
+
+def test_a_cancelled_waiter_gives_up_its_place():
+    limiter = _limiter(min_limit=1, max_limit=1)
+
+    async def run() -> None:
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limiter.release()
+
+    asyncio.run(run())
+
+    assert (limiter.in_flight, limiter.waiting) == (0, 0)
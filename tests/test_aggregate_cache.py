@@ -0,0 +1,69 @@
+from datetime import UTC, datetime, timedelta
+
+from parkly.adapters.outbound.caching.aggregate_cache import AggregateCache
+from parkly.domain.port.clock import Clock
+
+
+class _ManualClock(Clock):
+    def __init__(self) -> None:
+        self.moment = datetime(2030, 1, 1, tzinfo=UTC)
+
+    def now(self) -> datetime:
+        return self.moment
+
+
+def _cache(clock: Clock) -> AggregateCache[str, str]:
+    return AggregateCache[str, str](
+        max_weight=10,
+        ttl=timedelta(minutes=5),
+        negative_ttl=timedelta(seconds=30),
+        clock=clock,
+        weigh=len,
+        replica_lag=timedelta(seconds=5),
+    )
+
+
+def test_fill_started_before_an_invalidation_is_dropped():
+    cache = _cache(_ManualClock())
+    token = cache.token()
+    cache.invalidate("a")
+
+    cache.put("a", "old", token)
+    cache.put("b", "b", token)
+
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+
+
+def test_replica_fill_is_dropped_within_the_lag_of_an_invalidation():
+    clock = _ManualClock()
+    cache = _cache(clock)
+    cache.invalidate("a")
+    clock.moment += timedelta(seconds=4)
+
+    cache.put("a", "lagged", cache.token(), from_replica=True)
+    assert cache.get("a") is None
+
+    cache.put("a", "primary", cache.token())
+    hit = cache.get("a")
+    assert hit is not None
+    assert hit.value == "primary"
+
+    clock.moment += timedelta(seconds=1)
+    cache.put("a", "settled", cache.token(), from_replica=True)
+    hit = cache.get("a")
+    assert hit is not None
+    assert hit.value == "settled"
+
+
+def test_replica_fills_wait_out_the_lag_after_a_clear():
+    clock = _ManualClock()
+    cache = _cache(clock)
+    cache.clear()
+
+    cache.put("a", "lagged", cache.token(), from_replica=True)
+    assert cache.get("a") is None
+
+    clock.moment += timedelta(seconds=6)
+    cache.put("a", "settled", cache.token(), from_replica=True)
+    assert cache.get("a") is not None
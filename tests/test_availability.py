@@ -0,0 +1,213 @@
+import random
+from datetime import UTC, datetime, timedelta
+
+from parkly.domain.model.availability_grid import AvailabilityGrid
+from parkly.domain.model.enums import SpotType
+from parkly.domain.model.spot_schedule import FacilitySchedule, SpotSchedule
+from parkly.domain.model.typed_ids import ReservationId, SessionId, SpotId
+from parkly.domain.model.value_objects import TimeSlot
+
+ORIGIN = datetime(2030, 1, 1, tzinfo=UTC)
+BUCKET = timedelta(minutes=15)
+SPOTS = [SpotId(value=f"spot-{n}") for n in range(6)]
+TYPES = {
+    s: (SpotType.STANDARD, SpotType.EV_CHARGING)[n % 2] for n, s in enumerate(SPOTS)
+}
+
+
+def _slot(rng: random.Random) -> TimeSlot:
+    start = ORIGIN + timedelta(minutes=rng.randrange(0, 48 * 60, 5))
+    return TimeSlot(
+        start=start, end=start + timedelta(minutes=rng.randrange(5, 600, 5))
+    )
+
+
+def _bucket(moment: datetime) -> int:
+    return (moment - ORIGIN) // BUCKET
+
+
+def _buckets(time_slot: TimeSlot) -> range:
+    return range(
+        _bucket(time_slot.start),
+        _bucket(time_slot.end - timedelta(microseconds=1)) + 1,
+    )
+
+
+def test_spot_schedule_matches_brute_force_with_overlaps():
+    rng = random.Random(7)
+    schedule = SpotSchedule()
+    held: dict[ReservationId, TimeSlot] = {}
+
+    for step in range(2_000):
+        if held and rng.random() < 0.4:
+            reservation_id = rng.choice(list(held))
+            schedule.remove(reservation_id, held.pop(reservation_id).start)
+        else:
+            reservation_id = ReservationId(value=f"r{step}")
+            held[reservation_id] = _slot(rng)
+            schedule.add(reservation_id, held[reservation_id])
+
+        query = _slot(rng)
+        assert schedule.is_free(query) == all(
+            not query.overlaps(s) for s in held.values()
+        )
+
+
+def test_spot_schedule_leaves_the_scan_once_overlaps_are_gone():
+    schedule = SpotSchedule()
+    first = TimeSlot(start=ORIGIN, end=ORIGIN + timedelta(hours=2))
+    second = TimeSlot(
+        start=ORIGIN + timedelta(hours=1), end=ORIGIN + timedelta(hours=3)
+    )
+    schedule.add(ReservationId(value="a"), first)
+    schedule.add(ReservationId(value="b"), second)
+    assert schedule._has_overlaps
+
+    schedule.remove(ReservationId(value="b"), second.start)
+
+    assert not schedule._has_overlaps
+    assert schedule.is_free(TimeSlot(start=first.end, end=second.end))
+    assert not schedule.is_free(TimeSlot(start=ORIGIN, end=first.end))
+
+
+def test_facility_schedule_matches_brute_force():
+    rng = random.Random(11)
+    schedule = FacilitySchedule()
+    held: dict[ReservationId, tuple[SpotId, TimeSlot]] = {}
+
+    for step in range(2_000):
+        roll = rng.random()
+        if held and roll < 0.25:
+            reservation_id = rng.choice(list(held))
+            del held[reservation_id]
+            schedule.remove(reservation_id)
+        elif held and roll < 0.4:
+            reservation_id = rng.choice(list(held))
+            held[reservation_id] = (held[reservation_id][0], _slot(rng))
+            schedule.reschedule(reservation_id, held[reservation_id][1])
+        else:
+            reservation_id = ReservationId(value=f"r{step}")
+            held[reservation_id] = (rng.choice(SPOTS), _slot(rng))
+            schedule.add(reservation_id, *held[reservation_id])
+
+        spot_id, query = rng.choice(SPOTS), _slot(rng)
+        assert schedule.is_free(spot_id, query) == all(
+            s != spot_id or not query.overlaps(t) for s, t in held.values()
+        )
+
+
+def _brute_force_free(
+    reservations: dict[ReservationId, tuple[SpotId, TimeSlot]],
+    sessions: dict[SessionId, tuple[SpotId, datetime]],
+    out_of_service: set[SpotId],
+    time_slot: TimeSlot,
+    spot_type: SpotType | None,
+) -> set[SpotId]:
+    buckets = _buckets(time_slot)
+    free = set()
+    for spot_id in SPOTS:
+        if spot_id in out_of_service:
+            continue
+        if spot_type is not None and TYPES[spot_id] != spot_type:
+            continue
+        if any(
+            s == spot_id and set(_buckets(t)) & set(buckets)
+            for s, t in reservations.values()
+        ):
+            continue
+        if any(
+            s == spot_id and _bucket(start) <= buckets[-1]
+            for s, start in sessions.values()
+        ):
+            continue
+        free.add(spot_id)
+    return free
+
+
+def test_availability_grid_matches_brute_force():
+    rng = random.Random(13)
+    out_of_service = {SPOTS[-1]}
+    grid = AvailabilityGrid.build(
+        spots=[(s, TYPES[s], s not in out_of_service) for s in SPOTS],
+        reservations=[],
+        sessions=[],
+    )
+    reservations: dict[ReservationId, tuple[SpotId, TimeSlot]] = {}
+    sessions: dict[SessionId, tuple[SpotId, datetime]] = {}
+
+    for step in range(1_500):
+        roll = rng.random()
+        if reservations and roll < 0.2:
+            reservation_id = rng.choice(list(reservations))
+            del reservations[reservation_id]
+            grid.release(reservation_id)
+        elif reservations and roll < 0.3:
+            reservation_id = rng.choice(list(reservations))
+            reservations[reservation_id] = (reservations[reservation_id][0], _slot(rng))
+            grid.move(reservation_id, reservations[reservation_id][1])
+        elif sessions and roll < 0.4:
+            session_id = rng.choice(list(sessions))
+            del sessions[session_id]
+            grid.release(session_id)
+        elif roll < 0.45:
+            session_id = SessionId(value=f"s{step}")
+            sessions[session_id] = (rng.choice(SPOTS), _slot(rng).start)
+            grid.claim_open(session_id, *sessions[session_id])
+        else:
+            reservation_id = ReservationId(value=f"r{step}")
+            reservations[reservation_id] = (rng.choice(SPOTS), _slot(rng))
+            grid.claim(reservation_id, *reservations[reservation_id])
+
+        query = _slot(rng)
+        spot_type = rng.choice([None, SpotType.STANDARD, SpotType.EV_CHARGING])
+        assert set(grid.free_spots(query, spot_type)) == _brute_force_free(
+            reservations, sessions, out_of_service, query, spot_type
+        )
+
+    window = TimeSlot(start=ORIGIN, end=ORIGIN + timedelta(hours=48))
+    for start, free in grid.free_counts(window):
+        bucket = TimeSlot(start=start, end=start + BUCKET)
+        assert free == len(
+            _brute_force_free(reservations, sessions, out_of_service, bucket, None)
+        )
+
+
+def test_grid_build_drops_claims_on_removed_spots():
+    gone = SpotId(value="gone")
+    window = TimeSlot(start=ORIGIN, end=ORIGIN + timedelta(hours=1))
+
+    grid = AvailabilityGrid.build(
+        spots=[(SPOTS[0], SpotType.STANDARD, True)],
+        reservations=[(ReservationId(value="r"), gone, window)],
+        sessions=[(SessionId(value="s"), gone, ORIGIN)],
+    )
+
+    assert list(grid) == []
+    assert grid.free_spots(window) == [SPOTS[0]]
+
+
+def test_grid_add_spot_is_idempotent():
+    window = TimeSlot(start=ORIGIN, end=ORIGIN + timedelta(hours=1))
+    grid = AvailabilityGrid.build(
+        spots=[(SPOTS[0], SpotType.STANDARD, True)],
+        reservations=[(ReservationId(value="r"), SPOTS[0], window)],
+        sessions=[],
+    )
+
+    grid.add_spot(SPOTS[0], SpotType.STANDARD)
+
+    assert ReservationId(value="r") in grid
+    assert grid.free_spots(window) == []
+
+
+def test_grid_remove_of_an_unknown_spot_is_ignored():
+    window = TimeSlot(start=ORIGIN, end=ORIGIN + timedelta(hours=1))
+    grid = AvailabilityGrid.build(
+        spots=[(SPOTS[0], SpotType.STANDARD, True)], reservations=[], sessions=[]
+    )
+
+    grid.remove_spot(SPOTS[1])
+    grid.remove_spot(SPOTS[0])
+    grid.remove_spot(SPOTS[0])
+
+    assert grid.free_spots(window) == []
@@ -0,0 +1,151 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+from parkly.application.service.availability_index import AvailabilityIndex
+from parkly.domain.model.enums import (
+    AccessControlMethod,
+    FacilityType,
+    ReservationStatus,
+    SpotStatus,
+    SpotType,
+)
+from parkly.domain.model.parking_facility import ParkingFacility, ParkingSpot
+from parkly.domain.model.reservation import Reservation
+from parkly.domain.model.typed_ids import (
+    FacilityId,
+    ReservationId,
+    SpotId,
+    VehicleId,
+)
+from parkly.domain.model.value_objects import (
+    Capacity,
+    Currency,
+    FacilityName,
+    Location,
+    Money,
+    SpotNumber,
+    TimeSlot,
+)
+from parkly.domain.port.clock import Clock
+from tests.fakes import (
+    InMemoryParkingFacilityRepository,
+    InMemoryParkingSessionRepository,
+    InMemoryReservationRepository,
+    NullLogger,
+)
+
+NOW = datetime(2030, 1, 1, 8, tzinfo=UTC)
+FACILITY_ID = FacilityId(value="01ARZ3NDEKTSV4RRFFQ69G5FAV")
+SPOTS = [SpotId(value=f"spot-{n}") for n in range(2)]
+LATER = TimeSlot(start=NOW + timedelta(hours=1), end=NOW + timedelta(hours=2))
+
+
+class _FixedClock(Clock):
+    def now(self) -> datetime:
+        return NOW
+
+
+def _facility() -> ParkingFacility:
+    return ParkingFacility.reconstitute(
+        facility_id=FACILITY_ID,
+        name=FacilityName(value="Central"),
+        location=Location(
+            latitude=Decimal("40.7128"),
+            longitude=Decimal("-74.0060"),
+            address="1 Main St",
+        ),
+        facility_type=FacilityType.PUBLIC,
+        access_control=AccessControlMethod.LPR,
+        total_capacity=Capacity(value=10),
+        spots=[
+            ParkingSpot.reconstitute(
+                spot_id,
+                SpotNumber(value=f"A{n}"),
+                SpotType.STANDARD,
+                SpotStatus.AVAILABLE,
+            )
+            for n, spot_id in enumerate(SPOTS)
+        ],
+    )
+
+
+def _reservation(reservation_id: str, spot_id: SpotId) -> Reservation:
+    return Reservation.reconstitute(
+        reservation_id=ReservationId(value=reservation_id),
+        facility_id=FACILITY_ID,
+        spot_id=spot_id,
+        vehicle_id=VehicleId(value="vehicle"),
+        time_slot=LATER,
+        status=ReservationStatus.CONFIRMED,
+        total_cost=Money(amount=Decimal("5.00"), currency=Currency.of("USD")),
+        created_at=NOW,
+    )
+
+
+def _index() -> tuple[AvailabilityIndex, InMemoryParkingFacilityRepository]:
+    facilities = InMemoryParkingFacilityRepository([_facility()])
+    index = AvailabilityIndex(
+        facility_repo=facilities,
+        reservation_repo=InMemoryReservationRepository(
+            [_reservation("held", SPOTS[0])]
+        ),
+        session_repo=InMemoryParkingSessionRepository(),
+        clock=_FixedClock(),
+        logger=NullLogger(),
+        max_facilities=10,
+        ttl=timedelta(minutes=5),
+    )
+    return index, facilities
+
+
+def test_concurrent_cold_loads_share_one_load():
+    index, facilities = _index()
+
+    async def run() -> list[object]:
+        return await asyncio.gather(
+            index.grid_for(FACILITY_ID), index.schedule_for(FACILITY_ID)
+        )
+
+    grid, schedule = asyncio.run(run())
+
+    assert facilities.loads == 1
+    assert grid is not None
+    assert schedule is not None
+    assert list(grid.free_spots(LATER, None)) == [SPOTS[1]]
+
+
+def test_change_during_a_load_is_served_but_not_kept():
+    index, facilities = _index()
+
+    async def run() -> None:
+        load = asyncio.create_task(index.grid_for(FACILITY_ID))
+        await asyncio.sleep(0)
+        index.reserve(ReservationId(value="raced"), FACILITY_ID, SPOTS[1], LATER)
+        assert await load is not None
+        await index.grid_for(FACILITY_ID)
+
+    asyncio.run(run())
+
+    assert facilities.loads == 2
+
+
+def test_reservation_on_a_removed_spot_does_not_fail_the_load():
+    index, facilities = _index()
+    facilities.facilities[FACILITY_ID].remove_spot(SPOTS[0], NOW)
+
+    grid = asyncio.run(index.grid_for(FACILITY_ID))
+
+    assert grid is not None
+    assert list(grid.free_spots(LATER, None)) == [SPOTS[1]]
+
+
+def test_spot_added_event_after_the_load_is_ignored():
+    index, _ = _index()
+    grid = asyncio.run(index.grid_for(FACILITY_ID))
+
+    index.add_spot(FACILITY_ID, SPOTS[1], SpotType.STANDARD)
+    index.remove_spot(FACILITY_ID, SpotId(value="never-loaded"))
+
+    assert grid is not None
+    assert list(grid.free_spots(LATER, None)) == [SPOTS[1]]
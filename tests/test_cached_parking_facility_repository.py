@@ -0,0 +1,196 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+from parkly.adapters.outbound.caching.aggregate_cache import AggregateCache
+from parkly.adapters.outbound.caching.cached_parking_facility_repository import (
+    CachedParkingFacilityRepository,
+    FacilitySnapshot,
+    facility_weight,
+)
+from parkly.adapters.outbound.messaging.in_memory_event_publisher import (
+    InMemoryEventPublisher,
+)
+from parkly.adapters.outbound.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from parkly.domain.model.enums import (
+    AccessControlMethod,
+    FacilityType,
+    SpotStatus,
+    SpotType,
+)
+from parkly.domain.model.parking_facility import ParkingFacility
+from parkly.domain.model.typed_ids import FacilityId, SpotId
+from parkly.domain.model.value_objects import (
+    Capacity,
+    FacilityName,
+    Location,
+    SpotNumber,
+)
+from parkly.domain.port.clock import Clock
+from parkly.domain.port.parking_facility_repository import ParkingFacilityRepository
+from tests.fakes import FakeSessionFactory, NullLogger
+
+FACILITY_ID = FacilityId(value="01ARZ3NDEKTSV4RRFFQ69G5FAV")
+
+
+class _ManualClock(Clock):
+    def __init__(self) -> None:
+        self.moment = datetime(2030, 1, 1, tzinfo=UTC)
+
+    def now(self) -> datetime:
+        return self.moment
+
+
+class _CountingRepository(ParkingFacilityRepository):
+    def __init__(self, facility: ParkingFacility) -> None:
+        self._facility = facility
+        self.loads = 0
+
+    def _load(self) -> ParkingFacility:
+        self.loads += 1
+        return FacilitySnapshot.of(self._facility).restore()
+
+    async def save(self, facility: ParkingFacility) -> None:
+        self._facility = facility
+
+    async def save_many(self, facilities: list[ParkingFacility]) -> None:
+        for facility in facilities:
+            await self.save(facility)
+
+    async def find_by_id(self, id: FacilityId) -> ParkingFacility | None:
+        return self._load() if id == self._facility.id else None
+
+    async def find_by_ids(self, ids: list[FacilityId]) -> list[ParkingFacility]:
+        return [self._load()] if self._facility.id in ids else []
+
+    async def find_all_locations(self) -> list[tuple[FacilityId, Location]]:
+        return [(self._facility.id, self._facility.location)]
+
+    async def find_by_location(
+        self, location: Location, radius: Decimal, limit: int | None = None
+    ) -> list[ParkingFacility]:
+        return [self._load()]
+
+
+def _facility() -> ParkingFacility:
+    facility = ParkingFacility.reconstitute(
+        facility_id=FACILITY_ID,
+        name=FacilityName(value="Central"),
+        location=Location(
+            latitude=Decimal("40.7128"),
+            longitude=Decimal("-74.0060"),
+            address="1 Main St",
+        ),
+        facility_type=FacilityType.PUBLIC,
+        access_control=AccessControlMethod.LPR,
+        total_capacity=Capacity(value=10),
+    )
+    facility.add_spot(
+        SpotId(value="spot-1"),
+        SpotNumber(value="A1"),
+        SpotType.STANDARD,
+        SpotStatus.AVAILABLE,
+        datetime(2030, 1, 1, tzinfo=UTC),
+    )
+    facility.collect_changes()
+    return facility
+
+
+def _repository(
+    replica: bool = False,
+) -> tuple[
+    CachedParkingFacilityRepository,
+    _CountingRepository,
+    SqlAlchemyUnitOfWork,
+    _ManualClock,
+]:
+    inner = _CountingRepository(_facility())
+    uow = SqlAlchemyUnitOfWork(
+        session_factory=FakeSessionFactory(),
+        event_publisher=InMemoryEventPublisher(logger=NullLogger()),
+        logger=NullLogger(),
+        read_session_factory=FakeSessionFactory() if replica else None,
+    )
+    clock = _ManualClock()
+    cache = AggregateCache[FacilityId, FacilitySnapshot](
+        max_weight=100,
+        ttl=timedelta(minutes=5),
+        negative_ttl=timedelta(seconds=30),
+        clock=clock,
+        weigh=facility_weight,
+        replica_lag=timedelta(seconds=5),
+    )
+    repo = CachedParkingFacilityRepository(
+        inner=inner, cache=cache, uow=uow, logger=NullLogger()
+    )
+    return repo, inner, uow, clock
+
+
+def test_cache_hits_rebuild_independent_facilities():
+    repo, inner, _, _ = _repository()
+
+    async def run() -> tuple[ParkingFacility | None, ParkingFacility | None]:
+        first = await repo.find_by_id(FACILITY_ID)
+        assert first is not None
+        first.reserve_spot(SpotId(value="spot-1"))
+        return first, await repo.find_by_id(FACILITY_ID)
+
+    first, second = asyncio.run(run())
+
+    assert inner.loads == 1
+    assert first is not second
+    assert second is not None
+    assert second.find_spot(SpotId(value="spot-1")).status == SpotStatus.AVAILABLE
+
+
+def test_reads_inside_a_unit_share_one_instance_restored_from_the_cache():
+    repo, inner, uow, _ = _repository()
+
+    async def run() -> None:
+        await repo.find_by_id(FACILITY_ID)
+        async with uow:
+            first = await repo.find_by_id(FACILITY_ID)
+            assert first is not None
+            first.reserve_spot(SpotId(value="spot-1"))
+            assert await repo.find_by_id(FACILITY_ID) is first
+            assert await repo.find_by_ids([FACILITY_ID]) == [first]
+        outside = await repo.find_by_id(FACILITY_ID)
+        assert outside is not None
+        assert outside.find_spot(SpotId(value="spot-1")).status == (
+            SpotStatus.AVAILABLE
+        )
+
+    asyncio.run(run())
+
+    assert inner.loads == 1
+
+
+def test_replica_reads_fill_the_cache():
+    repo, inner, _, _ = _repository(replica=True)
+
+    async def run() -> None:
+        await repo.find_by_id(FACILITY_ID)
+        await repo.find_by_ids([FACILITY_ID])
+
+    asyncio.run(run())
+
+    assert inner.loads == 1
+
+
+def test_replica_reads_do_not_fill_until_a_write_is_past_the_lag():
+    repo, inner, _, clock = _repository(replica=True)
+
+    async def run() -> None:
+        facility = await repo.find_by_id(FACILITY_ID)
+        assert facility is not None
+        await repo.save(facility)
+        clock.moment += timedelta(seconds=4)
+        await repo.find_by_id(FACILITY_ID)
+        await repo.find_by_id(FACILITY_ID)
+        clock.moment += timedelta(seconds=2)
+        await repo.find_by_id(FACILITY_ID)
+        await repo.find_by_id(FACILITY_ID)
+
+    asyncio.run(run())
+
+    assert inner.loads == 4
@@ -0,0 +1,40 @@
+from sqlalchemy.exc import IntegrityError
+
+from parkly.adapters.outbound.persistence.constraint_errors import (
+    ACTIVE_SESSION_PER_SPOT,
+    RESERVATION_SLOT_OVERLAP,
+    violated_constraint,
+    violation_detail,
+)
+from tests.fakes import integrity_error
+
+
+def test_active_session_index_is_read_from_the_driver_error():
+    exc = integrity_error(
+        ACTIVE_SESSION_PER_SPOT, "Key (spot_ulid)=(spot-1) already exists."
+    )
+
+    assert violated_constraint(exc) == ACTIVE_SESSION_PER_SPOT
+    assert violation_detail(exc) == "Key (spot_ulid)=(spot-1) already exists."
+
+
+def test_slot_exclusion_constraint_is_read_from_the_driver_error():
+    detail = (
+        "Key (spot_ulid, tstzrange(start_time, end_time))=(spot-1, ...) "
+        "conflicts with existing key (spot_ulid, tstzrange(start_time, end_time))"
+        "=(spot-1, ...)."
+    )
+    exc = integrity_error(RESERVATION_SLOT_OVERLAP, detail)
+
+    assert violated_constraint(exc) == RESERVATION_SLOT_OVERLAP
+    assert violation_detail(exc) == detail
+
+
+def test_errors_without_a_driver_cause_name_nothing():
+    bare = IntegrityError("INSERT ...", {}, Exception("integrity violation"))
+    unnamed = integrity_error(None)
+
+    assert violated_constraint(bare) is None
+    assert violation_detail(bare) == ""
+    assert violated_constraint(unnamed) is None
+    assert violation_detail(unnamed) == ""
@@ -0,0 +1,46 @@
+import pytest
+
+from parkly.adapters.config import AppSettings
+from parkly.adapters.container import Container
+
+# Never connected to: building the container creates engines but no connections.
+DATABASE_URL = "postgresql+asyncpg://parkly@localhost/parkly"
+
+
+def _settings(**overrides: object) -> AppSettings:
+    return AppSettings(database_url=DATABASE_URL, db_pool_adaptive=True, **overrides)
+
+
+def test_slow_checkouts_cut_admission_to_the_configured_floor():
+    container = Container(
+        _settings(db_pool_size=5, db_max_overflow=5, db_pool_min_concurrency=3)
+    )
+    limiter = container.pool_limiter
+    assert limiter is not None
+    assert limiter.limit == 10
+
+    for _ in range(20):
+        container.pool_monitor.record_wait(1.0)
+
+    assert limiter.limit == 3
+
+
+@pytest.mark.parametrize("floor", [3, 50])
+def test_a_floor_above_the_pool_is_clamped_to_the_pool(floor: int):
+    container = Container(
+        _settings(db_pool_size=2, db_max_overflow=1, db_pool_min_concurrency=floor)
+    )
+    limiter = container.pool_limiter
+    assert limiter is not None
+
+    for _ in range(20):
+        container.pool_monitor.record_wait(1.0)
+
+    assert limiter.limit == 3
+
+
+def test_no_limiter_unless_adaptive():
+    container = Container(AppSettings(database_url=DATABASE_URL))
+
+    assert container.pool_limiter is None
+    assert container.pool_monitor.limiter is None
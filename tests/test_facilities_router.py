@@ -0,0 +1,105 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from parkly.adapters.inbound.api.exception_handlers import (
+    register_exception_handlers,
+)
+from parkly.adapters.inbound.api.facilities_router import create_facilities_router
+from parkly.application.command.add_parking_spots import AddParkingSpots, NewSpot
+from tests.fakes import NullLogger
+
+URL = "/facilities/facility/spots:batch"
+CSV = {"content-type": "text/csv"}
+
+
+class _RecordingHandler:
+    def __init__(self) -> None:
+        self.commands: list[AddParkingSpots] = []
+
+    async def handle(self, command: AddParkingSpots) -> list[str]:
+        self.commands.append(command)
+        return [f"spot-{n}" for n in range(len(command.spots))]
+
+
+def _client() -> tuple[TestClient, _RecordingHandler]:
+    handler = _RecordingHandler()
+    app = FastAPI()
+    register_exception_handlers(app, NullLogger())
+    container = SimpleNamespace(add_parking_spots_handler=handler)
+    app.include_router(create_facilities_router(container))
+    return TestClient(app), handler
+
+
+def test_csv_rows_become_spots_with_defaults_for_empty_cells():
+    client, handler = _client()
+    # Spreadsheet exports often start with a byte order mark.
+    body = (
+        "\ufeffspot_number,spot_type,status\nA-1,standard,\nA-2,ev_charging,occupied\n"
+    )
+
+    response = client.post(URL, content=body.encode(), headers=CSV)
+
+    assert response.status_code == 201
+    assert response.json() == {"ids": ["spot-0", "spot-1"]}
+    assert handler.commands[0].spots == [
+        NewSpot(spot_number="A-1", spot_type="standard", status="available"),
+        NewSpot(spot_number="A-2", spot_type="ev_charging", status="occupied"),
+    ]
+
+
+def test_json_array_becomes_spots():
+    client, handler = _client()
+
+    response = client.post(URL, json=[{"spot_number": "A-1", "spot_type": "standard"}])
+
+    assert response.status_code == 201
+    assert handler.commands[0].spots == [
+        NewSpot(spot_number="A-1", spot_type="standard", status="available")
+    ]
+
+
+@pytest.mark.parametrize(
+    ("body", "headers"),
+    [
+        (b"spot_number,spot_type\nA-1\n", CSV),
+        (b"spot_number,status\nA-1,available\n", CSV),
+        (b"spot_number,spot_type,status\n", CSV),
+        (b"spot_number,spot_type\n\xff\xfe,standard\n", CSV),
+        (b'spot_number,spot_type\n"A-1,standard\n', CSV),
+        (b"[", {"content-type": "application/json"}),
+        (b"[]", {"content-type": "application/json"}),
+        (b'{"spot_number": "A-1"}', {"content-type": "application/json"}),
+    ],
+    ids=[
+        "csv-short-row",
+        "csv-missing-column",
+        "csv-no-rows",
+        "csv-not-utf8",
+        "csv-unclosed-quote",
+        "json-malformed",
+        "json-empty",
+        "json-not-an-array",
+    ],
+)
+def test_unparseable_bodies_are_rejected_before_any_spot_is_added(
+    body: bytes, headers: dict[str, str]
+):
+    client, handler = _client()
+
+    response = client.post(URL, content=body, headers=headers)
+
+    assert response.status_code == 422
+    assert handler.commands == []
+
+
+def test_more_than_the_batch_limit_is_rejected():
+    client, handler = _client()
+    rows = "".join(f"A-{n},standard\n" for n in range(10_001))
+
+    response = client.post(URL, content=f"spot_number,spot_type\n{rows}", headers=CSV)
+
+    assert response.status_code == 422
+    assert handler.commands == []
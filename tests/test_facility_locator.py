@@ -0,0 +1,124 @@
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any
+
+from parkly.adapters.app_factory import _refresh_facility_locator
+from parkly.application.service.facility_locator import FacilityLocator
+from parkly.domain.model.enums import AccessControlMethod, FacilityType
+from parkly.domain.model.parking_facility import ParkingFacility
+from parkly.domain.model.typed_ids import FacilityId
+from parkly.domain.model.value_objects import Capacity, FacilityName, Location
+from tests.fakes import InMemoryParkingFacilityRepository, NullLogger
+
+MIDTOWN = Location(
+    latitude=Decimal("40.7549"), longitude=Decimal("-73.9840"), address="Midtown"
+)
+DOWNTOWN = Location(
+    latitude=Decimal("40.7128"), longitude=Decimal("-74.0060"), address="Downtown"
+)
+
+
+def _facility(n: int, location: Location) -> ParkingFacility:
+    return ParkingFacility.reconstitute(
+        facility_id=FacilityId(value=f"facility-{n}"),
+        name=FacilityName(value=f"Garage {n}"),
+        location=location,
+        facility_type=FacilityType.PUBLIC,
+        access_control=AccessControlMethod.LPR,
+        total_capacity=Capacity(value=10),
+    )
+
+
+def _ids(matches: list[tuple[FacilityId, float]]) -> list[str]:
+    return [facility_id.value for facility_id, _ in matches]
+
+
+def test_refresh_replaces_stale_entries():
+    repo = InMemoryParkingFacilityRepository(
+        [_facility(1, MIDTOWN), _facility(2, MIDTOWN)]
+    )
+    locator = FacilityLocator(facility_repo=repo, logger=NullLogger())
+
+    async def run() -> tuple[list[str], list[str], list[str]]:
+        await locator.load()
+        del repo.facilities[FacilityId(value="facility-1")]
+        moved = _facility(2, DOWNTOWN)
+        repo.facilities[moved.id] = moved
+        await repo.save(_facility(3, MIDTOWN))
+        before = _ids(await locator.within(MIDTOWN, Decimal(1)))
+        await locator.refresh()
+        return (
+            before,
+            _ids(await locator.within(MIDTOWN, Decimal(1))),
+            _ids(await locator.within(DOWNTOWN, Decimal(1))),
+        )
+
+    before, midtown, downtown = asyncio.run(run())
+
+    assert sorted(before) == ["facility-1", "facility-2"]
+    assert midtown == ["facility-3"]
+    assert downtown == ["facility-2"]
+
+
+def test_facility_added_during_a_refresh_is_kept():
+    repo = InMemoryParkingFacilityRepository([_facility(1, MIDTOWN)])
+    locator = FacilityLocator(facility_repo=repo, logger=NullLogger())
+
+    async def run() -> list[str]:
+        await locator.load()
+        refresh = asyncio.create_task(locator.refresh())
+        await asyncio.sleep(0)
+        locator.add(FacilityId(value="facility-2"), MIDTOWN)
+        await refresh
+        return _ids(await locator.within(MIDTOWN, Decimal(1)))
+
+    assert sorted(asyncio.run(run())) == ["facility-1", "facility-2"]
+
+
+def test_searches_load_the_index_on_first_use():
+    repo = InMemoryParkingFacilityRepository([_facility(1, MIDTOWN)])
+    locator = FacilityLocator(facility_repo=repo, logger=NullLogger())
+
+    matches = asyncio.run(locator.nearest(DOWNTOWN, 1, Decimal(10)))
+
+    assert locator.is_loaded
+    assert _ids(matches) == ["facility-1"]
+
+
+class _FlakyLocator:
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.refreshes = 0
+        self.done = asyncio.Event()
+
+    async def refresh(self) -> None:
+        self.refreshes += 1
+        if self.refreshes <= self.failures:
+            raise OSError("connection refused")
+        self.done.set()
+
+
+class _RecordingLogger(NullLogger):
+    def __init__(self) -> None:
+        self.warnings: list[str] = []
+
+    def warning(self, message: str, extra: dict[str, Any] | None = None) -> None:
+        self.warnings.append(message)
+
+
+def test_refresh_loop_logs_failures_and_keeps_going():
+    logger = _RecordingLogger()
+
+    async def run() -> _FlakyLocator:
+        locator = _FlakyLocator(failures=2)
+        container = SimpleNamespace(facility_locator=locator, logger=logger)
+        refresher = asyncio.create_task(_refresh_facility_locator(container, 0))
+        await locator.done.wait()
+        refresher.cancel()
+        return locator
+
+    locator = asyncio.run(run())
+
+    assert locator.refreshes == 3
+    assert logger.warnings == ["Facility locator refresh failed"] * 2
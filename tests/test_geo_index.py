@@ -0,0 +1,190 @@
+import random
+from math import asin, atan2, cos, degrees, radians, sin
+
+import pytest
+
+from parkly.domain.model.consts import EARTH_RADIUS_KM
+from parkly.domain.model.typed_ids import FacilityId
+from parkly.domain.service.geo_index import GeoIndex, bounding_box, haversine_km
+
+_EARTH_RADIUS_KM = float(EARTH_RADIUS_KM)
+
+# Centres inside a cell, on a cell corner, beside the antimeridian and by
+# both poles.
+CENTRES = [
+    (40.7128, -74.0060),
+    (10.0, 20.0),
+    (0.0, 179.98),
+    (-33.9, -179.99),
+    (89.97, 45.0),
+    (-89.99, -120.0),
+]
+
+
+def _id(n: int) -> FacilityId:
+    return FacilityId(value=f"facility-{n}")
+
+
+def _scattered(
+    latitude: float, longitude: float, count: int
+) -> dict[FacilityId, tuple[float, float]]:
+    # Points within about half a degree, wrapped onto valid coordinates.
+    rng = random.Random(f"{latitude},{longitude}")
+    points = {}
+    for n in range(count):
+        lat = latitude + rng.uniform(-0.5, 0.5)
+        lat = max(-90.0, min(90.0, lat))
+        lng = (longitude + rng.uniform(-0.5, 0.5) + 180) % 360 - 180
+        points[_id(n)] = (lat, lng)
+    return points
+
+
+def _brute_force(
+    points: dict[FacilityId, tuple[float, float]],
+    latitude: float,
+    longitude: float,
+    radius: float,
+) -> set[FacilityId]:
+    return {
+        facility_id
+        for facility_id, (lat, lng) in points.items()
+        if haversine_km(latitude, longitude, lat, lng) <= radius
+    }
+
+
+def test_points_bucket_into_wrapped_and_clamped_cells():
+    index = GeoIndex(cell_degrees=0.1)
+
+    assert index._cell_of(0.0, 0.0) == (900, 1800)
+    assert index._cell_of(-90.0, -180.0) == (0, 0)
+    assert index._cell_of(90.0, 0.0) == (1799, 1800)
+    assert index._cell_of(0.0, 180.0) == index._cell_of(0.0, -180.0)
+
+
+@pytest.mark.parametrize("centre", CENTRES, ids=str)
+@pytest.mark.parametrize("radius", [0.5, 5.0, 25.0, 60.0])
+def test_within_matches_brute_force(centre: tuple[float, float], radius: float):
+    points = _scattered(*centre, count=400)
+    index = GeoIndex(cell_degrees=0.1)
+    for facility_id, (lat, lng) in points.items():
+        index.add(facility_id, lat, lng)
+
+    matches = index.within(*centre, radius)
+
+    assert {facility_id for facility_id, _ in matches} == _brute_force(
+        points, *centre, radius
+    )
+    distances = [distance for _, distance in matches]
+    assert distances == sorted(distances)
+
+
+def test_within_reaches_across_the_antimeridian():
+    index = GeoIndex()
+    index.add(_id(1), 0.0, -179.95)
+
+    (match,) = index.within(0.0, 179.95, 12.0)
+
+    assert match[0] == _id(1)
+    assert match[1] == pytest.approx(11.1, abs=0.1)
+
+
+def test_within_reaches_around_a_pole():
+    index = GeoIndex()
+    index.add(_id(1), 89.95, 180.0)
+    index.add(_id(2), -89.95, 90.0)
+
+    assert [f for f, _ in index.within(89.95, 0.0, 12.0)] == [_id(1)]
+    assert [f for f, _ in index.within(-90.0, 0.0, 6.0)] == [_id(2)]
+
+
+def test_adding_again_moves_the_point():
+    index = GeoIndex()
+    index.add(_id(1), 40.0, -74.0)
+    index.add(_id(1), 51.5, -0.1)
+
+    assert len(index) == 1
+    assert index.within(40.0, -74.0, 10.0) == []
+    assert [f for f, _ in index.within(51.5, -0.1, 1.0)] == [_id(1)]
+
+    index.remove(_id(1))
+    index.remove(_id(1))
+
+    assert len(index) == 0
+    assert index.within(51.5, -0.1, 1.0) == []
+
+
+def test_nearest_widens_until_k_found_within_the_limit():
+    index = GeoIndex()
+    index.add(_id(1), 0.0, 0.0)
+    index.add(_id(2), 0.0, 1.0)
+    index.add(_id(3), 0.0, 3.0)
+
+    assert [f for f, _ in index.nearest(0.0, 0.1, 2)] == [_id(1), _id(2)]
+    assert [f for f, _ in index.nearest(0.0, 0.1, 3, max_radius_km=200)] == [
+        _id(1),
+        _id(2),
+    ]
+    assert index.nearest(0.0, 0.1, 0) == []
+
+
+def _destination(
+    latitude: float, longitude: float, distance_km: float, bearing: float
+) -> tuple[float, float]:
+    delta = distance_km / _EARTH_RADIUS_KM
+    phi, lam, theta = radians(latitude), radians(longitude), radians(bearing)
+    phi2 = asin(sin(phi) * cos(delta) + cos(phi) * sin(delta) * cos(theta))
+    lam2 = lam + atan2(
+        sin(theta) * sin(delta) * cos(phi), cos(delta) - sin(phi) * sin(phi2)
+    )
+    return degrees(phi2), degrees(lam2)
+
+
+@pytest.mark.parametrize("radius", [1.0, 50.0, 500.0])
+def test_bounding_box_widens_in_longitude_away_from_the_equator(radius: float):
+    lat_spans, lng_spans = [], []
+    for latitude in (0.0, 30.0, 60.0, 80.0):
+        south, north, west, east = bounding_box(latitude, 10.0, radius)
+        assert west is not None and east is not None
+        assert north - latitude == pytest.approx(latitude - south)
+        assert east - 10.0 == pytest.approx(10.0 - west)
+        lat_spans.append(north - south)
+        lng_spans.append(east - west)
+
+    assert lat_spans == pytest.approx([lat_spans[0]] * 4)
+    assert lng_spans[0] == pytest.approx(lat_spans[0])
+    assert lng_spans == sorted(lng_spans)
+
+
+def test_bounding_box_encloses_the_circle():
+    rng = random.Random(7)
+    for _ in range(200):
+        latitude = rng.uniform(-85.0, 85.0)
+        longitude = rng.uniform(-180.0, 180.0)
+        radius = rng.uniform(0.1, 800.0)
+        south, north, west, east = bounding_box(latitude, longitude, radius)
+        for bearing in range(0, 360, 5):
+            lat, lng = _destination(latitude, longitude, radius, bearing)
+            assert south - 1e-9 <= lat <= north + 1e-9
+            if west is not None and east is not None:
+                offset = (lng - longitude + 180) % 360 - 180
+                assert west - 1e-9 <= longitude + offset <= east + 1e-9
+
+
+def test_bounding_box_clamps_at_a_pole_and_reaches_every_meridian():
+    south, north, west, east = bounding_box(89.95, 10.0, 10.0)
+
+    assert south == pytest.approx(89.86, abs=0.01)
+    assert (north, west, east) == (90.0, None, None)
+    assert bounding_box(-89.5, 10.0, 200.0)[0] == -90.0
+
+
+def test_bounding_box_covers_the_globe_for_a_huge_radius():
+    assert bounding_box(0.0, 0.0, 25_000.0) == (-90.0, 90.0, None, None)
+
+
+def test_bounding_box_leaves_antimeridian_edges_unwrapped():
+    _, _, west, east = bounding_box(0.0, 179.95, 20.0)
+
+    assert west is not None and east is not None
+    assert west < 179.95
+    assert east > 180.0
@@ -0,0 +1,82 @@
+import random
+from decimal import Decimal
+from math import cos, radians
+
+import pytest
+from sqlalchemy import create_engine, insert, select
+
+from parkly.adapters.outbound.persistence.geo_queries import bounding_box_predicates
+from parkly.adapters.outbound.persistence.orm_models import ParkingFacilityORM
+from parkly.domain.service.geo_index import haversine_km
+
+# Centres by a city, beside the antimeridian on both sides and by a pole.
+CENTRES = [
+    (40.7128, -74.0060),
+    (-17.7134, 179.95),
+    (65.0, -179.97),
+    (89.9, 30.0),
+]
+_STEP = Decimal("0.0000001")
+
+
+def _points(
+    latitude: float, longitude: float, radius: float
+) -> list[tuple[Decimal, Decimal]]:
+    # Points out to about twice the radius, at the scale of the NUMERIC(10, 7)
+    # columns.
+    rng = random.Random(f"{latitude},{longitude},{radius}")
+    lat_spread = 2 * radius / 111.0
+    lng_spread = min(lat_spread / max(cos(radians(latitude)), 0.01), 180.0)
+    points = []
+    for _ in range(500):
+        lat = latitude + rng.uniform(-lat_spread, lat_spread)
+        lat = max(-90.0, min(90.0, lat))
+        lng = longitude + rng.uniform(-lng_spread, lng_spread)
+        lng = (lng + 180) % 360 - 180
+        points.append((Decimal(lat).quantize(_STEP), Decimal(lng).quantize(_STEP)))
+    return points
+
+
+@pytest.mark.parametrize("centre", CENTRES, ids=str)
+@pytest.mark.parametrize("radius", [2.0, 40.0, 90.0])
+def test_prefilter_keeps_every_facility_within_the_radius(
+    centre: tuple[float, float], radius: float
+):
+    engine = create_engine("sqlite://")
+    ParkingFacilityORM.__table__.create(engine)
+    points = _points(*centre, radius)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(ParkingFacilityORM),
+            [
+                {
+                    "ulid": str(n),
+                    "name": "",
+                    "latitude": lat,
+                    "longitude": lng,
+                    "address": "",
+                    "facility_type": "public",
+                    "access_control": "lpr",
+                    "total_capacity": 1,
+                }
+                for n, (lat, lng) in enumerate(points)
+            ],
+        )
+        prefiltered = connection.execute(
+            select(ParkingFacilityORM.latitude, ParkingFacilityORM.longitude).where(
+                *bounding_box_predicates(*centre, radius)
+            )
+        ).all()
+
+    def within(lat: Decimal, lng: Decimal) -> bool:
+        return haversine_km(*centre, float(lat), float(lng)) <= radius
+
+    expected = sorted(point for point in points if within(*point))
+    matched = sorted(
+        (Decimal(lat).quantize(_STEP), Decimal(lng).quantize(_STEP))
+        for lat, lng in prefiltered
+        if within(lat, lng)
+    )
+    assert expected
+    assert matched == expected
+    assert len(prefiltered) < len(points)
@@ -0,0 +1,148 @@
+import asyncio
+import json
+from base64 import urlsafe_b64encode
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Self
+
+import pytest
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from parkly.adapters.outbound.persistence.keyset import (
+    decode_cursor,
+    encode_cursor,
+    fetch_page,
+)
+from parkly.adapters.outbound.persistence.orm_models import ParkingSessionORM
+from parkly.domain.exception.exceptions import InvalidCursorError
+from parkly.domain.model.pagination import PageRequest
+
+KEY = (ParkingSessionORM.entry_time, ParkingSessionORM.ulid)
+NOON = datetime(2030, 1, 1, 12, tzinfo=UTC)
+
+
+def _raw(value: object) -> str:
+    return urlsafe_b64encode(json.dumps(value).encode()).decode().rstrip("=")
+
+
+def test_cursor_round_trips_its_key_values():
+    values = [datetime(2030, 1, 1, 12, 30, 0, 123456, tzinfo=UTC), "01ARZ3NDEK"]
+
+    cursor = encode_cursor(values)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, KEY) == values
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "!!!",
+        "é",
+        urlsafe_b64encode(b"\xff\xfe").decode(),
+        _raw("not a list"),
+        _raw([NOON.isoformat()]),
+        _raw([NOON.isoformat(), "a", "b"]),
+        _raw(["yesterday", "a"]),
+        _raw([1_700_000_000, "a"]),
+        _raw([None, "a"]),
+        _raw([NOON.isoformat(), ["a"]]),
+        _raw(["2030-01-01T12:00:00", "a"]),
+    ],
+    ids=[
+        "empty",
+        "not-base64",
+        "not-ascii",
+        "not-utf8",
+        "not-a-list",
+        "too-short",
+        "too-long",
+        "bad-timestamp",
+        "number",
+        "null",
+        "nested",
+        "naive-timestamp",
+    ],
+)
+def test_malformed_or_tampered_cursors_are_rejected(cursor: str):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, KEY)
+
+
+class _SqliteSession:
+    """Runs fetch_page's statement on SQLite, standing in for PostgreSQL."""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    async def execute(self, statement: Any) -> Any:
+        result = self._session.execute(statement)
+        rows = result.scalars().all()
+        # SQLite drops the offset that PostgreSQL keeps on timestamptz.
+        for row in rows:
+            row.entry_time = row.entry_time.replace(tzinfo=UTC)
+        return _Result(rows)
+
+
+class _Result:
+    def __init__(self, rows: Sequence[Any]) -> None:
+        self._rows = rows
+
+    def scalars(self) -> Self:
+        return self
+
+    def all(self) -> Sequence[Any]:
+        return self._rows
+
+
+def _session() -> Session:
+    engine = create_engine("sqlite://")
+    ParkingSessionORM.__table__.create(engine)
+    session = Session(engine)
+    # Three sessions share each entry time, so pages split inside a tie.
+    session.execute(
+        insert(ParkingSessionORM),
+        [
+            {
+                "ulid": f"s{n:02}",
+                "facility_ulid": "facility",
+                "spot_ulid": f"spot-{n}",
+                "vehicle_ulid": "vehicle",
+                "entry_time": NOON + timedelta(hours=n // 3),
+                "cost_amount": Decimal(0),
+                "cost_currency": "USD",
+            }
+            for n in (4, 0, 7, 2, 5, 1, 8, 3, 6)
+        ],
+    )
+    return session
+
+
+@pytest.mark.parametrize("descending", [False, True], ids=["asc", "desc"])
+def test_pages_break_timestamp_ties_by_ulid(descending: bool):
+    session = _session()
+
+    async def run() -> list[list[str]]:
+        pages, cursor = [], None
+        while True:
+            rows, cursor = await fetch_page(
+                _SqliteSession(session),
+                select(ParkingSessionORM),
+                KEY,
+                PageRequest(limit=2, cursor=cursor),
+                descending=descending,
+            )
+            pages.append([row.ulid for row in rows])
+            if cursor is None:
+                return pages
+
+    pages = asyncio.run(run())
+
+    expected = [f"s{n:02}" for n in range(9)]
+    if descending:
+        expected.reverse()
+    assert [len(page) for page in pages] == [2, 2, 2, 2, 1]
+    assert [ulid for page in pages for ulid in page] == expected
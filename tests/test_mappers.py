@@ -0,0 +1,67 @@
+from datetime import UTC, datetime, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+
+import pytest
+
+from parkly.adapters.outbound.persistence.mappers import (
+    reservation_to_domain,
+    reservation_to_row,
+)
+from parkly.adapters.outbound.persistence.orm_models import (
+    ParkingSessionORM,
+    ReservationORM,
+)
+from parkly.domain.model.consts import ISO_4217_MINOR_UNITS
+from parkly.domain.model.enums import ReservationStatus
+from parkly.domain.model.reservation import Reservation
+from parkly.domain.model.typed_ids import (
+    FacilityId,
+    ReservationId,
+    SpotId,
+    VehicleId,
+)
+from parkly.domain.model.value_objects import (
+    Currency,
+    MinorMoney,
+    TimeSlot,
+)
+
+NOW = datetime(2030, 1, 1, 8, tzinfo=UTC)
+CURRENCIES = sorted({*ISO_4217_MINOR_UNITS, "USD", "EUR"})
+
+
+def _stored(amount: object) -> Decimal:
+    # What PostgreSQL keeps after coercing the value into the column.
+    scale = ReservationORM.__table__.c.cost_amount.type.scale
+    assert isinstance(amount, Decimal)
+    return amount.quantize(Decimal(1).scaleb(-scale), rounding=ROUND_HALF_UP)
+
+
+@pytest.mark.parametrize("orm", [ReservationORM, ParkingSessionORM])
+def test_cost_columns_hold_every_minor_unit(orm):
+    scale = orm.__table__.c.cost_amount.type.scale
+
+    assert scale >= max(ISO_4217_MINOR_UNITS.values())
+    assert scale >= Currency.of("USD").minor_units
+
+
+@pytest.mark.parametrize("code", CURRENCIES)
+def test_reservation_cost_round_trips_through_a_row(code):
+    cost = MinorMoney(units=123457, currency=Currency.of(code))
+    reservation = Reservation.reconstitute(
+        reservation_id=ReservationId(value="01ARZ3NDEKTSV4RRFFQ69G5FAV"),
+        facility_id=FacilityId(value="01ARZ3NDEKTSV4RRFFQ69G5FAW"),
+        spot_id=SpotId(value="01ARZ3NDEKTSV4RRFFQ69G5FAX"),
+        vehicle_id=VehicleId(value="01ARZ3NDEKTSV4RRFFQ69G5FAY"),
+        time_slot=TimeSlot(start=NOW, end=NOW + timedelta(hours=1)),
+        status=ReservationStatus.CONFIRMED,
+        total_cost=cost.to_money(),
+        created_at=NOW,
+    )
+    row = reservation_to_row(reservation)
+    row["cost_amount"] = _stored(row["cost_amount"])
+
+    loaded = reservation_to_domain(ReservationORM(**row))
+
+    assert MinorMoney.from_money(loaded.total_cost) == cost
+    assert loaded.total_cost == reservation.total_cost
@@ -0,0 +1,110 @@
+from datetime import UTC, datetime
+from decimal import Decimal
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from parkly.adapters.inbound.api.middleware import ReadYourWritesMiddleware
+from parkly.adapters.outbound.messaging.in_memory_event_publisher import (
+    InMemoryEventPublisher,
+)
+from parkly.adapters.outbound.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from parkly.domain.model.enums import AccessControlMethod, FacilityType
+from parkly.domain.model.parking_facility import ParkingFacility
+from parkly.domain.model.typed_ids import FacilityId
+from parkly.domain.model.value_objects import Capacity, FacilityName, Location
+from tests.fakes import FakeSessionFactory, NullLogger
+
+COOKIE = ReadYourWritesMiddleware.COOKIE
+
+
+def _new_facility() -> ParkingFacility:
+    return ParkingFacility.create(
+        facility_id=FacilityId(value="01ARZ3NDEKTSV4RRFFQ69G5FAV"),
+        name=FacilityName(value="Central"),
+        location=Location(
+            latitude=Decimal("40.7128"),
+            longitude=Decimal("-74.0060"),
+            address="1 Main St",
+        ),
+        facility_type=FacilityType.PUBLIC,
+        access_control=AccessControlMethod.LPR,
+        total_capacity=Capacity(value=10),
+        occurred_at=datetime(2030, 1, 1, tzinfo=UTC),
+    )
+
+
+def _client() -> TestClient:
+    uow = SqlAlchemyUnitOfWork(
+        session_factory=FakeSessionFactory(),
+        event_publisher=InMemoryEventPublisher(logger=NullLogger()),
+        logger=NullLogger(),
+        read_session_factory=FakeSessionFactory(),
+    )
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware, window_seconds=5)
+
+    @app.get("/read")
+    async def read() -> dict[str, bool]:
+        return {"replica": uow.reads_replica()}
+
+    @app.post("/write")
+    async def write() -> dict[str, bool]:
+        async with uow:
+            uow.mark_saved(_new_facility())
+        return {"replica": uow.reads_replica()}
+
+    @app.post("/read-in-unit")
+    async def read_in_unit() -> dict[str, bool]:
+        async with uow:
+            pass
+        return {"replica": uow.reads_replica()}
+
+    @app.post("/fail")
+    async def fail() -> dict[str, bool]:
+        try:
+            async with uow:
+                uow.mark_saved(_new_facility())
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+        return {"replica": uow.reads_replica()}
+
+    return TestClient(app)
+
+
+def test_reads_go_to_the_replica_without_the_cookie():
+    response = _client().get("/read")
+
+    assert response.json() == {"replica": True}
+    assert COOKIE not in response.cookies
+
+
+def test_a_committed_write_sets_the_cookie_and_pins_the_rest_of_the_request():
+    response = _client().post("/write")
+
+    assert response.json() == {"replica": False}
+    cookie = response.headers["set-cookie"]
+    assert cookie.startswith(f"{COOKIE}=1;")
+    assert "Max-Age=5" in cookie
+    assert "HttpOnly" in cookie
+    assert "SameSite=lax" in cookie
+
+
+def test_requests_carrying_the_cookie_read_the_primary():
+    client = _client()
+    client.post("/write")
+
+    assert client.get("/read").json() == {"replica": False}
+    client.cookies.clear()
+    assert client.get("/read").json() == {"replica": True}
+
+
+def test_units_that_save_nothing_or_roll_back_set_no_cookie():
+    client = _client()
+
+    for path in ("/read-in-unit", "/fail"):
+        response = client.post(path)
+
+        assert response.json() == {"replica": True}
+        assert "set-cookie" not in response.headers
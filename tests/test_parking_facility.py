@@ -0,0 +1,273 @@
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from parkly.domain.exception.exceptions import (
+    CapacityExceededError,
+    DuplicateSpotError,
+    DuplicateSpotNumberError,
+)
+from parkly.domain.model.enums import (
+    AccessControlMethod,
+    FacilityType,
+    SpotStatus,
+    SpotType,
+)
+from parkly.domain.model.parking_facility import ParkingFacility, ParkingSpot
+from parkly.domain.model.typed_ids import FacilityId, SpotId
+from parkly.domain.model.value_objects import (
+    Capacity,
+    FacilityName,
+    Location,
+    SpotNumber,
+    TimeSlot,
+)
+
+NOW = datetime(2030, 1, 1, tzinfo=UTC)
+
+
+def _spot(n: int) -> ParkingSpot:
+    return ParkingSpot.create(
+        spot_id=SpotId(value=f"spot-{n}"),
+        spot_number=SpotNumber(value=f"A{n}"),
+        spot_type=SpotType.STANDARD,
+        status=SpotStatus.AVAILABLE,
+    )
+
+
+def _stored_facility(spot_count: int) -> ParkingFacility:
+    return ParkingFacility.reconstitute(
+        facility_id=FacilityId(value="facility"),
+        name=FacilityName(value="Central"),
+        location=Location(
+            latitude=Decimal("40.7128"),
+            longitude=Decimal("-74.0060"),
+            address="1 Main St",
+        ),
+        facility_type=FacilityType.PUBLIC,
+        access_control=AccessControlMethod.LPR,
+        total_capacity=Capacity(value=10),
+        spots=[_spot(n) for n in range(spot_count)],
+    )
+
+
+def _add_spot(facility: ParkingFacility, n: int) -> None:
+    facility.add_spot(
+        SpotId(value=f"spot-{n}"),
+        SpotNumber(value=f"A{n}"),
+        SpotType.STANDARD,
+        SpotStatus.AVAILABLE,
+        NOW,
+    )
+
+
+def _ids(spots: list[ParkingSpot]) -> set[SpotId]:
+    return {s.id for s in spots}
+
+
+def test_created_facility_is_new_once():
+    facility = ParkingFacility.create(
+        facility_id=FacilityId(value="facility"),
+        name=FacilityName(value="Central"),
+        location=Location(
+            latitude=Decimal("40.7128"),
+            longitude=Decimal("-74.0060"),
+            address="1 Main St",
+        ),
+        facility_type=FacilityType.PUBLIC,
+        access_control=AccessControlMethod.LPR,
+        total_capacity=Capacity(value=10),
+        occurred_at=NOW,
+    )
+
+    assert facility.collect_changes().is_new
+    assert facility.collect_changes().is_empty
+
+
+def test_reconstituted_facility_has_no_changes():
+    assert _stored_facility(3).collect_changes().is_empty
+
+
+def test_added_spots_are_tracked_as_added_only():
+    facility = _stored_facility(1)
+    facility.add_spot(
+        SpotId(value="new"),
+        SpotNumber(value="B1"),
+        SpotType.STANDARD,
+        SpotStatus.AVAILABLE,
+        NOW,
+    )
+    _add_spot(facility, 5)
+    _add_spot(facility, 6)
+    facility.reserve_spot(SpotId(value="new"))
+
+    changes = facility.collect_changes()
+
+    assert not changes.is_new
+    assert _ids(changes.added_spots) == {
+        SpotId(value="new"),
+        SpotId(value="spot-5"),
+        SpotId(value="spot-6"),
+    }
+    assert changes.updated_spots == []
+    assert changes.removed_spot_ids == []
+    [added] = [s for s in changes.added_spots if s.id == SpotId(value="new")]
+    assert added.status == SpotStatus.RESERVED
+
+
+def test_status_changes_are_tracked_as_updates():
+    facility = _stored_facility(3)
+    facility.reserve_spot(SpotId(value="spot-0"))
+    facility.reserve_spot(SpotId(value="spot-1"))
+
+    changes = facility.collect_changes()
+
+    assert _ids(changes.updated_spots) == {
+        SpotId(value="spot-0"),
+        SpotId(value="spot-1"),
+    }
+    assert changes.added_spots == []
+    assert changes.removed_spot_ids == []
+
+
+def test_removed_spots_drop_pending_updates():
+    facility = _stored_facility(3)
+    facility.reserve_spot(SpotId(value="spot-0"))
+    facility.remove_spot(SpotId(value="spot-0"), NOW)
+    facility.remove_spot(SpotId(value="spot-2"), NOW)
+
+    changes = facility.collect_changes()
+
+    assert set(changes.removed_spot_ids) == {
+        SpotId(value="spot-0"),
+        SpotId(value="spot-2"),
+    }
+    assert changes.updated_spots == []
+    assert changes.added_spots == []
+
+
+def test_spot_added_then_removed_leaves_no_change():
+    facility = _stored_facility(0)
+    _add_spot(facility, 1)
+    facility.remove_spot(SpotId(value="spot-1"), NOW)
+
+    assert facility.collect_changes().is_empty
+
+
+def test_collecting_changes_resets_them():
+    facility = _stored_facility(2)
+    facility.reserve_spot(SpotId(value="spot-0"))
+    facility.collect_changes()
+
+    assert facility.collect_changes().is_empty
+
+
+def test_spot_number_index_follows_adds_and_removes():
+    facility = _stored_facility(2)
+    _add_spot(facility, 5)
+
+    assert facility.find_spot_by_number(SpotNumber(value="A5")) is (
+        facility.find_spot(SpotId(value="spot-5"))
+    )
+
+    facility.remove_spot(SpotId(value="spot-0"), NOW)
+
+    assert facility.find_spot_by_number(SpotNumber(value="A0")) is None
+    facility.add_spot(
+        SpotId(value="other"),
+        SpotNumber(value="A0"),
+        SpotType.STANDARD,
+        SpotStatus.AVAILABLE,
+        NOW,
+    )
+    reused = facility.find_spot_by_number(SpotNumber(value="A0"))
+    assert reused is not None
+    assert reused.id == SpotId(value="other")
+
+
+def test_duplicate_spot_number_is_rejected():
+    facility = _stored_facility(2)
+
+    with pytest.raises(DuplicateSpotNumberError):
+        facility.add_spot(
+            SpotId(value="other"),
+            SpotNumber(value="A1"),
+            SpotType.STANDARD,
+            SpotStatus.AVAILABLE,
+            NOW,
+        )
+
+
+def test_spot_type_index_follows_adds_and_removes():
+    facility = _stored_facility(2)
+    for n in (7, 8):
+        facility.add_spot(
+            SpotId(value=f"ev-{n}"),
+            SpotNumber(value=f"E{n}"),
+            SpotType.EV_CHARGING,
+            SpotStatus.AVAILABLE,
+            NOW,
+        )
+    time_slot = TimeSlot(start=NOW, end=NOW + timedelta(hours=1))
+
+    assert _ids(facility.get_available_spots(time_slot, SpotType.EV_CHARGING)) == {
+        SpotId(value="ev-7"),
+        SpotId(value="ev-8"),
+    }
+
+    facility.remove_spot(SpotId(value="ev-7"), NOW)
+    facility.remove_spot(SpotId(value="ev-8"), NOW)
+
+    assert facility.get_available_spots(time_slot, SpotType.EV_CHARGING) == []
+    assert _ids(facility.get_available_spots(time_slot, SpotType.STANDARD)) == {
+        SpotId(value="spot-0"),
+        SpotId(value="spot-1"),
+    }
+
+
+def test_add_spots_adds_every_spot_and_records_their_events():
+    facility = _stored_facility(spot_count=1)
+
+    facility.add_spots([_spot(1), _spot(2)], NOW)
+
+    assert _ids(facility.spots) == {SpotId(value=f"spot-{n}") for n in range(3)}
+    assert [e.spot_id for e in facility.collect_events()] == [
+        SpotId(value="spot-1"),
+        SpotId(value="spot-2"),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("spots", "error"),
+    [
+        ([_spot(n) for n in range(1, 11)], CapacityExceededError),
+        ([_spot(1), _spot(1)], DuplicateSpotError),
+        ([_spot(1), _spot(0)], DuplicateSpotError),
+        (
+            [
+                _spot(1),
+                ParkingSpot.create(
+                    spot_id=SpotId(value="other"),
+                    spot_number=SpotNumber(value="A1"),
+                    spot_type=SpotType.STANDARD,
+                    status=SpotStatus.AVAILABLE,
+                ),
+            ],
+            DuplicateSpotNumberError,
+        ),
+    ],
+    ids=["capacity", "repeated-id", "existing-id", "repeated-number"],
+)
+def test_add_spots_adds_nothing_when_any_spot_is_rejected(
+    spots: list[ParkingSpot], error: type[Exception]
+):
+    facility = _stored_facility(spot_count=1)
+
+    with pytest.raises(error):
+        facility.add_spots(spots, NOW)
+
+    assert _ids(facility.spots) == {SpotId(value="spot-0")}
+    assert facility.find_spot_by_number(SpotNumber(value="A1")) is None
+    assert facility.collect_events() == []
+    assert facility.collect_changes().added_spots == []
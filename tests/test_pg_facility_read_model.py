@@ -0,0 +1,150 @@
+import asyncio
+import math
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from sqlalchemy import Connection, Engine, create_engine, event, insert
+
+from parkly.adapters.outbound.messaging.in_memory_event_publisher import (
+    InMemoryEventPublisher,
+)
+from parkly.adapters.outbound.persistence.orm_models import (
+    ParkingFacilityORM,
+    ParkingSpotORM,
+)
+from parkly.adapters.outbound.persistence.pg_facility_read_model import (
+    PgFacilityReadModel,
+)
+from parkly.adapters.outbound.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from parkly.application.dto.facility_summary_dto import FacilitySummaryDTO
+from parkly.domain.model.value_objects import Location
+from parkly.domain.service.geo_index import haversine_km
+from tests.fakes import FakeSession, NullLogger
+
+ORIGIN = Location(
+    latitude=Decimal("40.7128"), longitude=Decimal("-74.0060"), address="1 Main St"
+)
+
+# ulid, latitude, longitude and (spot_type, status) of each spot. Facility
+# "d" sits inside the bounding box's corner but outside the radius.
+FACILITIES = [
+    ("c", "40.7300", "-74.0060", [("standard", "available")]),
+    (
+        "a",
+        "40.7130",
+        "-74.0060",
+        [
+            ("standard", "available"),
+            ("standard", "available"),
+            ("standard", "occupied"),
+            ("ev", "available"),
+        ],
+    ),
+    ("b", "40.7200", "-74.0060", []),
+    ("d", "40.7560", "-74.0630", [("standard", "available")]),
+    ("far", "41.5000", "-74.0060", [("standard", "available")]),
+]
+
+
+class _SqliteSession(FakeSession):
+    """Runs statements on SQLite, standing in for PostgreSQL."""
+
+    def __init__(self, connection: Connection) -> None:
+        super().__init__()
+        self._connection = connection
+
+    async def execute(self, statement: Any, params: Any = None) -> Any:
+        self.statements.append(statement)
+        return self._connection.execute(statement, params)
+
+
+def _engine() -> Engine:
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def _functions(dbapi_connection: Any, _: Any) -> None:
+        # The PostgreSQL functions the distance expression uses.
+        for name, arity, function in (
+            ("acos", 1, math.acos),
+            ("cos", 1, math.cos),
+            ("sin", 1, math.sin),
+            ("radians", 1, math.radians),
+            ("least", 2, min),
+            ("greatest", 2, max),
+        ):
+            dbapi_connection.create_function(name, arity, function)
+
+    ParkingFacilityORM.__table__.create(engine)
+    ParkingSpotORM.__table__.create(engine)
+    with engine.begin() as connection:
+        for pk, (ulid, lat, lng, spots) in enumerate(FACILITIES, start=1):
+            connection.execute(
+                insert(ParkingFacilityORM),
+                {
+                    "pk": pk,
+                    "ulid": ulid,
+                    "name": f"Garage {ulid}",
+                    "latitude": Decimal(lat),
+                    "longitude": Decimal(lng),
+                    "address": "",
+                    "facility_type": "public",
+                    "access_control": "lpr",
+                    "total_capacity": 10,
+                },
+            )
+            for n, (spot_type, status) in enumerate(spots):
+                connection.execute(
+                    insert(ParkingSpotORM),
+                    {
+                        "ulid": f"{ulid}-{n}",
+                        "facility_pk": pk,
+                        "spot_number": str(n),
+                        "spot_type": spot_type,
+                        "status": status,
+                    },
+                )
+    return engine
+
+
+def _summaries(radius_km: str, limit: int | None = None) -> list[FacilitySummaryDTO]:
+    engine = _engine()
+    with engine.connect() as connection:
+        uow = SqlAlchemyUnitOfWork(
+            session_factory=lambda: _SqliteSession(connection),
+            event_publisher=InMemoryEventPublisher(logger=NullLogger()),
+            logger=NullLogger(),
+        )
+        read_model = PgFacilityReadModel(uow=uow, logger=NullLogger())
+        return asyncio.run(
+            read_model.find_summaries_near(ORIGIN, Decimal(radius_km), limit)
+        )
+
+
+def test_summaries_count_spots_by_type_and_status_nearest_first():
+    summaries = _summaries("5")
+
+    assert [s.facility_id for s in summaries] == ["a", "b", "c"]
+    assert summaries[0].spot_counts == {
+        "standard": {"available": 2, "occupied": 1},
+        "ev": {"available": 1},
+    }
+    assert summaries[1].spot_counts == {}
+    assert summaries[2].spot_counts == {"standard": {"available": 1}}
+    assert summaries[2].distance_km == pytest.approx(
+        haversine_km(40.7128, -74.0060, 40.7300, -74.0060)
+    )
+
+
+def test_limit_keeps_the_nearest_facilities_with_all_their_spots():
+    summaries = _summaries("5", limit=1)
+
+    assert [s.facility_id for s in summaries] == ["a"]
+    assert sum(sum(c.values()) for c in summaries[0].spot_counts.values()) == 4
+
+
+def test_facilities_in_the_box_corner_beyond_the_radius_are_left_out():
+    summaries = _summaries("6")
+
+    assert "d" not in {s.facility_id for s in summaries}
+    assert haversine_km(40.7128, -74.0060, 40.7560, -74.0630) > 6
@@ -0,0 +1,100 @@
+import asyncio
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import pytest
+from loggerizer import LogLevel
+
+from parkly.adapters.outbound.logging.json_console_logger import JsonConsoleLogger
+from parkly.adapters.outbound.messaging.in_memory_event_publisher import (
+    InMemoryEventPublisher,
+)
+from parkly.adapters.outbound.persistence.pg_parking_facility_repository import (
+    PgParkingFacilityRepository,
+)
+from parkly.adapters.outbound.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from parkly.application.exception.exceptions import FacilityNotFoundError
+from parkly.domain.event.events import FacilityCreated
+from parkly.domain.model.enums import (
+    AccessControlMethod,
+    FacilityType,
+    SpotStatus,
+    SpotType,
+)
+from parkly.domain.model.parking_facility import ParkingFacility
+from parkly.domain.model.typed_ids import FacilityId, SpotId
+from parkly.domain.model.value_objects import (
+    Capacity,
+    FacilityName,
+    Location,
+    SpotNumber,
+)
+from tests.fakes import FakeSessionFactory
+
+FACILITY_ULID = "01ARZ3NDEKTSV4RRFFQ69G5FAV"
+
+
+def _new_facility() -> ParkingFacility:
+    return ParkingFacility.create(
+        facility_id=FacilityId(value=FACILITY_ULID),
+        name=FacilityName(value="Central"),
+        location=Location(
+            latitude=Decimal("40.7128"),
+            longitude=Decimal("-74.0060"),
+            address="1 Main St",
+        ),
+        facility_type=FacilityType.PUBLIC,
+        access_control=AccessControlMethod.LPR,
+        total_capacity=Capacity(value=10),
+        occurred_at=datetime(2030, 1, 1, tzinfo=UTC),
+    )
+
+
+def test_save_commits_with_debug_logging():
+    logger = JsonConsoleLogger(level=LogLevel.DEBUG)
+    publisher = InMemoryEventPublisher(logger=logger)
+    sessions = FakeSessionFactory(rows=[(FACILITY_ULID, 1)])
+    uow = SqlAlchemyUnitOfWork(
+        session_factory=sessions, event_publisher=publisher, logger=logger
+    )
+    repository = PgParkingFacilityRepository(uow=uow, logger=logger)
+
+    async def create() -> None:
+        async with uow:
+            await repository.save(_new_facility())
+
+    asyncio.run(create())
+
+    [session] = sessions.sessions
+    assert session.committed
+    assert not session.rolled_back
+    assert [type(e) for e in publisher._published] == [FacilityCreated]
+
+
+def test_adding_spots_to_a_facility_without_a_row_raises_not_found():
+    logger = JsonConsoleLogger(level=LogLevel.DEBUG)
+    sessions = FakeSessionFactory(rows=[])
+    uow = SqlAlchemyUnitOfWork(
+        session_factory=sessions,
+        event_publisher=InMemoryEventPublisher(logger=logger),
+        logger=logger,
+    )
+    repository = PgParkingFacilityRepository(uow=uow, logger=logger)
+    facility = _new_facility()
+    facility.collect_changes()
+    facility.add_spot(
+        SpotId(value="spot"),
+        SpotNumber(value="A1"),
+        SpotType.STANDARD,
+        SpotStatus.AVAILABLE,
+        datetime(2030, 1, 1, tzinfo=UTC),
+    )
+
+    async def add_spot() -> None:
+        async with uow:
+            await repository.save(facility)
+
+    with pytest.raises(FacilityNotFoundError):
+        asyncio.run(add_spot())
+    [session] = sessions.sessions
+    assert session.rolled_back
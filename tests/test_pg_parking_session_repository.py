@@ -0,0 +1,81 @@
+import asyncio
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from parkly.adapters.outbound.messaging.in_memory_event_publisher import (
+    InMemoryEventPublisher,
+)
+from parkly.adapters.outbound.persistence.constraint_errors import (
+    ACTIVE_SESSION_PER_SPOT,
+)
+from parkly.adapters.outbound.persistence.pg_parking_session_repository import (
+    PgParkingSessionRepository,
+)
+from parkly.adapters.outbound.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from parkly.application.exception.exceptions import SpotAlreadyOccupiedError
+from parkly.domain.model.parking_session import ParkingSession
+from parkly.domain.model.typed_ids import FacilityId, SessionId, SpotId, VehicleId
+from parkly.domain.model.value_objects import Currency, Money
+from tests.fakes import FakeSessionFactory, NullLogger, integrity_error
+
+ENTRY = datetime(2030, 1, 1, 8, tzinfo=UTC)
+
+
+def _session(session_id: str, spot_id: str) -> ParkingSession:
+    return ParkingSession.reconstitute(
+        session_id=SessionId(value=session_id),
+        facility_id=FacilityId(value="facility"),
+        spot_id=SpotId(value=spot_id),
+        vehicle_id=VehicleId(value="vehicle"),
+        entry_time=ENTRY,
+        total_cost=Money(amount=Decimal(0), currency=Currency.of("USD")),
+    )
+
+
+def _repository(error: IntegrityError) -> PgParkingSessionRepository:
+    uow = SqlAlchemyUnitOfWork(
+        session_factory=FakeSessionFactory(error=error),
+        event_publisher=InMemoryEventPublisher(logger=NullLogger()),
+        logger=NullLogger(),
+    )
+    return PgParkingSessionRepository(uow=uow, logger=NullLogger())
+
+
+def test_second_open_session_on_a_spot_is_reported_as_occupied():
+    error = integrity_error(
+        ACTIVE_SESSION_PER_SPOT, "Key (spot_ulid)=(spot-1) already exists."
+    )
+    repository = _repository(error)
+
+    with pytest.raises(SpotAlreadyOccupiedError) as raised:
+        asyncio.run(repository.save(_session("session-1", "spot-1")))
+
+    assert raised.value.spot_id == SpotId(value="spot-1")
+    assert raised.value.__cause__ is error
+
+
+def test_batch_violation_names_the_spot_from_the_detail():
+    error = integrity_error(
+        ACTIVE_SESSION_PER_SPOT, "Key (spot_ulid)=(spot-2) already exists."
+    )
+    repository = _repository(error)
+    sessions = [_session("session-1", "spot-1"), _session("session-2", "spot-2")]
+
+    with pytest.raises(SpotAlreadyOccupiedError) as raised:
+        asyncio.run(repository.save_many(sessions))
+
+    assert raised.value.spot_id == SpotId(value="spot-2")
+
+
+@pytest.mark.parametrize("constraint", ["parking_sessions_pkey", None])
+def test_unrecognised_violations_are_re_raised(constraint: str | None):
+    error = integrity_error(constraint)
+    repository = _repository(error)
+
+    with pytest.raises(IntegrityError) as raised:
+        asyncio.run(repository.save(_session("session-1", "spot-1")))
+
+    assert raised.value is error
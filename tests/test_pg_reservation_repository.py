@@ -0,0 +1,95 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from parkly.adapters.outbound.messaging.in_memory_event_publisher import (
+    InMemoryEventPublisher,
+)
+from parkly.adapters.outbound.persistence.constraint_errors import (
+    RESERVATION_SLOT_OVERLAP,
+)
+from parkly.adapters.outbound.persistence.pg_reservation_repository import (
+    PgReservationRepository,
+)
+from parkly.adapters.outbound.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from parkly.domain.exception.exceptions import SpotAlreadyReservedError
+from parkly.domain.model.enums import ReservationStatus
+from parkly.domain.model.reservation import Reservation
+from parkly.domain.model.typed_ids import (
+    FacilityId,
+    ReservationId,
+    SpotId,
+    VehicleId,
+)
+from parkly.domain.model.value_objects import Currency, Money, TimeSlot
+from tests.fakes import FakeSessionFactory, NullLogger, integrity_error
+
+NOW = datetime(2030, 1, 1, 8, tzinfo=UTC)
+
+
+def _reservation(reservation_id: str, spot_id: str) -> Reservation:
+    return Reservation.reconstitute(
+        reservation_id=ReservationId(value=reservation_id),
+        facility_id=FacilityId(value="facility"),
+        spot_id=SpotId(value=spot_id),
+        vehicle_id=VehicleId(value="vehicle"),
+        time_slot=TimeSlot(start=NOW, end=NOW + timedelta(hours=1)),
+        status=ReservationStatus.CONFIRMED,
+        total_cost=Money(amount=Decimal("5.00"), currency=Currency.of("USD")),
+        created_at=NOW,
+    )
+
+
+def _repository(error: IntegrityError) -> PgReservationRepository:
+    uow = SqlAlchemyUnitOfWork(
+        session_factory=FakeSessionFactory(error=error),
+        event_publisher=InMemoryEventPublisher(logger=NullLogger()),
+        logger=NullLogger(),
+    )
+    return PgReservationRepository(uow=uow, logger=NullLogger())
+
+
+def _overlap(spot_id: str) -> IntegrityError:
+    return integrity_error(
+        RESERVATION_SLOT_OVERLAP,
+        f"Key (spot_ulid, tstzrange(start_time, end_time))=({spot_id}, ...) "
+        "conflicts with existing key.",
+    )
+
+
+def test_overlapping_slot_is_reported_as_already_reserved():
+    error = _overlap("spot-1")
+    repository = _repository(error)
+
+    with pytest.raises(SpotAlreadyReservedError) as raised:
+        asyncio.run(repository.save(_reservation("reservation-1", "spot-1")))
+
+    assert raised.value.spot_identifier == "spot-1"
+    assert raised.value.__cause__ is error
+
+
+def test_batch_overlap_names_the_spot_from_the_detail():
+    repository = _repository(_overlap("spot-2"))
+    reservations = [
+        _reservation("reservation-1", "spot-1"),
+        _reservation("reservation-2", "spot-2"),
+    ]
+
+    with pytest.raises(SpotAlreadyReservedError) as raised:
+        asyncio.run(repository.save_many(reservations))
+
+    assert raised.value.spot_identifier == "spot-2"
+
+
+@pytest.mark.parametrize("constraint", ["reservations_pkey", None])
+def test_unrecognised_violations_are_re_raised(constraint: str | None):
+    error = integrity_error(constraint)
+    repository = _repository(error)
+
+    with pytest.raises(IntegrityError) as raised:
+        asyncio.run(repository.save(_reservation("reservation-1", "spot-1")))
+
+    assert raised.value is error
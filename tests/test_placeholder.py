@@ -1,3 +0,0 @@
-def test_placeholder():
-    """Remove once real tests exist."""
-    assert True
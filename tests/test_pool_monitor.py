@@ -0,0 +1,102 @@
+import asyncio
+
+from parkly.adapters.outbound.persistence.adaptive_limiter import AdaptiveLimiter
+from parkly.adapters.outbound.persistence.database import create_engine
+from parkly.adapters.outbound.persistence.pool_monitor import PoolMonitor
+from tests.fakes import NullLogger
+
+# Never connected to: the monitor only listens to the engine's pool.
+DATABASE_URL = "postgresql+asyncpg://parkly@localhost/parkly"
+
+
+class _ManualClock:
+    def __init__(self) -> None:
+        self.seconds = 1_000.0
+
+    def __call__(self) -> float:
+        return self.seconds
+
+
+def _monitor(
+    limiter: AdaptiveLimiter | None = None,
+) -> tuple[PoolMonitor, _ManualClock]:
+    clock = _ManualClock()
+    monitor = PoolMonitor(
+        engine=create_engine(DATABASE_URL, pool_size=3, max_overflow=2),
+        logger=NullLogger(),
+        limiter=limiter,
+        saturation_window=30.0,
+        clock=clock,
+    )
+    return monitor, clock
+
+
+def test_a_timeout_marks_the_pool_saturated_for_the_window():
+    monitor, clock = _monitor()
+    assert monitor.is_ready()
+
+    monitor.record_timeout(30.0)
+    clock.seconds += 29.9
+    assert not monitor.is_ready()
+
+    clock.seconds += 0.1
+    assert monitor.is_ready()
+
+
+def test_a_later_timeout_restarts_the_window():
+    monitor, clock = _monitor()
+    monitor.record_timeout(30.0)
+    clock.seconds += 20
+    monitor.record_timeout(30.0)
+
+    clock.seconds += 20
+    assert not monitor.is_ready()
+    clock.seconds += 10
+    assert monitor.is_ready()
+
+
+def test_waits_and_timeouts_feed_the_limiter():
+    limiter = AdaptiveLimiter(min_limit=2, max_limit=5, target_wait=0.02)
+    monitor, _ = _monitor(limiter)
+
+    monitor.record_wait(0.5)
+    assert limiter.limit == 3
+    monitor.record_timeout(30.0)
+    assert limiter.limit == 2
+    monitor.record_timeout(30.0)
+    assert limiter.limit == 2
+
+
+def test_the_pool_is_saturated_while_the_limiter_queues_more_than_it_admits():
+    limiter = AdaptiveLimiter(min_limit=1, max_limit=1, target_wait=0.02)
+    monitor, _ = _monitor(limiter)
+
+    async def run() -> list[bool]:
+        await limiter.acquire()
+        ready = []
+        waiters = []
+        for _ in range(2):
+            waiters.append(asyncio.create_task(limiter.acquire()))
+            await asyncio.sleep(0)
+            ready.append(monitor.is_ready())
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        return ready
+
+    assert asyncio.run(run()) == [True, False]
+
+
+def test_stats_report_the_smoothed_and_worst_waits():
+    limiter = AdaptiveLimiter(min_limit=2, max_limit=5, target_wait=0.02)
+    monitor, _ = _monitor(limiter)
+
+    monitor.record_wait(0.010)
+    monitor.record_wait(0.005)
+    stats = monitor.stats()
+
+    # 0.2 * 10 ms, then 2 ms + 0.2 * (5 ms - 2 ms)
+    assert stats.wait_ms_avg == 2.6
+    assert stats.wait_ms_max == 10.0
+    assert (stats.size, stats.in_use, stats.checkouts) == (3, 0, 0)
+    assert (stats.limit, stats.waiting, stats.ready) == (5, 0, True)
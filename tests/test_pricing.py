@@ -0,0 +1,197 @@
+import random
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from parkly.domain.model.config import (
+    DurationDiscountPricingConfig,
+    DynamicPricingConfig,
+    EventPricingConfig,
+    PeakHourPricingConfig,
+    TieredPricingConfig,
+)
+from parkly.domain.model.value_objects import Currency, Money, TimeSlot
+from parkly.domain.port.clock import Clock
+from parkly.domain.service.pricing_service import PricingService
+from parkly.domain.service.pricing_strategy import (
+    DurationDiscountPricing,
+    DynamicPricing,
+    EventAwarePricing,
+    PricingStrategy,
+    StaticPricing,
+    TieredPricing,
+    TimeOfDayPricing,
+)
+from parkly.domain.service.quote_cache import QuoteCache
+from parkly.domain.service.rate_calendar import RateCalendar
+
+USD = Currency.of("USD")
+PEAK = PeakHourPricingConfig(
+    peak_start_hour=8, peak_end_hour=18, peak_multiplier=Decimal("1.5")
+)
+STRATEGIES: list[PricingStrategy] = [
+    StaticPricing(),
+    DynamicPricing(DynamicPricingConfig(surge_multiplier=Decimal("1.75"))),
+    EventAwarePricing(EventPricingConfig(event_multiplier=Decimal("2.2"))),
+    TimeOfDayPricing(PEAK),
+    TimeOfDayPricing(PEAK, ZoneInfo("Europe/Berlin")),
+    TimeOfDayPricing(
+        PeakHourPricingConfig(
+            peak_start_hour=2, peak_end_hour=8, peak_multiplier=Decimal("1.5")
+        ),
+        ZoneInfo("Europe/Berlin"),
+    ),
+    TieredPricing(TieredPricingConfig(free_hours=1)),
+    DurationDiscountPricing(
+        DurationDiscountPricingConfig(
+            daily_max=Money(amount=Decimal("30.00"), currency=USD)
+        )
+    ),
+]
+
+
+class _FixedClock(Clock):
+    def now(self) -> datetime:
+        return datetime(2030, 1, 1, tzinfo=UTC)
+
+
+def _slots(count: int, seed: int) -> list[TimeSlot]:
+    rng = random.Random(seed)
+    origin = datetime(2030, 3, 25, tzinfo=UTC)
+    slots = []
+    for _ in range(count):
+        start = origin + timedelta(minutes=rng.randrange(14 * 24 * 60))
+        length = timedelta(minutes=rng.randrange(1, 3 * 24 * 60))
+        slots.append(TimeSlot(start=start, end=start + length))
+    return slots
+
+
+def _rates(count: int, seed: int) -> list[Money]:
+    rng = random.Random(seed)
+    amounts = [Decimal("2.50"), Decimal("3.99"), Decimal("0.10"), Decimal("12.00")]
+    return [Money(amount=rng.choice(amounts), currency=USD) for _ in range(count)]
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES, ids=lambda s: type(s).__name__)
+def test_batch_prices_match_scalar_prices(strategy: PricingStrategy):
+    slots = _slots(300, seed=1)
+    rates = _rates(300, seed=2)
+
+    batch = strategy.calculate_many(slots, rates)
+
+    assert batch == [strategy.calculate_minor(s, r) for s, r in zip(slots, rates)]
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES, ids=lambda s: type(s).__name__)
+def test_cached_service_matches_uncached_service(strategy: PricingStrategy):
+    # Repeated slots so the second half is served from the cache.
+    slots = _slots(100, seed=3) * 2
+    rates = _rates(100, seed=4) * 2
+    uncached = PricingService(strategy)
+    cached = PricingService(
+        strategy,
+        cache=QuoteCache(
+            max_entries=1_000, ttl=timedelta(minutes=5), clock=_FixedClock()
+        ),
+    )
+    expected = [uncached.calculate_price_minor(s, r) for s, r in zip(slots, rates)]
+
+    assert cached.calculate_price_many(slots, rates) == expected
+    assert [cached.calculate_price_minor(s, r) for s, r in zip(slots, rates)] == (
+        expected
+    )
+    assert uncached.calculate_price_many(slots, rates) == expected
+
+
+def _brute_force_weighted_micros(
+    config: PeakHourPricingConfig, time_slot: TimeSlot, tz: ZoneInfo | None
+) -> int:
+    numerator, denominator = config.peak_multiplier.as_integer_ratio()
+    weighted = 0
+    moment = time_slot.start
+    while moment < time_slot.end:
+        hour = (moment.astimezone(tz) if tz else moment).hour
+        peak = config.peak_start_hour <= hour < config.peak_end_hour
+        weighted += (numerator if peak else denominator) * 60_000_000
+        moment += timedelta(minutes=1)
+    return weighted
+
+
+@pytest.mark.parametrize("tz", [None, ZoneInfo("Europe/Berlin")], ids=["utc", "dst"])
+def test_rate_calendar_matches_minute_by_minute_weighting(tz: ZoneInfo | None):
+    calendar = RateCalendar(PEAK, tz or UTC)
+
+    # The Berlin slots cross the 2030-03-31 switch to summer time.
+    for time_slot in _slots(60, seed=5):
+        assert calendar.weighted_micros(time_slot) == _brute_force_weighted_micros(
+            PEAK, time_slot, tz
+        )
+
+
+# Berlin changes the clocks at 01:00 UTC: 02:00 CET becomes 03:00 CEST on
+# 2030-03-31 and 03:00 CEST becomes 02:00 CET on 2030-10-27.
+_BERLIN = ZoneInfo("Europe/Berlin")
+_SPRING_FORWARD = datetime(2030, 3, 31, 1, tzinfo=UTC)
+_FALL_BACK = datetime(2030, 10, 27, 1, tzinfo=UTC)
+_NIGHT_PEAKS = [
+    PeakHourPricingConfig(
+        peak_start_hour=2, peak_end_hour=8, peak_multiplier=Decimal("1.5")
+    ),
+    PeakHourPricingConfig(
+        peak_start_hour=0, peak_end_hour=3, peak_multiplier=Decimal("2.25")
+    ),
+]
+
+
+@pytest.mark.parametrize("transition", [_SPRING_FORWARD, _FALL_BACK])
+@pytest.mark.parametrize("config", _NIGHT_PEAKS, ids=["from-2h", "until-3h"])
+def test_rate_calendar_weights_the_hours_around_a_clock_change(
+    config: PeakHourPricingConfig, transition: datetime
+):
+    calendar = RateCalendar(config, _BERLIN)
+    rng = random.Random(6)
+
+    for _ in range(40):
+        start = transition - timedelta(minutes=rng.randrange(1, 6 * 60))
+        end = transition + timedelta(minutes=rng.randrange(0, 6 * 60))
+        time_slot = TimeSlot(start=start, end=end)
+        assert calendar.weighted_micros(time_slot) == _brute_force_weighted_micros(
+            config, time_slot, _BERLIN
+        )
+
+
+def test_repeated_peak_hour_is_charged_at_the_peak_rate():
+    strategy = TimeOfDayPricing(_NIGHT_PEAKS[0], _BERLIN)
+    # 02:00 CEST to 02:00 CET: two hours lived, both at local hour 2.
+    repeated = TimeSlot(
+        start=_FALL_BACK - timedelta(hours=1), end=_FALL_BACK + timedelta(hours=1)
+    )
+    # 01:30 CET to 03:30 CEST: half an hour off-peak, half an hour peak.
+    skipped = TimeSlot(
+        start=_SPRING_FORWARD - timedelta(minutes=30),
+        end=_SPRING_FORWARD + timedelta(minutes=30),
+    )
+    rate = Money(amount=Decimal("4.00"), currency=USD)
+
+    assert strategy.calculate(repeated, rate).amount == Decimal("12.00")
+    assert strategy.calculate(skipped, rate).amount == Decimal("5.00")
+
+
+def test_slot_key_tells_apart_slots_priced_differently_across_a_change():
+    strategy = TimeOfDayPricing(_NIGHT_PEAKS[1], _BERLIN)
+    rate = Money(amount=Decimal("4.00"), currency=USD)
+    # Same local start time and length, one a week before the change.
+    crossing = TimeSlot(
+        start=_FALL_BACK - timedelta(hours=2), end=_FALL_BACK + timedelta(hours=2)
+    )
+    plain = TimeSlot(
+        start=crossing.start - timedelta(days=7),
+        end=crossing.end - timedelta(days=7),
+    )
+
+    assert strategy.calculate_minor(crossing, rate) != strategy.calculate_minor(
+        plain, rate
+    )
+    assert strategy.slot_key(crossing) != strategy.slot_key(plain)
@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from parkly.adapters.inbound.api.exception_handlers import (
+    register_exception_handlers,
+)
+from parkly.adapters.inbound.api.sessions_router import create_sessions_router
+from parkly.adapters.outbound.persistence.keyset import decode_cursor
+from parkly.adapters.outbound.persistence.orm_models import ParkingSessionORM
+from parkly.application.query.list_vehicle_sessions import ListVehicleSessions
+from parkly.domain.model.pagination import Page
+from tests.fakes import NullLogger
+
+URL = "/sessions/vehicle/vehicle"
+
+
+class _DecodingHandler:
+    """Decodes the cursor the way the session repository does, then pages nothing."""
+
+    async def handle(self, query: ListVehicleSessions) -> Page[object]:
+        if query.cursor is not None:
+            decode_cursor(
+                query.cursor, (ParkingSessionORM.entry_time, ParkingSessionORM.ulid)
+            )
+        return Page(items=[], next_cursor=None)
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    register_exception_handlers(app, NullLogger())
+    container = SimpleNamespace(list_vehicle_sessions_handler=_DecodingHandler())
+    app.include_router(create_sessions_router(container))
+    return TestClient(app)
+
+
+def test_listing_without_a_cursor_succeeds():
+    response = _client().get(URL)
+
+    assert response.status_code == 200
+    assert response.json() == {"items": [], "next_cursor": None}
+
+
+@pytest.mark.parametrize("cursor", ["!!!", "bm90IGpzb24", "WzEsIDJd"])
+def test_tampered_cursor_is_a_bad_request(cursor: str):
+    response = _client().get(URL, params={"cursor": cursor})
+
+    assert response.status_code == 400
+    assert response.json()["error"] == "InvalidCursorError"
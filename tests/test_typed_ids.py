@@ -0,0 +1,37 @@
+import pytest
+
+from parkly.domain.exception.exceptions import RequiredFieldError
+from parkly.domain.model.typed_ids import (
+    FacilityId,
+    OwnerId,
+    ReservationId,
+    SessionId,
+    SpotId,
+    TypedId,
+    VehicleId,
+)
+
+ULID = "01ARZ3NDEKTSV4RRFFQ69G5FAV"
+ID_TYPES = [FacilityId, SpotId, ReservationId, VehicleId, SessionId, OwnerId]
+
+
+@pytest.mark.parametrize("cls", ID_TYPES, ids=lambda cls: cls.__name__)
+def test_reconstitute_builds_the_subclass_equal_to_a_validated_id(
+    cls: type[TypedId[str]],
+):
+    rebuilt = cls.reconstitute(ULID)
+
+    assert type(rebuilt) is cls
+    assert rebuilt == cls(value=ULID)
+    assert {cls(value=ULID): "found"}[rebuilt] == "found"
+
+
+def test_ids_of_different_types_never_compare_equal():
+    assert FacilityId.reconstitute(ULID) != SpotId.reconstitute(ULID)
+
+
+def test_reconstitute_skips_the_required_value_check():
+    with pytest.raises(RequiredFieldError):
+        FacilityId(value=None)
+
+    assert FacilityId.reconstitute(None).value is None
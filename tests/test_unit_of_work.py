@@ -0,0 +1,206 @@
+import asyncio
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import pytest
+
+from parkly.adapters.outbound.persistence.adaptive_limiter import AdaptiveLimiter
+from parkly.adapters.outbound.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from parkly.application.port.event_publisher import EventPublisher
+from parkly.domain.event.domain_event import DomainEvent
+from parkly.domain.event.events import FacilityCreated
+from parkly.domain.model.enums import AccessControlMethod, FacilityType
+from parkly.domain.model.parking_facility import ParkingFacility
+from parkly.domain.model.typed_ids import FacilityId
+from parkly.domain.model.value_objects import Capacity, FacilityName, Location
+from tests.fakes import FakeSessionFactory, NullLogger
+
+
+class _RecordingPublisher(EventPublisher):
+    def __init__(self, sessions: FakeSessionFactory) -> None:
+        self._sessions = sessions
+        self.published: list[DomainEvent] = []
+        self.committed_before_publish: list[bool] = []
+
+    async def publish(self, events: list[DomainEvent]) -> None:
+        self.committed_before_publish.append(
+            all(s.committed for s in self._sessions.sessions)
+        )
+        self.published.extend(events)
+
+
+def _new_facility() -> ParkingFacility:
+    return ParkingFacility.create(
+        facility_id=FacilityId(value="01ARZ3NDEKTSV4RRFFQ69G5FAV"),
+        name=FacilityName(value="Central"),
+        location=Location(
+            latitude=Decimal("40.7128"),
+            longitude=Decimal("-74.0060"),
+            address="1 Main St",
+        ),
+        facility_type=FacilityType.PUBLIC,
+        access_control=AccessControlMethod.LPR,
+        total_capacity=Capacity(value=10),
+        occurred_at=datetime(2030, 1, 1, tzinfo=UTC),
+    )
+
+
+def _unit_of_work() -> tuple[
+    SqlAlchemyUnitOfWork, FakeSessionFactory, _RecordingPublisher
+]:
+    sessions = FakeSessionFactory()
+    publisher = _RecordingPublisher(sessions)
+    uow = SqlAlchemyUnitOfWork(
+        session_factory=sessions, event_publisher=publisher, logger=NullLogger()
+    )
+    return uow, sessions, publisher
+
+
+def test_nested_units_share_one_session_and_commit_once():
+    uow, sessions, _ = _unit_of_work()
+
+    async def run() -> None:
+        async with uow:
+            async with uow, uow.session() as inner:
+                pass
+            assert not inner.committed
+            async with uow.session() as outer:
+                assert outer is inner
+
+    asyncio.run(run())
+
+    [session] = sessions.sessions
+    assert session.began
+    assert session.committed
+    assert session.closed
+
+
+def test_error_rolls_back_without_callbacks_or_events():
+    uow, sessions, publisher = _unit_of_work()
+    callbacks: list[str] = []
+
+    async def run() -> None:
+        async with uow:
+            uow.mark_saved(_new_facility())
+            uow.on_commit(lambda: callbacks.append("committed"))
+            raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(run())
+
+    [session] = sessions.sessions
+    assert session.rolled_back
+    assert not session.committed
+    assert session.closed
+    assert callbacks == []
+    assert publisher.published == []
+
+
+def test_error_in_nested_unit_rolls_back_the_outer_unit():
+    uow, sessions, publisher = _unit_of_work()
+
+    async def run() -> None:
+        async with uow:
+            uow.mark_saved(_new_facility())
+            with pytest.raises(RuntimeError):
+                async with uow:
+                    raise RuntimeError("boom")
+            raise ValueError("outer")
+
+    with pytest.raises(ValueError):
+        asyncio.run(run())
+
+    [session] = sessions.sessions
+    assert session.rolled_back
+    assert publisher.published == []
+
+
+def test_callbacks_and_events_run_only_after_commit():
+    uow, sessions, publisher = _unit_of_work()
+    committed_at_callback: list[bool] = []
+
+    async def run() -> None:
+        async with uow:
+            uow.mark_saved(_new_facility())
+            uow.on_commit(
+                lambda: committed_at_callback.append(sessions.sessions[0].committed)
+            )
+            assert committed_at_callback == []
+            assert publisher.published == []
+
+    asyncio.run(run())
+
+    assert committed_at_callback == [True]
+    assert publisher.committed_before_publish == [True]
+    assert [type(e) for e in publisher.published] == [FacilityCreated]
+
+
+def test_on_commit_outside_a_unit_runs_at_once():
+    uow, _, _ = _unit_of_work()
+    callbacks: list[str] = []
+
+    uow.on_commit(lambda: callbacks.append("ran"))
+
+    assert callbacks == ["ran"]
+
+
+def test_identity_map_returns_the_tracked_instance_within_a_unit():
+    uow, _, _ = _unit_of_work()
+    facility = _new_facility()
+
+    async def run() -> None:
+        async with uow:
+            assert uow.track(facility) is facility
+            assert uow.track(_new_facility()) is facility
+            assert uow.get(ParkingFacility, facility.id) is facility
+        assert uow.get(ParkingFacility, facility.id) is None
+
+    asyncio.run(run())
+
+
+def test_streams_read_the_replica_without_a_limiter_slot():
+    sessions = FakeSessionFactory()
+    replica = FakeSessionFactory()
+    limiter = AdaptiveLimiter(min_limit=1, max_limit=1, target_wait=0.02)
+    uow = SqlAlchemyUnitOfWork(
+        session_factory=sessions,
+        event_publisher=_RecordingPublisher(sessions),
+        logger=NullLogger(),
+        read_session_factory=replica,
+        limiter=limiter,
+    )
+
+    async def run() -> None:
+        await limiter.acquire()
+        async with uow.stream_session():
+            pass
+
+    asyncio.run(run())
+
+    assert sessions.sessions == []
+    assert len(replica.sessions) == 1
+    assert replica.sessions[0].closed
+
+
+def test_streams_over_the_cap_wait_for_a_running_one():
+    sessions = FakeSessionFactory()
+    uow = SqlAlchemyUnitOfWork(
+        session_factory=sessions,
+        event_publisher=_RecordingPublisher(sessions),
+        logger=NullLogger(),
+        max_streams=1,
+    )
+    order: list[str] = []
+
+    async def stream(name: str) -> None:
+        async with uow.stream_session():
+            order.append(f"{name} start")
+            await asyncio.sleep(0)
+            order.append(f"{name} end")
+
+    async def run() -> None:
+        await asyncio.gather(stream("a"), stream("b"))
+
+    asyncio.run(run())
+
+    assert order == ["a start", "a end", "b start", "b end"]
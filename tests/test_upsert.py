@@ -0,0 +1,207 @@
+import asyncio
+import re
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from sqlalchemy import ClauseElement, Insert
+from sqlalchemy.dialects import postgresql
+
+from parkly.adapters.outbound.messaging.in_memory_event_publisher import (
+    InMemoryEventPublisher,
+)
+from parkly.adapters.outbound.persistence import upsert
+from parkly.adapters.outbound.persistence.mappers import reservation_to_row
+from parkly.adapters.outbound.persistence.orm_models import (
+    ReservationORM,
+    VehicleORM,
+)
+from parkly.adapters.outbound.persistence.pg_reservation_repository import (
+    PgReservationRepository,
+)
+from parkly.adapters.outbound.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from parkly.adapters.outbound.persistence.upsert import (
+    COPY_THRESHOLD,
+    MAX_BIND_PARAMS,
+    bulk_upsert_by_ulid,
+    upsert_by_ulid,
+)
+from parkly.domain.model.enums import ReservationStatus
+from parkly.domain.model.reservation import Reservation
+from parkly.domain.model.typed_ids import (
+    FacilityId,
+    ReservationId,
+    SpotId,
+    VehicleId,
+)
+from parkly.domain.model.value_objects import Currency, Money, TimeSlot
+from tests.fakes import FakeSession, FakeSessionFactory, NullLogger
+
+NOW = datetime(2030, 1, 1, 8, tzinfo=UTC)
+
+
+def _vehicle_row(n: int) -> dict[str, object]:
+    return {
+        "ulid": f"vehicle-{n}",
+        "owner_ulid": "owner",
+        "license_plate_value": f"PLATE{n}",
+        "license_plate_region": "NY",
+        "vehicle_type": "car",
+        "is_ev": False,
+    }
+
+
+def _reservation() -> Reservation:
+    return Reservation.reconstitute(
+        reservation_id=ReservationId(value="reservation"),
+        facility_id=FacilityId(value="facility"),
+        spot_id=SpotId(value="spot"),
+        vehicle_id=VehicleId(value="vehicle"),
+        time_slot=TimeSlot(start=NOW, end=NOW + timedelta(hours=1)),
+        status=ReservationStatus.CONFIRMED,
+        total_cost=Money(amount=Decimal("5.00"), currency=Currency.of("USD")),
+        created_at=NOW,
+    )
+
+
+def _sql(statement: ClauseElement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_upsert_updates_every_column_but_the_ulid():
+    sql = _sql(upsert_by_ulid(VehicleORM, _vehicle_row(1)))
+
+    assert "ON CONFLICT (ulid) DO UPDATE SET" in sql
+    updated = sql.split("DO UPDATE SET", 1)[1]
+    assert set(re.findall(r"(\w+) = excluded\.\1", updated)) == {
+        "owner_ulid",
+        "license_plate_value",
+        "license_plate_region",
+        "vehicle_type",
+        "is_ev",
+    }
+
+
+def test_upsert_of_many_rows_is_one_multi_row_statement():
+    statement = upsert_by_ulid(VehicleORM, [_vehicle_row(n) for n in range(3)])
+
+    params = statement.compile(dialect=postgresql.dialect()).params
+
+    assert {params[f"ulid_m{n}"] for n in range(3)} == {
+        f"vehicle-{n}" for n in range(3)
+    }
+
+
+def test_reservation_save_is_a_single_upsert():
+    sessions = FakeSessionFactory()
+    uow = SqlAlchemyUnitOfWork(
+        session_factory=sessions,
+        event_publisher=InMemoryEventPublisher(logger=NullLogger()),
+        logger=NullLogger(),
+    )
+    repository = PgReservationRepository(uow=uow, logger=NullLogger())
+
+    asyncio.run(repository.save(_reservation()))
+
+    (session,) = sessions.sessions
+    (statement,) = session.statements
+    assert _sql(statement).startswith("INSERT INTO reservations")
+    assert "ON CONFLICT (ulid) DO UPDATE" in _sql(statement)
+    assert session.committed
+
+
+class _CopyConnection:
+    """The asyncpg connection under the session; records COPY calls."""
+
+    def __init__(self) -> None:
+        self.copies: list[tuple[str, list[tuple[Any, ...]], list[str]]] = []
+
+    @property
+    def driver_connection(self) -> _CopyConnection:
+        return self
+
+    async def get_raw_connection(self) -> _CopyConnection:
+        return self
+
+    async def copy_records_to_table(
+        self, table: str, records: list[tuple[Any, ...]], columns: list[str]
+    ) -> None:
+        self.copies.append((table, records, columns))
+
+
+class _CopySession(FakeSession):
+    def __init__(self) -> None:
+        super().__init__()
+        self.raw = _CopyConnection()
+
+    async def connection(self) -> _CopyConnection:
+        return self.raw
+
+
+def _upserted_rows(session: FakeSession) -> list[int]:
+    counts = []
+    for statement in session.statements:
+        assert isinstance(statement, Insert)
+        params = statement.compile(dialect=postgresql.dialect()).params
+        assert len(params) <= MAX_BIND_PARAMS
+        counts.append(sum(1 for name in params if name.startswith("ulid_m")))
+    return counts
+
+
+@pytest.mark.parametrize("extra", [0, 1])
+def test_bulk_upsert_batches_at_the_bind_parameter_limit(
+    extra: int, monkeypatch: pytest.MonkeyPatch
+):
+    # Keep two full batches of reservation rows below the COPY switch.
+    monkeypatch.setattr(upsert, "COPY_THRESHOLD", 10 * MAX_BIND_PARAMS)
+    row = reservation_to_row(_reservation())
+    batch = MAX_BIND_PARAMS // len(row)
+    rows = [{**row, "ulid": f"r{n}"} for n in range(2 * batch + extra)]
+    session = FakeSession()
+
+    asyncio.run(bulk_upsert_by_ulid(session, ReservationORM, rows))
+
+    assert _upserted_rows(session) == [batch, batch] + [extra] * extra
+
+
+def test_bulk_upsert_sends_each_ulid_once_with_its_last_row():
+    rows = [_vehicle_row(1), _vehicle_row(2), {**_vehicle_row(1), "is_ev": True}]
+    session = FakeSession()
+
+    asyncio.run(bulk_upsert_by_ulid(session, VehicleORM, rows))
+
+    (statement,) = session.statements
+    params = statement.compile(dialect=postgresql.dialect()).params
+    assert (params["ulid_m0"], params["is_ev_m0"]) == ("vehicle-1", True)
+    assert params["ulid_m1"] == "vehicle-2"
+    assert "ulid_m2" not in params
+
+
+def test_bulk_upsert_of_nothing_sends_nothing():
+    session = FakeSession()
+
+    asyncio.run(bulk_upsert_by_ulid(session, VehicleORM, []))
+
+    assert session.statements == []
+
+
+def test_bulk_upsert_switches_to_copy_at_the_threshold():
+    rows = [_vehicle_row(n) for n in range(COPY_THRESHOLD)]
+    below = FakeSession()
+    session = _CopySession()
+
+    asyncio.run(bulk_upsert_by_ulid(below, VehicleORM, rows[:-1]))
+    asyncio.run(bulk_upsert_by_ulid(session, VehicleORM, rows))
+
+    assert _upserted_rows(below) == [COPY_THRESHOLD - 1]
+    ((table, records, columns),) = session.raw.copies
+    assert table == "_staging_vehicles"
+    assert columns == list(rows[0])
+    assert records == [tuple(row.values()) for row in rows]
+    create, merge, drop = (_sql(s) for s in session.statements)
+    assert create.startswith("CREATE TEMP TABLE _staging_vehicles ON COMMIT DROP")
+    assert merge.startswith("INSERT INTO vehicles")
+    assert "FROM _staging_vehicles" in merge
+    assert "ON CONFLICT (ulid) DO UPDATE" in merge
+    assert drop == "DROP TABLE _staging_vehicles"
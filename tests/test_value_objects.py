@@ -0,0 +1,103 @@
+from dataclasses import FrozenInstanceError
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from parkly.domain.exception.exceptions import (
+    DomainValidationError,
+    InvalidCurrencyCodeError,
+)
+from parkly.domain.model.value_objects import (
+    Capacity,
+    Currency,
+    FacilityName,
+    LicensePlate,
+    Location,
+    Money,
+    SpotNumber,
+    TimeSlot,
+)
+
+NOON = datetime(2030, 1, 1, 12, tzinfo=UTC)
+
+VALID: list[tuple[type[Any], dict[str, Any]]] = [
+    (TimeSlot, {"start": NOON, "end": NOON + timedelta(hours=1)}),
+    (Money, {"amount": Decimal("5.00"), "currency": Currency.of("USD")}),
+    (LicensePlate, {"value": "ABC-123", "region": "NY"}),
+    (SpotNumber, {"value": "A1"}),
+    (
+        Location,
+        {
+            "latitude": Decimal("40.7128"),
+            "longitude": Decimal("-74.0060"),
+            "address": "1 Main St",
+        },
+    ),
+    (FacilityName, {"value": "Central"}),
+    (Capacity, {"value": 10}),
+]
+# What validation would refuse; stored data is trusted as it is.
+INVALID: list[tuple[type[Any], dict[str, Any]]] = [
+    (TimeSlot, {"start": NOON, "end": NOON}),
+    (Money, {"amount": Decimal(-1), "currency": Currency.of("USD")}),
+    (LicensePlate, {"value": "", "region": "NY"}),
+    (SpotNumber, {"value": " "}),
+    (
+        Location,
+        {"latitude": Decimal(91), "longitude": Decimal(0), "address": "1 Main St"},
+    ),
+    (FacilityName, {"value": ""}),
+    (Capacity, {"value": -1}),
+]
+
+
+def test_currency_of_returns_one_instance_per_code():
+    assert Currency.of("EUR") is Currency.of("EUR")
+    assert Currency.of("jpy") is Currency.of("JPY")
+    assert Currency.of("JPY") is Currency.of("jpy")
+    assert Currency.of("chf").code == "CHF"
+
+
+def test_currency_of_equals_a_constructed_currency():
+    assert Currency.of("USD") == Currency(code="USD")
+    assert hash(Currency.of("USD")) == hash(Currency(code="usd"))
+
+
+def test_currency_of_rejects_unknown_codes():
+    with pytest.raises(InvalidCurrencyCodeError):
+        Currency.of("XXZ")
+
+
+@pytest.mark.parametrize(
+    ("cls", "fields"), VALID, ids=lambda v: getattr(v, "__name__", "")
+)
+def test_reconstitute_equals_the_validated_value(
+    cls: type[Any], fields: dict[str, Any]
+):
+    rebuilt = cls.reconstitute(**fields)
+
+    assert type(rebuilt) is cls
+    assert rebuilt == cls(**fields)
+    assert hash(rebuilt) == hash(cls(**fields))
+    with pytest.raises(FrozenInstanceError):
+        setattr(rebuilt, next(iter(fields)), None)
+
+
+@pytest.mark.parametrize(
+    ("cls", "fields"), INVALID, ids=lambda v: getattr(v, "__name__", "")
+)
+def test_reconstitute_skips_validation(cls: type[Any], fields: dict[str, Any]):
+    with pytest.raises(DomainValidationError):
+        cls(**fields)
+
+    rebuilt = cls.reconstitute(**fields)
+
+    assert {name: getattr(rebuilt, name) for name in fields} == fields
+
+
+def test_reconstitute_keeps_stored_text_as_it_is():
+    assert SpotNumber(value=" A1 ").value == "A1"
+    assert SpotNumber.reconstitute(" A1 ").value == " A1 "
+    assert FacilityName.reconstitute(" Central ").value == " Central "